@@ -0,0 +1,412 @@
+"""Benchmark conversation analysis against a simulated LLM provider.
+
+Usage:
+    python benchmarks/bench_conversations.py [--sessions 50] [--turns 20]
+        [--tool-output-kb 8] [--sidechains 0.2] [--rules 3] [--latency 0.05]
+        [--tokens-per-second 4000] [--output-tokens 200] [--violation-rate 0.1]
+        [--seed 0] [--output results.json] [--keep DIR]
+
+Generates a deterministic corpus of Claude Code JSONL sessions (user and
+assistant turns, tool calls whose results bloat the files, and Task
+sidechains) and runs DriftAnalyzer.analyze() end to end against
+tests/mock_provider.MockProvider, which sleeps for --latency plus
+--output-tokens at --tokens-per-second per call and answers with a finding
+for a deterministic --violation-rate share of prompts. No API is called.
+
+The analysis runs twice: "cold" with an empty response cache and "warm"
+with the cache the first run filled. Each case reports the wall time, loader
+throughput, time spent building prompts, the response cache hit rate and the
+LLM concurrency achieved (simulated call time over the time any call was in
+flight, and the most calls in flight at once).
+"""
+
+import argparse
+import functools
+import hashlib
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+from common import peak_rss_mb, write_results
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tests.mock_provider import MockProvider  # noqa: E402
+
+MODEL = "bench"
+
+WORDS = (
+    "refactor the parser module and keep the tests green while updating docs for the new "
+    "config option then check the cache invalidation path before release"
+).split()
+
+
+class SimulatedProvider(MockProvider):
+    """MockProvider that takes as long as a real model and records how calls overlap."""
+
+    def __init__(
+        self,
+        provider_config: Any = None,
+        model_config: Any = None,
+        cache: Any = None,
+        latency: float = 0.05,
+        tokens_per_second: float = 4000.0,
+        output_tokens: int = 200,
+        violation_rate: float = 0.1,
+    ) -> None:
+        """Initialize the provider.
+
+        Args:
+            provider_config: Provider configuration (ignored)
+            model_config: Model configuration (ignored)
+            cache: Response cache
+            latency: Seconds before the first token
+            tokens_per_second: Output token throughput
+            output_tokens: Output tokens per response
+            violation_rate: Share of prompts answered with a finding
+        """
+        super().__init__(provider_config, model_config, cache)
+        self.duration = latency + output_tokens / tokens_per_second
+        self.violation_rate = violation_rate
+        self.lock = threading.Lock()
+        self.intervals: List[Tuple[float, float]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lookups = 0
+        self.hits = 0
+
+    def _get_cached(self, *args: Any) -> Optional[str]:
+        """Look up a cached response, counting hits."""
+        response: Optional[str] = super()._get_cached(*args)
+        with self.lock:
+            self.lookups += 1
+            self.hits += response is not None
+        return response
+
+    def _respond(self, prompt: str) -> str:
+        """Answer deterministically: a finding for a fixed share of prompts."""
+        digest = int(hashlib.sha256(prompt.encode()).hexdigest()[:8], 16)
+        if digest / 0xFFFFFFFF >= self.violation_rate:
+            return "[]"
+        return json.dumps(
+            [
+                {
+                    "turn_number": 1,
+                    "observed_behavior": "Skipped the requested tests",
+                    "expected_behavior": "Run the tests before finishing",
+                    "context": "Simulated finding",
+                }
+            ]
+        )
+
+    def _start(self) -> float:
+        """Record a call starting."""
+        with self.lock:
+            self.call_count += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return time.perf_counter()
+
+    def _finish(self, start: float) -> None:
+        """Record a call finishing."""
+        with self.lock:
+            self.in_flight -= 1
+            self.intervals.append((start, time.perf_counter()))
+
+    def _generate_impl(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """Generate a response after the simulated model time."""
+        start = self._start()
+        try:
+            time.sleep(self.duration)
+            return self._respond(prompt)
+        finally:
+            self._finish(start)
+
+    def concurrency(self) -> float:
+        """Get the mean number of calls in flight while any call was."""
+        busy = total = 0.0
+        end = float("-inf")
+        for start, stop in sorted(self.intervals):
+            total += stop - start
+            if start > end:
+                busy += stop - start
+            elif stop > end:
+                busy += stop - end
+            end = max(end, stop)
+        return total / busy if busy else 0.0
+
+
+def _line(kind: str, content: List[Dict[str, Any]], session: Dict[str, Any], **extra: Any) -> str:
+    """Render one JSONL message in the Claude Code format."""
+    session["clock"] += timedelta(seconds=session["rng"].randint(1, 30))
+    uuid = f"{session['id']}-{session['count']:05d}"
+    message = {
+        "type": kind,
+        "uuid": uuid,
+        "parentUuid": session["parent"],
+        "sessionId": session["id"],
+        "cwd": session["cwd"],
+        "timestamp": session["clock"].isoformat().replace("+00:00", "Z"),
+        "isSidechain": False,
+        "message": {"role": kind, "content": content},
+        **extra,
+    }
+    session["count"] += 1
+    session["parent"] = uuid
+    return json.dumps(message)
+
+
+def _text(rng: random.Random, words: int) -> str:
+    """Generate prose of the given number of words."""
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def generate_corpus(
+    root: Path,
+    sessions: int,
+    turns: int = 20,
+    tool_output_kb: float = 8,
+    sidechains: float = 0.2,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Generate a corpus of Claude Code sessions (the same for the same arguments).
+
+    Sessions are spread over a few project directories under root, as in
+    ~/.claude/projects.
+
+    Args:
+        root: Directory to generate the corpus in
+        sessions: Number of session files
+        turns: Mean user turns per session
+        tool_output_kb: Mean size of a tool result
+        sidechains: Share of turns that run a Task sidechain
+        seed: Random seed
+
+    Returns:
+        Counts of generated sessions, turns, sidechain turns and bytes
+    """
+    rng = random.Random(seed)
+    total_turns = total_sidechain_turns = total_bytes = 0
+    epoch = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    for index in range(sessions):
+        project = f"-bench-project-{index % 5}"
+        project_dir = root / project
+        project_dir.mkdir(parents=True, exist_ok=True)
+        session = {
+            "rng": rng,
+            "id": f"session-{index:05d}",
+            "cwd": "/bench/project-" + str(index % 5),
+            "clock": epoch + timedelta(hours=index),
+            "count": 0,
+            "parent": None,
+        }
+        lines = []
+        for turn in range(rng.randint(max(1, turns // 2), max(1, turns * 3 // 2))):
+            lines.append(_line("user", [{"type": "text", "text": _text(rng, 30)}], session))
+            tool_id = f"tool-{index}-{turn}"
+            lines.append(
+                _line(
+                    "assistant",
+                    [
+                        {"type": "text", "text": _text(rng, 60)},
+                        {
+                            "type": "tool_use",
+                            "id": tool_id,
+                            "name": "Bash",
+                            "input": {"command": "pytest -q"},
+                        },
+                    ],
+                    session,
+                )
+            )
+            # Tool results are most of a real session file's size
+            size = int(rng.uniform(0, 2 * tool_output_kb) * 1024)
+            output = ("collected 120 items ... PASSED\n" * (size // 31 + 1))[:size]
+            lines.append(
+                _line(
+                    "user",
+                    [{"type": "tool_result", "tool_use_id": tool_id, "content": output}],
+                    session,
+                )
+            )
+            if rng.random() < sidechains:
+                for _ in range(rng.randint(1, 3)):
+                    lines.append(
+                        _line(
+                            "user",
+                            [{"type": "text", "text": _text(rng, 20)}],
+                            session,
+                            isSidechain=True,
+                        )
+                    )
+                    lines.append(
+                        _line(
+                            "assistant",
+                            [{"type": "text", "text": _text(rng, 40)}],
+                            session,
+                            isSidechain=True,
+                        )
+                    )
+                    total_sidechain_turns += 1
+            lines.append(_line("assistant", [{"type": "text", "text": _text(rng, 80)}], session))
+            total_turns += 1
+        text = "\n".join(lines) + "\n"
+        (project_dir / f"{session['id']}.jsonl").write_text(text)
+        total_bytes += len(text.encode())
+
+    return {
+        "sessions": sessions,
+        "turns": total_turns,
+        "sidechain_turns": total_sidechain_turns,
+        "corpus_mb": round(total_bytes / 1024 / 1024, 2),
+    }
+
+
+def bench_config(corpus: Path, cache_dir: Path, rules: int) -> Any:
+    """Build a config analyzing every session in the corpus for the given number of rules."""
+    from drift.config.models import DriftConfig
+
+    return DriftConfig.model_validate(
+        {
+            "providers": {MODEL: {"provider": "bedrock", "params": {"region": "us-east-1"}}},
+            "models": {MODEL: {"provider": MODEL, "model_id": "simulated"}},
+            "default_model": MODEL,
+            "agent_tools": {"claude-code": {"conversation_path": str(corpus)}},
+            "conversations": {"mode": "all"},
+            "cache_dir": str(cache_dir),
+            "rule_definitions": {
+                f"rule_{index:02d}": {
+                    "description": f"Benchmark rule {index}",
+                    "scope": "conversation_level",
+                    "context": "Benchmark rule",
+                    "requires_project_context": False,
+                    "phases": [
+                        {"name": "detection", "type": "prompt", "prompt": f"Find issue {index}"}
+                    ],
+                }
+                for index in range(rules)
+            },
+        }
+    )
+
+
+def run_case(analyzer: Any, provider: Any, corpus_bytes: int) -> Dict[str, Any]:
+    """Run one timed analysis and collect its metrics."""
+    from drift.agent_tools.claude_code import ClaudeCodeLoader
+    from drift.core.analyzer import DriftAnalyzer
+
+    timings = {"load": 0.0, "prompt": 0.0}
+
+    def timed(name: str, function: Any) -> Any:
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                timings[name] += time.perf_counter() - start
+
+        return wrapper
+
+    with patch.object(
+        ClaudeCodeLoader,
+        "load_conversations",
+        timed("load", ClaudeCodeLoader.load_conversations),
+    ), patch.object(
+        DriftAnalyzer,
+        "_build_analysis_prompt",
+        timed("prompt", DriftAnalyzer._build_analysis_prompt),
+    ):
+        start = time.perf_counter()
+        result = analyzer.analyze()
+        wall = time.perf_counter() - start
+
+    return {
+        "time_s": round(wall, 4),
+        "conversations": result.summary.total_conversations,
+        "violations": result.summary.total_rule_violations,
+        "loader_s": round(timings["load"], 4),
+        "loader_mb_s": round(corpus_bytes / 1024 / 1024 / timings["load"], 1),
+        "prompt_build_s": round(timings["prompt"], 4),
+        "llm_calls": provider.call_count,
+        "llm_s": round(sum(stop - start for start, stop in provider.intervals), 4),
+        "cache_hit_rate": round(provider.hits / provider.lookups, 3) if provider.lookups else 0.0,
+        "llm_concurrency_mean": round(provider.concurrency(), 2),
+        "llm_concurrency_max": provider.max_in_flight,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main() -> None:
+    """Generate the corpus, run the cold and warm analyses and report the results."""
+    from drift.core.analyzer import DriftAnalyzer
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=50, help="Session files")
+    parser.add_argument("--turns", type=int, default=20, help="Mean user turns per session")
+    parser.add_argument("--tool-output-kb", type=float, default=8, help="Mean tool result size")
+    parser.add_argument("--sidechains", type=float, default=0.2, help="Share of turns with one")
+    parser.add_argument("--rules", type=int, default=3, help="Conversation rules to check")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds to first token")
+    parser.add_argument("--tokens-per-second", type=float, default=4000, help="Output throughput")
+    parser.add_argument("--output-tokens", type=int, default=200, help="Tokens per response")
+    parser.add_argument("--violation-rate", type=float, default=0.1, help="Share of findings")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the generator")
+    parser.add_argument("--output", help="Write JSON results to this file ('-' for stdout)")
+    parser.add_argument("--keep", default="", help="Generate the corpus under DIR and keep it")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="drift-bench-") as tmp:
+        root = Path(args.keep or tmp)
+        corpus = root / "projects"
+        counts = generate_corpus(
+            corpus, args.sessions, args.turns, args.tool_output_kb, args.sidechains, args.seed
+        )
+        corpus_bytes = sum(path.stat().st_size for path in corpus.rglob("*.jsonl"))
+        print(
+            f"Corpus: {counts['sessions']} sessions, {counts['turns']} turns, "
+            f"{counts['sidechain_turns']} sidechain turns, {counts['corpus_mb']} MB",
+            file=sys.stderr,
+        )
+
+        provider_class = functools.partial(
+            SimulatedProvider,
+            latency=args.latency,
+            tokens_per_second=args.tokens_per_second,
+            output_tokens=args.output_tokens,
+            violation_rate=args.violation_rate,
+        )
+        config = bench_config(corpus, root / "cache", args.rules)
+        name = f"conversations/{args.sessions}x{args.turns}"
+        cases = {}
+        with patch("drift.core.analyzer.BedrockProvider", provider_class):
+            for temperature in ("cold", "warm"):
+                # A new analyzer (and provider) per run, sharing the on-disk cache
+                analyzer = DriftAnalyzer(config=config)
+                provider = analyzer.providers[MODEL]
+                case = run_case(analyzer, provider, corpus_bytes)
+                case.update(counts)
+                cases[f"{name}/{temperature}"] = case
+                print(
+                    f"{temperature}: {case['time_s']:.3f}s, loader {case['loader_mb_s']} MB/s, "
+                    f"prompts {case['prompt_build_s']:.3f}s, {case['llm_calls']} LLM calls "
+                    f"({case['llm_s']:.3f}s), cache hit rate {case['cache_hit_rate']:.0%}, "
+                    f"concurrency {case['llm_concurrency_mean']} "
+                    f"(max {case['llm_concurrency_max']})",
+                    file=sys.stderr,
+                )
+
+    if args.output:
+        write_results(args.output, "conversations", cases)
+
+
+if __name__ == "__main__":
+    main()
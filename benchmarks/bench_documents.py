@@ -0,0 +1,403 @@
+"""Benchmark document analysis on deterministic synthetic projects.
+
+Usage:
+    python benchmarks/bench_documents.py [--scales 100,1000,10000] [--links 5]
+        [--seed 0] [--repeat 1] [--output results.json] [--keep DIR]
+
+For each scale N, generates a project with N resources (skills, commands and
+agents, each checked as its own bundle) whose frontmatter ``skills:`` lists
+form a dependency graph with a few cycles and deep chains, markdown links
+between them (some broken), docs with code blocks, and JSON/YAML config
+files. Rules exercise the frontmatter, markdown link, regex, block line
+count and schema validators. The dependency graph validators only do work
+when given every bundle, which analyze_documents() does not do, so they are
+measured by bench_validators.py instead.
+
+Each scale runs in a fresh process and reports the wall time of
+DriftAnalyzer.analyze_documents(), the time spent in each validator (summed
+over threads) and the peak RSS. --output writes the results in the layout
+compare.py checks against a stored baseline.
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List
+
+from common import peak_rss_mb, write_results
+
+# Share of resources of each type
+SKILL_SHARE = 0.6
+COMMAND_SHARE = 0.25
+
+FENCE = "```"
+
+RULES: Dict[str, Any] = {
+    "skill_frontmatter": {
+        "description": "Skills declare a name and description",
+        "bundle": (".claude/skills/*/SKILL.md", "skill"),
+        "rules": [
+            {
+                "rule_type": "core:yaml_frontmatter",
+                "params": {"required_fields": ["name", "description"]},
+            }
+        ],
+    },
+    "command_links": {
+        "description": "Command links resolve",
+        "bundle": (".claude/commands/*.md", "command"),
+        "rules": [
+            {
+                "rule_type": "core:markdown_link",
+                "params": {"check_local_files": True, "check_external_urls": False},
+            }
+        ],
+    },
+    "agent_tools": {
+        "description": "Agents list their tools comma-separated",
+        "bundle": (".claude/agents/*.md", "agent"),
+        "rules": [
+            {
+                "rule_type": "core:regex_match",
+                "params": {"pattern": r"^tools:\s+[A-Z]\w+(?:,\s*[A-Z]\w+)*\s*$", "flags": 8},
+            }
+        ],
+    },
+    "doc_quality": {
+        "description": "Docs keep code blocks short and links working",
+        "bundle": ("docs/*.md", "doc"),
+        "rules": [
+            {
+                "rule_type": "core:block_line_count",
+                "params": {"pattern_start": "^```", "pattern_end": "^```", "max_lines": 40},
+            },
+            {
+                "rule_type": "core:markdown_link",
+                "params": {"check_local_files": True, "check_external_urls": False},
+            },
+        ],
+    },
+    "json_config": {
+        "description": "JSON config files match their schema",
+        "bundle": ("config/*.json", "config"),
+        "rules": [
+            {
+                "rule_type": "core:json_schema",
+                "params": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["name", "enabled"],
+                        "properties": {
+                            "name": {"type": "string"},
+                            "enabled": {"type": "boolean"},
+                            "retries": {"type": "integer", "minimum": 0},
+                        },
+                    }
+                },
+            }
+        ],
+    },
+    "yaml_config": {
+        "description": "YAML config files match their schema",
+        "bundle": ("config/*.yaml", "config"),
+        "rules": [
+            {
+                "rule_type": "core:yaml_schema",
+                "params": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["name", "steps"],
+                        "properties": {"steps": {"type": "array", "items": {"type": "string"}}},
+                    }
+                },
+            }
+        ],
+    },
+}
+
+
+def rule_definitions() -> Dict[str, Any]:
+    """Build the benchmark's rule definitions."""
+    definitions = {}
+    for name, spec in RULES.items():
+        pattern, bundle_type = spec["bundle"]
+        definitions[name] = {
+            "description": spec["description"],
+            "scope": "project_level",
+            "context": "Benchmark rule",
+            "requires_project_context": True,
+            "validation_rules": {
+                "document_bundle": {
+                    "bundle_type": bundle_type,
+                    "file_patterns": [pattern],
+                    "bundle_strategy": "individual",
+                },
+                "rules": [
+                    {
+                        "description": f"{name}: {rule['rule_type']}",
+                        "failure_message": f"{name} failed",
+                        "expected_behavior": f"{name} passes",
+                        **rule,
+                    }
+                    for rule in spec["rules"]
+                ],
+            },
+        }
+    definitions["project_files"] = {
+        "description": "Project has CLAUDE.md",
+        "scope": "project_level",
+        "context": "Benchmark rule",
+        "requires_project_context": False,
+        "validation_rules": {
+            "document_bundle": {
+                "bundle_type": "project",
+                "file_patterns": ["CLAUDE.md"],
+                "bundle_strategy": "collection",
+            },
+            "rules": [
+                {
+                    "rule_type": "core:file_exists",
+                    "description": "CLAUDE.md exists",
+                    "file_path": "CLAUDE.md",
+                    "failure_message": "CLAUDE.md is missing",
+                    "expected_behavior": "Project has CLAUDE.md",
+                }
+            ],
+        },
+    }
+    return definitions
+
+
+def _frontmatter(fields: Dict[str, Any]) -> str:
+    """Render a YAML frontmatter block."""
+    lines = ["---"]
+    for key, value in fields.items():
+        if isinstance(value, list):
+            lines.append(f"{key}:")
+            lines.extend(f"  - {item}" for item in value)
+        else:
+            lines.append(f"{key}: {value}")
+    lines.append("---")
+    return "\n".join(lines) + "\n"
+
+
+def _body(rng: random.Random, title: str, links: List[str]) -> str:
+    """Render a markdown body with prose, links and a code block."""
+    parts = [f"# {title}\n"]
+    for index, target in enumerate(links):
+        parts.append(
+            f"Step {index + 1}: follow [the {index + 1}. guide]({target}) before running "
+            "the command, and keep the output for review.\n"
+        )
+    code_lines = rng.randint(3, 50)
+    parts.append(f"{FENCE}bash\n" + "".join(f"echo step {i}\n" for i in range(code_lines)))
+    parts.append(f"{FENCE}\n")
+    return "\n".join(parts)
+
+
+def generate_project(root: Path, resources: int, links: int = 5, seed: int = 0) -> Dict[str, int]:
+    """Generate a synthetic project (the same for the same arguments).
+
+    Args:
+        root: Directory to generate the project in
+        resources: Number of skills, commands and agents
+        links: Markdown links per command and doc
+        seed: Random seed
+
+    Returns:
+        Counts of generated files by kind
+    """
+    rng = random.Random(seed)
+    skills = max(1, int(resources * SKILL_SHARE))
+    commands = max(1, int(resources * COMMAND_SHARE))
+    agents = max(1, resources - skills - commands)
+    docs = max(1, resources // 10)
+    configs = max(1, resources // 20)
+    skill_names = [f"skill-{i:05d}" for i in range(skills)]
+
+    def link_targets(count: int, depth: int) -> List[str]:
+        prefix = "../" * depth
+        targets = []
+        for _ in range(count):
+            if rng.random() < 0.05:
+                targets.append(f"{prefix}docs/missing-{rng.randrange(1000)}.md")
+            elif rng.random() < 0.5:
+                targets.append(f"{prefix}.claude/skills/{rng.choice(skill_names)}/SKILL.md")
+            else:
+                targets.append(f"{prefix}docs/guide-{rng.randrange(docs):05d}.md")
+        return targets
+
+    (root / "CLAUDE.md").write_text("# Project\n\nSee [the docs](docs/guide-00000.md).\n")
+
+    for index, name in enumerate(skill_names):
+        # Mostly a DAG over earlier skills, with occasional long chains and cycles
+        deps = rng.sample(skill_names[:index], min(index, rng.randint(0, 3)))
+        if index % 50 == 49:
+            deps.append(skill_names[(index + 1) % skills])
+        if index % 100 == 0 and index:
+            deps.append(skill_names[index - 1])
+        fields: Dict[str, Any] = {"name": name, "description": f"Skill {index}"}
+        if index % 97 == 13:
+            del fields["description"]
+        if deps:
+            fields["skills"] = sorted(set(deps))
+        skill_dir = root / ".claude" / "skills" / name
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            _frontmatter(fields) + _body(rng, name, link_targets(2, 3))
+        )
+
+    commands_dir = root / ".claude" / "commands"
+    commands_dir.mkdir(parents=True)
+    for index in range(commands):
+        fields = {"description": f"Command {index}", "skills": rng.sample(skill_names, 1)}
+        (commands_dir / f"command-{index:05d}.md").write_text(
+            _frontmatter(fields) + _body(rng, f"Command {index}", link_targets(links, 2))
+        )
+
+    agents_dir = root / ".claude" / "agents"
+    agents_dir.mkdir(parents=True)
+    for index in range(agents):
+        tools = "Read, Write, Edit" if index % 10 else "- Read\n  - Write"
+        (agents_dir / f"agent-{index:05d}.md").write_text(
+            f"---\nname: agent-{index:05d}\ndescription: Agent {index}\ntools: {tools}\n---\n"
+            + _body(rng, f"Agent {index}", link_targets(2, 2))
+        )
+
+    docs_dir = root / "docs"
+    docs_dir.mkdir()
+    for index in range(docs):
+        (docs_dir / f"guide-{index:05d}.md").write_text(
+            _body(rng, f"Guide {index}", link_targets(links, 1))
+        )
+
+    config_dir = root / "config"
+    config_dir.mkdir()
+    for index in range(configs):
+        enabled: Any = index % 25 != 0 or "yes"
+        (config_dir / f"service-{index:05d}.json").write_text(
+            json.dumps({"name": f"service-{index}", "enabled": enabled, "retries": index % 5})
+        )
+        steps = "\n".join(f"  - step-{step}" for step in range(rng.randint(1, 8)))
+        (config_dir / f"pipeline-{index:05d}.yaml").write_text(
+            f"name: pipeline-{index}\nsteps:\n{steps}\n"
+        )
+
+    return {
+        "skills": skills,
+        "commands": commands,
+        "agents": agents,
+        "docs": docs,
+        "config_files": 2 * configs,
+    }
+
+
+def run_scale(resources: int, links: int, seed: int, repeat: int, keep: str) -> Dict[str, Any]:
+    """Generate a project and time its document analysis (run in a fresh process)."""
+    from drift.config.models import DriftConfig
+    from drift.core.analyzer import DriftAnalyzer
+    from drift.validation.validators import ValidatorRegistry
+
+    with tempfile.TemporaryDirectory(prefix="drift-bench-") as tmp:
+        root = Path(keep) / f"project-{resources}" if keep else Path(tmp)
+        root.mkdir(parents=True, exist_ok=True)
+        files = generate_project(root, resources, links, seed)
+        config = DriftConfig.model_validate(
+            {"rule_definitions": rule_definitions(), "cache_enabled": False}
+        )
+        config.url_cache.enabled = False
+
+        # Time every validator call; rules of a bundle run on several threads
+        validator_times: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])
+        lock = threading.Lock()
+        execute_rule = ValidatorRegistry.execute_rule
+
+        def timed_execute_rule(self: Any, rule: Any, *args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return execute_rule(self, rule, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with lock:
+                    entry = validator_times[rule.rule_type]
+                    entry[0] += 1
+                    entry[1] += elapsed
+
+        ValidatorRegistry.execute_rule = timed_execute_rule  # type: ignore[method-assign]
+
+        timings = []
+        for _ in range(repeat):
+            validator_times.clear()
+            analyzer = DriftAnalyzer(config=config, project_path=root)
+            start = time.perf_counter()
+            result = analyzer.analyze_documents()
+            timings.append(time.perf_counter() - start)
+
+    return {
+        "time_s": round(min(timings), 4),
+        "resources": resources,
+        "files": files,
+        "bundles": len(
+            {
+                (detail["rule_name"], detail["execution_context"]["bundle_id"])
+                for detail in result.metadata["execution_details"]
+                if detail.get("execution_context", {}).get("bundle_id")
+            }
+        ),
+        "checks": result.summary.total_checks,
+        "violations": result.summary.total_rule_violations,
+        "peak_rss_mb": peak_rss_mb(),
+        "validators": {
+            rule_type: {"calls": int(calls), "time_s": round(total, 4)}
+            for rule_type, (calls, total) in sorted(validator_times.items())
+        },
+    }
+
+
+def main() -> None:
+    """Run the benchmark at each scale and report the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scales", default="100,1000,10000", help="Comma-separated resource counts"
+    )
+    parser.add_argument("--links", type=int, default=5, help="Links per command and doc")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the generator")
+    parser.add_argument("--repeat", type=int, default=1, help="Timed runs per scale (best)")
+    parser.add_argument("--output", help="Write JSON results to this file ('-' for stdout)")
+    parser.add_argument("--keep", default="", help="Generate projects under DIR and keep them")
+    args = parser.parse_args()
+
+    cases = {}
+    context = multiprocessing.get_context("spawn")
+    for scale in (int(value) for value in args.scales.split(",")):
+        # A fresh process per scale, so peak RSS and warm caches don't carry over
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            case = pool.submit(
+                run_scale, scale, args.links, args.seed, args.repeat, args.keep
+            ).result()
+        cases[f"documents/{scale}"] = case
+        print(
+            f"{scale:>6} resources: {case['time_s']:8.3f}s, {case['checks']} checks, "
+            f"{case['violations']} violations, peak RSS {case['peak_rss_mb']} MB",
+            file=sys.stderr,
+        )
+        for rule_type, timing in case["validators"].items():
+            print(
+                f"         {rule_type:<36} {timing['time_s']:8.3f}s ({timing['calls']} calls)",
+                file=sys.stderr,
+            )
+
+    if args.output:
+        write_results(args.output, "documents", cases)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark LinkValidator reference extraction on a large markdown document.
+
+Usage:
+    python benchmarks/bench_link_scanner.py [--size-mb 10] [--repeat 3]
+
+Builds a synthetic document mixing prose, markdown links, bare paths, URLs,
+inline code, fenced code blocks and placeholders, then reports the best
+throughput of extract_all_file_references() over several runs.
+"""
+
+import argparse
+import time
+
+from drift.utils.link_validator import LinkValidator
+
+SECTION = """## Section {index}
+
+See [the guide](docs/guide-{mod}.md) and ./scripts/run-{mod}.sh for details. Edit
+`config.yaml` or README.md, then check https://docs.site.io/page/{mod} and
+src/module_{mod}/file.py before you commit your changes to the repository.
+
+Most paragraphs are plain prose without any references at all, which is what a
+scanner spends the bulk of its time on in real documentation. They wrap at a
+reasonable width and end with ordinary punctuation.
+
+```python
+import os
+print(open("path/to/data.json").read())
+```
+
+    indented example: old/notes.md
+
+- Use {{project}}/notes.md as a template
+- Link: [home](https://home.site.io/) or [#anchor](#section-{mod})
+
+"""
+
+
+def build_document(size_mb: float) -> str:
+    """Build a synthetic markdown document of roughly size_mb megabytes."""
+    target = int(size_mb * 1024 * 1024)
+    sections = []
+    size = 0
+    index = 0
+    while size < target:
+        section = SECTION.format(index=index, mod=index % 500)
+        sections.append(section)
+        size += len(section)
+        index += 1
+    return "".join(sections)
+
+
+def main() -> None:
+    """Run the benchmark and print throughput."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=10.0, help="Document size in MB")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs")
+    args = parser.parse_args()
+
+    content = build_document(args.size_mb)
+    validator = LinkValidator(custom_skip_patterns=[r"vendor/", r"\.tmp$"])
+    megabytes = len(content.encode("utf-8")) / (1024 * 1024)
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        references = validator.extract_all_file_references(content)
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    print(f"document: {megabytes:.1f} MB, {content.count(chr(10)) + 1} lines")
+    print(f"references: {len(references)} unique")
+    print(f"best of {args.repeat}: {best:.3f}s ({megabytes / best:.1f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""Micro-benchmark each built-in validator on standardized inputs.
+
+Usage:
+    python benchmarks/bench_validators.py [--validators regex_match,markdown_link]
+        [--sizes small,medium,pathological] [--repeat 3] [--output results.json]
+        [--keep DIR]
+
+Every validator runs in isolation, through ValidatorRegistry.execute_rule(),
+on three deterministic inputs: a small file, a medium one and a
+pathological one that targets its worst case (backtracking-prone regexes,
+100k-line files, link-dense docs, 10k-node dependency graphs, large JSON
+documents). Inputs are generated once and timed --repeat times with fresh
+validators and bundles; each case ("<validator>/<size>") reports the best
+time, the input size and the outcome, so a change in behavior is as visible
+as a change in speed. --output writes the results in the layout compare.py
+checks against a stored baseline.
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from common import peak_rss_mb, write_results
+
+SIZES = ("small", "medium", "pathological")
+
+FENCE = "```"
+
+PROSE = (
+    "Most paragraphs are plain prose without any references at all, which is what a "
+    "validator spends the bulk of its time on in real documentation.\n"
+)
+
+
+class Input(NamedTuple):
+    """A generated input: the rule params and the files to validate."""
+
+    params: Dict[str, Any]
+    files: List[str]
+    # Files of every bundle, for validators that look across bundles
+    all_files: Optional[List[str]] = None
+
+
+def _write(root: Path, relative_path: str, content: str) -> str:
+    """Write a generated file and return its relative path."""
+    path = root / relative_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return relative_path
+
+
+def _markdown(lines: int, block_every: int = 0, block_lines: int = 20) -> str:
+    """Generate markdown of about the given number of lines, with code blocks."""
+    parts = []
+    count = 0
+    while count < lines:
+        if block_every and count % block_every == 0:
+            parts.append(f"{FENCE}python\n" + "print('step')\n" * block_lines + f"{FENCE}\n")
+            count += block_lines + 2
+        else:
+            parts.append(PROSE)
+            count += 1
+    return "".join(parts)
+
+
+def regex_match(root: Path, size: str) -> Input:
+    """Look for a missing required heading, or use a backtracking-prone pattern."""
+    if size == "pathological":
+        # "[ \t]+$" restarts at every blank of a long run that doesn't end the line
+        content = ("word" + " " * 4000 + "x\n") * 20
+        params = {"pattern": r"[ \t]+$", "flags": 8}
+    else:
+        content = _markdown(50 if size == "small" else 5000)
+        params = {"pattern": r"^## Overview\s*$", "flags": 8}
+    return Input(params, [_write(root, "doc.md", content)])
+
+
+def block_line_count(root: Path, size: str) -> Input:
+    """Count fenced code blocks in files of 200, 10k and 100k lines."""
+    lines = {"small": 200, "medium": 10000, "pathological": 100000}[size]
+    params = {"pattern_start": f"^{FENCE}", "pattern_end": f"^{FENCE}", "max_lines": 50}
+    return Input(params, [_write(root, "doc.md", _markdown(lines, block_every=40))])
+
+
+def markdown_link(root: Path, size: str) -> Input:
+    """Check docs with 20, 2k and 50k local links, some broken."""
+    links = {"small": 20, "medium": 2000, "pathological": 50000}[size]
+    targets = [_write(root, f"docs/page-{index:03d}.md", "# Page\n") for index in range(200)]
+    rng = random.Random(0)
+    lines = []
+    for index in range(links):
+        target = rng.choice(targets) if index % 20 else f"docs/missing-{index}.md"
+        lines.append(f"See [page {index}]({target}) and [the site](https://example.com/{index}).")
+    params = {"check_local_files": True, "check_external_urls": False}
+    return Input(params, [_write(root, "index.md", "\n".join(lines) + "\n")])
+
+
+def json_schema(root: Path, size: str) -> Input:
+    """Check arrays of 10, 5k and 50k objects against an item schema."""
+    items = {"small": 10, "medium": 5000, "pathological": 50000}[size]
+    document = [
+        {"id": index, "name": f"item-{index}", "tags": ["a", "b"], "enabled": index % 2 == 0}
+        for index in range(items)
+    ]
+    schema = {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "required": ["id", "name", "enabled"],
+            "properties": {
+                "id": {"type": "integer", "minimum": 0},
+                "name": {"type": "string", "pattern": "^item-[0-9]+$"},
+                "tags": {"type": "array", "items": {"type": "string"}},
+                "enabled": {"type": "boolean"},
+            },
+        },
+    }
+    return Input({"schema": schema}, [_write(root, "data.json", json.dumps(document))])
+
+
+def yaml_schema(root: Path, size: str) -> Input:
+    """Check lists of 10, 1k and 10k mappings against a schema."""
+    entries = {"small": 10, "medium": 1000, "pathological": 10000}[size]
+    content = "steps:\n" + "".join(
+        f"  - name: step-{index}\n    run: make target-{index}\n" for index in range(entries)
+    )
+    schema = {
+        "type": "object",
+        "required": ["steps"],
+        "properties": {
+            "steps": {
+                "type": "array",
+                "items": {"type": "object", "required": ["name", "run"]},
+            }
+        },
+    }
+    return Input({"schema": schema}, [_write(root, "pipeline.yaml", content)])
+
+
+def yaml_frontmatter(root: Path, size: str) -> Input:
+    """Parse frontmatter of 2, 1k and 10k list items above a growing body."""
+    entries, body = {"small": (2, 50), "medium": (1000, 5000), "pathological": (10000, 50000)}[size]
+    content = (
+        "---\nname: skill\ndescription: A skill\ntools:\n"
+        + "".join(f"  - tool-{index}\n" for index in range(entries))
+        + "---\n"
+        + _markdown(body)
+    )
+    params = {"required_fields": ["name", "description"]}
+    return Input(params, [_write(root, "SKILL.md", content)])
+
+
+def file_exists(root: Path, size: str) -> Input:
+    """Glob for files that match nothing in trees of 100, 2k and 10k files."""
+    files = {"small": 100, "medium": 2000, "pathological": 10000}[size]
+    for index in range(files):
+        _write(root, f"src/pkg-{index % 50}/module_{index}.py", "")
+    return Input({"file_path": "src/**/*.md"}, [])
+
+
+def token_count(root: Path, size: str) -> Input:
+    """Count approximate tokens of 10 KB, 1 MB and 10 MB files."""
+    lines = {"small": 60, "medium": 6000, "pathological": 60000}[size]
+    params = {"file_path": "doc.md", "provider": "approximate", "max_count": 1000}
+    return Input(params, [_write(root, "doc.md", _markdown(lines))])
+
+
+def _skill_graph(root: Path, size: str) -> Input:
+    """Resolve skills depending on earlier skills: 100, 1k and 10k nodes, a few cycles.
+
+    The pathological graph is also one long chain, the worst case for
+    depth and cycle searches.
+    """
+    nodes = {"small": 100, "medium": 1000, "pathological": 10000}[size]
+    rng = random.Random(0)
+    files = []
+    for index in range(nodes):
+        deps = set(rng.sample(range(index), min(index, 3)))
+        if size == "pathological" and index:
+            deps.add(index - 1)
+        if index % 100 == 99:
+            deps.add(index + 1 if index + 1 < nodes else 0)
+        frontmatter = f"---\nname: skill-{index:05d}\ndescription: Skill {index}\n"
+        if deps:
+            frontmatter += "skills:\n" + "".join(f"  - skill-{dep:05d}\n" for dep in sorted(deps))
+        files.append(
+            _write(root, f".claude/skills/skill-{index:05d}/SKILL.md", frontmatter + "---\n")
+        )
+    params = {"resource_dirs": [".claude/skills"], "max_depth": 5}
+    # Check the last skill, which reaches the most of the graph
+    return Input(params, [files[-1]], files)
+
+
+SUITES: Dict[str, Callable[[Path, str], Input]] = {
+    "core:regex_match": regex_match,
+    "core:block_line_count": block_line_count,
+    "core:markdown_link": markdown_link,
+    "core:json_schema": json_schema,
+    "core:yaml_schema": yaml_schema,
+    "core:yaml_frontmatter": yaml_frontmatter,
+    "core:file_exists": file_exists,
+    "core:token_count": token_count,
+    "core:claude_circular_dependencies": _skill_graph,
+    "core:claude_max_dependency_depth": _skill_graph,
+    "core:claude_dependency_duplicate": _skill_graph,
+}
+
+
+def _bundle(root: Path, files: List[str], bundle_id: str) -> Any:
+    """Build a document bundle of generated files."""
+    from drift.core.types import DocumentBundle, DocumentFile
+
+    return DocumentBundle(
+        bundle_id=bundle_id,
+        bundle_type="bench",
+        bundle_strategy="individual",
+        files=[DocumentFile(relative_path=path, file_path=root / path) for path in files],
+        project_path=root,
+    )
+
+
+def run_case(rule_type: str, root: Path, case: Input, repeat: int) -> Dict[str, Any]:
+    """Time a validator on one input."""
+    from drift.config.models import ValidationRule
+    from drift.validation.validators import ValidatorRegistry
+
+    rule = ValidationRule(
+        rule_type=rule_type,
+        description="Benchmark rule",
+        params=case.params,
+        failure_message="Benchmark rule failed",
+        expected_behavior="Benchmark rule passes",
+    )
+    timings = []
+    outcome = "pass"
+    for _ in range(repeat):
+        # Fresh validators and bundles, so no run reuses another's parsed content
+        registry = ValidatorRegistry()
+        bundle = _bundle(root, case.files, "bench")
+        all_bundles = (
+            [_bundle(root, [path], path) for path in case.all_files]
+            if case.all_files is not None
+            else None
+        )
+        start = time.perf_counter()
+        try:
+            result = registry.execute_rule(rule, bundle, all_bundles)
+        except Exception as e:
+            result = None
+            outcome = f"error: {type(e).__name__}"
+        timings.append(time.perf_counter() - start)
+        if result is not None:
+            outcome = "fail"
+
+    paths = case.all_files if case.all_files is not None else case.files
+    return {
+        "time_s": round(min(timings), 5),
+        "input_mb": round(sum((root / path).stat().st_size for path in paths) / 1024 / 1024, 2),
+        "files": len(paths),
+        "outcome": outcome,
+    }
+
+
+def main() -> None:
+    """Run the selected validators on the selected inputs and report the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--validators",
+        default="",
+        help="Comma-separated validators without the core: prefix (default: all)",
+    )
+    parser.add_argument("--sizes", default=",".join(SIZES), help="Comma-separated input sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (best)")
+    parser.add_argument("--output", help="Write JSON results to this file ('-' for stdout)")
+    parser.add_argument("--keep", default="", help="Generate inputs under DIR and keep them")
+    args = parser.parse_args()
+
+    selected = [f"core:{name}" for name in args.validators.split(",") if name] or list(SUITES)
+    unknown = [name for name in selected if name not in SUITES]
+    if unknown:
+        sys.exit(f"Unknown validators: {', '.join(unknown)}")
+    sizes = args.sizes.split(",")
+
+    cases = {}
+    with tempfile.TemporaryDirectory(prefix="drift-bench-") as tmp:
+        for rule_type in selected:
+            for size in sizes:
+                name = f"{rule_type.split(':', 1)[1]}/{size}"
+                root = Path(args.keep or tmp) / name
+                root.mkdir(parents=True, exist_ok=True)
+                case = run_case(rule_type, root, SUITES[rule_type](root, size), args.repeat)
+                cases[name] = case
+                print(
+                    f"{name:<44} {case['time_s']:10.4f}s  {case['input_mb']:8.2f} MB  "
+                    f"{case['outcome']}",
+                    file=sys.stderr,
+                )
+
+    print(f"Peak RSS: {peak_rss_mb()} MB", file=sys.stderr)
+    if args.output:
+        write_results(args.output, "validators", cases)
+
+
+if __name__ == "__main__":
+    main()
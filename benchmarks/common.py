@@ -0,0 +1,64 @@
+"""Shared helpers for the benchmark scripts.
+
+Every benchmark writes the same JSON layout, so compare.py can check any of
+them against a stored baseline:
+
+    {
+      "benchmark": "documents",
+      "environment": {"drift": "0.10.0", "python": "3.11.7", ...},
+      "cases": {"<case>": {"time_s": 1.23, ...}, ...}
+    }
+
+``time_s`` is the primary metric of each case; benchmarks add their own
+secondary metrics next to it.
+"""
+
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+
+def environment() -> Dict[str, Any]:
+    """Describe where the benchmark ran, so results are only compared like for like."""
+    try:
+        from importlib.metadata import version
+
+        drift_version = version("ai-drift")
+    except Exception:
+        drift_version = "unknown"
+    return {
+        "drift": drift_version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Get the peak resident set size of this process in MB, if the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def write_results(path: str, benchmark: str, cases: Dict[str, Dict[str, Any]]) -> None:
+    """Write benchmark results as JSON ("-" writes to stdout)."""
+    document = {"benchmark": benchmark, "environment": environment(), "cases": cases}
+    text = json.dumps(document, indent=2, sort_keys=True) + "\n"
+    if path == "-":
+        sys.stdout.write(text)
+    else:
+        Path(path).write_text(text, encoding="utf-8")
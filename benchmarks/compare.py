@@ -0,0 +1,109 @@
+"""Compare benchmark results against a baseline and fail on regressions.
+
+Usage:
+    python benchmarks/compare.py BASELINE CURRENT [--threshold 0.2]
+        [--metric time_s] [--min-delta 0.01]
+
+Both files are --output results of the same benchmark script. Cases present
+in both are compared on --metric; a case regresses when it grew by more than
+--threshold (a fraction of the baseline) and by more than --min-delta in
+absolute terms, which keeps tiny, noisy timings from failing the check.
+Exits with code 1 if any case regressed.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+
+def load(path: str) -> Dict[str, Any]:
+    """Load a results file written by one of the benchmarks."""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    metric: str = "time_s",
+    threshold: float = 0.2,
+    min_delta: float = 0.01,
+) -> Tuple[List[Tuple[str, float, float, float]], List[str]]:
+    """Compare the cases of two results files.
+
+    Args:
+        baseline: Baseline results
+        current: Current results
+        metric: Case metric to compare
+        threshold: Allowed relative increase
+        min_delta: Increase below which a case never regresses
+
+    Returns:
+        Rows of (case, baseline, current, relative change) and the regressed cases
+    """
+    rows = []
+    regressions = []
+    for case, result in sorted(current["cases"].items()):
+        before = baseline["cases"].get(case, {}).get(metric)
+        after = result.get(metric)
+        if before is None or after is None:
+            continue
+        change = (after - before) / before if before else 0.0
+        rows.append((case, before, after, change))
+        if change > threshold and after - before > min_delta:
+            regressions.append(case)
+    return rows, regressions
+
+
+def main() -> None:
+    """Print the comparison and exit non-zero on regressions."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", help="Baseline results file")
+    parser.add_argument("current", help="Current results file")
+    parser.add_argument("--metric", default="time_s", help="Case metric to compare")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="Allowed relative increase (0.2 = 20%%)"
+    )
+    parser.add_argument(
+        "--min-delta", type=float, default=0.01, help="Ignore increases smaller than this"
+    )
+    args = parser.parse_args()
+
+    baseline = load(args.baseline)
+    current = load(args.current)
+    if baseline.get("benchmark") != current.get("benchmark"):
+        sys.exit(
+            f"Cannot compare {baseline.get('benchmark')!r} results "
+            f"with {current.get('benchmark')!r} results"
+        )
+    for key in ("python", "machine"):
+        if baseline["environment"].get(key) != current["environment"].get(key):
+            print(
+                f"Warning: baseline ran on {key} {baseline['environment'].get(key)}, "
+                f"current on {current['environment'].get(key)}",
+                file=sys.stderr,
+            )
+
+    rows, regressions = compare(baseline, current, args.metric, args.threshold, args.min_delta)
+    if not rows:
+        sys.exit("No cases in common")
+    width = max(len(case) for case, *_ in rows)
+    for case, before, after, change in rows:
+        flag = "  REGRESSION" if case in regressions else ""
+        print(f"{case:<{width}}  {before:10.4f}  {after:10.4f}  {change:+7.1%}{flag}")
+        # A faster run that now gives a different answer is not a like-for-like comparison
+        outcomes = baseline["cases"][case].get("outcome"), current["cases"][case].get("outcome")
+        if outcomes[0] != outcomes[1]:
+            print(f"Warning: {case} outcome changed from {outcomes[0]} to {outcomes[1]}")
+
+    if regressions:
+        print(
+            f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,17 @@
-"""CLI commands for drift."""
+"""CLI commands for drift.
 
-from drift.cli.commands import analyze, document, draft, list
+Command modules are imported on first access, so running one command does
+not import the others.
+"""
 
-__all__ = ["analyze", "document", "draft", "list"]
+import importlib
+from types import ModuleType
+
+__all__ = ["analyze", "document", "draft", "list", "lsp", "serve"]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import a command module on first access."""
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,18 +1,22 @@
 """Analyze command for drift CLI."""
 
 import logging
+import posixpath
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Optional
 
 from drift.cli.logging_config import setup_logging
 from drift.cli.output.formatter import OutputFormatter
 from drift.cli.output.json import JsonFormatter
 from drift.cli.output.markdown import MarkdownFormatter
+from drift.cli.output.ndjson import NdjsonFormatter
 from drift.config.loader import ConfigLoader
 from drift.config.models import ConversationMode
-from drift.core.analyzer import DriftAnalyzer
-from drift.core.types import CompleteAnalysisResult
+from drift.core.analyzer import DriftAnalyzer, is_programmatic_rule
+from drift.core.types import AnalysisEventKind, CompleteAnalysisResult
+from drift.daemon.warm import WarmCache
+from drift.documents.changes import ChangeSet
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +80,12 @@ def _merge_results(
     if conv_skipped or doc_skipped:
         merged_metadata["skipped_rules"] = list(set(conv_skipped) | set(doc_skipped))
 
+    if "change_filter" in doc_result.metadata:
+        merged_metadata["change_filter"] = doc_result.metadata["change_filter"]
+
+    if "partial" in doc_result.metadata:
+        merged_metadata["partial"] = doc_result.metadata["partial"]
+
     # Merge summaries
     merged_summary = conv_result.summary.model_copy()
     merged_summary.total_rule_violations += doc_result.summary.total_rule_violations
@@ -141,6 +151,51 @@ def _merge_results(
     )
 
 
+def _stream_results(
+    analyzer: DriftAnalyzer, formatter: NdjsonFormatter, scope: str, **options: Any
+) -> CompleteAnalysisResult:
+    """Run one analysis scope, printing each record as soon as it is available.
+
+    -- analyzer: Analyzer to run
+    -- formatter: Formatter for the streamed records
+    -- scope: "conversation" or "project"
+    -- options: Further DriftAnalyzer.iter_results() arguments
+
+    Returns the run's summary and metadata (without the streamed records).
+    """
+    result = None
+    for event in analyzer.iter_results(scope, **options):
+        if event.kind == AnalysisEventKind.SUMMARY:
+            result = event.result
+        else:
+            print(formatter.format_event(event), flush=True)
+    assert result is not None
+    return result
+
+
+def _project_relative_paths(project_path: Path, paths: List[str]) -> List[str]:
+    """Convert document paths to POSIX paths relative to the project.
+
+    -- project_path: Project directory
+    -- paths: Paths relative to the project, or absolute paths inside it
+
+    Returns relative POSIX paths.
+
+    Raises ValueError if a path is outside the project.
+    """
+    root = project_path.resolve()
+    relative_paths = []
+    for path in paths:
+        candidate = Path(path)
+        if candidate.is_absolute():
+            try:
+                candidate = candidate.resolve().relative_to(root)
+            except ValueError:
+                raise ValueError(f"Path is outside the project: {path}")
+        relative_paths.append(posixpath.normpath(candidate.as_posix()))
+    return relative_paths
+
+
 def analyze_command(
     format: str = "markdown",
     scope: str = "project",
@@ -154,9 +209,14 @@ def analyze_command(
     no_cache: bool = False,
     cache_dir: Optional[str] = None,
     no_parallel: bool = False,
+    changed_since: Optional[str] = None,
+    staged: bool = False,
+    fail_fast: bool = False,
+    paths: Optional[List[str]] = None,
     project: Optional[str] = None,
     rules_file: Optional[list[str]] = None,
     verbose: int = 0,
+    warm_cache: Optional[WarmCache] = None,
 ) -> None:
     """Analyze AI agent conversations to identify drift patterns.
 
@@ -165,7 +225,9 @@ def analyze_command(
     documentation, workflows, and context.
 
     This function is called by the main CLI (drift command) and can also be used
-    programmatically.
+    programmatically. The drift daemon passes a warm_cache to reuse the loaded
+    configuration and analyzer across runs, and paths to only check the given
+    documents (and documents that depend on them).
 
     Examples
     --------
@@ -175,6 +237,9 @@ def analyze_command(
     # Output as JSON
     drift --format json
 
+    # Stream one JSON object per check and violation as they finish
+    drift --format ndjson
+
     # Analyze only incomplete_work and documentation_gap
     drift --types incomplete_work,documentation_gap
 
@@ -183,6 +248,12 @@ def analyze_command(
 
     # Use sonnet model for all analysis
     drift --model sonnet
+
+    # Only check documents affected by staged changes (pre-commit)
+    drift --staged
+
+    # Stop at the first failing check (CI gates)
+    drift --fail-fast --no-llm
     """
     # Setup colored logging based on verbosity
     setup_logging(verbose)
@@ -199,7 +270,12 @@ def analyze_command(
 
         # Load configuration
         try:
-            config = ConfigLoader.load_config(project_path, rules_files=rules_file)
+            if warm_cache is not None:
+                config = warm_cache.load_config(project_path, rules_files=rules_file)
+            else:
+                config = ConfigLoader.load_config(
+                    project_path, rules_files=rules_file, use_cache=True
+                )
         except ValueError as e:
             print_error(f"Configuration error: {e}")
             sys.exit(1)
@@ -207,6 +283,7 @@ def analyze_command(
         # Override cache settings if flags provided
         if no_cache:
             config.cache_enabled = False
+            config.url_cache.enabled = False
         if cache_dir:
             config.cache_dir = cache_dir
 
@@ -252,15 +329,40 @@ def analyze_command(
             sys.exit(1)
 
         # Validate output format
-        if format not in ["markdown", "json"]:
-            print_error(f"Error: Invalid format: {format}. Use 'markdown' or 'json'")
+        if format not in ["markdown", "json", "ndjson"]:
+            print_error(f"Error: Invalid format: {format}. Use 'markdown', 'json' or 'ndjson'")
             sys.exit(1)
+        # NDJSON records are printed as checks finish rather than at the end
+        stream = NdjsonFormatter() if format == "ndjson" else None
 
         # Validate scope
         if scope not in ["conversation", "project", "all"]:
             print_error(f"Error: Invalid scope: {scope}. Use 'conversation', 'project', or 'all'")
             sys.exit(1)
 
+        # Collect changed files for incremental document checks
+        changes = None
+        if sum([bool(changed_since), staged, paths is not None]) > 1:
+            print_error("Error: Only one of --changed-since, --staged or paths can be specified")
+            sys.exit(1)
+        if changed_since or staged or paths is not None:
+            if scope == "conversation":
+                print_error("Error: --changed-since and --staged require project or all scope")
+                sys.exit(1)
+            try:
+                if paths is not None:
+                    changes = ChangeSet(
+                        project_path, _project_relative_paths(project_path, paths), "given paths"
+                    )
+                elif staged:
+                    changes = ChangeSet.staged(project_path)
+                else:
+                    assert changed_since is not None
+                    changes = ChangeSet.since(project_path, changed_since)
+            except ValueError as e:
+                print_error(f"Error: Could not determine changed files: {e}")
+                sys.exit(1)
+
         # Filter LLM-based rules if --no-llm flag is set
         llm_skipped_rules = []
         if no_llm:
@@ -292,18 +394,7 @@ def analyze_command(
                 if rule_scope not in target_scopes:
                     continue
 
-                # Check if this is an LLM-based rule by inspecting phases
-                # A rule uses LLM if ANY phase has type="prompt"
-                phases = getattr(type_config, "phases", []) or []
-                validation_rules = getattr(type_config, "validation_rules", None)
-
-                # Rule uses LLM if any phase has type="prompt"
-                uses_llm = any(getattr(p, "type", "prompt") == "prompt" for p in phases)
-
-                # Rule is programmatic if it has validation_rules OR no phases use LLM
-                is_programmatic = validation_rules is not None or not uses_llm
-
-                if is_programmatic:
+                if is_programmatic_rule(type_config):
                     filtered_types.append(name)
                 else:
                     llm_skipped_rules.append(name)
@@ -323,20 +414,46 @@ def analyze_command(
             rule_names_list = filtered_types if filtered_types else []
 
         # Create analyzer
-        analyzer = DriftAnalyzer(config=config, project_path=project_path)
+        if warm_cache is not None:
+            analyzer = warm_cache.analyzer(config, project_path)
+        else:
+            analyzer = DriftAnalyzer(config=config, project_path=project_path)
 
         # Run analysis based on scope
         try:
-            if scope == "conversation":
+            if scope == "conversation" and stream is not None:
+                result = _stream_results(
+                    analyzer,
+                    stream,
+                    "conversation",
+                    agent_tool=agent_tool,
+                    rule_types=rule_names_list,
+                    model_override=model,
+                    fail_fast=fail_fast,
+                )
+            elif scope == "conversation":
                 result = analyzer.analyze(
                     agent_tool=agent_tool,
                     rule_types=rule_names_list,
                     model_override=model,
+                    fail_fast=fail_fast,
+                )
+            elif scope == "project" and stream is not None:
+                result = _stream_results(
+                    analyzer,
+                    stream,
+                    "project",
+                    rule_types=rule_names_list,
+                    model_override=model,
+                    changes=changes,
+                    fail_fast=fail_fast,
                 )
             elif scope == "project":
                 result = analyzer.analyze_documents(
                     rule_types=rule_names_list,
                     model_override=model,
+                    changes=changes,
+                    fail_fast=fail_fast,
                 )
             elif scope == "all":
                 # When --no-llm is used with scope=all, need to split filtered rules by scope
@@ -358,18 +475,48 @@ def analyze_command(
                         in ("document_level", "project_level")
                     ]
 
-                # Run both analyses
-                conv_result = analyzer.analyze(
-                    agent_tool=agent_tool,
-                    rule_types=conv_types_list,
-                    model_override=model,
-                )
-                doc_result = analyzer.analyze_documents(
-                    rule_types=doc_types_list,
-                    model_override=model,
-                )
-                # Merge results
-                result = _merge_results(conv_result, doc_result)
+                # Run both analyses, documents first: their checks are mostly
+                # programmatic, so --fail-fast can stop before any conversation
+                # is sent to a model
+                if stream is not None:
+                    doc_result = _stream_results(
+                        analyzer,
+                        stream,
+                        "project",
+                        rule_types=doc_types_list,
+                        model_override=model,
+                        changes=changes,
+                        fail_fast=fail_fast,
+                    )
+                else:
+                    doc_result = analyzer.analyze_documents(
+                        rule_types=doc_types_list,
+                        model_override=model,
+                        changes=changes,
+                        fail_fast=fail_fast,
+                    )
+                if "partial" in doc_result.metadata:
+                    result = doc_result
+                else:
+                    if stream is not None:
+                        conv_result = _stream_results(
+                            analyzer,
+                            stream,
+                            "conversation",
+                            agent_tool=agent_tool,
+                            rule_types=conv_types_list,
+                            model_override=model,
+                            fail_fast=fail_fast,
+                        )
+                    else:
+                        conv_result = analyzer.analyze(
+                            agent_tool=agent_tool,
+                            rule_types=conv_types_list,
+                            model_override=model,
+                            fail_fast=fail_fast,
+                        )
+                    # Merge results
+                    result = _merge_results(conv_result, doc_result)
 
             # Add LLM-skipped rules to metadata if --no-llm was used
             if no_llm and llm_skipped_rules:
@@ -415,15 +562,46 @@ def analyze_command(
                 print(f"{YELLOW}  {rule}{RESET}", file=sys.stderr)
             print("", file=sys.stderr)  # Blank line
 
+        # Tell that --fail-fast stopped the run early
+        partial = result.metadata.get("partial")
+        if partial:
+            print(
+                f"\n{RED}Stopped at the first failing rule ({partial['rule']}) because of "
+                f"--fail-fast; remaining checks were skipped{RESET}\n",
+                file=sys.stderr,
+            )
+
+        # Tell which rules could not be limited to the changed files
+        change_filter = result.metadata.get("change_filter")
+        if change_filter:
+            print(
+                f"\n{BLUE}Checked documents affected by {change_filter['description']} "
+                f"({len(change_filter['changed_files'])} changed file(s)){RESET}",
+                file=sys.stderr,
+            )
+            full_scope_rules = change_filter["full_scope_rules"]
+            if full_scope_rules:
+                print(
+                    f"{YELLOW}Ran {len(full_scope_rules)} project-wide rule(s) in full:{RESET}",
+                    file=sys.stderr,
+                )
+                for rule in sorted(full_scope_rules):
+                    print(f"{YELLOW}  {rule}{RESET}", file=sys.stderr)
+            print("", file=sys.stderr)  # Blank line
+
         # Format and output results
         formatter: OutputFormatter
-        if format == "markdown":
-            formatter = MarkdownFormatter(config=config)
+        if stream is not None:
+            # Execution and violation records were printed already
+            print(stream.format_summary(result))
         else:
-            formatter = JsonFormatter()
+            if format == "markdown":
+                formatter = MarkdownFormatter(config=config)
+            else:
+                formatter = JsonFormatter()
 
-        output = formatter.format(result)
-        print(output)
+            output = formatter.format(result)
+            print(output)
 
         # Exit with appropriate code
         # Exit code 0: No rules found (clean)
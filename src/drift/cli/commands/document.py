@@ -352,7 +352,7 @@ def document_command(
 
         # Load configuration
         try:
-            config = ConfigLoader.load_config(project_path, rules_files=rules_file)
+            config = ConfigLoader.load_config(project_path, rules_files=rules_file, use_cache=True)
         except ValueError as e:
             print_error(f"Configuration error: {e}")
             sys.exit(1)
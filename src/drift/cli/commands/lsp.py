@@ -0,0 +1,41 @@
+"""LSP command for drift CLI.
+
+Runs a language server on stdin/stdout that publishes drift violations as
+diagnostics for the Markdown, JSON and YAML files open in an editor, checking
+unsaved buffers as they are typed.
+"""
+
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from drift.cli.logging_config import setup_logging
+from drift.daemon.lsp import LanguageServer
+
+
+def lsp_command(
+    project: Optional[str] = None,
+    rules_file: Optional[List[str]] = None,
+    llm: bool = False,
+    verbose: int = 0,
+) -> None:
+    """Run the drift language server until the editor exits it.
+
+    -- project: Project to check if the editor names no workspace root
+    -- rules_file: Optional list of rules file paths/URLs
+    -- llm: Also run rules that need an LLM (only programmatic ones by default)
+    -- verbose: Verbosity level (0=WARNING, 1=INFO, 2=DEBUG)
+    """
+    # stdout carries the protocol; anything printed goes to the editor's log
+    writer = sys.stdout.buffer
+    sys.stdout = sys.stderr
+    setup_logging(verbose)
+
+    server = LanguageServer(
+        sys.stdin.buffer,
+        writer,
+        project_path=Path(project) if project else None,
+        rules_files=rules_file,
+        allow_llm=llm,
+    )
+    sys.exit(server.serve())
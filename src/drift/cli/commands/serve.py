@@ -0,0 +1,67 @@
+"""Serve command for drift CLI.
+
+Runs the drift daemon in the foreground. While it runs, the drift command
+forwards analysis runs to it, skipping configuration loading and analyzer
+setup that the daemon keeps warm per project.
+"""
+
+import logging
+import sys
+from pathlib import Path
+from typing import Optional
+
+from drift.cli.logging_config import setup_logging
+from drift.cli.utils import print_error, print_success
+from drift.daemon.client import (
+    DaemonError,
+    DaemonUnavailable,
+    daemon_supported,
+    default_socket_path,
+    send_request,
+)
+from drift.daemon.server import run_server
+
+logger = logging.getLogger(__name__)
+
+
+def serve_command(
+    socket_path: Optional[str] = None,
+    stop: bool = False,
+    verbose: int = 0,
+) -> None:
+    """Run the drift daemon, or stop a running one.
+
+    -- socket_path: Socket to listen on (defaults to $DRIFT_SOCKET, then
+       $XDG_RUNTIME_DIR/drift.sock, then ~/.drift/drift.sock)
+    -- stop: Ask the daemon listening on the socket to shut down instead
+    -- verbose: Verbosity level (0=WARNING, 1=INFO, 2=DEBUG)
+    """
+    setup_logging(verbose)
+
+    if not daemon_supported():
+        print_error("Error: drift serve needs Unix domain sockets, which this platform lacks")
+        sys.exit(1)
+
+    path = Path(socket_path).expanduser() if socket_path else default_socket_path()
+
+    if stop:
+        try:
+            send_request("shutdown", socket_path=path)
+        except DaemonUnavailable:
+            print_error(f"Error: No drift daemon is listening on {path}")
+            sys.exit(1)
+        except (OSError, DaemonError) as e:
+            print_error(f"Error: Could not stop the drift daemon: {e}")
+            sys.exit(1)
+        print_success(f"Stopped the drift daemon on {path}")
+        sys.exit(0)
+
+    try:
+        print(f"drift daemon listening on {path} (stop with Ctrl-C)", file=sys.stderr)
+        run_server(path, verbose)
+    except KeyboardInterrupt:
+        print("\ndrift daemon stopped", file=sys.stderr)
+    except (RuntimeError, OSError) as e:
+        print_error(f"Error: {e}")
+        sys.exit(1)
+    sys.exit(0)
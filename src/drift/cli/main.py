@@ -1,11 +1,40 @@
 """Main CLI application for drift."""
 
 import argparse
-from importlib.metadata import version
+import sys
+from typing import Any, Dict, NoReturn, Optional, Sequence, Union
 
-from drift.cli.commands import analyze, document, draft, list
+from drift.daemon.client import forward_analyze
 
-__version__ = version("ai-drift")
+# Command modules are imported when their command runs, and the package
+# version is only looked up for --version, so that startup stays fast
+
+
+class _VersionAction(argparse.Action):
+    """Print the installed drift version and exit, looking it up only when asked."""
+
+    def __init__(
+        self,
+        option_strings: Sequence[str],
+        dest: str = argparse.SUPPRESS,
+        default: str = argparse.SUPPRESS,
+        help: Optional[str] = None,
+    ) -> None:
+        """Initialize a flag that takes no argument."""
+        super().__init__(option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Union[str, Sequence[Any], None],
+        option_string: Optional[str] = None,
+    ) -> NoReturn:
+        """Print the version and exit."""
+        from importlib.metadata import version
+
+        sys.stdout.write(f"drift version {version('ai-drift')}\n")
+        parser.exit()
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -38,12 +67,21 @@ Examples:
   # Use sonnet model for all analysis
   drift --model sonnet
 
+  # Stop at the first failing check (CI gates)
+  drift --fail-fast --no-llm
+
   # Use custom rules file (ignores .drift.yaml/.drift_rules.yaml rules)
   drift --rules-file custom_rules.yaml
 
   # Use multiple rules files (later files override earlier ones)
   drift --rules-file base_rules.yaml --rules-file extra_rules.yaml
 
+  # Pre-commit hook: only check documents affected by staged changes
+  drift --staged --no-llm
+
+  # Pull request check: only check documents affected since the base branch
+  drift --changed-since origin/main
+
   # Use remote rules file for isolated testing
   drift --rules-file https://example.com/drift-rules.yaml
 
@@ -60,14 +98,20 @@ Examples:
   # List command - list available rules
   drift list
   drift list --format json
+
+  # Serve command - keep a warm daemon that drift runs are forwarded to
+  drift serve
+  drift serve --stop
+
+  # LSP command - editor diagnostics for open documents, as they are typed
+  drift lsp
         """,
     )
 
     # Global arguments (available to all commands)
     parser.add_argument(
         "--version",
-        action="version",
-        version=f"drift version {__version__}",
+        action=_VersionAction,
         help="Show version and exit",
     )
 
@@ -94,7 +138,7 @@ Examples:
         "--format",
         "-f",
         default="markdown",
-        help="Output format (markdown or json)",
+        help="Output format (markdown, json or ndjson)",
     )
 
     parser.add_argument(
@@ -169,6 +213,46 @@ Examples:
         description="List all available rules from configuration",
     )
 
+    # Serve subcommand
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run a warm drift daemon that analysis runs are forwarded to",
+        description=(
+            "Keep configuration and analyzers loaded per project and answer JSON-RPC "
+            "requests (analyze, analyze-paths, invalidate, shutdown) on a Unix socket"
+        ),
+    )
+    serve_parser.add_argument(
+        "--socket",
+        dest="socket_path",
+        default=None,
+        help=(
+            "Socket path (default: $DRIFT_SOCKET, $XDG_RUNTIME_DIR/drift.sock "
+            "or ~/.drift/drift.sock)"
+        ),
+    )
+    serve_parser.add_argument(
+        "--stop",
+        action="store_true",
+        help="Stop the daemon listening on the socket",
+    )
+
+    # LSP subcommand
+    lsp_parser = subparsers.add_parser(
+        "lsp",
+        help="Run a language server publishing drift violations as editor diagnostics",
+        description=(
+            "Check open Markdown, JSON and YAML files, including unsaved edits, "
+            "and publish violations as diagnostics over the Language Server Protocol "
+            "on stdin/stdout"
+        ),
+    )
+    lsp_parser.add_argument(
+        "--llm",
+        action="store_true",
+        help="Also run rules that need an LLM (only programmatic rules run by default)",
+    )
+
     # Analyze command arguments (default command - no explicit subcommand)
     parser.add_argument(
         "--scope",
@@ -228,7 +312,7 @@ Examples:
     parser.add_argument(
         "--no-cache",
         action="store_true",
-        help="Disable LLM response caching",
+        help="Disable LLM response and external URL status caching",
     )
 
     parser.add_argument(
@@ -243,6 +327,40 @@ Examples:
         help="Disable parallel execution of validation rules",
     )
 
+    change_group = parser.add_mutually_exclusive_group()
+    change_group.add_argument(
+        "--changed-since",
+        default=None,
+        metavar="REF",
+        help=(
+            "Only check documents changed since the merge base of REF and HEAD, "
+            "plus documents that depend on them (project-wide rules still run in full)"
+        ),
+    )
+    change_group.add_argument(
+        "--staged",
+        action="store_true",
+        help=(
+            "Only check staged documents (using their staged content) and documents "
+            "that depend on them (project-wide rules still run in full)"
+        ),
+    )
+
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help=(
+            "Stop at the first violation of a fail-severity rule, checking programmatic "
+            "rules first, and report the partial results"
+        ),
+    )
+
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Run in this process even if a drift daemon (drift serve) is running",
+    )
+
     return parser
 
 
@@ -256,6 +374,8 @@ def main() -> None:
 
     # Handle subcommands
     if args.command == "draft":
+        from drift.cli.commands import draft
+
         # Call draft command - uses global args: project, rules_file, format, verbose
         draft.draft_command(
             rule=args.draft_rule,
@@ -267,6 +387,8 @@ def main() -> None:
             verbose=args.verbose,
         )
     elif args.command == "document":
+        from drift.cli.commands import document
+
         # Call document command - uses global args: project, rules_file, format, verbose
         document.document_command(
             rules=args.rules,
@@ -278,6 +400,8 @@ def main() -> None:
             verbose=args.verbose,
         )
     elif args.command == "list":
+        from drift.cli.commands import list
+
         # Call list command - uses global args: project, rules_file, format, verbose
         list.list_command(
             format_type=args.format,
@@ -285,10 +409,27 @@ def main() -> None:
             rules_file=args.rules_file,
             verbose=args.verbose,
         )
+    elif args.command == "lsp":
+        from drift.cli.commands import lsp
+
+        lsp.lsp_command(
+            project=args.project,
+            rules_file=args.rules_file,
+            llm=args.llm,
+            verbose=args.verbose,
+        )
+    elif args.command == "serve":
+        from drift.cli.commands import serve
+
+        serve.serve_command(
+            socket_path=args.socket_path,
+            stop=args.stop,
+            verbose=args.verbose,
+        )
     else:
         # Default to analyze command for backward compatibility
         # Uses global args: project, rules_file, format, verbose
-        analyze.analyze_command(
+        options: Dict[str, Any] = dict(
             format=args.format,
             scope=args.scope,
             agent_tool=args.agent_tool,
@@ -301,10 +442,23 @@ def main() -> None:
             no_cache=args.no_cache,
             cache_dir=args.cache_dir,
             no_parallel=args.no_parallel,
+            changed_since=args.changed_since,
+            staged=args.staged,
+            fail_fast=args.fail_fast,
             project=args.project,
             rules_file=args.rules_file,
             verbose=args.verbose,
         )
+        # Forward to a running daemon, which has everything loaded already. The
+        # daemon answers once the run is done, so streamed output runs locally.
+        if not args.no_daemon and args.format != "ndjson":
+            exit_code = forward_analyze(options)
+            if exit_code is not None:
+                sys.exit(exit_code)
+
+        from drift.cli.commands import analyze
+
+        analyze.analyze_command(**options)
 
 
 if __name__ == "__main__":
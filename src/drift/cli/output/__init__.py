@@ -3,5 +3,6 @@
 from drift.cli.output.formatter import OutputFormatter
 from drift.cli.output.json import JsonFormatter
 from drift.cli.output.markdown import MarkdownFormatter
+from drift.cli.output.ndjson import NdjsonFormatter
 
-__all__ = ["OutputFormatter", "MarkdownFormatter", "JsonFormatter"]
+__all__ = ["OutputFormatter", "MarkdownFormatter", "JsonFormatter", "NdjsonFormatter"]
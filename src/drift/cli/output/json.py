@@ -4,7 +4,7 @@ import json
 from typing import Any, Dict
 
 from drift.cli.output.formatter import OutputFormatter
-from drift.core.types import CompleteAnalysisResult
+from drift.core.types import CompleteAnalysisResult, Rule
 
 
 class JsonFormatter(OutputFormatter):
@@ -48,6 +48,10 @@ class JsonFormatter(OutputFormatter):
             },
             "results": [],
         }
+        # Stopped early by --fail-fast: the results only cover the checks that ran
+        metadata = output.get("metadata")
+        if "partial" in result.metadata and isinstance(metadata, dict):
+            metadata["partial"] = result.metadata["partial"]
 
         # Add conversation results
         for analysis_result in result.results:
@@ -65,32 +69,10 @@ class JsonFormatter(OutputFormatter):
             }
 
             # Add rules
-            for learning in analysis_result.rules:
-                learning_data: Dict[str, Any] = {
-                    "turn_number": learning.turn_number,
-                    "turn_uuid": learning.turn_uuid,
-                    "agent_tool": learning.agent_tool,
-                    "conversation_file": learning.conversation_file,
-                    "observed_behavior": learning.observed_behavior,
-                    "expected_behavior": learning.expected_behavior,
-                    "rule_type": learning.rule_type,
-                    "workflow_element": learning.workflow_element.value,
-                    "turns_to_resolve": learning.turns_to_resolve,
-                    "turns_involved": learning.turns_involved,
-                    "context": learning.context,
-                }
-
-                # Add optional document-specific fields
-                if hasattr(learning, "affected_files") and learning.affected_files:
-                    learning_data["affected_files"] = learning.affected_files
-                if hasattr(learning, "bundle_id") and learning.bundle_id:
-                    learning_data["bundle_id"] = learning.bundle_id
-                if hasattr(learning, "phase_name") and learning.phase_name:
-                    learning_data["phase_name"] = learning.phase_name
-
-                learnings_list = conversation_data.get("rules")
-                if isinstance(learnings_list, list):
-                    learnings_list.append(learning_data)
+            learnings_list = conversation_data.get("rules")
+            if isinstance(learnings_list, list):
+                for learning in analysis_result.rules:
+                    learnings_list.append(self.rule_data(learning))
 
             results_list = output.get("results")
             if isinstance(results_list, list):
@@ -98,3 +80,36 @@ class JsonFormatter(OutputFormatter):
 
         # Convert to JSON with nice formatting
         return json.dumps(output, indent=2, sort_keys=False, ensure_ascii=False)
+
+    @staticmethod
+    def rule_data(learning: Rule) -> Dict[str, Any]:
+        """Build the JSON object for a rule violation.
+
+        Args:
+            learning: Rule violation to convert
+
+        Returns:
+            JSON-serializable dict
+        """
+        learning_data: Dict[str, Any] = {
+            "turn_number": learning.turn_number,
+            "turn_uuid": learning.turn_uuid,
+            "agent_tool": learning.agent_tool,
+            "conversation_file": learning.conversation_file,
+            "observed_behavior": learning.observed_behavior,
+            "expected_behavior": learning.expected_behavior,
+            "rule_type": learning.rule_type,
+            "workflow_element": learning.workflow_element.value,
+            "turns_to_resolve": learning.turns_to_resolve,
+            "turns_involved": learning.turns_involved,
+            "context": learning.context,
+        }
+
+        # Add optional document-specific fields
+        if hasattr(learning, "affected_files") and learning.affected_files:
+            learning_data["affected_files"] = learning.affected_files
+        if hasattr(learning, "bundle_id") and learning.bundle_id:
+            learning_data["bundle_id"] = learning.bundle_id
+        if hasattr(learning, "phase_name") and learning.phase_name:
+            learning_data["phase_name"] = learning.phase_name
+        return learning_data
@@ -109,6 +109,15 @@ class MarkdownFormatter(OutputFormatter):
         lines.append("# Drift Analysis Results")
         lines.append("")
 
+        partial = result.metadata.get("partial")
+        if partial:
+            notice = (
+                f"**Partial results:** stopped at the first failing rule "
+                f"({partial.get('rule')}) because of --fail-fast"
+            )
+            lines.append(self._colorize(notice, self.RED))
+            lines.append("")
+
         # Summary section
         lines.append("## Summary")
         lines.append(f"- Total conversations: {result.summary.total_conversations}")
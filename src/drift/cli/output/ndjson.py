@@ -0,0 +1,100 @@
+"""Newline-delimited JSON output formatter for drift analysis results.
+
+Each line is one JSON object with a "type" member:
+
+- "execution": a rule check finished (its execution detail)
+- "violation": a rule violation (same fields as in the JSON format)
+- "summary": the run's summary and metadata, always the last line
+
+With DriftAnalyzer.iter_results() the records can be written as checks
+finish instead of after the whole run.
+"""
+
+import json
+from typing import Any, Dict, List
+
+from drift.cli.output.formatter import OutputFormatter
+from drift.cli.output.json import JsonFormatter
+from drift.core.types import AnalysisEvent, AnalysisEventKind, CompleteAnalysisResult
+
+# Metadata that is streamed as records rather than repeated in the summary
+_STREAMED_METADATA = ("execution_details", "document_rules")
+
+
+class NdjsonFormatter(OutputFormatter):
+    """Formats drift analysis results as one JSON object per line."""
+
+    def get_format_name(self) -> str:
+        """Get the name of this format.
+
+        Returns:
+            Format name
+        """
+        return "ndjson"
+
+    def format(self, result: CompleteAnalysisResult) -> str:
+        """Format a finished analysis as execution, violation and summary records.
+
+        Args:
+            result: Complete analysis result to format
+
+        Returns:
+            One JSON object per line
+        """
+        lines: List[str] = [
+            self._dumps({"type": AnalysisEventKind.EXECUTION.value, **detail})
+            for detail in result.metadata.get("execution_details", [])
+        ]
+        for analysis_result in result.results:
+            for learning in analysis_result.rules:
+                lines.append(self._violation(learning))
+        lines.append(self.format_summary(result))
+        return "\n".join(lines)
+
+    def format_event(self, event: AnalysisEvent) -> str:
+        """Format one streamed record.
+
+        Args:
+            event: Event from DriftAnalyzer.iter_results()
+
+        Returns:
+            A single line of JSON
+        """
+        if event.kind == AnalysisEventKind.EXECUTION:
+            return self._dumps({"type": event.kind.value, **(event.execution or {})})
+        if event.kind == AnalysisEventKind.VIOLATION:
+            assert event.rule is not None
+            return self._violation(event.rule)
+        assert event.result is not None
+        return self.format_summary(event.result)
+
+    def format_summary(self, result: CompleteAnalysisResult) -> str:
+        """Format the closing summary record of a run.
+
+        Args:
+            result: Result holding the run's summary and metadata
+
+        Returns:
+            A single line of JSON
+        """
+        metadata = {
+            key: value for key, value in result.metadata.items() if key not in _STREAMED_METADATA
+        }
+        return self._dumps(
+            {
+                "type": AnalysisEventKind.SUMMARY.value,
+                **result.summary.model_dump(mode="json"),
+                "metadata": metadata,
+            }
+        )
+
+    def _violation(self, learning: Any) -> str:
+        """Format a violation record."""
+        return self._dumps(
+            {"type": AnalysisEventKind.VIOLATION.value, **JsonFormatter.rule_data(learning)}
+        )
+
+    @staticmethod
+    def _dumps(record: Dict[str, Any]) -> str:
+        """Serialize a record to one line of JSON."""
+        return json.dumps(record, ensure_ascii=False, default=str)
@@ -0,0 +1,230 @@
+"""On-disk cache of merged and validated configurations.
+
+ConfigLoader.load_config() reads the global config, the project config and
+every rules file, deep-merges them and validates the result on each run. For
+large shared rule packs that costs far more than the check itself, so the
+result is stored as JSON next to a fingerprint of everything it was built
+from: the drift version and the mtime, size and content hash of each
+contributing file. A hit is a few stat() calls and one
+DriftConfig.model_validate_json().
+
+Configurations that include remote rules files are never cached here.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, List, Optional, Sequence
+
+from drift.config.models import DriftConfig
+
+logger = logging.getLogger(__name__)
+
+# Environment variable overriding the cache directory
+CACHE_DIR_ENV_VAR = "DRIFT_CONFIG_CACHE_DIR"
+
+# Environment variable that disables the cache when set to 0/false/no/off
+CACHE_ENABLED_ENV_VAR = "DRIFT_CONFIG_CACHE"
+
+# Bumped whenever the entry layout changes
+CACHE_FORMAT = 1
+
+# Modules whose code shapes the loaded config, fingerprinted along with the
+# drift version so editable installs do not reuse stale entries
+_CODE_SOURCES = [
+    Path(__file__).with_name("defaults.py"),
+    Path(__file__).with_name("loader.py"),
+    Path(__file__).with_name("models.py"),
+]
+
+
+def default_cache_dir() -> Path:
+    """Get the directory configuration cache entries are stored in.
+
+    Returns $DRIFT_CONFIG_CACHE_DIR if set, else drift/config under
+    $XDG_CACHE_HOME (or ~/.cache).
+    """
+    configured = os.environ.get(CACHE_DIR_ENV_VAR)
+    if configured:
+        return Path(configured).expanduser()
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "drift" / "config"
+
+
+def cache_enabled() -> bool:
+    """Check whether $DRIFT_CONFIG_CACHE leaves the configuration cache on."""
+    value = os.environ.get(CACHE_ENABLED_ENV_VAR, "")
+    return value.strip().lower() not in ("0", "false", "no", "off")
+
+
+def _drift_version() -> str:
+    """Get the installed drift version, or "unknown" when running from a checkout."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("ai-drift")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _hash_file(path: Path) -> str:
+    """Hash a file's content with SHA-256.
+
+    -- path: File to hash
+    """
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _fingerprint(path: Path) -> Optional[List[Any]]:
+    """Fingerprint a source file as [mtime_ns, size, sha256].
+
+    -- path: Source file
+
+    Returns None if the file does not exist.
+    """
+    try:
+        stat = path.stat()
+        return [stat.st_mtime_ns, stat.st_size, _hash_file(path)]
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _is_unchanged(path: Path, fingerprint: Optional[List[Any]]) -> bool:
+    """Check a source file against its stored fingerprint.
+
+    The content is only hashed when mtime or size differ, so touching a file
+    without editing it still hits.
+
+    -- path: Source file
+    -- fingerprint: Stored [mtime_ns, size, sha256], or None if it did not exist
+    """
+    try:
+        stat = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return fingerprint is None
+    if fingerprint is None:
+        return False
+    if [stat.st_mtime_ns, stat.st_size] == fingerprint[:2]:
+        return True
+    try:
+        return bool(_hash_file(path) == fingerprint[2])
+    except OSError:
+        return False
+
+
+class ConfigCache:
+    """Stores merged configurations keyed by project and rules files.
+
+    Each (project, rules files) pair has one JSON entry holding the drift
+    version, a fingerprint of every source file and the serialized config.
+    Cache problems are logged and treated as misses; they never fail a run.
+
+    -- cache_dir: Directory for cache entries (defaults to default_cache_dir())
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize the cache.
+
+        -- cache_dir: Directory for cache entries (defaults to default_cache_dir())
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+
+    @staticmethod
+    def _key(project_path: Path, rules_files: Optional[Sequence[str]]) -> str:
+        """Build the entry name for a project and its CLI rules files.
+
+        Relative rules file paths resolve against the working directory, so
+        they are resolved here as well.
+
+        -- project_path: Project directory
+        -- rules_files: Rules file paths/URLs from the CLI
+        """
+        resolved = [
+            source if "://" in source else str(Path(source).expanduser().resolve())
+            for source in rules_files or []
+        ]
+        identity = json.dumps([str(project_path.resolve()), resolved, str(Path.home())])
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, project_path: Path, rules_files: Optional[Sequence[str]]) -> Path:
+        """Get the entry file for a project and its CLI rules files.
+
+        -- project_path: Project directory
+        -- rules_files: Rules file paths/URLs from the CLI
+        """
+        return self.cache_dir / f"{self._key(project_path, rules_files)}.json"
+
+    def get(
+        self, project_path: Path, rules_files: Optional[Sequence[str]] = None
+    ) -> Optional[DriftConfig]:
+        """Get the cached configuration if none of its sources changed.
+
+        -- project_path: Project directory
+        -- rules_files: Rules file paths/URLs from the CLI
+
+        Returns the configuration, or None on a miss.
+        """
+        entry_path = self._entry_path(project_path, rules_files)
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            if entry.get("format") != CACHE_FORMAT or entry.get("version") != _drift_version():
+                return None
+            for source, fingerprint in entry["sources"].items():
+                if not _is_unchanged(Path(source), fingerprint):
+                    logger.debug(f"Config cache miss: {source} changed")
+                    return None
+            return DriftConfig.model_validate_json(entry["config"])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable config cache entry {entry_path}: {e}")
+            return None
+
+    def set(
+        self,
+        project_path: Path,
+        rules_files: Optional[Sequence[str]],
+        config: DriftConfig,
+        sources: Sequence[Path],
+    ) -> None:
+        """Store a configuration with the fingerprints of its sources.
+
+        -- project_path: Project directory
+        -- rules_files: Rules file paths/URLs from the CLI
+        -- config: Merged and validated configuration
+        -- sources: Local files the configuration was loaded from
+        """
+        entry_path = self._entry_path(project_path, rules_files)
+        try:
+            entry = {
+                "format": CACHE_FORMAT,
+                "version": _drift_version(),
+                "sources": {
+                    str(source): _fingerprint(source) for source in [*sources, *_CODE_SOURCES]
+                },
+                "config": config.model_dump_json(),
+            }
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, entry_path)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Failed to write config cache entry {entry_path}: {e}")
+
+    def clear(self) -> int:
+        """Remove all cache entries.
+
+        Returns the number of entries removed.
+        """
+        removed = 0
+        for entry_path in self.cache_dir.glob("*.json"):
+            try:
+                entry_path.unlink()
+                removed += 1
+            except OSError as e:
+                logger.debug(f"Failed to remove config cache entry {entry_path}: {e}")
+        return removed
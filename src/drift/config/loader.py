@@ -1,14 +1,14 @@
 """Configuration loading and merging logic."""
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Union
 from urllib.parse import urlparse
 
-import requests
 import yaml
 
 from drift.config.defaults import get_default_config
-from drift.config.models import DriftConfig
+from drift.config.models import DriftConfig, RemoteRulesConfig
+from drift.config.remote import RemoteRulesFetcher
 
 
 class ConfigLoader:
@@ -53,31 +53,49 @@ class ConfigLoader:
         return parsed.scheme in ("http", "https")
 
     @classmethod
-    def _load_remote_rules(cls, url: str) -> Dict[str, Any]:
+    def _load_remote_rules(cls, url: str, text: Optional[str] = None) -> Dict[str, Any]:
         """Load rules from remote HTTP(S) URL.
 
         -- url: Remote URL to fetch rules from
+        -- text: Content already fetched by _fetch_remote_rules(), if any
 
         Returns parsed YAML content from remote file.
 
         Raises ValueError if request fails or YAML is invalid.
         """
-        try:
-            response = requests.get(url, timeout=cls.RULES_FETCH_TIMEOUT)
-            response.raise_for_status()
-        except requests.exceptions.Timeout:
-            raise ValueError(
-                f"Timeout fetching rules from {url} (timeout: {cls.RULES_FETCH_TIMEOUT}s)"
-            )
-        except requests.exceptions.RequestException as e:
-            raise ValueError(f"Error fetching rules from {url}: {e}")
+        if text is None:
+            with RemoteRulesFetcher(cls.RULES_FETCH_TIMEOUT) as fetcher:
+                text = fetcher.fetch(url)
 
         try:
-            content = yaml.safe_load(response.text)
+            content = yaml.safe_load(text)
             return content if content is not None else {}
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in remote rules file {url}: {e}")
 
+    @classmethod
+    def _fetch_remote_rules(
+        cls, sources: List[str], merged: Dict[str, Any]
+    ) -> Dict[str, Union[str, ValueError]]:
+        """Fetch the remote ones of a list of rules files concurrently.
+
+        -- sources: Rules file paths/URLs
+        -- merged: Merged config dict holding the remote_rules settings
+
+        Returns each remote URL's text, or the ValueError fetching it raised.
+        """
+        urls = [source for source in sources if cls._is_remote_url(source)]
+        if not urls:
+            return {}
+
+        try:
+            settings = RemoteRulesConfig.model_validate(merged.get("remote_rules") or {})
+        except Exception as e:
+            raise ValueError(f"Invalid configuration: {e}")
+
+        with RemoteRulesFetcher(cls.RULES_FETCH_TIMEOUT, settings) as fetcher:
+            return fetcher.fetch_many(urls)
+
     @classmethod
     def _process_rules_file_content(cls, content: Dict[str, Any]) -> Dict[str, Any]:
         """Process rules file content, handling top-level group_name.
@@ -104,17 +122,23 @@ class ConfigLoader:
         return content
 
     @classmethod
-    def _load_rules_file(cls, source: str) -> Dict[str, Any]:
+    def _load_rules_file(
+        cls, source: str, remote: Optional[Mapping[str, Union[str, ValueError]]] = None
+    ) -> Dict[str, Any]:
         """Load rules from file or URL.
 
         -- source: Local file path or HTTP(S) URL
+        -- remote: Results of _fetch_remote_rules() to use instead of fetching again
 
         Returns parsed rules dictionary.
 
         Raises ValueError if source doesn't exist or has invalid YAML.
         """
         if cls._is_remote_url(source):
-            content = cls._load_remote_rules(source)
+            fetched = remote.get(source) if remote else None
+            if isinstance(fetched, ValueError):
+                raise fetched
+            content = cls._load_remote_rules(source, fetched)
             return cls._process_rules_file_content(content)
 
         # Local file
@@ -269,9 +293,56 @@ class ConfigLoader:
 
         return config_path
 
+    @classmethod
+    def config_sources(
+        cls,
+        project_path: Path,
+        rules_files: Optional[List[str]] = None,
+        config: Optional[DriftConfig] = None,
+    ) -> List[Path]:
+        """List the local files load_config() reads (or would read if they existed).
+
+        Remote rules files are not included.
+
+        -- project_path: Path to project directory
+        -- rules_files: Optional list of rules file paths/URLs from CLI
+        -- config: The loaded config, to include its additional_rules_files
+
+        Returns absolute paths of every local config and rules file source.
+        """
+        project_path = project_path.resolve()
+        sources = list(cls.GLOBAL_CONFIG_PATHS)
+        sources.append(project_path / cls.PROJECT_CONFIG_NAME)
+
+        if rules_files:
+            # CLI rules files are relative to the working directory
+            for source in rules_files:
+                if not cls._is_remote_url(source):
+                    sources.append(Path(source).expanduser().resolve())
+        else:
+            sources.append(project_path / cls.DEFAULT_RULES_FILE)
+            # Additional rules files are relative to the project
+            for source in config.additional_rules_files if config else []:
+                if not cls._is_remote_url(source):
+                    sources.append((project_path / source).resolve())
+        return sources
+
+    @classmethod
+    def _has_remote_rules(cls, config: DriftConfig, rules_files: Optional[List[str]]) -> bool:
+        """Check whether a loaded config includes rules fetched over HTTP(S).
+
+        -- config: The loaded config
+        -- rules_files: Optional list of rules file paths/URLs from CLI
+        """
+        sources = rules_files if rules_files else config.additional_rules_files
+        return any(cls._is_remote_url(source) for source in sources)
+
     @classmethod
     def load_config(
-        cls, project_path: Optional[Path] = None, rules_files: Optional[List[str]] = None
+        cls,
+        project_path: Optional[Path] = None,
+        rules_files: Optional[List[str]] = None,
+        use_cache: bool = False,
     ) -> DriftConfig:
         """Load complete configuration with proper merging.
 
@@ -289,12 +360,43 @@ class ConfigLoader:
 
         -- project_path: Path to project directory (defaults to current directory)
         -- rules_files: Optional list of rules file paths/URLs from CLI
+        -- use_cache: Reuse the result of an earlier load from the on-disk config
+           cache while none of its source files changed (see drift.config.cache)
 
         Returns merged and validated DriftConfig.
         """
         if project_path is None:
             project_path = Path.cwd()
 
+        if use_cache:
+            from drift.config.cache import ConfigCache, cache_enabled
+
+            if cache_enabled():
+                cache = ConfigCache()
+                cached = cache.get(project_path, rules_files)
+                if cached is not None:
+                    return cached
+                config = cls._load_config(project_path, rules_files)
+                if not cls._has_remote_rules(config, rules_files):
+                    cache.set(
+                        project_path,
+                        rules_files,
+                        config,
+                        cls.config_sources(project_path, rules_files, config),
+                    )
+                return config
+
+        return cls._load_config(project_path, rules_files)
+
+    @classmethod
+    def _load_config(cls, project_path: Path, rules_files: Optional[List[str]]) -> DriftConfig:
+        """Read, merge and validate the configuration for load_config().
+
+        -- project_path: Path to project directory
+        -- rules_files: Optional list of rules file paths/URLs from CLI
+
+        Returns merged and validated DriftConfig.
+        """
         # Start with default config
         default_dict = cls._config_to_dict(get_default_config())
 
@@ -313,11 +415,16 @@ class ConfigLoader:
         # Load rules with priority order
         rules_dict: Dict[str, Any] = {}
 
+        # Fetch remote rules files up front, all at once
+        remote = cls._fetch_remote_rules(
+            rules_files or merged.get("additional_rules_files") or [], merged
+        )
+
         if rules_files:
             # CLI rules files provided - use ONLY these (ignore defaults)
             for rules_file in rules_files:
                 try:
-                    file_rules = cls._load_rules_file(rules_file)
+                    file_rules = cls._load_rules_file(rules_file, remote)
                     rules_dict = cls._merge_rules(rules_dict, file_rules, default_group_name)
                 except ValueError as e:
                     raise ValueError(f"Error loading rules file '{rules_file}': {e}")
@@ -350,7 +457,7 @@ class ConfigLoader:
                         else:
                             full_path = rules_file_path
 
-                        file_rules = cls._load_rules_file(full_path)
+                        file_rules = cls._load_rules_file(full_path, remote)
                         rules_dict = cls._merge_rules(rules_dict, file_rules, default_group_name)
                     except ValueError as e:
                         raise ValueError(
@@ -385,6 +385,86 @@ class ParallelExecutionConfig(BaseModel):
     """Configuration for parallel rule execution."""
 
     enabled: bool = Field(True, description="Enable parallel execution of validation rules")
+    max_conversations: int = Field(
+        default=4,
+        ge=1,
+        description="Conversations analyzed at once when enabled, so their LLM calls overlap",
+    )
+
+
+class UrlCacheConfig(BaseModel):
+    """Configuration for the persistent external URL status cache."""
+
+    enabled: bool = Field(True, description="Reuse external URL check results across runs")
+    path: str = Field(".drift/cache/url_status.json", description="File storing URL check results")
+    ttl: Dict[str, int] = Field(
+        default_factory=dict,
+        description=(
+            "TTL in seconds per status class (2xx, 3xx, 4xx, 5xx, error). "
+            "Defaults: 7 days for 2xx, 1 day for 3xx, 1 hour otherwise."
+        ),
+    )
+
+    @field_validator("ttl")
+    @classmethod
+    def validate_ttl(cls, v: Dict[str, int]) -> Dict[str, int]:
+        """Validate TTL keys are status classes and values are non-negative."""
+        valid_classes = ("2xx", "3xx", "4xx", "5xx", "error")
+        for status_class, seconds in v.items():
+            if status_class not in valid_classes:
+                raise ValueError(
+                    f"Unknown status class '{status_class}'. "
+                    f"Must be one of: {', '.join(valid_classes)}"
+                )
+            if seconds < 0:
+                raise ValueError(f"TTL for {status_class} must not be negative")
+        return v
+
+
+class RemoteRulesConfig(BaseModel):
+    """Configuration for fetching and caching remote rules files."""
+
+    cache_enabled: bool = Field(
+        True, description="Store fetched rules files on disk and revalidate them"
+    )
+    max_age: int = Field(
+        300, description="Seconds a cached rules file is used without contacting the server"
+    )
+    stale_if_error: int = Field(
+        604800,
+        description=(
+            "Seconds past max_age a cached rules file is still used when the server "
+            "cannot be reached or answers with an error (default: 7 days, 0 disables)"
+        ),
+    )
+
+    @field_validator("max_age", "stale_if_error")
+    @classmethod
+    def validate_non_negative(cls, v: int) -> int:
+        """Validate durations are not negative."""
+        if v < 0:
+            raise ValueError("must not be negative")
+        return v
+
+
+class DiscoveryBackend(str, Enum):
+    """How bundle discovery enumerates candidate files."""
+
+    FILESYSTEM = "filesystem"  # Walk directories with os.scandir
+    GIT = "git"  # List files from the git index, walking outside git repositories
+
+
+class DiscoveryConfig(BaseModel):
+    """Configuration for document bundle file discovery."""
+
+    respect_gitignore: bool = Field(
+        False,
+        description="Skip files and directories ignored by the project's .gitignore files",
+    )
+    backend: DiscoveryBackend = Field(
+        DiscoveryBackend.FILESYSTEM,
+        description="Enumerate files by walking the filesystem or from the git index",
+    )
 
 
 class DriftConfig(BaseModel):
@@ -418,6 +498,18 @@ class DriftConfig(BaseModel):
         default_factory=lambda: ParallelExecutionConfig(enabled=True),
         description="Parallel execution configuration for validation rules",
     )
+    url_cache: UrlCacheConfig = Field(
+        default_factory=lambda: UrlCacheConfig(),  # type: ignore[call-arg]
+        description="Persistent cache for external URL check results",
+    )
+    remote_rules: RemoteRulesConfig = Field(
+        default_factory=lambda: RemoteRulesConfig(),  # type: ignore[call-arg]
+        description="Fetching and HTTP caching of remote rules files",
+    )
+    discovery: DiscoveryConfig = Field(
+        default_factory=lambda: DiscoveryConfig(),  # type: ignore[call-arg]
+        description="Document bundle file discovery settings",
+    )
     additional_rules_files: List[str] = Field(
         default_factory=list,
         description="List of additional rule files to load (relative to project root)",
@@ -0,0 +1,305 @@
+"""Fetching and HTTP caching of remote rules files.
+
+Remote rules files (``--rules-file https://...`` or HTTP(S) entries in
+``additional_rules_files``) are fetched concurrently through one pooled
+requests.Session. Each response is stored on disk with its ETag and
+Last-Modified validators:
+
+- within ``max_age`` seconds of being fetched, a stored file is used without
+  contacting the server;
+- after that it is revalidated with If-None-Match/If-Modified-Since, so an
+  unchanged file costs a 304 without a body;
+- when the server cannot be reached or answers with an error, a stored file
+  up to ``stale_if_error`` seconds past its max-age is used instead.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Union
+
+from drift.config.models import RemoteRulesConfig
+
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger(__name__)
+
+# Environment variable overriding the cache directory
+CACHE_DIR_ENV_VAR = "DRIFT_RULES_CACHE_DIR"
+
+# Maximum remote rules files fetched at once
+MAX_CONCURRENT_FETCHES = 8
+
+USER_AGENT = "Drift-Rules/1.0"
+
+CACHE_VERSION = 1
+
+
+def default_cache_dir() -> Path:
+    """Get the directory remote rules files are cached in.
+
+    Returns $DRIFT_RULES_CACHE_DIR if set, else drift/rules under
+    $XDG_CACHE_HOME (or ~/.cache).
+    """
+    configured = os.environ.get(CACHE_DIR_ENV_VAR)
+    if configured:
+        return Path(configured).expanduser()
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "drift" / "rules"
+
+
+class RemoteRulesCache:
+    """On-disk store of fetched rules files, one JSON file per URL.
+
+    Entries hold the response body, its ETag/Last-Modified validators and when
+    it was last fetched or revalidated. Unreadable entries count as missing
+    and write failures are logged, so the cache never fails a run.
+
+    -- cache_dir: Directory for entries (defaults to default_cache_dir())
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize the cache.
+
+        -- cache_dir: Directory for entries (defaults to default_cache_dir())
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+
+    def _entry_path(self, url: str) -> Path:
+        """Get the entry file for a URL.
+
+        -- url: Rules file URL
+        """
+        return self.cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get the stored entry for a URL, fresh or not.
+
+        -- url: Rules file URL
+
+        Returns the entry, or None if the URL was never stored.
+        """
+        try:
+            with open(self._entry_path(url), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            if entry.get("version") != CACHE_VERSION or entry.get("url") != url:
+                return None
+            if not isinstance(entry.get("body"), str):
+                return None
+            return dict(entry)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable rules cache entry for {url}: {e}")
+            return None
+
+    def set(
+        self,
+        url: str,
+        body: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store a fetched rules file, marking it fetched now.
+
+        -- url: Rules file URL
+        -- body: Response body
+        -- etag: ETag response header, if any
+        -- last_modified: Last-Modified response header, if any
+        """
+        entry_path = self._entry_path(url)
+        entry = {
+            "version": CACHE_VERSION,
+            "url": url,
+            "fetched_at": time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+        }
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache rules file {url}: {e}")
+
+    @staticmethod
+    def age(entry: Dict[str, Any]) -> float:
+        """Get the seconds since an entry was fetched or revalidated.
+
+        -- entry: Entry from get()
+        """
+        try:
+            return max(0.0, time.time() - float(entry["fetched_at"]))
+        except (KeyError, TypeError, ValueError):
+            return float("inf")
+
+
+class RemoteRulesFetcher:
+    """Fetch remote rules files concurrently through a pooled, HTTP-cached session.
+
+    Failures are raised as ValueError with the reason, unless a stored copy
+    within the stale-if-error window can be used instead.
+
+    -- timeout: Per-request timeout in seconds
+    -- settings: Cache settings (max_age, stale_if_error, enabled)
+    -- cache: Disk cache to use (defaults to RemoteRulesCache() when enabled)
+    """
+
+    def __init__(
+        self,
+        timeout: float,
+        settings: Optional[RemoteRulesConfig] = None,
+        cache: Optional[RemoteRulesCache] = None,
+    ):
+        """Initialize the fetcher and its pooled session.
+
+        -- timeout: Per-request timeout in seconds
+        -- settings: Cache settings (max_age, stale_if_error, enabled)
+        -- cache: Disk cache to use (defaults to RemoteRulesCache() when enabled)
+        """
+        self.timeout = timeout
+        self.settings = settings or RemoteRulesConfig()  # type: ignore[call-arg]
+        self.cache = cache
+        if self.cache is None and self.settings.cache_enabled:
+            self.cache = RemoteRulesCache()
+
+        # Only runs that use remote rules pay for importing requests
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(
+            pool_connections=MAX_CONCURRENT_FETCHES, pool_maxsize=MAX_CONCURRENT_FETCHES
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self) -> "RemoteRulesFetcher":
+        """Return the fetcher for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the fetcher."""
+        self.close()
+
+    def close(self) -> None:
+        """Release pooled connections."""
+        self.session.close()
+
+    def fetch(self, url: str) -> str:
+        """Get the content of a remote rules file.
+
+        -- url: HTTP(S) URL of the rules file
+
+        Returns the file's text.
+
+        Raises ValueError if it cannot be fetched and no usable copy is cached.
+        """
+        entry = self.cache.get(url) if self.cache is not None else None
+        if entry is not None and RemoteRulesCache.age(entry) <= self.settings.max_age:
+            return str(entry["body"])
+
+        try:
+            return self._request(url, entry)
+        except ValueError as e:
+            if entry is None:
+                raise
+            age = RemoteRulesCache.age(entry)
+            if age > self.settings.max_age + self.settings.stale_if_error:
+                raise
+            logger.warning(f"{e}; using cached copy from {int(age)}s ago")
+            return str(entry["body"])
+
+    def fetch_many(self, urls: Iterable[str]) -> Dict[str, Union[str, ValueError]]:
+        """Fetch several remote rules files concurrently.
+
+        -- urls: URLs to fetch (duplicates are fetched once)
+
+        Returns each URL's text, or the ValueError fetching it raised.
+        """
+        unique = list(dict.fromkeys(urls))
+        results: Dict[str, Union[str, ValueError]] = {}
+        if not unique:
+            return results
+
+        def fetch(url: str) -> Union[str, ValueError]:
+            try:
+                return self.fetch(url)
+            except ValueError as e:
+                return e
+
+        if len(unique) == 1:
+            return {unique[0]: fetch(unique[0])}
+
+        workers = min(len(unique), MAX_CONCURRENT_FETCHES)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="drift-rules") as pool:
+            for url, result in zip(unique, pool.map(fetch, unique)):
+                results[url] = result
+        return results
+
+    def _request(self, url: str, entry: Optional[Dict[str, Any]]) -> str:
+        """Request a rules file, revalidating a stored copy if there is one.
+
+        -- url: HTTP(S) URL of the rules file
+        -- entry: Stored entry to revalidate, if any
+
+        Returns the file's text.
+
+        Raises ValueError if the request fails.
+        """
+        import requests
+
+        headers: Dict[str, str] = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            response = self.session.get(url, timeout=self.timeout, headers=headers)
+            if response.status_code == 304 and entry is not None:
+                return self._store(url, str(entry["body"]), response, entry)
+            response.raise_for_status()
+        except requests.exceptions.Timeout:
+            raise ValueError(f"Timeout fetching rules from {url} (timeout: {self.timeout}s)")
+        except requests.exceptions.RequestException as e:
+            raise ValueError(f"Error fetching rules from {url}: {e}")
+
+        return self._store(url, response.text, response)
+
+    def _store(
+        self,
+        url: str,
+        body: str,
+        response: "requests.Response",
+        entry: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Store a fetched or revalidated rules file in the cache.
+
+        -- url: HTTP(S) URL of the rules file
+        -- body: File content
+        -- response: Response carrying the validators
+        -- entry: Revalidated entry whose validators the response may omit
+
+        Returns the body.
+        """
+        if self.cache is not None:
+            previous = entry or {}
+            self.cache.set(
+                url,
+                body,
+                etag=response.headers.get("ETag") or previous.get("etag"),
+                last_modified=response.headers.get("Last-Modified")
+                or previous.get("last_modified"),
+            )
+        return body
@@ -3,11 +3,14 @@
 Parallel Execution
 ------------------
 Validation rules execute in parallel by default when multiple rules are present.
-Single rules execute sequentially to avoid async overhead.
+Single rules execute sequentially to avoid async overhead. Conversations are
+analyzed several at a time, so their LLM calls are in flight together; results
+are still reported in conversation order.
 
 Configuration:
     parallel_execution:
       enabled: true  # Default
+      max_conversations: 4  # Default
 
 Thread Safety:
     Each parallel task gets its own ValidatorRegistry instance to prevent
@@ -15,14 +18,34 @@ Thread Safety:
 """
 
 import asyncio
+import contextlib
+import functools
 import hashlib
+import importlib
 import json
 import logging
 import re
+import sys
+import threading
 import traceback
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Coroutine,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 from drift.agent_tools.base import AgentLoader
 from drift.agent_tools.claude_code import ClaudeCodeLoader
@@ -31,13 +54,18 @@ from drift.config.loader import ConfigLoader
 from drift.config.models import (
     BundleStrategy,
     ClientType,
+    DocumentBundleConfig,
     DriftConfig,
+    ModelConfig,
+    ProviderConfig,
     ProviderType,
     RuleDefinition,
     SeverityLevel,
     ValidationRule,
 )
 from drift.core.types import (
+    AnalysisEvent,
+    AnalysisEventKind,
     AnalysisResult,
     AnalysisSummary,
     CompleteAnalysisResult,
@@ -50,16 +78,67 @@ from drift.core.types import (
     Rule,
     WorkflowElement,
 )
+from drift.documents.changes import ChangeSet
 from drift.documents.loader import DocumentLoader
-from drift.providers.anthropic import AnthropicProvider
+from drift.documents.overlay import overlay_session
 from drift.providers.base import Provider
-from drift.providers.bedrock import BedrockProvider
-from drift.providers.claude_code import ClaudeCodeProvider
+from drift.providers.registry import ProviderRegistry
+from drift.utils.path_index import project_index_session
 from drift.utils.temp import TempManager
+from drift.utils.url_cache import UrlStatusCache
+from drift.utils.url_checker import get_url_checker, url_check_session
 from drift.validation.validators import ValidatorRegistry
 
 logger = logging.getLogger(__name__)
 
+# Provider classes are imported on first use so that runs which never reach an
+# LLM phase don't pay for importing anthropic/boto3.
+_PROVIDER_CLASSES = {
+    ProviderType.ANTHROPIC: ("drift.providers.anthropic", "AnthropicProvider"),
+    ProviderType.BEDROCK: ("drift.providers.bedrock", "BedrockProvider"),
+    ProviderType.CLAUDE_CODE: ("drift.providers.claude_code", "ClaudeCodeProvider"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve provider classes lazily (PEP 562)."""
+    for module_path, class_name in _PROVIDER_CLASSES.values():
+        if class_name == name:
+            return getattr(importlib.import_module(module_path), class_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class AnalysisStopped(Exception):
+    """The run a conversation analysis belongs to stopped before it finished."""
+
+
+def _check_stopped(stop: Optional[threading.Event]) -> None:
+    """Raise AnalysisStopped if the run has stopped.
+
+    Args:
+        stop: Event set when the run stops, or None if it cannot stop early
+
+    Raises:
+        AnalysisStopped: If stop is set
+    """
+    if stop is not None and stop.is_set():
+        raise AnalysisStopped("Analysis stopped before its next LLM call")
+
+
+def is_programmatic_rule(type_config: Any) -> bool:
+    """Check whether a rule runs without an LLM.
+
+    Args:
+        type_config: Rule definition
+
+    Returns:
+        True if the rule has validation_rules or none of its phases is a prompt
+    """
+    if getattr(type_config, "validation_rules", None) is not None:
+        return True
+    phases = getattr(type_config, "phases", []) or []
+    return not any(getattr(p, "type", "prompt") == "prompt" for p in phases)
+
 
 def _has_programmatic_phases(phases: List[Any], registry: ValidatorRegistry) -> bool:
     """Check if any phases are programmatic (non-LLM) types.
@@ -152,7 +231,7 @@ class DriftAnalyzer:
         """
         self.config = config or ConfigLoader.load_config(project_path)
         self.project_path = project_path
-        self.providers: Dict[str, Provider] = {}
+        self.providers: ProviderRegistry = ProviderRegistry()
         self.agent_loaders: Dict[str, AgentLoader] = {}
         self.temp_manager = TempManager(self.config.temp_dir)
 
@@ -319,7 +398,11 @@ class DriftAnalyzer:
         return False
 
     def _initialize_providers(self) -> None:
-        """Initialize LLM providers based on config."""
+        """Register LLM providers based on config.
+
+        Providers are registered lazily: the SDK client (or CLI probe) for a model
+        is only created the first time that model is looked up.
+        """
         for model_name, model_config in self.config.models.items():
             # Get the provider config
             provider_name = model_config.provider
@@ -329,20 +412,29 @@ class DriftAnalyzer:
                 )
 
             provider_config = self.config.providers[provider_name]
+            if provider_config.provider not in _PROVIDER_CLASSES:
+                continue
 
-            # Create provider instance based on provider type
-            if provider_config.provider == ProviderType.ANTHROPIC:
-                self.providers[model_name] = AnthropicProvider(
-                    provider_config, model_config, self.cache
-                )
-            elif provider_config.provider == ProviderType.BEDROCK:
-                self.providers[model_name] = BedrockProvider(
-                    provider_config, model_config, self.cache
-                )
-            elif provider_config.provider == ProviderType.CLAUDE_CODE:
-                self.providers[model_name] = ClaudeCodeProvider(
-                    provider_config, model_config, self.cache
-                )
+            self.providers.register(
+                model_name,
+                functools.partial(self._create_provider, provider_config, model_config),
+            )
+
+    def _create_provider(
+        self, provider_config: ProviderConfig, model_config: ModelConfig
+    ) -> Provider:
+        """Create a provider instance for a model.
+
+        -- provider_config: Provider configuration
+        -- model_config: Model configuration
+
+        Returns the constructed provider.
+        """
+        _, class_name = _PROVIDER_CLASSES[provider_config.provider]
+        # Look the class up through the module so it resolves lazily (and can be patched)
+        provider_class = getattr(sys.modules[__name__], class_name)
+        provider: Provider = provider_class(provider_config, model_config, self.cache)
+        return provider
 
     def _initialize_agent_loaders(self) -> None:
         """Initialize agent loaders based on config."""
@@ -365,6 +457,7 @@ class DriftAnalyzer:
         agent_tool: Optional[str] = None,
         rule_types: Optional[List[str]] = None,
         model_override: Optional[str] = None,
+        fail_fast: bool = False,
     ) -> CompleteAnalysisResult:
         """Run drift analysis on conversations.
 
@@ -372,6 +465,34 @@ class DriftAnalyzer:
             agent_tool: Optional specific agent tool to analyze
             rule_types: Optional list of specific rules to check
             model_override: Optional model to use (overrides all config settings)
+            fail_fast: Stop at the first violation of a fail-severity rule; the
+                result then only covers what ran and is marked partial in its
+                metadata
+
+        Returns:
+            Complete analysis results
+        """
+        return self._drain(
+            self._iter_conversation_analysis(agent_tool, rule_types, model_override, fail_fast)
+        )
+
+    def _iter_conversation_analysis(
+        self,
+        agent_tool: Optional[str],
+        rule_types: Optional[List[str]],
+        model_override: Optional[str],
+        fail_fast: bool = False,
+    ) -> Generator[AnalysisEvent, None, CompleteAnalysisResult]:
+        """Run drift analysis on conversations, yielding checks as each conversation finishes.
+
+        Args:
+            agent_tool: Optional specific agent tool to analyze
+            rule_types: Optional list of specific rules to check
+            model_override: Optional model to use (overrides all config settings)
+            fail_fast: Stop at the first violation of a fail-severity rule
+
+        Yields:
+            Execution and violation events
 
         Returns:
             Complete analysis results
@@ -527,17 +648,28 @@ class DriftAnalyzer:
             # Analyze each conversation
             results: List[AnalysisResult] = []
             all_execution_details: List[dict] = []
+            failed_rule: Optional[str] = None
             logger.info(f"Analyzing {len(all_conversations)} conversation(s)")
-            for conversation in all_conversations:
+            scheduled = self._schedule_conversations(
+                all_conversations, types_to_check, model_override, fail_fast
+            )
+            for conversation, analysis in scheduled:
                 try:
-                    logger.info(f"Analyzing conversation {conversation.session_id}")
-                    result, exec_details = self._analyze_conversation(
-                        conversation,
-                        types_to_check,
-                        model_override,
-                    )
+                    result, exec_details = analysis()
                     results.append(result)
                     all_execution_details.extend(exec_details)
+                    for detail in exec_details:
+                        yield AnalysisEvent(kind=AnalysisEventKind.EXECUTION, execution=detail)
+                    for rule in result.rules:
+                        yield AnalysisEvent(kind=AnalysisEventKind.VIOLATION, rule=rule)
+                    if fail_fast:
+                        failed_rule = self._first_failing_rule(
+                            rule.rule_type for rule in result.rules
+                        )
+                        if failed_rule is not None:
+                            # Leaves the conversations that were not reached unchecked
+                            scheduled.close()
+                            break
                 except Exception as e:
                     # Re-raise critical errors (API errors, config issues, etc)
                     error_msg = str(e)
@@ -553,6 +685,7 @@ class DriftAnalyzer:
                             "ServiceException",
                         ]
                     ):
+                        scheduled.close()
                         raise
                     # Log non-critical errors with traceback
                     error_details = traceback.format_exc()
@@ -560,6 +693,13 @@ class DriftAnalyzer:
                     logger.debug(f"Full traceback:\n{error_details}")
                     continue
 
+            if failed_rule is not None:
+                # Only report the rules that ran before the run was stopped
+                ran = {detail["rule_name"] for detail in all_execution_details}
+                types_to_check = {
+                    name: config for name, config in types_to_check.items() if name in ran
+                }
+
             # Generate summary
             summary = self._generate_summary(results, types_to_check)
 
@@ -574,16 +714,20 @@ class DriftAnalyzer:
                 }
             )
 
-            return CompleteAnalysisResult(
-                metadata={
-                    "generated_at": datetime.now().isoformat(),
-                    "session_id": session_id,
-                    "config_used": {
-                        "default_model": self.config.default_model,
-                        "conversation_mode": self.config.conversations.mode.value,
-                    },
-                    "execution_details": all_execution_details,
+            metadata: Dict[str, Any] = {
+                "generated_at": datetime.now().isoformat(),
+                "session_id": session_id,
+                "config_used": {
+                    "default_model": self.config.default_model,
+                    "conversation_mode": self.config.conversations.mode.value,
                 },
+                "execution_details": all_execution_details,
+            }
+            if failed_rule is not None:
+                metadata["partial"] = {"reason": "fail_fast", "rule": failed_rule}
+
+            return CompleteAnalysisResult(
+                metadata=metadata,
                 summary=summary,
                 results=results,
             )
@@ -593,11 +737,67 @@ class DriftAnalyzer:
             # On error, preserve for debugging
             pass
 
+    def _schedule_conversations(
+        self,
+        conversations: List[Conversation],
+        rule_types: Dict[str, Any],
+        model_override: Optional[str],
+        fail_fast: bool = False,
+    ) -> Generator[
+        Tuple[Conversation, Callable[[], Tuple[AnalysisResult, List[dict]]]], None, None
+    ]:
+        """Start analyzing conversations, up to parallel_execution.max_conversations at once.
+
+        Conversations are independent, so their LLM calls can be in flight
+        together; providers still bound how many requests actually run (e.g.
+        the Claude Code CLI pool's max_concurrency). Closing the generator
+        cancels the analyses that have not started; running ones make no
+        further LLM calls and their calls in flight are aborted where the
+        provider supports it (see Provider.cancel()).
+
+        Args:
+            conversations: Conversations to analyze
+            rule_types: Rule types to check
+            model_override: Optional model override
+            fail_fast: Skip the remaining passes once a fail-severity rule is violated
+
+        Yields:
+            Each conversation, in order, with a callable that waits for its
+            (result, execution_details) or raises the error of its analysis
+        """
+        parallel = self.config.parallel_execution
+        workers = min(parallel.max_conversations, len(conversations)) if parallel.enabled else 1
+        stop = threading.Event()
+
+        def analyze(conversation: Conversation) -> Tuple[AnalysisResult, List[dict]]:
+            logger.info(f"Analyzing conversation {conversation.session_id}")
+            return self._analyze_conversation(
+                conversation, rule_types, model_override, fail_fast, stop
+            )
+
+        if workers <= 1:
+            for conversation in conversations:
+                yield conversation, functools.partial(analyze, conversation)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="drift-conversation")
+        try:
+            futures = [executor.submit(analyze, conversation) for conversation in conversations]
+            for conversation, future in zip(conversations, futures):
+                yield conversation, future.result
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            for provider in self.providers.loaded():
+                provider.cancel()
+
     def _analyze_conversation(
         self,
         conversation: Conversation,
         rule_types: Dict[str, Any],
         model_override: Optional[str],
+        fail_fast: bool = False,
+        stop: Optional[threading.Event] = None,
     ) -> tuple[AnalysisResult, List[dict]]:
         """Analyze a single conversation using multi-pass approach.
 
@@ -605,9 +805,14 @@ class DriftAnalyzer:
             conversation: Conversation to analyze
             rule_types: Rule types to check
             model_override: Optional model override
+            fail_fast: Skip the remaining passes once a fail-severity rule is violated
+            stop: Event set when the run stops; no pass or LLM call starts after that
 
         Returns:
             Tuple of (AnalysisResult, execution_details)
+
+        Raises:
+            AnalysisStopped: If stop is set before the analysis finishes
         """
         all_rules: List[Rule] = []
         conversation_level_rules: Dict[str, Rule] = {}
@@ -617,6 +822,8 @@ class DriftAnalyzer:
 
         # Perform one pass per learning type
         for type_name, type_config in rule_types.items():
+            _check_stopped(stop)
+
             # Client filtering: determine supported clients from validators or explicit config
             supported_clients = _get_supported_clients_from_rule(
                 type_config, self.validator_registry, conversation.agent_tool
@@ -630,6 +837,7 @@ class DriftAnalyzer:
                 type_name,
                 type_config,
                 model_override,
+                stop,
             )
 
             # Track errors
@@ -679,6 +887,9 @@ class DriftAnalyzer:
                 rules,
             )
 
+            if fail_fast and rules and self._get_rule_severity(type_name) == SeverityLevel.FAIL:
+                break
+
         # Add conversation-level rules (max 1 per type)
         all_rules.extend(conversation_level_rules.values())
 
@@ -709,6 +920,7 @@ class DriftAnalyzer:
         rule_type: str,
         type_config: Any,
         model_override: Optional[str],
+        stop: Optional[threading.Event] = None,
     ) -> tuple[List[Rule], Optional[str], Optional[List[PhaseAnalysisResult]]]:
         """Run a single analysis pass for one rule.
 
@@ -717,6 +929,7 @@ class DriftAnalyzer:
             rule_type: Name of the rule
             type_config: Configuration for this rule
             model_override: Optional model override
+            stop: Event set when the run stops; checked before the LLM call
 
         Returns:
             Tuple of (rules, error_message, phase_results).
@@ -729,7 +942,7 @@ class DriftAnalyzer:
         if len(phases) > 1:
             # Route to multi-phase analysis - returns phase_results
             return self._run_multi_phase_analysis(
-                conversation, rule_type, type_config, model_override
+                conversation, rule_type, type_config, model_override, stop
             )
 
         # Determine which model to use (from phase)
@@ -756,6 +969,7 @@ class DriftAnalyzer:
         cache_key = f"{conversation.session_id}_{rule_type}"
 
         # Generate analysis
+        _check_stopped(stop)
         logger.debug(f"Sending prompt to {model_name}:\n{prompt}")
         response = provider.generate(
             prompt,
@@ -924,6 +1138,39 @@ as JSON."""
 
         return rules
 
+    def _get_rule_severity(self, rule_type: str) -> SeverityLevel:
+        """Get the severity of a rule's violations.
+
+        Args:
+            rule_type: Name of the rule
+
+        Returns:
+            The configured severity, else FAIL for project-level rules and
+            WARNING for other (and unknown) rules
+        """
+        if rule_type not in self.config.rule_definitions:
+            return SeverityLevel.WARNING
+        type_config = self.config.rule_definitions[rule_type]
+        if type_config.severity is not None:
+            return type_config.severity
+        if type_config.scope == "project_level":
+            return SeverityLevel.FAIL
+        return SeverityLevel.WARNING
+
+    def _first_failing_rule(self, rule_types: Iterable[str]) -> Optional[str]:
+        """Find the first fail-severity rule among violated rules.
+
+        Args:
+            rule_types: Names of the violated rules
+
+        Returns:
+            Name of the first rule whose violations fail the run, or None
+        """
+        for rule_type in rule_types:
+            if self._get_rule_severity(rule_type) == SeverityLevel.FAIL:
+                return rule_type
+        return None
+
     def _generate_summary(
         self,
         results: List[AnalysisResult],
@@ -995,15 +1242,7 @@ as JSON."""
 
             for rule_type in by_type.keys():
                 # Get severity for this rule
-                severity = SeverityLevel.WARNING  # Default
-                if rule_type in self.config.rule_definitions:
-                    type_config = self.config.rule_definitions[rule_type]
-                    if type_config.severity is not None:
-                        severity = type_config.severity
-                    elif type_config.scope == "project_level":
-                        severity = SeverityLevel.FAIL
-                    else:
-                        severity = SeverityLevel.WARNING
+                severity = self._get_rule_severity(rule_type)
 
                 if severity == SeverityLevel.FAIL:
                     rules_failed.append(rule_type)
@@ -1027,12 +1266,173 @@ as JSON."""
         self,
         rule_types: Optional[List[str]] = None,
         model_override: Optional[str] = None,
+        changes: Optional[ChangeSet] = None,
+        document_loader: Optional[DocumentLoader] = None,
+        fail_fast: bool = False,
     ) -> CompleteAnalysisResult:
         """Run drift analysis on project documents.
 
         Args:
             rule_types: Optional list of specific rules to check
             model_override: Optional model to use (overrides all config settings)
+            changes: Optional change set. Rules that check each document on its
+                own then only check bundles with a changed file or a dependent of
+                one; other rules still run in full (listed in the result metadata
+                under "change_filter").
+            document_loader: Optional loader to reuse across runs, keeping the
+                documents and bundles it has loaded (a new one is created per
+                run by default)
+            fail_fast: Stop at the first violation of a fail-severity rule,
+                checking programmatic rules before LLM rules and cancelling
+                the bundle's pending validations; the result then only covers
+                what ran and is marked partial in its metadata
+
+        Returns:
+            Complete analysis results with document rules
+        """
+        # One URL checker and one project path index per run, so links and paths
+        # shared by many files and rules are checked once
+        with url_check_session(status_cache=self._create_url_status_cache()):
+            with project_index_session(), self._change_contents_session(changes):
+                return self._drain(
+                    self._iter_document_analysis(
+                        rule_types, model_override, changes, document_loader, fail_fast=fail_fast
+                    )
+                )
+
+    def iter_results(
+        self,
+        scope: str = "project",
+        agent_tool: Optional[str] = None,
+        rule_types: Optional[List[str]] = None,
+        model_override: Optional[str] = None,
+        changes: Optional[ChangeSet] = None,
+        document_loader: Optional[DocumentLoader] = None,
+        fail_fast: bool = False,
+    ) -> Iterator[AnalysisEvent]:
+        """Run drift analysis, yielding each check and violation as soon as it finishes.
+
+        Document runs only keep the counts their summary needs instead of every
+        execution detail and violation, so memory stays flat on large projects.
+        Stopping the iteration early stops the analysis.
+
+        Args:
+            scope: "conversation" (what analyze() checks) or "project" (what
+                analyze_documents() checks)
+            agent_tool: Optional specific agent tool to analyze (conversation scope)
+            rule_types: Optional list of specific rules to check
+            model_override: Optional model to use (overrides all config settings)
+            changes: Optional change set limiting document checks (project scope)
+            document_loader: Optional loader to reuse across runs (project scope)
+            fail_fast: Stop at the first violation of a fail-severity rule (see
+                analyze_documents())
+
+        Yields:
+            An execution event per finished check and a violation event per
+            violation, then a summary event whose result holds the summary and
+            run metadata (without the execution details and violations already
+            streamed)
+
+        Raises:
+            ValueError: If the scope is unknown
+        """
+        if scope == "conversation":
+            result = yield from self._iter_conversation_analysis(
+                agent_tool, rule_types, model_override, fail_fast
+            )
+        elif scope == "project":
+            with url_check_session(status_cache=self._create_url_status_cache()):
+                with project_index_session(), self._change_contents_session(changes):
+                    result = yield from self._iter_document_analysis(
+                        rule_types,
+                        model_override,
+                        changes,
+                        document_loader,
+                        collect=False,
+                        fail_fast=fail_fast,
+                    )
+        else:
+            raise ValueError(f"Unknown scope: {scope}. Use 'conversation' or 'project'")
+
+        metadata = {
+            key: value
+            for key, value in result.metadata.items()
+            if key not in ("execution_details", "document_rules")
+        }
+        yield AnalysisEvent(
+            kind=AnalysisEventKind.SUMMARY,
+            result=CompleteAnalysisResult(metadata=metadata, summary=result.summary),
+        )
+
+    @staticmethod
+    def _drain(
+        events: Generator[AnalysisEvent, None, CompleteAnalysisResult]
+    ) -> CompleteAnalysisResult:
+        """Run an event generator to the end and get the result it returns."""
+        while True:
+            try:
+                next(events)
+            except StopIteration as stop:
+                result: CompleteAnalysisResult = stop.value
+                return result
+
+    def _change_contents_session(self, changes: Optional[ChangeSet]) -> ContextManager[None]:
+        """Layer a change set's contents (e.g. staged text) over the working tree.
+
+        Validators that open files themselves then read the same text as the
+        loaded documents.
+
+        Args:
+            changes: Optional change set
+
+        Returns:
+            An overlay session, or a no-op context without contents to layer
+        """
+        if not changes or not changes.contents or not self.project_path:
+            return contextlib.nullcontext()
+        return overlay_session(
+            {self.project_path / path: text for path, text in changes.contents.items()}
+        )
+
+    def _create_url_status_cache(self) -> Optional[UrlStatusCache]:
+        """Create the persistent URL status cache from config, if enabled.
+
+        Returns:
+            UrlStatusCache, or None if disabled or there is no project path
+        """
+        url_cache_config = self.config.url_cache
+        if not url_cache_config.enabled or not self.project_path:
+            return None
+
+        cache_path = Path(url_cache_config.path).expanduser()
+        if not cache_path.is_absolute():
+            cache_path = self.project_path / cache_path
+        return UrlStatusCache(cache_path, url_cache_config.ttl)
+
+    def _iter_document_analysis(
+        self,
+        rule_types: Optional[List[str]],
+        model_override: Optional[str],
+        changes: Optional[ChangeSet],
+        document_loader: Optional[DocumentLoader],
+        collect: bool = True,
+        fail_fast: bool = False,
+    ) -> Generator[AnalysisEvent, None, CompleteAnalysisResult]:
+        """Run drift analysis on project documents, yielding checks as each bundle finishes.
+
+        Runs inside the URL check and path index sessions of the caller.
+
+        Args:
+            rule_types: Optional list of specific rules to check
+            model_override: Optional model to use (overrides all config settings)
+            changes: Optional change set (see analyze_documents())
+            document_loader: Optional loader to reuse across runs
+            collect: Keep every execution detail and violation for the returned
+                result; otherwise only the counts for its summary are kept
+            fail_fast: Stop at the first violation of a fail-severity rule
+
+        Yields:
+            Execution and violation events
 
         Returns:
             Complete analysis results with document rules
@@ -1089,16 +1489,129 @@ as JSON."""
                 results=[],
             )
 
-        doc_loader = DocumentLoader(self.project_path)
+        if fail_fast:
+            # Cheap programmatic rules first, so a failure is found before any LLM call
+            document_types = dict(
+                sorted(
+                    document_types.items(),
+                    key=lambda item: not is_programmatic_rule(item[1]),
+                )
+            )
 
-        all_document_learnings: List[DocumentRule] = []
+        doc_loader = document_loader or DocumentLoader(
+            self.project_path,
+            respect_gitignore=self.config.discovery.respect_gitignore,
+            backend=self.config.discovery.backend,
+            content_overrides=changes.contents if changes else None,
+        )
+
+        document_rules: List[DocumentRule] = []
+        converted_learnings: List[Rule] = []
         all_execution_details: List[dict] = []
+        # All the summary needs: how often each rule's checks ended with each
+        # status, and the rule type and group of each violation
+        check_statuses: Counter[Tuple[Optional[str], Optional[str]]] = Counter()
+        violation_types: Counter[Tuple[str, Optional[str]]] = Counter()
+        # Rules that ran in full despite a change set
+        full_scope_rules: List[str] = []
 
         logger.debug(
             f"analyze_documents: Processing {len(document_types)} document types: "
             f"{list(document_types.keys())}"
         )
 
+        failed_rule: Optional[str] = None
+        bundle_results = self._iter_document_bundles(
+            document_types, model_override, changes, doc_loader, full_scope_rules, fail_fast
+        )
+        for rules, exec_details in bundle_results:
+            for exec_detail in exec_details:
+                check_statuses[(exec_detail.get("rule_name"), exec_detail.get("status"))] += 1
+                yield AnalysisEvent(kind=AnalysisEventKind.EXECUTION, execution=exec_detail)
+            for doc_learning in rules:
+                violation_types[(doc_learning.rule_type, doc_learning.group_name)] += 1
+                learning = self._document_rule_to_rule(doc_learning)
+                yield AnalysisEvent(kind=AnalysisEventKind.VIOLATION, rule=learning)
+                if collect:
+                    document_rules.append(doc_learning)
+                    converted_learnings.append(learning)
+            if collect:
+                all_execution_details.extend(exec_details)
+            if fail_fast:
+                failed_rule = self._first_failing_rule(rule.rule_type for rule in rules)
+                if failed_rule is not None:
+                    # Leaves the rules and bundles that were not reached unchecked
+                    bundle_results.close()
+                    break
+
+        rules_checked = list(document_types.keys())
+        if failed_rule is not None:
+            # Only report the rules that ran before the run was stopped
+            ran = {rule_name for rule_name, _ in check_statuses}
+            ran.update(rule_type for rule_type, _ in violation_types)
+            rules_checked = [name for name in rules_checked if name in ran]
+        summary = self._summarize_document_checks(rules_checked, check_statuses, violation_types)
+
+        logger.info(f"analyze_documents: Returning {summary.total_checks} execution details")
+        logger.debug(f"analyze_documents: execution_details = {all_execution_details}")
+
+        result = AnalysisResult(
+            session_id="document_analysis",
+            agent_tool="documents",
+            conversation_file="N/A",
+            project_path=str(self.project_path),
+            rules=converted_learnings,
+            analysis_timestamp=datetime.now(),
+            error=None,
+        )
+
+        metadata: Dict[str, Any] = {
+            "generated_at": datetime.now().isoformat(),
+            "analysis_type": "documents",
+            "project_path": str(self.project_path),
+            "document_rules": [learning.model_dump() for learning in document_rules],
+            "execution_details": all_execution_details,
+        }
+        if changes is not None:
+            metadata["change_filter"] = {
+                "description": changes.description,
+                "changed_files": sorted(changes.paths),
+                "full_scope_rules": full_scope_rules,
+            }
+        if failed_rule is not None:
+            metadata["partial"] = {"reason": "fail_fast", "rule": failed_rule}
+
+        return CompleteAnalysisResult(
+            metadata=metadata,
+            summary=summary,
+            results=[result] if converted_learnings else [],
+        )
+
+    def _iter_document_bundles(
+        self,
+        document_types: Dict[str, Any],
+        model_override: Optional[str],
+        changes: Optional[ChangeSet],
+        doc_loader: DocumentLoader,
+        full_scope_rules: List[str],
+        fail_fast: bool = False,
+    ) -> Generator[Tuple[List[DocumentRule], List[dict]], None, None]:
+        """Analyze the bundles of each document rule, one bundle at a time.
+
+        Args:
+            document_types: Document rules to check by name
+            model_override: Optional model to use (overrides all config settings)
+            changes: Optional change set limiting the bundles checked
+            doc_loader: Loader for the rules' bundles
+            full_scope_rules: Receives rules that ran in full despite a change set
+            fail_fast: Stop validating a bundle at its first failed validation rule
+
+        Yields:
+            Violations and execution details of each analyzed bundle
+        """
+        # Checked by _iter_document_analysis()
+        assert self.project_path is not None
+
         for type_name, type_config in document_types.items():
             logger.debug(f"analyze_documents: Processing type {type_name}")
             try:
@@ -1130,7 +1643,23 @@ as JSON."""
                     )
                     continue
 
-                bundles = doc_loader.load_bundles(bundle_config) if bundle_config else []
+                bundles = (
+                    doc_loader.load_bundles(
+                        bundle_config,
+                        ignore_pattern_sets=self._discovery_ignore_patterns(type_name, type_config),
+                    )
+                    if bundle_config
+                    else []
+                )
+                if changes is not None:
+                    if bundles and self._checks_documents_separately(type_config, bundle_config):
+                        bundles = [bundle for bundle in bundles if changes.affects_bundle(bundle)]
+                        if not bundles:
+                            logger.debug(f"analyze_documents: {type_name} has no affected bundles")
+                            continue
+                    else:
+                        full_scope_rules.append(type_name)
+                self._prefetch_external_urls(bundles, type_name, type_config)
 
                 if not bundles:
                     if has_validation_rules or has_programmatic_phases or has_any_phases:
@@ -1151,11 +1680,14 @@ as JSON."""
                             files=[],
                             project_path=self.project_path,
                         )
-                        rules, exec_details = self._analyze_document_bundle(
-                            empty_bundle, type_name, type_config, model_override, doc_loader
+                        yield self._analyze_document_bundle(
+                            empty_bundle,
+                            type_name,
+                            type_config,
+                            model_override,
+                            doc_loader,
+                            fail_fast,
                         )
-                        all_document_learnings.extend(rules)
-                        all_execution_details.extend(exec_details)
                     continue
 
                 # At this point bundle_config must exist (bundles were loaded from it)
@@ -1163,20 +1695,21 @@ as JSON."""
 
                 if bundle_config.bundle_strategy == BundleStrategy.INDIVIDUAL:
                     for bundle in bundles:
-                        rules, exec_details = self._analyze_document_bundle(
-                            bundle, type_name, type_config, model_override, doc_loader
+                        yield self._analyze_document_bundle(
+                            bundle, type_name, type_config, model_override, doc_loader, fail_fast
                         )
-                        all_document_learnings.extend(rules)
-                        all_execution_details.extend(exec_details)
                 else:
                     if bundles:
                         combined_bundle = self._combine_bundles(bundles, type_config)
                         rules, exec_details = self._analyze_document_bundle(
-                            combined_bundle, type_name, type_config, model_override, doc_loader
+                            combined_bundle,
+                            type_name,
+                            type_config,
+                            model_override,
+                            doc_loader,
+                            fail_fast,
                         )
-                        if rules:
-                            all_document_learnings.append(rules[0])
-                        all_execution_details.extend(exec_details)
+                        yield rules[:1], exec_details
 
             except Exception as e:
                 error_msg = str(e)
@@ -1196,45 +1729,57 @@ as JSON."""
                 logger.warning(f"Failed to analyze documents for {type_name}: {e}")
                 continue
 
-        # Convert DocumentLearnings to Learnings for compatibility with AnalysisResult
-        converted_learnings = []
-        for doc_learning in all_document_learnings:
-            # Map DocumentRule fields to Rule fields
-            learning = Rule(
-                turn_number=0,  # Document rules aren't tied to specific turns
-                turn_uuid=None,
-                agent_tool="documents",
-                conversation_file="N/A",
-                observed_behavior=doc_learning.observed_issue,
-                expected_behavior=doc_learning.expected_quality,
-                rule_type=doc_learning.rule_type,
-                group_name=doc_learning.group_name,  # Transfer group name from DocumentRule
-                workflow_element=WorkflowElement.UNKNOWN,
-                turns_to_resolve=1,
-                turns_involved=[],
-                context=doc_learning.context,
-                resources_consulted=[],
-                phases_count=1,
-                source_type="document",  # Mark as document-sourced learning
-                affected_files=doc_learning.file_paths,  # Transfer file information
-                bundle_id=doc_learning.bundle_id,  # Transfer bundle identifier
-                phase_name=doc_learning.phase_name,  # Transfer phase name if present
-            )
-            converted_learnings.append(learning)
+    @staticmethod
+    def _document_rule_to_rule(doc_learning: DocumentRule) -> Rule:
+        """Convert a document rule violation to a Rule for AnalysisResult compatibility.
 
-        result = AnalysisResult(
-            session_id="document_analysis",
+        Args:
+            doc_learning: Violation found in a document bundle
+
+        Returns:
+            The violation as a Rule
+        """
+        # Map DocumentRule fields to Rule fields
+        return Rule(
+            turn_number=0,  # Document rules aren't tied to specific turns
+            turn_uuid=None,
             agent_tool="documents",
             conversation_file="N/A",
-            project_path=str(self.project_path),
-            rules=converted_learnings,
-            analysis_timestamp=datetime.now(),
-            error=None,
+            observed_behavior=doc_learning.observed_issue,
+            expected_behavior=doc_learning.expected_quality,
+            rule_type=doc_learning.rule_type,
+            group_name=doc_learning.group_name,  # Transfer group name from DocumentRule
+            workflow_element=WorkflowElement.UNKNOWN,
+            turns_to_resolve=1,
+            turns_involved=[],
+            context=doc_learning.context,
+            resources_consulted=[],
+            phases_count=1,
+            source_type="document",  # Mark as document-sourced learning
+            affected_files=doc_learning.file_paths,  # Transfer file information
+            bundle_id=doc_learning.bundle_id,  # Transfer bundle identifier
+            phase_name=doc_learning.phase_name,  # Transfer phase name if present
         )
 
+    def _summarize_document_checks(
+        self,
+        rules_checked: List[str],
+        check_statuses: Mapping[Tuple[Optional[str], Optional[str]], int],
+        violation_types: Mapping[Tuple[str, Optional[str]], int],
+    ) -> AnalysisSummary:
+        """Build the summary of a document analysis run.
+
+        Args:
+            rules_checked: Names of the document rules that were checked
+            check_statuses: Number of checks per (rule name, status)
+            violation_types: Number of violations per (rule type, group name)
+
+        Returns:
+            Analysis summary
+        """
         summary = AnalysisSummary(
             total_conversations=0,
-            total_rule_violations=len(all_document_learnings),
+            total_rule_violations=sum(violation_types.values()),
             conversations_with_drift=0,
             conversations_without_drift=0,
             total_checks=0,
@@ -1249,66 +1794,54 @@ as JSON."""
 
         # Build by_type and by_group from execution_details (captures ALL checks)
         # execution_details has rule_name which corresponds to the rule definition key
-        for ed in all_execution_details:
-            rule_name = ed.get("rule_name")
+        for (rule_name, _), count in check_statuses.items():
             if rule_name and rule_name in self.config.rule_definitions:
                 # Count by type (rule_name is the rule type)
-                by_type[rule_name] = by_type.get(rule_name, 0) + 1
+                by_type[rule_name] = by_type.get(rule_name, 0) + count
 
                 # Count by group
                 rule_def = self.config.rule_definitions[rule_name]
                 group_name = rule_def.group_name or "General"
-                by_group[group_name] = by_group.get(group_name, 0) + 1
+                by_group[group_name] = by_group.get(group_name, 0) + count
 
         # Also include document_learnings for rules that only produce failures
         # (to ensure we don't miss any rule types)
-        for doc_learning in all_document_learnings:
+        for rule_type, violation_group in violation_types:
             # Only add if not already counted from execution_details
-            if doc_learning.rule_type not in by_type:
-                by_type[doc_learning.rule_type] = by_type.get(doc_learning.rule_type, 0) + 1
-                group_name = doc_learning.group_name or "General"
+            if rule_type not in by_type:
+                by_type[rule_type] = by_type.get(rule_type, 0) + 1
+                group_name = violation_group or "General"
                 by_group[group_name] = by_group.get(group_name, 0) + 1
 
         summary.by_type = by_type
         summary.by_group = by_group
 
-        summary.rules_checked = list(document_types.keys())
+        summary.rules_checked = rules_checked
 
         # Count individual checks from execution_details
-        summary.total_checks = len(all_execution_details)
+        summary.total_checks = sum(check_statuses.values())
         summary.checks_passed = sum(
-            1 for ed in all_execution_details if ed.get("status") == "passed"
+            count for (_, status), count in check_statuses.items() if status == "passed"
         )
         summary.checks_errored = sum(
-            1 for ed in all_execution_details if ed.get("status") == "errored"
+            count for (_, status), count in check_statuses.items() if status == "errored"
         )
 
         # Separate warnings from failures based on severity
         # Build set of rule_types that actually had failures
         failed_rule_types = set()
-        for doc_learning in all_document_learnings:
-            failed_rule_types.add(doc_learning.rule_type)
+        for rule_type, _ in violation_types:
+            failed_rule_types.add(rule_type)
 
         # Also check execution_details for failed status
-        for ed in all_execution_details:
-            if ed.get("status") == "failed":
-                rule_name = ed.get("rule_name")
-                if rule_name:
-                    failed_rule_types.add(rule_name)
+        for rule_name, status in check_statuses:
+            if status == "failed" and rule_name:
+                failed_rule_types.add(rule_name)
 
         # Build severity map only for rules that actually failed
         rule_severity_map = {}
         for rule_type in failed_rule_types:
-            severity = SeverityLevel.WARNING  # Default
-            if rule_type in self.config.rule_definitions:
-                type_config = self.config.rule_definitions[rule_type]
-                if type_config.severity is not None:
-                    severity = type_config.severity
-                elif type_config.scope == "project_level":
-                    severity = SeverityLevel.FAIL
-                else:
-                    severity = SeverityLevel.WARNING
-            rule_severity_map[rule_type] = severity
+            rule_severity_map[rule_type] = self._get_rule_severity(rule_type)
 
         # Categorize rules by severity (only for failed rules)
         rules_warned = [rt for rt, sev in rule_severity_map.items() if sev == SeverityLevel.WARNING]
@@ -1326,30 +1859,119 @@ as JSON."""
         # Each execution_detail has a rule_name field - categorize by severity
         checks_failed_count = 0
         checks_warned_count = 0
-        for ed in all_execution_details:
-            if ed.get("status") == "failed":
-                rule_name = ed.get("rule_name")
+        for (rule_name, status), count in check_statuses.items():
+            if status == "failed":
                 if rule_name and rule_severity_map.get(rule_name) == SeverityLevel.FAIL:
-                    checks_failed_count += 1
+                    checks_failed_count += count
                 elif rule_name and rule_severity_map.get(rule_name) == SeverityLevel.WARNING:
-                    checks_warned_count += 1
+                    checks_warned_count += count
         summary.checks_failed = checks_failed_count
         summary.checks_warned = checks_warned_count
 
-        logger.info(f"analyze_documents: Returning {len(all_execution_details)} execution details")
-        logger.debug(f"analyze_documents: execution_details = {all_execution_details}")
+        return summary
 
-        return CompleteAnalysisResult(
-            metadata={
-                "generated_at": datetime.now().isoformat(),
-                "analysis_type": "documents",
-                "project_path": str(self.project_path),
-                "document_rules": [learning.model_dump() for learning in all_document_learnings],
-                "execution_details": all_execution_details,
-            },
-            summary=summary,
-            results=[result] if all_document_learnings else [],
-        )
+    @staticmethod
+    def _checks_documents_separately(
+        type_config: Any, bundle_config: Optional[DocumentBundleConfig]
+    ) -> bool:
+        """Check whether a rule validates each bundle independently of the others.
+
+        Such rules can be limited to the bundles a change affects. Collection
+        bundles and project-level validation rules look at the project as a
+        whole and always run in full.
+
+        Args:
+            type_config: Rule definition
+            bundle_config: The rule's bundle configuration
+
+        Returns:
+            True if every bundle is checked on its own
+        """
+        if bundle_config is None or bundle_config.bundle_strategy != BundleStrategy.INDIVIDUAL:
+            return False
+        validation_rules = getattr(type_config, "validation_rules", None)
+        return validation_rules is None or validation_rules.scope != "project_level"
+
+    def _discovery_ignore_patterns(self, rule_type: str, type_config: Any) -> List[List[str]]:
+        """Collect the merged ignore_patterns of every check that will see a rule's bundles.
+
+        Bundle discovery skips only files that all of these lists ignore. An
+        empty result (some check has no ignore_patterns, or a prompt phase reads
+        every file) means discovery keeps everything.
+
+        Args:
+            rule_type: Name of learning type
+            type_config: Configuration for this rule
+
+        Returns:
+            One ignore_patterns list per validation rule or programmatic phase
+        """
+        group_name = type_config.group_name or self.config.default_group_name
+        validation_config = getattr(type_config, "validation_rules", None)
+        checks: List[tuple[str, Dict[str, Any], Optional[str]]] = []
+        if validation_config is not None:
+            checks = [(rule.rule_type, rule.params, None) for rule in validation_config.rules]
+        else:
+            for phase in getattr(type_config, "phases", None) or []:
+                if getattr(phase, "type", "prompt") == "prompt":
+                    return []
+                checks.append((phase.type, phase.params or {}, phase.name))
+
+        pattern_sets = []
+        for validator_type, params, phase_name in checks:
+            merged_params = self._merge_params(
+                base_params=params,
+                validator_type=validator_type,
+                rule_name=rule_type,
+                group_name=group_name,
+                phase_name=phase_name,
+            )
+            ignore_patterns = merged_params.get("ignore_patterns")
+            if not ignore_patterns or not isinstance(ignore_patterns, list):
+                return []
+            pattern_sets.append(ignore_patterns)
+        return pattern_sets
+
+    def _prefetch_external_urls(
+        self,
+        bundles: List[DocumentBundle],
+        rule_type: str,
+        type_config: Any,
+    ) -> None:
+        """Start checking external URLs referenced by a rule's markdown link validations.
+
+        URLs from all bundles are deduplicated and checked in the background on the
+        run's shared checker while bundles are validated; the validators then pick
+        up the results instead of requesting each URL themselves.
+
+        Args:
+            bundles: All bundles loaded for the rule
+            rule_type: Name of learning type
+            type_config: Configuration for this rule
+        """
+        checker = get_url_checker()
+        validation_config = getattr(type_config, "validation_rules", None)
+        if checker is None or validation_config is None or not bundles:
+            return
+
+        from drift.validation.validators import MarkdownLinkValidator
+
+        group_name = type_config.group_name or self.config.default_group_name
+        link_validator = MarkdownLinkValidator()
+        files = [file for bundle in bundles for file in bundle.files]
+
+        for rule in validation_config.rules:
+            if rule.rule_type != "core:markdown_link":
+                continue
+            merged_params = self._merge_params(
+                base_params=rule.params,
+                validator_type=rule.rule_type,
+                rule_name=rule_type,
+                group_name=group_name,
+                phase_name=None,
+            )
+            merged_rule = rule.model_copy(update={"params": merged_params})
+            checker.prefetch(link_validator.collect_external_urls(merged_rule, files))
 
     def _analyze_document_bundle(
         self,
@@ -1358,6 +1980,7 @@ as JSON."""
         type_config: Any,
         model_override: Optional[str],
         loader: Optional[Any] = None,
+        fail_fast: bool = False,
     ) -> tuple[List[DocumentRule], List[dict]]:
         """Analyze a single document bundle.
 
@@ -1367,6 +1990,7 @@ as JSON."""
             type_config: Configuration for this rule
             model_override: Optional model override
             loader: Optional document loader for resource access
+            fail_fast: Stop at the first failed validation rule of a fail-severity rule
 
         Returns:
             Tuple of (rules, execution_details)
@@ -1380,7 +2004,7 @@ as JSON."""
             logger.debug(
                 f"_analyze_document_bundle: Calling _execute_validation_rules for {rule_type}"
             )
-            return self._execute_validation_rules(bundle, rule_type, type_config, loader)
+            return self._execute_validation_rules(bundle, rule_type, type_config, loader, fail_fast)
 
         phases = getattr(type_config, "phases", [])
 
@@ -1596,6 +2220,7 @@ as JSON."""
         rule_type: str,
         type_config: Any,
         loader: Optional[Any] = None,
+        fail_fast: bool = False,
     ) -> tuple[List[DocumentRule], List[dict]]:
         """Execute rule-based validation on a bundle.
 
@@ -1607,6 +2232,8 @@ as JSON."""
             rule_type: Name of learning type
             type_config: Configuration for this rule
             loader: Optional document loader for resource access
+            fail_fast: For fail-severity rules, stop at the first failed
+                validation rule, cancelling validations that have not finished
 
         Returns:
             Tuple of (rules, execution_details).
@@ -1624,19 +2251,25 @@ as JSON."""
         # Determine if we should use parallel execution
         parallel_enabled = self.config.parallel_execution.enabled
         num_rules = len(validation_config.rules)
+        stop_on_failure = fail_fast and self._get_rule_severity(rule_type) == SeverityLevel.FAIL
 
         # Use parallel execution if enabled and more than one rule
         if parallel_enabled and num_rules > 1:
             logger.debug(f"Using parallel execution for {num_rules} rules")
             return asyncio.run(
                 self._execute_rules_parallel(
-                    validation_config.rules, bundle, rule_type, type_config, loader
+                    validation_config.rules,
+                    bundle,
+                    rule_type,
+                    type_config,
+                    loader,
+                    stop_on_failure,
                 )
             )
         else:
             logger.debug(f"Using sequential execution for {num_rules} rules")
             return self._execute_rules_sequential(
-                validation_config.rules, bundle, rule_type, type_config, loader
+                validation_config.rules, bundle, rule_type, type_config, loader, stop_on_failure
             )
 
     def _execute_rules_sequential(
@@ -1646,6 +2279,7 @@ as JSON."""
         rule_type: str,
         type_config: Any,
         loader: Optional[Any] = None,
+        stop_on_failure: bool = False,
     ) -> tuple[List[DocumentRule], List[dict]]:
         """Execute validation rules sequentially.
 
@@ -1655,6 +2289,7 @@ as JSON."""
             rule_type: Name of learning type
             type_config: Configuration for this rule
             loader: Optional document loader for resource access
+            stop_on_failure: Skip the remaining rules after the first failure
 
         Returns:
             Tuple of (rules, execution_details).
@@ -1707,6 +2342,8 @@ as JSON."""
                     # Validation failed - set the learning type name
                     result.rule_type = rule_type
                     doc_rules.append(result)
+                    if stop_on_failure:
+                        break
 
             except Exception as e:
                 # Log error but continue with other rules
@@ -1731,6 +2368,7 @@ as JSON."""
         rule_type: str,
         type_config: Any,
         loader: Optional[Any] = None,
+        stop_on_failure: bool = False,
     ) -> tuple[List[DocumentRule], List[dict]]:
         """Execute validation rules in parallel using asyncio.
 
@@ -1743,6 +2381,8 @@ as JSON."""
             rule_type: Name of learning type
             type_config: Configuration for this rule
             loader: Optional document loader for resource access
+            stop_on_failure: Cancel the rules still running at the first
+                failure; they are left out of the execution details
 
         Returns:
             Tuple of (rules, execution_details).
@@ -1768,7 +2408,11 @@ as JSON."""
         tasks = [self._execute_single_rule_async(rule, bundle, rule_type, loader) for rule in rules]
 
         # Execute all rules concurrently, collecting exceptions
-        results: list[Any] = await asyncio.gather(*tasks, return_exceptions=True)
+        results: list[Any]
+        if stop_on_failure:
+            results = await self._gather_until_failure(tasks)
+        else:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Process results
         doc_rules = []
@@ -1794,6 +2438,39 @@ as JSON."""
 
         return doc_rules, execution_details
 
+    @staticmethod
+    async def _gather_until_failure(
+        coroutines: List[Coroutine[Any, Any, tuple[Optional[DocumentRule], dict]]]
+    ) -> list[Any]:
+        """Run rule coroutines concurrently until one finds a violation.
+
+        Rules that have not finished by then are cancelled: rules still queued
+        for a worker thread never start. Rules already running are short
+        programmatic checks that cannot be interrupted; asyncio.run() waits for
+        them before returning, so none outlive the bundle, and their results
+        are discarded.
+
+        Args:
+            coroutines: Coroutines from _execute_single_rule_async()
+
+        Returns:
+            Results (or raised exceptions) of the finished rules, in rule order
+        """
+        tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if any(task.exception() is None and task.result()[0] is not None for task in done):
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                break
+        return [
+            task.exception() or task.result()
+            for task in tasks
+            if task.done() and not task.cancelled()
+        ]
+
     async def _execute_single_rule_async(
         self,
         rule: ValidationRule,
@@ -2083,9 +2760,12 @@ as JSON."""
         rule_type: str,
         type_config: Any,
         model_override: Optional[str],
+        stop: Optional[threading.Event] = None,
     ) -> tuple[List[Rule], Optional[str], List[PhaseAnalysisResult]]:
         """Execute multi-phase analysis with resource requests.
 
+        The stop event, if given, is checked before each phase's LLM call.
+
         Returns:
             Tuple of (rules, error_message, phase_results).
             error_message is None if successful.
@@ -2160,6 +2840,7 @@ as JSON."""
             cache_key = f"{conversation.session_id}_{rule_type}_phase{phase_idx + 1}"
 
             # Call LLM
+            _check_stopped(stop)
             logger.debug(f"Sending phase {phase_idx + 1} prompt to {model_name}:\n{prompt}")
             response = provider.generate(
                 prompt,
@@ -5,7 +5,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
 
 
 class FrequencyType(str, Enum):
@@ -220,15 +220,93 @@ class CompleteAnalysisResult(BaseModel):
     )
 
 
+class AnalysisEventKind(str, Enum):
+    """Kinds of records streamed by DriftAnalyzer.iter_results()."""
+
+    EXECUTION = "execution"  # A rule check finished
+    VIOLATION = "violation"  # A check found a rule violation
+    SUMMARY = "summary"  # The run finished (always the last record)
+
+
+class AnalysisEvent(BaseModel):
+    """One record of a streamed analysis run."""
+
+    kind: AnalysisEventKind = Field(..., description="What this record reports")
+    execution: Optional[Dict[str, Any]] = Field(
+        default=None, description="Execution detail of the finished check (execution records)"
+    )
+    rule: Optional[Rule] = Field(default=None, description="The rule violation (violation records)")
+    result: Optional[CompleteAnalysisResult] = Field(
+        default=None,
+        description=(
+            "Summary and metadata of the run (summary records); execution details and "
+            "violations are not repeated here since they were streamed before"
+        ),
+    )
+
+
 # Document analysis types
 
 
 class DocumentFile(BaseModel):
-    """Represents a single document file."""
+    """Represents a single document file.
+
+    Content may be passed in, or left out to be read from file_path on first
+    access, so validators that only look at paths or file metadata never read
+    the file. Binary files are detected without decoding and have empty content.
+    """
 
     relative_path: str = Field(..., description="Path relative to project root")
-    content: str = Field(..., description="File content")
     file_path: Path = Field(..., description="Absolute path to file")
+    fingerprint: Optional[str] = Field(
+        None,
+        description="Content identifier known without reading the file (git blob id), if any",
+    )
+
+    _content: Optional[str] = PrivateAttr(default=None)
+    _is_binary: bool = PrivateAttr(default=False)
+
+    def __init__(self, content: Optional[str] = None, **data: Any) -> None:
+        """Create a document file.
+
+        -- content: File content; read lazily from file_path when omitted
+        -- data: relative_path and file_path
+        """
+        super().__init__(**data)
+        self._content = content
+
+    @computed_field(repr=False)  # type: ignore[prop-decorator]
+    @property
+    def content(self) -> str:
+        """File content, read from file_path on first access."""
+        if self._content is None:
+            # Imported here: drift.documents depends on this module
+            from drift.documents.content import read_document_content
+
+            loaded = read_document_content(self.file_path)
+            self._content, self._is_binary = loaded.text, loaded.is_binary
+        return self._content
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the content is in memory."""
+        return self._content is not None
+
+    @property
+    def is_binary(self) -> bool:
+        """Whether the file was detected as binary (reads the file if needed)."""
+        self.content
+        return self._is_binary
+
+    def __eq__(self, other: object) -> bool:
+        """Compare by paths and content, regardless of whether content was loaded yet."""
+        if not isinstance(other, DocumentFile):
+            return NotImplemented
+        return (self.relative_path, self.file_path, self.content) == (
+            other.relative_path,
+            other.file_path,
+            other.content,
+        )
 
 
 class DocumentBundle(BaseModel):
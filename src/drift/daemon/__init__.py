@@ -0,0 +1,17 @@
+"""Warm drift daemon ("drift serve"), its client and the language server ("drift lsp")."""
+
+from drift.daemon.client import (
+    DaemonError,
+    DaemonUnavailable,
+    default_socket_path,
+    forward_analyze,
+    send_request,
+)
+
+__all__ = [
+    "DaemonError",
+    "DaemonUnavailable",
+    "default_socket_path",
+    "forward_analyze",
+    "send_request",
+]
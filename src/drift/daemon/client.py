@@ -0,0 +1,167 @@
+"""Client side of the drift daemon protocol.
+
+The daemon ("drift serve") listens on a Unix socket and speaks JSON-RPC 2.0,
+one JSON object per line in each direction. This module only uses the
+standard library so the CLI can forward a run without importing the analyzer.
+"""
+
+import json
+import logging
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Environment variable overriding the socket location
+SOCKET_ENV_VAR = "DRIFT_SOCKET"
+
+# Seconds to wait for the daemon to accept a connection
+CONNECT_TIMEOUT = 1.0
+
+# Seconds to wait for a response before giving up (the CLI then runs locally)
+RESPONSE_TIMEOUT = 300.0
+
+
+class DaemonError(Exception):
+    """The daemon answered a request with an error.
+
+    Attributes:
+        code: JSON-RPC error code
+    """
+
+    def __init__(self, code: int, message: str) -> None:
+        """Initialize with the error from the response.
+
+        Args:
+            code: JSON-RPC error code
+            message: Error message
+        """
+        super().__init__(message)
+        self.code = code
+
+
+class DaemonUnavailable(ConnectionError):
+    """No daemon is listening on the socket."""
+
+
+def daemon_supported() -> bool:
+    """Check whether this platform has Unix domain sockets."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def default_socket_path() -> Path:
+    """Get the socket path the daemon listens on by default.
+
+    Returns:
+        $DRIFT_SOCKET if set, else drift.sock in $XDG_RUNTIME_DIR if set,
+        else ~/.drift/drift.sock
+    """
+    configured = os.environ.get(SOCKET_ENV_VAR)
+    if configured:
+        return Path(configured).expanduser()
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "drift.sock"
+    return Path.home() / ".drift" / "drift.sock"
+
+
+def send_request(
+    method: str,
+    params: Optional[Dict[str, Any]] = None,
+    socket_path: Optional[Path] = None,
+    timeout: float = RESPONSE_TIMEOUT,
+) -> Any:
+    """Send one request to the daemon and wait for its result.
+
+    Args:
+        method: Method name (analyze, analyze-paths, invalidate, shutdown)
+        params: Method parameters
+        socket_path: Socket to connect to (defaults to default_socket_path())
+        timeout: Seconds to wait for the response
+
+    Returns:
+        The "result" member of the response
+
+    Raises:
+        DaemonUnavailable: If no daemon accepts the connection
+        DaemonError: If the daemon answers with an error
+        ConnectionError: If the connection drops before the response arrives
+        TimeoutError: If no response arrives within timeout
+    """
+    if not daemon_supported():
+        raise DaemonUnavailable("Unix domain sockets are not supported on this platform")
+    path = socket_path or default_socket_path()
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.settimeout(CONNECT_TIMEOUT)
+        try:
+            client.connect(str(path))
+        except OSError as e:
+            raise DaemonUnavailable(f"No drift daemon at {path}: {e}") from e
+        # A busy or stuck daemon must not hang the client forever
+        client.settimeout(timeout)
+
+        request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or {}}
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with client.makefile("rb") as reader:
+            line = reader.readline()
+    finally:
+        client.close()
+
+    if not line:
+        raise ConnectionError("drift daemon closed the connection without responding")
+    response = json.loads(line)
+    if "error" in response:
+        error = response["error"]
+        raise DaemonError(error.get("code", -32603), error.get("message", "Unknown error"))
+    return response.get("result")
+
+
+def _absolute(path: str) -> str:
+    """Resolve a local path against the working directory; URLs are kept."""
+    if urlparse(path).scheme in ("http", "https"):
+        return path
+    return str(Path(path).expanduser().resolve())
+
+
+def forward_analyze(options: Dict[str, Any], socket_path: Optional[Path] = None) -> Optional[int]:
+    """Run an analysis in the daemon, if one is running, and print its output.
+
+    Relative paths are resolved here since the daemon has its own working
+    directory.
+
+    Args:
+        options: analyze_command() keyword arguments
+        socket_path: Socket to connect to (defaults to default_socket_path())
+
+    Returns:
+        The run's exit code, or None if there is no daemon or it does not
+        answer within RESPONSE_TIMEOUT (run locally then)
+    """
+    if not daemon_supported():
+        return None
+    path = socket_path or default_socket_path()
+    if not path.exists():
+        return None
+
+    params = dict(options)
+    params["project"] = _absolute(params.get("project") or os.getcwd())
+    if params.get("rules_file"):
+        params["rules_file"] = [_absolute(source) for source in params["rules_file"]]
+    if params.get("cache_dir"):
+        params["cache_dir"] = _absolute(params["cache_dir"])
+
+    try:
+        result = send_request("analyze", params, path, RESPONSE_TIMEOUT)
+    except (OSError, ValueError, DaemonError) as e:
+        logger.debug(f"Running locally, drift daemon unavailable: {e}")
+        return None
+
+    sys.stderr.write(result["stderr"])
+    sys.stdout.write(result["stdout"])
+    return int(result["exit_code"])
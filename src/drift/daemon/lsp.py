@@ -0,0 +1,497 @@
+"""Language server publishing drift violations as editor diagnostics.
+
+"drift lsp" speaks the Language Server Protocol over stdin/stdout. It checks
+open Markdown, JSON and YAML files as they are typed, before they are saved:
+the buffers are layered over the files on disk with overlay_session(), so
+validators reading files themselves see the editor's text too.
+
+A check runs once typing pauses for DEBOUNCE_SECONDS. Only programmatic rules
+run by default (LLM rules need the "llm" initialization option or --llm), and
+of those only the bundles affected by the edited files, as with
+--changed-since. The document loader is kept between checks, so unchanged
+files are neither discovered nor read again; it is replaced when a file is
+opened, when the client reports file system changes, or when the
+configuration changes.
+
+Validators do not report line numbers, so diagnostics cover the first line of
+each file they name.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Set
+from urllib.parse import unquote, urlparse
+
+from drift.config.models import SeverityLevel
+from drift.core.analyzer import DriftAnalyzer, is_programmatic_rule
+from drift.core.types import DocumentFile
+from drift.daemon.warm import WarmCache
+from drift.documents.changes import ChangeSet
+from drift.documents.loader import DocumentLoader
+from drift.documents.overlay import overlay_session
+
+logger = logging.getLogger(__name__)
+
+# Files checked while open in the editor
+DOCUMENT_SUFFIXES = frozenset({".md", ".json", ".yaml", ".yml"})
+
+# Seconds without edits before open files are checked
+DEBOUNCE_SECONDS = 0.3
+
+# JSON-RPC and LSP error codes
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+SERVER_NOT_INITIALIZED = -32002
+
+# LSP DiagnosticSeverity and MessageType values
+SEVERITY_ERROR = 1
+SEVERITY_WARNING = 2
+MESSAGE_ERROR = 1
+
+# LSP TextDocumentSyncKind.Full: clients send the whole buffer on each change
+SYNC_FULL = 1
+
+
+def uri_to_path(uri: str) -> Optional[Path]:
+    """Convert a file URI to a path.
+
+    Args:
+        uri: Document URI
+
+    Returns:
+        Absolute path, or None for URIs of other schemes
+    """
+    parsed = urlparse(uri)
+    if parsed.scheme != "file":
+        return None
+    return Path(os.path.normpath(unquote(parsed.path)))
+
+
+def read_message(reader: BinaryIO) -> Optional[Dict[str, Any]]:
+    """Read one Content-Length framed message.
+
+    Args:
+        reader: Binary input stream
+
+    Returns:
+        Decoded message, or None at end of input
+
+    Raises:
+        ValueError: If the header or body is malformed
+    """
+    length = None
+    while True:
+        line = reader.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("ascii").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value.strip())
+    if length is None:
+        raise ValueError("Message without Content-Length header")
+    message = json.loads(reader.read(length).decode("utf-8"))
+    if not isinstance(message, dict):
+        raise ValueError("Message must be a JSON object")
+    return message
+
+
+def write_message(writer: BinaryIO, message: Dict[str, Any]) -> None:
+    """Write one Content-Length framed message.
+
+    Args:
+        writer: Binary output stream
+        message: Message to send
+    """
+    body = json.dumps(message).encode("utf-8")
+    writer.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+    writer.flush()
+
+
+class LanguageServer:
+    """Drift diagnostics for the documents open in an editor.
+
+    Args:
+        reader: Stream the client's messages arrive on
+        writer: Stream to send responses and notifications to
+        project_path: Project to use if the client names no workspace root
+        rules_files: Optional rules files, as with --rules-file
+        allow_llm: Also run rules that need an LLM
+        debounce: Seconds without edits before open files are checked (0 to
+            check only when validate_pending() is called)
+    """
+
+    def __init__(
+        self,
+        reader: BinaryIO,
+        writer: BinaryIO,
+        project_path: Optional[Path] = None,
+        rules_files: Optional[List[str]] = None,
+        allow_llm: bool = False,
+        debounce: float = DEBOUNCE_SECONDS,
+    ) -> None:
+        """Initialize the server; the project root is set by the initialize request.
+
+        Args:
+            reader: Stream the client's messages arrive on
+            writer: Stream to send responses and notifications to
+            project_path: Project to use if the client names no workspace root
+            rules_files: Optional rules files, as with --rules-file
+            allow_llm: Also run rules that need an LLM
+            debounce: Seconds without edits before open files are checked
+        """
+        self.reader = reader
+        self.writer = writer
+        self.project_path = (project_path or Path.cwd()).resolve()
+        self.rules_files = rules_files
+        self.allow_llm = allow_llm
+        self.debounce = debounce
+        self.cache = WarmCache()
+
+        self.initialized = False
+        self.shutdown_requested = False
+        # Open buffers and their URIs by path
+        self.buffers: Dict[Path, str] = {}
+        self._uris: Dict[Path, str] = {}
+        # Files edited, opened or closed since the last check
+        self._pending: Set[Path] = set()
+        # Published diagnostics per file, per rule
+        self._diagnostics: Dict[Path, Dict[str, List[Dict[str, Any]]]] = {}
+
+        self._analyzer: Optional[DriftAnalyzer] = None
+        self._loader: Optional[DocumentLoader] = None
+        self._last_error: Optional[str] = None
+
+        self._state_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._check_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+        self._requests: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "initialize": self._initialize,
+            "shutdown": self._shutdown,
+        }
+        self._notifications: Dict[str, Callable[[Dict[str, Any]], None]] = {
+            "initialized": lambda params: None,
+            "textDocument/didOpen": self._did_open,
+            "textDocument/didChange": self._did_change,
+            "textDocument/didClose": self._did_close,
+            "workspace/didChangeWatchedFiles": self._did_change_watched_files,
+        }
+
+    def serve(self) -> int:
+        """Handle messages until the client sends exit or closes the input.
+
+        Returns:
+            Process exit code: 0 if the client asked for a shutdown first, else 1
+        """
+        try:
+            while True:
+                try:
+                    message = read_message(self.reader)
+                except ValueError as e:
+                    logger.warning(f"Ignoring malformed message: {e}")
+                    continue
+                if message is None or message.get("method") == "exit":
+                    break
+                self.handle_message(message)
+        finally:
+            self._cancel_timer()
+        return 0 if self.shutdown_requested else 1
+
+    def handle_message(self, message: Dict[str, Any]) -> None:
+        """Answer a request or apply a notification.
+
+        Args:
+            message: Decoded JSON-RPC message
+        """
+        method = message.get("method")
+        params = message.get("params") or {}
+        if "id" not in message:
+            handler = self._notifications.get(method) if isinstance(method, str) else None
+            if handler is None:
+                # Unknown notifications, including $/ ones, may be ignored
+                return
+            if not self.initialized or self.shutdown_requested:
+                return
+            try:
+                handler(params)
+            except Exception:
+                logger.exception(f"Failed to handle {method}")
+            return
+
+        request_id = message["id"]
+        request_handler = self._requests.get(method) if isinstance(method, str) else None
+        if request_handler is None:
+            self._send_error(request_id, METHOD_NOT_FOUND, f"Unknown method: {method}")
+            return
+        if not self.initialized and method != "initialize":
+            self._send_error(request_id, SERVER_NOT_INITIALIZED, "Server is not initialized")
+            return
+        if self.shutdown_requested:
+            self._send_error(request_id, INVALID_REQUEST, "Server is shutting down")
+            return
+        try:
+            result = request_handler(params)
+        except Exception as e:
+            logger.exception(f"Failed to handle {method}")
+            self._send_error(request_id, INTERNAL_ERROR, f"{type(e).__name__}: {e}")
+            return
+        self._send({"jsonrpc": "2.0", "id": request_id, "result": result})
+
+    def validate_pending(self) -> None:
+        """Check the files edited, opened or closed since the last check and publish."""
+        with self._check_lock:
+            with self._state_lock:
+                pending = self._pending
+                self._pending = set()
+                buffers = dict(self.buffers)
+            if pending:
+                self._check(pending, buffers)
+
+    def _initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Set the project root and options and describe the server's capabilities."""
+        root = None
+        if params.get("rootUri"):
+            root = uri_to_path(params["rootUri"])
+        elif params.get("rootPath"):
+            root = Path(params["rootPath"])
+        if root is not None:
+            self.project_path = root.resolve()
+
+        options = params.get("initializationOptions") or {}
+        if "llm" in options:
+            self.allow_llm = bool(options["llm"])
+        if options.get("rulesFiles"):
+            self.rules_files = [str(source) for source in options["rulesFiles"]]
+
+        self.initialized = True
+        return {
+            "capabilities": {"textDocumentSync": {"openClose": True, "change": SYNC_FULL}},
+            "serverInfo": {"name": "drift"},
+        }
+
+    def _shutdown(self, params: Dict[str, Any]) -> None:
+        """Stop checking files; the client sends exit next."""
+        self.shutdown_requested = True
+        self._cancel_timer()
+        return None
+
+    def _did_open(self, params: Dict[str, Any]) -> None:
+        """Track a newly opened document."""
+        document = params["textDocument"]
+        path = self._document_path(document["uri"])
+        if path is None:
+            return
+        with self._state_lock:
+            self.buffers[path] = document["text"]
+            self._uris[path] = document["uri"]
+            self._pending.add(path)
+            # The file may not have existed when the loader listed the project
+            self._loader = None
+        self._schedule()
+
+    def _did_change(self, params: Dict[str, Any]) -> None:
+        """Replace a document's buffer with its new text."""
+        path = self._document_path(params["textDocument"]["uri"])
+        changes = params.get("contentChanges") or []
+        if path is None or path not in self.buffers or not changes:
+            return
+        with self._state_lock:
+            # Full sync: the last change holds the whole text
+            self.buffers[path] = changes[-1]["text"]
+            self._pending.add(path)
+        self._schedule()
+
+    def _did_close(self, params: Dict[str, Any]) -> None:
+        """Stop tracking a document and clear its diagnostics."""
+        path = self._document_path(params["textDocument"]["uri"])
+        if path is None or path not in self.buffers:
+            return
+        with self._state_lock:
+            del self.buffers[path]
+            uri = self._uris.pop(path)
+            self._diagnostics.pop(path, None)
+            # Documents depending on it now see the file on disk
+            self._pending.add(path)
+        self._publish(uri, [])
+        self._schedule()
+
+    def _did_change_watched_files(self, params: Dict[str, Any]) -> None:
+        """Reload the project after files changed outside the editor."""
+        with self._state_lock:
+            self._loader = None
+            self._pending.update(self.buffers)
+        self._schedule()
+
+    def _document_path(self, uri: str) -> Optional[Path]:
+        """Get the path of a document drift checks, or None for other documents."""
+        path = uri_to_path(uri)
+        if path is None or path.suffix.lower() not in DOCUMENT_SUFFIXES:
+            return None
+        try:
+            path.relative_to(self.project_path)
+        except ValueError:
+            return None
+        return path
+
+    def _schedule(self) -> None:
+        """Check pending files once no edit arrives for the debounce delay."""
+        if self.debounce <= 0:
+            return
+        with self._state_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce, self._validate_safely)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        """Cancel a scheduled check."""
+        with self._state_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _validate_safely(self) -> None:
+        """Run validate_pending() from the debounce timer, logging failures."""
+        try:
+            self.validate_pending()
+        except Exception:
+            logger.exception("drift check failed")
+
+    def _check(self, pending: Set[Path], buffers: Dict[Path, str]) -> None:
+        """Run drift on the documents affected by the pending files and publish."""
+        try:
+            config = self.cache.load_config(self.project_path, rules_files=self.rules_files)
+        except Exception as e:
+            self._report_error(f"drift: Could not load the configuration: {e}")
+            return
+        self._last_error = None
+
+        rule_types = [
+            name
+            for name, type_config in config.rule_definitions.items()
+            if getattr(type_config, "scope", "turn_level") in ("document_level", "project_level")
+            and (self.allow_llm or is_programmatic_rule(type_config))
+        ]
+
+        analyzer = self.cache.analyzer(config, self.project_path)
+        with self._state_lock:
+            if analyzer is not self._analyzer:
+                # Different rules: start over
+                self._analyzer = analyzer
+                self._loader = None
+                self._diagnostics.clear()
+                pending = pending | set(buffers)
+            if self._loader is None:
+                self._loader = DocumentLoader(
+                    self.project_path,
+                    respect_gitignore=config.discovery.respect_gitignore,
+                    backend=config.discovery.backend,
+                )
+            loader = self._loader
+
+        changes = ChangeSet(
+            self.project_path,
+            [path.relative_to(self.project_path).as_posix() for path in pending],
+            "edited documents",
+        )
+        with overlay_session(buffers):
+            loader.refresh(pending)
+            result = analyzer.analyze_documents(
+                rule_types=rule_types, changes=changes, document_loader=loader
+            )
+            affected = {
+                path
+                for path, text in buffers.items()
+                if changes.affects(
+                    DocumentFile(
+                        relative_path=path.relative_to(self.project_path).as_posix(),
+                        file_path=path,
+                        content=text,
+                    )
+                )
+            }
+
+        full_scope_rules = set(result.metadata.get("change_filter", {}).get("full_scope_rules", []))
+        with self._state_lock:
+            open_paths = set(self.buffers)
+            for rule_name in result.summary.rules_checked or []:
+                cleared = open_paths if rule_name in full_scope_rules else affected
+                for path in cleared:
+                    self._diagnostics.get(path, {}).pop(rule_name, None)
+
+            for rule in result.metadata.get("document_rules", []):
+                diagnostic = self._diagnostic(config, rule)
+                for rel_path in rule.get("file_paths") or []:
+                    path = Path(os.path.normpath(self.project_path / rel_path))
+                    if path not in open_paths:
+                        continue
+                    rule_diagnostics = self._diagnostics.setdefault(path, {}).setdefault(
+                        rule["rule_type"], []
+                    )
+                    if diagnostic not in rule_diagnostics:
+                        rule_diagnostics.append(diagnostic)
+
+            published = [
+                (
+                    self._uris[path],
+                    [d for ds in self._diagnostics.get(path, {}).values() for d in ds],
+                )
+                for path in sorted(open_paths)
+            ]
+        for uri, diagnostics in published:
+            self._publish(uri, diagnostics)
+
+    @staticmethod
+    def _diagnostic(config: Any, rule: Dict[str, Any]) -> Dict[str, Any]:
+        """Build an LSP diagnostic from a document rule violation."""
+        rule_type = rule["rule_type"]
+        type_config = config.rule_definitions.get(rule_type)
+        if type_config is not None and type_config.severity is not None:
+            severity = type_config.severity
+        elif type_config is not None and type_config.scope == "project_level":
+            severity = SeverityLevel.FAIL
+        else:
+            severity = SeverityLevel.WARNING
+        start = {"line": 0, "character": 0}
+        return {
+            "range": {"start": start, "end": start},
+            "severity": SEVERITY_ERROR if severity == SeverityLevel.FAIL else SEVERITY_WARNING,
+            "source": "drift",
+            "code": rule_type,
+            "message": rule["observed_issue"],
+        }
+
+    def _report_error(self, message: str) -> None:
+        """Show an error in the editor, once until it changes."""
+        logger.error(message)
+        if message != self._last_error:
+            self._last_error = message
+            self._notify("window/showMessage", {"type": MESSAGE_ERROR, "message": message})
+
+    def _publish(self, uri: str, diagnostics: List[Dict[str, Any]]) -> None:
+        """Send a document's diagnostics."""
+        self._notify("textDocument/publishDiagnostics", {"uri": uri, "diagnostics": diagnostics})
+
+    def _notify(self, method: str, params: Dict[str, Any]) -> None:
+        """Send a notification."""
+        self._send({"jsonrpc": "2.0", "method": method, "params": params})
+
+    def _send_error(self, request_id: Any, code: int, message: str) -> None:
+        """Send an error response."""
+        self._send(
+            {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+        )
+
+    def _send(self, message: Dict[str, Any]) -> None:
+        """Write a message; the debounce timer and the reader loop both send."""
+        with self._write_lock:
+            write_message(self.writer, message)
@@ -0,0 +1,242 @@
+"""The drift daemon: a warm analyzer per project behind a Unix socket.
+
+Requests are JSON-RPC 2.0 objects, one per line; each gets one response line.
+Each connection is read on its own thread, so an idle client cannot block
+others, but requests are answered one at a time since analyze captures the
+process-wide stdout and stderr. Methods:
+
+- analyze: run drift with analyze_command() options ("project" is required);
+  returns {"exit_code", "stdout", "stderr"}
+- analyze-paths: like analyze, but only checks documents given in "paths"
+  (relative to the project or absolute) and their direct dependents
+- invalidate: drop warm state of "project" (or of every project if omitted);
+  returns {"invalidated": <number of projects>}
+- shutdown: stop the daemon after responding
+"""
+
+import inspect
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from drift.cli.commands.analyze import analyze_command
+from drift.cli.logging_config import setup_logging
+from drift.daemon.client import default_socket_path
+from drift.daemon.warm import WarmCache
+
+logger = logging.getLogger(__name__)
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+# analyze_command() options a client may pass
+ANALYZE_OPTIONS = frozenset(inspect.signature(analyze_command).parameters) - {"warm_cache"}
+
+
+class InvalidParams(ValueError):
+    """Request parameters are missing or have the wrong type."""
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answer newline-delimited JSON-RPC requests on one connection."""
+
+    server: "DriftServer"
+
+    def handle(self) -> None:
+        """Handle requests until the client disconnects or the daemon stops."""
+        try:
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                response = self.server.handle_message(line)
+                self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+                self.wfile.flush()
+                if self.server.stopping:
+                    break
+        except OSError as e:
+            # The client gave up waiting (and ran locally) or went away
+            logger.debug(f"drift daemon lost a client: {e}")
+        if self.server.stopping:
+            self.server.shutdown()
+
+
+class DriftServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server answering drift daemon requests.
+
+    Args:
+        socket_path: Path of the socket to create
+        verbose: Verbosity of the daemon's own logging
+    """
+
+    # Connection threads must not keep a stopped daemon alive
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, verbose: int = 0) -> None:
+        """Bind the socket, replacing a stale one left by a daemon that died.
+
+        Args:
+            socket_path: Path of the socket to create
+            verbose: Verbosity of the daemon's own logging
+
+        Raises:
+            RuntimeError: If another daemon is listening on socket_path
+        """
+        self.socket_path = Path(socket_path)
+        self.verbose = verbose
+        self.cache = WarmCache()
+        self.stopping = False
+        self._request_lock = threading.Lock()
+        self._methods: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "analyze": self._analyze,
+            "analyze-paths": self._analyze_paths,
+            "invalidate": self._invalidate,
+            "shutdown": self._shutdown,
+        }
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        if self.socket_path.exists():
+            if _is_listening(self.socket_path):
+                raise RuntimeError(f"A drift daemon is already listening on {self.socket_path}")
+            self.socket_path.unlink()
+
+        # Only the current user may connect
+        old_umask = os.umask(0o077)
+        try:
+            super().__init__(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def serve(self) -> None:
+        """Handle connections until a shutdown request, then remove the socket."""
+        logger.info(f"drift daemon listening on {self.socket_path}")
+        try:
+            self.serve_forever()
+        finally:
+            self.server_close()
+
+    def server_close(self) -> None:
+        """Close the listening socket and remove its file."""
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def handle_message(self, line: bytes) -> Dict[str, Any]:
+        """Answer one JSON-RPC request line.
+
+        Args:
+            line: Raw request line
+
+        Returns:
+            JSON-RPC response object
+        """
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return _error(None, PARSE_ERROR, f"Parse error: {e}")
+        if not isinstance(request, dict):
+            return _error(None, INVALID_REQUEST, "Request must be a JSON object")
+
+        request_id = request.get("id")
+        method = request.get("method")
+        params = request.get("params", {})
+        if not isinstance(method, str) or not isinstance(params, dict):
+            return _error(request_id, INVALID_REQUEST, "Request needs a method and object params")
+        handler = self._methods.get(method)
+        if handler is None:
+            return _error(request_id, METHOD_NOT_FOUND, f"Unknown method: {method}")
+
+        try:
+            with self._request_lock:
+                result = handler(params)
+        except InvalidParams as e:
+            return _error(request_id, INVALID_PARAMS, str(e))
+        except Exception as e:
+            logger.exception(f"drift daemon failed to handle {method}")
+            return _error(request_id, INTERNAL_ERROR, f"{type(e).__name__}: {e}")
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def _analyze(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run analyze_command() with captured output."""
+        unknown = set(params) - ANALYZE_OPTIONS
+        if unknown:
+            raise InvalidParams(f"Unknown analyze options: {', '.join(sorted(unknown))}")
+        project = params.get("project")
+        if not isinstance(project, str) or not Path(project).is_absolute():
+            raise InvalidParams("analyze needs an absolute project path")
+
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        exit_code = 0
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                analyze_command(**params, warm_cache=self.cache)
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+        # analyze_command() pointed logging at the captured stderr
+        setup_logging(self.verbose)
+        return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+    def _analyze_paths(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run analyze_command() limited to the given documents."""
+        paths = params.get("paths")
+        if not isinstance(paths, list) or not all(isinstance(path, str) for path in paths):
+            raise InvalidParams("analyze-paths needs a list of paths")
+        return self._analyze({"scope": "project", **params})
+
+    def _invalidate(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop warm state."""
+        project = params.get("project")
+        if project is not None and not isinstance(project, str):
+            raise InvalidParams("project must be a path")
+        count = self.cache.invalidate(Path(project) if project else None)
+        return {"invalidated": count}
+
+    def _shutdown(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Stop serving after this response."""
+        self.stopping = True
+        return {"stopping": True}
+
+
+def _is_listening(socket_path: Path) -> bool:
+    """Check whether a process accepts connections on a Unix socket."""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(socket_path))
+    except OSError:
+        return False
+    finally:
+        probe.close()
+    return True
+
+
+def _error(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    """Build a JSON-RPC error response."""
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def run_server(socket_path: Optional[Path] = None, verbose: int = 0) -> None:
+    """Serve drift daemon requests until shut down.
+
+    Args:
+        socket_path: Socket to listen on (defaults to default_socket_path())
+        verbose: Verbosity of the daemon's own logging
+
+    Raises:
+        RuntimeError: If another daemon is listening on the socket
+        OSError: If the socket cannot be created
+    """
+    server = DriftServer(socket_path or default_socket_path(), verbose)
+    server.serve()
@@ -0,0 +1,137 @@
+"""Configuration and analyzers kept warm across runs by the drift daemon.
+
+A one-shot drift run loads and validates the merged configuration and builds
+an analyzer (providers, agent loaders, validator registry) before it looks at
+a single file. WarmCache keeps both per project, reloading the configuration
+when one of its local source files changes. Documents are still discovered
+and read on every run, so file edits never need an invalidation.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from drift.config.loader import ConfigLoader
+from drift.config.models import DriftConfig
+from drift.core.analyzer import DriftAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# Modification time and size of a config source, or None if it does not exist
+SourceStamp = Optional[Tuple[int, int]]
+
+
+def _stamp(path: Path) -> SourceStamp:
+    """Get the modification time and size of a file, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class _WarmConfig:
+    """A loaded configuration and the state of the files it was loaded from."""
+
+    def __init__(self, config: DriftConfig, sources: List[Path]) -> None:
+        """Record a loaded configuration.
+
+        Args:
+            config: Loaded configuration
+            sources: Local files the configuration was loaded from
+        """
+        self.config = config
+        self.stamps = {source: _stamp(source) for source in sources}
+
+    def is_current(self) -> bool:
+        """Check whether no source file was created, changed or deleted since loading."""
+        return all(_stamp(source) == stamp for source, stamp in self.stamps.items())
+
+
+class WarmCache:
+    """Merged configurations and analyzers per project, reused across runs.
+
+    Remote rules files are fetched once and kept until the project is
+    invalidated.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        # Keyed by (project path, rules files)
+        self._configs: Dict[Tuple[str, Tuple[str, ...]], _WarmConfig] = {}
+        # One analyzer per project, with the serialized config it was built for
+        self._analyzers: Dict[str, Tuple[str, DriftAnalyzer]] = {}
+
+    def load_config(
+        self, project_path: Path, rules_files: Optional[List[str]] = None
+    ) -> DriftConfig:
+        """Load a project's configuration, reusing it while its sources are unchanged.
+
+        Args:
+            project_path: Project directory
+            rules_files: Optional list of rules file paths/URLs
+
+        Returns:
+            A copy of the configuration that the caller may modify
+
+        Raises:
+            ValueError: If the configuration is invalid
+        """
+        key = (str(project_path.resolve()), tuple(rules_files or ()))
+        warm = self._configs.get(key)
+        if warm is None or not warm.is_current():
+            if warm is not None:
+                logger.info(f"Configuration of {key[0]} changed, reloading")
+            config = ConfigLoader.load_config(project_path, rules_files=rules_files, use_cache=True)
+            warm = _WarmConfig(
+                config, ConfigLoader.config_sources(project_path, rules_files, config)
+            )
+            self._configs[key] = warm
+        return warm.config.model_copy(deep=True)
+
+    def analyzer(self, config: DriftConfig, project_path: Path) -> DriftAnalyzer:
+        """Get an analyzer for a project, reusing the last one if its config is equal.
+
+        Args:
+            config: Configuration for this run (after command line overrides)
+            project_path: Project directory
+
+        Returns:
+            DriftAnalyzer for the configuration
+        """
+        key = str(project_path.resolve())
+        serialized = config.model_dump_json()
+        cached = self._analyzers.get(key)
+        if cached is not None and cached[0] == serialized:
+            return cached[1]
+        analyzer = DriftAnalyzer(config=config, project_path=project_path)
+        self._analyzers[key] = (serialized, analyzer)
+        return analyzer
+
+    def invalidate(self, project_path: Optional[Path] = None) -> int:
+        """Drop warm state for one project, or for all projects.
+
+        Args:
+            project_path: Project to drop, or None for every project
+
+        Returns:
+            Number of projects whose state was dropped
+        """
+        if project_path is None:
+            projects = {key[0] for key in self._configs} | set(self._analyzers)
+            self._configs.clear()
+            self._analyzers.clear()
+            return len(projects)
+
+        project = str(project_path.resolve())
+        config_keys = [key for key in self._configs if key[0] == project]
+        for key in config_keys:
+            del self._configs[key]
+        had_analyzer = self._analyzers.pop(project, None) is not None
+        return 1 if config_keys or had_analyzer else 0
+
+    @property
+    def projects(self) -> List[str]:
+        """Get the projects with warm state."""
+        return sorted({key[0] for key in self._configs} | set(self._analyzers))
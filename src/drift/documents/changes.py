@@ -0,0 +1,266 @@
+"""Changed files and the documents they affect, for incremental runs.
+
+Pre-commit hooks and pull request checks only need to validate what a change
+touched. A ChangeSet lists the files changed since a git ref (committed, staged,
+unstaged and untracked) or only the staged ones, and decides which documents a
+run must check: the changed files themselves plus their direct dependents,
+i.e. documents that link to a changed file and resources that list a changed
+skill under "skills:" in their frontmatter.
+
+For staged changes, the staged content of each changed file is read from the
+git index, so the commit is validated rather than the working tree.
+"""
+
+import logging
+import os
+import posixpath
+import subprocess
+from pathlib import Path, PurePath
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+import yaml
+
+from drift.core.types import DocumentBundle, DocumentFile
+from drift.documents.content import decode_document
+from drift.utils.frontmatter import extract_frontmatter
+from drift.utils.link_validator import LinkValidator
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for one git command
+GIT_TIMEOUT = 60
+
+# Skills live in .claude/skills/<name>/; any file in there changes the skill
+_SKILLS_DIR = (".claude", "skills")
+
+
+def _git(project_root: Path, *args: str, stdin: Optional[bytes] = None) -> bytes:
+    """Run a git command in project_root and return its output.
+
+    Args:
+        project_root: Directory to run git in
+        *args: git arguments (without the leading "git")
+        stdin: Optional input for the command
+
+    Returns:
+        Raw standard output
+
+    Raises:
+        ValueError: If git is missing, fails or times out
+    """
+    try:
+        completed = subprocess.run(
+            ["git", "-C", str(project_root), *args],
+            input=stdin,
+            capture_output=True,
+            timeout=GIT_TIMEOUT,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        raise ValueError(f"Failed to run git: {e}") from e
+    if completed.returncode != 0:
+        message = completed.stderr.decode("utf-8", "replace").strip()
+        raise ValueError(f"git {args[0]} failed: {message}")
+    return completed.stdout
+
+
+def _split_paths(output: bytes) -> List[str]:
+    """Split NUL-separated git path output."""
+    return [os.fsdecode(record) for record in output.split(b"\0") if record]
+
+
+def _read_blobs(project_root: Path, object_ids: List[str]) -> List[bytes]:
+    """Read git blobs in one "git cat-file --batch" call.
+
+    Args:
+        project_root: Directory to run git in
+        object_ids: Blob ids
+
+    Returns:
+        Blob contents, in the order of object_ids
+
+    Raises:
+        ValueError: If git fails or a blob is missing
+    """
+    output = _git(project_root, "cat-file", "--batch", stdin="\n".join(object_ids).encode() + b"\n")
+    blobs = []
+    position = 0
+    for object_id in object_ids:
+        # "<id> <type> <size>\n<content>\n", or "<id> missing\n"
+        header_end = output.index(b"\n", position)
+        header = output[position:header_end].split()
+        if len(header) != 3:
+            raise ValueError(f"git object {object_id} is missing")
+        size = int(header[2])
+        blobs.append(output[header_end + 1 : header_end + 1 + size])
+        position = header_end + 1 + size + 1
+    return blobs
+
+
+class ChangeSet:
+    """Files changed relative to a git ref or the index, and the documents they affect.
+
+    Build one with since() or staged(). Paths are POSIX paths relative to the
+    project root, including deleted files (documents linking to them are
+    affected too).
+
+    Args:
+        project_root: Project directory
+        paths: Changed paths relative to project_root
+        description: Human-readable origin of the change (e.g. "staged changes")
+        contents: Text to use instead of the working tree copy, per changed path
+
+    Attributes:
+        project_root: Project directory
+        paths: Changed paths
+        description: Origin of the change
+        contents: Content overrides per changed path (staged content)
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        paths: Iterable[str],
+        description: str,
+        contents: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Initialize a change set.
+
+        Args:
+            project_root: Project directory
+            paths: Changed paths relative to project_root
+            description: Human-readable origin of the change
+            contents: Content overrides per changed path
+        """
+        self.project_root = Path(project_root)
+        self.paths: FrozenSet[str] = frozenset(paths)
+        self.description = description
+        self.contents = contents or {}
+        self._skills: Set[str] = set()
+        for path in self.paths:
+            parts = path.split("/")
+            if len(parts) > 3 and tuple(parts[:2]) == _SKILLS_DIR:
+                self._skills.add(parts[2])
+        # Every reference to a changed file or skill mentions its name
+        self._names = {posixpath.basename(path) for path in self.paths} | self._skills
+        self._link_scanner = LinkValidator()
+        self._affected: Dict[str, bool] = {}
+
+    @classmethod
+    def since(cls, project_root: Path, ref: str) -> "ChangeSet":
+        """List files changed since the merge base of a git ref and HEAD.
+
+        Committed, staged, unstaged and untracked (but not ignored) changes
+        all count, as in a pull request built from the working tree.
+
+        Args:
+            project_root: Project directory inside a git working tree
+            ref: Git ref, e.g. "origin/main"
+
+        Returns:
+            ChangeSet of the changed paths
+
+        Raises:
+            ValueError: If git fails (not a repository, unknown ref)
+        """
+        merge_base = _git(project_root, "merge-base", ref, "HEAD").decode().strip()
+        changed = _split_paths(
+            _git(
+                project_root, "diff", "--name-only", "-z", "--relative", "--no-renames", merge_base
+            )
+        )
+        untracked = _split_paths(
+            _git(project_root, "ls-files", "-z", "--others", "--exclude-standard")
+        )
+        return cls(project_root, changed + untracked, f"changes since {ref}")
+
+    @classmethod
+    def staged(cls, project_root: Path) -> "ChangeSet":
+        """List staged files, with their staged content.
+
+        Args:
+            project_root: Project directory inside a git working tree
+
+        Returns:
+            ChangeSet of the staged paths, with contents read from the index
+
+        Raises:
+            ValueError: If git fails (e.g. not a repository)
+        """
+        changed = _split_paths(
+            _git(
+                project_root, "diff", "--cached", "--name-only", "-z", "--relative", "--no-renames"
+            )
+        )
+        contents: Dict[str, str] = {}
+        if changed:
+            # Deleted paths have no index entry; conflicted ones have no stage 0
+            object_ids: Dict[str, str] = {}
+            staged = _git(
+                project_root, "--literal-pathspecs", "ls-files", "-z", "--stage", "--", *changed
+            )
+            for record in _split_paths(staged):
+                info, _, path = record.partition("\t")
+                if info.endswith(" 0") and not info.startswith("160000"):
+                    object_ids[path] = info.split(" ")[1]
+            if object_ids:
+                blobs = _read_blobs(project_root, list(object_ids.values()))
+                for path, blob in zip(object_ids, blobs):
+                    contents[path] = decode_document(blob).text
+        return cls(project_root, changed, "staged changes", contents)
+
+    def affects(self, document: DocumentFile) -> bool:
+        """Check whether a document is changed or depends on a changed file.
+
+        Args:
+            document: Document to check
+
+        Returns:
+            True if the document must be validated
+        """
+        rel_path = PurePath(document.relative_path).as_posix()
+        affected = self._affected.get(rel_path)
+        if affected is None:
+            affected = rel_path in self.paths or self._depends_on_changes(rel_path, document)
+            self._affected[rel_path] = affected
+        return affected
+
+    def affects_bundle(self, bundle: DocumentBundle) -> bool:
+        """Check whether any file of a bundle is affected by the change.
+
+        Args:
+            bundle: Bundle to check
+
+        Returns:
+            True if the bundle must be validated
+        """
+        return any(self.affects(file) for file in bundle.files)
+
+    def _depends_on_changes(self, rel_path: str, document: DocumentFile) -> bool:
+        """Check whether a document links to a changed file or lists a changed skill."""
+        content = document.content
+        if not any(name in content for name in self._names):
+            return False
+
+        if self._skills:
+            try:
+                frontmatter = extract_frontmatter(content)
+            except yaml.YAMLError:
+                # Can't tell what it depends on; let validation report it
+                return True
+            skills = frontmatter.get("skills") if frontmatter else None
+            if isinstance(skills, list) and self._skills.intersection(map(str, skills)):
+                return True
+
+        document_dir = posixpath.dirname(rel_path)
+        for target in self._link_scanner.extract_all_file_references(content):
+            if self._link_scanner.categorize_link(target) != "local":
+                continue
+            target = target.split("#", 1)[0].split("?", 1)[0]
+            if not target or target.startswith("/"):
+                continue
+            # Links resolve from the document's directory or the project root
+            for candidate in (posixpath.join(document_dir, target), target):
+                if posixpath.normpath(candidate) in self.paths:
+                    return True
+        return False
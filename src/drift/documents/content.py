@@ -0,0 +1,97 @@
+"""Reading document file content.
+
+Files are opened in binary mode and the first block is sniffed for NUL bytes,
+so binary files (images, archives, compiled files) are reported as binary
+without being read in full or decoded. Large text files are decoded straight
+from a memory map, avoiding an intermediate bytes copy of the whole file.
+"""
+
+import mmap
+import os
+from pathlib import Path
+from typing import NamedTuple, Union
+
+# Bytes inspected to decide whether a file is binary
+SNIFF_BYTES = 8192
+
+# Files at least this large are decoded from a memory map
+MMAP_THRESHOLD = 1024 * 1024
+
+
+class DocumentContent(NamedTuple):
+    """Text of a document file and whether it was detected as binary."""
+
+    text: str
+    is_binary: bool
+
+
+def is_binary_data(sample: bytes) -> bool:
+    """Check whether a leading block of a file looks binary.
+
+    Args:
+        sample: First bytes of the file
+
+    Returns:
+        True if the sample contains a NUL byte (never valid in text documents)
+    """
+    return b"\0" in sample
+
+
+def _decode(data: Union[bytes, memoryview]) -> str:
+    """Decode file bytes like Path.read_text() with a latin-1 fallback."""
+    try:
+        text = str(data, "utf-8")
+    except UnicodeDecodeError:
+        text = str(data, "latin-1")
+    # Text-mode reads translate newlines; keep doing so
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def decode_document(data: bytes) -> DocumentContent:
+    """Decode document bytes held in memory (e.g. a staged git blob).
+
+    Args:
+        data: Complete file content
+
+    Returns:
+        DocumentContent, with empty text for binary data
+    """
+    if is_binary_data(data[:SNIFF_BYTES]):
+        return DocumentContent("", True)
+    return DocumentContent(_decode(data), False)
+
+
+def read_document_content(file_path: Path, mmap_threshold: int = MMAP_THRESHOLD) -> DocumentContent:
+    """Read a document file's text.
+
+    Text is decoded as UTF-8, falling back to latin-1. Binary files yield
+    empty text. Read errors are reported in the text (as "[Error reading
+    file: ...]") rather than raised, so one unreadable file does not stop a run.
+
+    Args:
+        file_path: Path to the file
+        mmap_threshold: Size in bytes from which the file is memory-mapped
+
+    Returns:
+        DocumentContent with the text and binary flag
+    """
+    try:
+        with file_path.open("rb") as handle:
+            head = handle.read(SNIFF_BYTES)
+            if is_binary_data(head):
+                return DocumentContent("", True)
+            if len(head) < SNIFF_BYTES:
+                return DocumentContent(_decode(head), False)
+
+            if os.fstat(handle.fileno()).st_size >= mmap_threshold:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    view = memoryview(mapped)
+                    try:
+                        return DocumentContent(_decode(view), False)
+                    finally:
+                        view.release()
+            return DocumentContent(_decode(head + handle.read()), False)
+    except Exception as e:
+        return DocumentContent(f"[Error reading file: {e}]", False)
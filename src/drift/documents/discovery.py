@@ -0,0 +1,445 @@
+"""Ignore-aware file discovery for document bundles.
+
+Bundle file patterns are expanded with os.scandir instead of Path.glob so that
+ignore rules can be applied while walking: directories whose whole subtree is
+ignored are never entered, and ignored files are dropped before anything opens
+them. Ignore rules come from the validators' ignore_patterns params and,
+optionally, from the project's .gitignore files.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Sequence, Tuple, Union
+
+from drift.utils.globs import split_glob, translate_path_glob, translate_segment
+from drift.validation.patterns import CompiledPatternSet, compile_patterns
+
+# A compiled glob segment: None for "**", a str for a literal name, else a regex
+_Segment = Union[None, str, Pattern[str]]
+
+
+class _GitIgnoreRule:
+    """One pattern line of a .gitignore file."""
+
+    __slots__ = ("regex", "negated", "dir_only")
+
+    def __init__(self, regex: Pattern[str], negated: bool, dir_only: bool) -> None:
+        self.regex = regex
+        self.negated = negated
+        self.dir_only = dir_only
+
+
+def _parse_gitignore_line(line: str) -> Optional[_GitIgnoreRule]:
+    """Parse one .gitignore line.
+
+    Args:
+        line: Line from a .gitignore file, without the newline
+
+    Returns:
+        Parsed rule, or None for blank lines and comments
+    """
+    if not line or line.startswith("#"):
+        return None
+    # Trailing spaces are ignored unless escaped with a backslash
+    stripped = line.rstrip(" ")
+    if stripped.endswith("\\") and len(stripped) < len(line):
+        stripped += " "
+    line = stripped
+
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+    elif line.startswith(("\\!", "\\#")):
+        line = line[1:]
+
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+
+    # A slash at the start or in the middle anchors the pattern to the
+    # .gitignore's directory; otherwise it matches at any depth
+    anchored = "/" in line
+    segments = split_glob(line)
+    if not segments:
+        return None
+    if not anchored:
+        segments = ["**"] + segments
+    if segments[-1] == "**" and len(segments) > 1:
+        # "dir/**" matches everything inside dir, but not dir itself
+        regex = translate_path_glob(segments[:-1]) + "(?:/[^/]+)+"
+    else:
+        regex = translate_path_glob(segments)
+    return _GitIgnoreRule(re.compile(regex), negated, dir_only)
+
+
+class GitIgnoreMatcher:
+    """Evaluates a project's .gitignore files for paths below its root.
+
+    Rules are read from .git/info/exclude and from the .gitignore file of every
+    directory on the way to a path, deeper files taking precedence and the
+    last matching line of a file winning, as in git. Files are read lazily and
+    parsed once.
+
+    Args:
+        root: Project root directory
+    """
+
+    def __init__(self, root: Path) -> None:
+        """Initialize the matcher.
+
+        Args:
+            root: Project root directory
+        """
+        self.root = Path(root)
+        self._rules: Dict[str, List[_GitIgnoreRule]] = {
+            "": self._read_rules(self.root / ".git" / "info" / "exclude")
+            + self._read_rules(self.root / ".gitignore")
+        }
+
+    @staticmethod
+    def _read_rules(path: Path) -> List[_GitIgnoreRule]:
+        """Parse the rules of one ignore file (empty if it cannot be read)."""
+        try:
+            lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+        except OSError:
+            return []
+        rules = []
+        for line in lines:
+            rule = _parse_gitignore_line(line)
+            if rule is not None:
+                rules.append(rule)
+        return rules
+
+    def _rules_for(self, rel_dir: str) -> List[_GitIgnoreRule]:
+        """Get the rules of the .gitignore file in a directory."""
+        rules = self._rules.get(rel_dir)
+        if rules is None:
+            rules = self._read_rules(self.root / rel_dir / ".gitignore")
+            self._rules[rel_dir] = rules
+        return rules
+
+    def is_ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """Check whether git would ignore a path.
+
+        Parent directories are not checked: callers walking the tree prune
+        ignored directories before reaching their contents.
+
+        Args:
+            rel_path: POSIX path relative to the root
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the path is ignored
+        """
+        parts = rel_path.split("/")
+        if is_dir and parts[-1] == ".git":
+            return True
+        ignored = False
+        for depth in range(len(parts)):
+            rules = self._rules_for("/".join(parts[:depth]))
+            if not rules:
+                continue
+            sub_path = "/".join(parts[depth:])
+            for rule in rules:
+                if rule.dir_only and not is_dir:
+                    continue
+                if rule.regex.fullmatch(sub_path):
+                    ignored = not rule.negated
+        return ignored
+
+
+class DiscoveryFilter:
+    """Decides which files and directories bundle discovery skips.
+
+    Several validation rules usually share one bundle, each with its own
+    ignore_patterns. A file is only skipped when every one of those pattern
+    lists ignores it, so no rule loses a file it would have checked. A
+    directory is pruned when every list ignores its whole subtree (a glob
+    ending in "**" such as "node_modules/**"). Paths ignored by git are
+    skipped when a GitIgnoreMatcher is given.
+
+    Args:
+        ignore_pattern_sets: Pattern lists (glob or regex), one per rule
+        gitignore: Optional matcher for the project's .gitignore files
+    """
+
+    def __init__(
+        self,
+        ignore_pattern_sets: Iterable[Sequence[str]] = (),
+        gitignore: Optional[GitIgnoreMatcher] = None,
+    ) -> None:
+        """Compile the pattern lists.
+
+        Args:
+            ignore_pattern_sets: Pattern lists (glob or regex), one per rule
+            gitignore: Optional matcher for the project's .gitignore files
+
+        Raises:
+            ValueError: If a regex pattern is invalid
+        """
+        self._pattern_sets: List[CompiledPatternSet] = [
+            compile_patterns(patterns) for patterns in ignore_pattern_sets
+        ]
+        if not all(self._pattern_sets):
+            # A rule without ignore patterns needs every file
+            self._pattern_sets = []
+        self.gitignore = gitignore
+
+    def __bool__(self) -> bool:
+        """Check whether the filter can skip anything."""
+        return bool(self._pattern_sets) or self.gitignore is not None
+
+    def skips_file(self, rel_path: str) -> bool:
+        """Check whether discovery should skip a file.
+
+        Args:
+            rel_path: POSIX path relative to the project root
+
+        Returns:
+            True if the file should not be loaded
+        """
+        if self._pattern_sets and all(
+            patterns.matches(rel_path) for patterns in self._pattern_sets
+        ):
+            return True
+        return self.gitignore is not None and self.gitignore.is_ignored(rel_path, False)
+
+    def skips_dir(self, rel_path: str) -> bool:
+        """Check whether discovery should not descend into a directory.
+
+        Args:
+            rel_path: POSIX path relative to the project root
+
+        Returns:
+            True if nothing below the directory can be loaded
+        """
+        if self._pattern_sets and all(
+            patterns.matches_tree(rel_path) for patterns in self._pattern_sets
+        ):
+            return True
+        return self.gitignore is not None and self.gitignore.is_ignored(rel_path, True)
+
+
+def _compile_segment(segment: str) -> _Segment:
+    """Compile one glob segment for matching directory entry names."""
+    if segment == "**":
+        return None
+    if not any(char in segment for char in "*?["):
+        return segment
+    return re.compile(translate_segment(segment))
+
+
+def _compile_pattern(pattern: str) -> Optional[List[_Segment]]:
+    """Compile a glob into segments, or None if it cannot match files."""
+    segments = split_glob(pattern)
+    if not segments or segments[-1] == "**":
+        # Path.glob() only yields directories for a trailing "**"
+        return None
+    return [_compile_segment(segment) for segment in segments]
+
+
+class _Listing:
+    """Entries of one directory: name -> (is_dir, is_file, is_symlink)."""
+
+    __slots__ = ("entries", "folded")
+
+    def __init__(self, entries: Dict[str, Tuple[bool, bool, bool]]) -> None:
+        self.entries = entries
+        # Case-folded name -> name, built on the first case-insensitive lookup
+        self.folded: Optional[Dict[str, str]] = None
+
+
+# A walk state: (pattern index, index of the next segment to match)
+_State = Tuple[int, int]
+
+
+class FileDiscovery:
+    """Expands glob patterns over directory listings cached for a run.
+
+    Each directory is listed at most once with os.scandir, however many
+    patterns, bundles and resource lookups touch it, and all patterns given to
+    one glob() call are matched during a single walk. Literal path components
+    are resolved against the listing, so results carry the names as stored on
+    disk even on case-insensitive filesystems.
+
+    Listings are never refreshed: use one instance per run.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty listing cache."""
+        self._listings: Dict[str, Optional[_Listing]] = {}
+
+    def _listing(self, abs_dir: str) -> Optional[_Listing]:
+        """Get the cached listing of a directory (None if it cannot be read)."""
+        if abs_dir in self._listings:
+            return self._listings[abs_dir]
+        entries: Dict[str, Tuple[bool, bool, bool]] = {}
+        listing: Optional[_Listing]
+        try:
+            with os.scandir(abs_dir) as scanned:
+                for entry in scanned:
+                    try:
+                        is_dir = entry.is_dir()
+                        entries[entry.name] = (
+                            is_dir,
+                            not is_dir and entry.is_file(),
+                            entry.is_symlink(),
+                        )
+                    except OSError:
+                        continue
+            listing = _Listing(entries)
+        except OSError:
+            listing = None
+        self._listings[abs_dir] = listing
+        return listing
+
+    @staticmethod
+    def _resolve_literal(abs_dir: str, listing: _Listing, name: str) -> Optional[str]:
+        """Find the on-disk name of a literal path component.
+
+        Args:
+            abs_dir: Directory the listing belongs to
+            listing: Listing of abs_dir
+            name: Name from the pattern
+
+        Returns:
+            Entry name, which differs from name only in case on case-insensitive
+            filesystems, or None if there is no such entry
+        """
+        if name in listing.entries:
+            return name
+        if listing.folded is None:
+            listing.folded = {entry.casefold(): entry for entry in listing.entries}
+        actual = listing.folded.get(name.casefold())
+        # Only a case-insensitive filesystem lets the pattern's spelling resolve
+        if actual is not None and os.path.exists(os.path.join(abs_dir, name)):
+            return actual
+        return None
+
+    def glob(
+        self,
+        base: Path,
+        patterns: Sequence[str],
+        project_root: Optional[Path] = None,
+        discovery_filter: Optional[DiscoveryFilter] = None,
+    ) -> List[Path]:
+        """Find the files below base matching any of the glob patterns.
+
+        Matches what Path.glob() yields for files: "*", "?" and "[...]" match
+        within one path component and "**" matches zero or more directories
+        (without following symlinks).
+
+        Args:
+            base: Directory the patterns are relative to
+            patterns: Glob patterns (e.g. ".claude/skills/*/SKILL.md")
+            project_root: Root that ignore rules are relative to (default: base)
+            discovery_filter: Optional filter for files and directories to skip
+
+        Returns:
+            Sorted, de-duplicated list of matching file paths
+        """
+        compiled = [segments for segments in map(_compile_pattern, patterns) if segments]
+        if not compiled:
+            return []
+        if discovery_filter is not None and not discovery_filter:
+            discovery_filter = None
+
+        base_rel = ""
+        if project_root is not None and base != project_root:
+            try:
+                base_rel = base.relative_to(project_root).as_posix()
+            except ValueError:
+                base_rel = ""
+
+        found = set()
+        start = self._closure(compiled, [(index, 0) for index in range(len(compiled))])
+        stack: List[Tuple[str, str, FrozenSet[_State]]] = [(str(base), base_rel, start)]
+        while stack:
+            abs_dir, rel_dir, states = stack.pop()
+            listing = self._listing(abs_dir)
+            if listing is None:
+                continue
+
+            literals: Dict[_State, str] = {}
+            wildcard = False
+            for state in states:
+                segment = compiled[state[0]][state[1]]
+                if isinstance(segment, str):
+                    actual = self._resolve_literal(abs_dir, listing, segment)
+                    if actual is not None:
+                        literals[state] = actual
+                else:
+                    wildcard = True
+            names: Iterable[str] = listing.entries if wildcard else set(literals.values())
+
+            for name in names:
+                is_dir, is_file, is_symlink = listing.entries[name]
+                next_states = set()
+                for state in states:
+                    pattern_index, segment_index = state
+                    segment = compiled[pattern_index][segment_index]
+                    if segment is None:
+                        # "**" consumes real directories only
+                        if is_dir and not is_symlink:
+                            next_states.add(state)
+                    elif isinstance(segment, str):
+                        if literals.get(state) == name:
+                            next_states.add((pattern_index, segment_index + 1))
+                    elif segment.fullmatch(name):
+                        next_states.add((pattern_index, segment_index + 1))
+                if not next_states:
+                    continue
+
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                deeper = [state for state in next_states if state[1] < len(compiled[state[0]])]
+                if is_file and len(deeper) < len(next_states):
+                    if discovery_filter is None or not discovery_filter.skips_file(rel_path):
+                        found.add(os.path.join(abs_dir, name))
+                if is_dir and deeper:
+                    if discovery_filter is None or not discovery_filter.skips_dir(rel_path):
+                        stack.append(
+                            (
+                                os.path.join(abs_dir, name),
+                                rel_path,
+                                self._closure(compiled, deeper),
+                            )
+                        )
+
+        return [Path(path) for path in sorted(found)]
+
+    @staticmethod
+    def _closure(
+        compiled: Sequence[Sequence[_Segment]], states: Iterable[_State]
+    ) -> FrozenSet[_State]:
+        """Add the states reached by letting each "**" match zero directories."""
+        result = set(states)
+        for pattern_index, segment_index in list(result):
+            segments = compiled[pattern_index]
+            while segment_index < len(segments) and segments[segment_index] is None:
+                segment_index += 1
+                result.add((pattern_index, segment_index))
+        return frozenset(result)
+
+
+def glob_files(
+    base: Path,
+    pattern: str,
+    project_root: Optional[Path] = None,
+    discovery_filter: Optional[DiscoveryFilter] = None,
+) -> List[Path]:
+    """Find the files below base matching a glob pattern, skipping ignored paths.
+
+    One-off form of FileDiscovery.glob() without a shared listing cache.
+
+    Args:
+        base: Directory the pattern is relative to
+        pattern: Glob pattern (e.g. ".claude/skills/*/SKILL.md")
+        project_root: Root that ignore rules are relative to (default: base)
+        discovery_filter: Optional filter for files and directories to skip
+
+    Returns:
+        Sorted list of matching file paths
+    """
+    return FileDiscovery().glob(base, [pattern], project_root, discovery_filter)
@@ -0,0 +1,328 @@
+"""Bundle file discovery from the git index.
+
+Walking a large repository with os.scandir lists every directory, including
+build output and dependencies. Git already knows the project's files: the
+index holds every tracked path with the blob id of its staged content, and
+"git ls-files --others --exclude-standard" adds untracked files that are not
+ignored. GitFileIndex enumerates candidates from those lists once per run and
+matches glob patterns against them in memory.
+
+Blob ids double as free content fingerprints: for a tracked file whose working
+tree copy is unmodified, the blob id identifies its content without reading it.
+
+Compared with walking the filesystem, discovery from the index:
+
+- never yields untracked files ignored by git (tracked files always count)
+- does not look inside submodules or symlinked directories
+- matches literal pattern components case-sensitively
+"""
+
+import bisect
+import logging
+import os
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from drift.documents.discovery import DiscoveryFilter
+from drift.utils.globs import compile_glob, split_glob
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for one git command
+GIT_TIMEOUT = 60
+
+# Paths per fingerprint lookup, to stay below command line length limits
+FINGERPRINT_BATCH = 1000
+
+# Mode of submodule (gitlink) index entries
+_GITLINK_MODE = "160000"
+
+
+def _start_git(project_root: Path, *args: str) -> Optional["subprocess.Popen[bytes]"]:
+    """Start a git command in project_root with its output piped.
+
+    Args:
+        project_root: Directory to run git in
+        *args: git arguments (without the leading "git")
+
+    Returns:
+        The running process, or None if git cannot be started
+    """
+    try:
+        return subprocess.Popen(
+            ["git", "-C", str(project_root), *args],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except OSError as e:
+        logger.debug(f"git {args[0]} failed in {project_root}: {e}")
+        return None
+
+
+def _finish_git(process: Optional["subprocess.Popen[bytes]"]) -> Optional[List[str]]:
+    """Wait for a git listing command started with _start_git().
+
+    Args:
+        process: Process running a command with NUL-separated output (-z)
+
+    Returns:
+        Output records, or None if git failed or timed out
+    """
+    if process is None:
+        return None
+    try:
+        stdout, stderr = process.communicate(timeout=GIT_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        logger.debug(f"git timed out after {GIT_TIMEOUT}s: {process.args!r}")
+        return None
+    if process.returncode != 0:
+        logger.debug(
+            f"git exited with {process.returncode}: {process.args!r}: "
+            f"{stderr.decode('utf-8', 'replace').strip()}"
+        )
+        return None
+    # Decoding once and splitting the text is much faster than per record
+    records = os.fsdecode(stdout).split("\0")
+    if records and not records[-1]:
+        records.pop()
+    return records
+
+
+def _run_git(project_root: Path, *args: str) -> Optional[List[str]]:
+    """Run a NUL-separated git listing command in project_root.
+
+    Args:
+        project_root: Directory to run git in
+        *args: git arguments (without the leading "git")
+
+    Returns:
+        Output records, or None if git is missing, failed or timed out
+    """
+    return _finish_git(_start_git(project_root, *args))
+
+
+def _literal_prefix(segments: Sequence[str]) -> str:
+    """Get the leading glob components that contain no wildcards, joined by "/"."""
+    prefix = []
+    for segment in segments:
+        if segment == "**" or any(char in segment for char in "*?["):
+            break
+        prefix.append(segment)
+    return "/".join(prefix)
+
+
+class GitFileIndex:
+    """Files of a git working tree below a project root, listed by git.
+
+    Use load() to build one; it returns None outside a git working tree.
+    Blob ids are looked up on demand, for the files that were matched.
+
+    Args:
+        project_root: Project directory (may be a subdirectory of the repository)
+        paths: POSIX paths relative to project_root, sorted
+    """
+
+    def __init__(self, project_root: Path, paths: List[str]) -> None:
+        """Initialize from listed paths.
+
+        Args:
+            project_root: Project directory
+            paths: Sorted POSIX paths relative to project_root
+        """
+        self.project_root = Path(project_root)
+        self._root_str = str(self.project_root)
+        self._paths = paths
+        # Looked-up fingerprints: blob id, or None if the file has none
+        self._fingerprints: Dict[str, Optional[str]] = {}
+
+    @classmethod
+    def load(cls, project_root: Path) -> Optional["GitFileIndex"]:
+        """List the files of the git working tree containing project_root.
+
+        Args:
+            project_root: Project directory
+
+        Returns:
+            GitFileIndex, or None if project_root is not in a git working tree
+            or git is not available
+        """
+        # Both listings run concurrently; the untracked one walks the tree
+        tracked_process = _start_git(project_root, "ls-files", "-z", "--cached")
+        untracked_process = _start_git(
+            project_root, "ls-files", "-z", "--others", "--exclude-standard"
+        )
+        tracked = _finish_git(tracked_process)
+        untracked = _finish_git(untracked_process)
+        if tracked is None or untracked is None:
+            return None
+
+        # Conflicted paths are listed once per stage. git sorts its output, so
+        # sorting after appending the few untracked paths is nearly free.
+        paths = sorted(dict.fromkeys(tracked + untracked))
+        logger.debug(f"git index lists {len(paths)} files under {project_root}")
+        return cls(project_root, paths)
+
+    def __len__(self) -> int:
+        """Get the number of listed files."""
+        return len(self._paths)
+
+    def _under(self, prefix: str) -> List[str]:
+        """Get the listed paths inside a directory ("" for the project root)."""
+        if not prefix:
+            return self._paths
+        # Paths starting with "prefix/" sort between "prefix/" and "prefix0"
+        low = bisect.bisect_left(self._paths, prefix + "/")
+        high = bisect.bisect_left(self._paths, prefix + "0")
+        return self._paths[low:high]
+
+    def glob(
+        self,
+        base: Path,
+        patterns: Sequence[str],
+        discovery_filter: Optional[DiscoveryFilter] = None,
+    ) -> Optional[List[Path]]:
+        """Find listed files below base matching any of the glob patterns.
+
+        Patterns have the same meaning as for FileDiscovery.glob(). The
+        filter's paths are relative to the project root.
+
+        Args:
+            base: Directory the patterns are relative to
+            patterns: Glob patterns
+            discovery_filter: Optional filter for files and directories to skip
+
+        Returns:
+            Sorted list of existing matching files, or None if the index cannot
+            answer (base outside the project root or a pattern using "..")
+        """
+        base_rel = self._relative(base)
+        if base_rel is None:
+            return None
+        base_rel = "" if base_rel == "." else base_rel
+        if discovery_filter is not None and not discovery_filter:
+            discovery_filter = None
+
+        candidates: Set[str] = set()
+        for pattern in patterns:
+            segments = split_glob(pattern)
+            if ".." in segments:
+                return None
+            regex = compile_glob(pattern)
+            # Only directory components narrow the search; the last one names files
+            prefix = "/".join(part for part in (base_rel, _literal_prefix(segments[:-1])) if part)
+            offset = len(base_rel) + 1 if base_rel else 0
+            for path in self._under(prefix):
+                if regex.fullmatch(path[offset:]):
+                    candidates.add(path)
+
+        skipped_dirs: Dict[str, bool] = {}
+        found = []
+        for path in candidates:
+            if discovery_filter is not None and self._skipped(
+                path, base_rel, discovery_filter, skipped_dirs
+            ):
+                continue
+            abs_path = os.path.join(self._root_str, *path.split("/"))
+            # Deleted but still staged files, and symlinks to directories
+            if os.path.isfile(abs_path):
+                found.append(abs_path)
+        return [Path(path) for path in sorted(found)]
+
+    @staticmethod
+    def _skipped(
+        path: str,
+        base_rel: str,
+        discovery_filter: DiscoveryFilter,
+        skipped_dirs: Dict[str, bool],
+    ) -> bool:
+        """Check whether the filter skips a file or a directory between base and it."""
+        parts = path.split("/")
+        start = len(base_rel.split("/")) + 1 if base_rel else 1
+        for depth in range(start, len(parts)):
+            directory = "/".join(parts[:depth])
+            skipped = skipped_dirs.get(directory)
+            if skipped is None:
+                skipped = discovery_filter.skips_dir(directory)
+                skipped_dirs[directory] = skipped
+            if skipped:
+                return True
+        return discovery_filter.skips_file(path)
+
+    def _relative(self, file_path: Path) -> Optional[str]:
+        """Get a path relative to the project root, or None if outside it."""
+        try:
+            return file_path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return None
+
+    def load_fingerprints(self, file_paths: Iterable[Path]) -> None:
+        """Look up the fingerprints of several files in as few git calls as possible.
+
+        fingerprint() looks files up one at a time; loading the files of a
+        glob result up front batches that work.
+
+        Args:
+            file_paths: Absolute paths of listed files
+        """
+        pending = []
+        for file_path in file_paths:
+            rel_path = self._relative(file_path)
+            if rel_path is not None and rel_path not in self._fingerprints:
+                pending.append(rel_path)
+        for start in range(0, len(pending), FINGERPRINT_BATCH):
+            batch = pending[start : start + FINGERPRINT_BATCH]
+            pathspec = ("--", *batch)
+            staged_process = _start_git(
+                self.project_root, "--literal-pathspecs", "ls-files", "-z", "--stage", *pathspec
+            )
+            modified_process = _start_git(
+                self.project_root, "--literal-pathspecs", "ls-files", "-z", "--modified", *pathspec
+            )
+            staged = _finish_git(staged_process)
+            modified = _finish_git(modified_process)
+
+            fingerprints: Dict[str, Optional[str]] = dict.fromkeys(batch)
+            if staged is not None and modified is not None:
+                # Modified files no longer have their staged content
+                untrusted = set(modified)
+                for record in staged:
+                    # "<mode> <blob id> <stage>\t<path>", with a 1-digit stage
+                    info, _, path = record.partition("\t")
+                    if info[-1] != "0":
+                        untrusted.add(path)
+                    elif path in fingerprints and not info.startswith(_GITLINK_MODE):
+                        fingerprints[path] = info[7:-2]
+                for path in untrusted:
+                    fingerprints[path] = None
+            self._fingerprints.update(fingerprints)
+
+    def forget_fingerprints(self, file_paths: Iterable[Path]) -> None:
+        """Drop looked-up fingerprints of files that may have changed since.
+
+        Args:
+            file_paths: Absolute paths of listed files
+        """
+        for file_path in file_paths:
+            rel_path = self._relative(file_path)
+            if rel_path is not None:
+                self._fingerprints.pop(rel_path, None)
+
+    def fingerprint(self, file_path: Path) -> Optional[str]:
+        """Get the blob id of a file whose working tree copy matches the index.
+
+        Args:
+            file_path: Absolute path of a listed file
+
+        Returns:
+            Hex blob id, or None for untracked, modified or conflicted files
+            (and if git fails)
+        """
+        rel_path = self._relative(file_path)
+        if rel_path is None:
+            return None
+        if rel_path not in self._fingerprints:
+            self.load_fingerprints([file_path])
+        return self._fingerprints.get(rel_path)
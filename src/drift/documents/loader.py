@@ -1,23 +1,110 @@
 """Document loader for analyzing project documentation."""
 
 import hashlib
+import logging
 from pathlib import Path
-from typing import List
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple
 
-from drift.config.models import BundleStrategy, DocumentBundleConfig
+from drift.config.models import BundleStrategy, DiscoveryBackend, DocumentBundleConfig
 from drift.core.types import DocumentBundle, DocumentFile
+from drift.documents.discovery import DiscoveryFilter, FileDiscovery, GitIgnoreMatcher
+from drift.documents.git_index import GitFileIndex
+from drift.documents.overlay import get_overlay
+from drift.utils.globs import split_glob
 
+logger = logging.getLogger(__name__)
+
+
+def _canonical_patterns(patterns: Sequence[str]) -> Tuple[str, ...]:
+    """Normalize glob patterns for use in a cache key.
+
+    Discovery results are sorted and deduplicated, so pattern order and
+    repeats don't matter; "./", "//" and repeated "**" components don't either.
+
+    Args:
+        patterns: Glob patterns
+
+    Returns:
+        Sorted tuple of distinct normalized patterns
+    """
+    return tuple(sorted({"/".join(split_glob(pattern)) for pattern in patterns}))
 
-class DocumentLoader:
-    """Loads and processes document bundles for analysis."""
 
-    def __init__(self, project_path: Path):
+def bundle_cache_key(
+    bundle_config: DocumentBundleConfig,
+    ignore_pattern_sets: Optional[Sequence[Sequence[str]]] = None,
+) -> Hashable:
+    """Build the key under which DocumentLoader caches a load_bundles() result.
+
+    Two configs get the same key exactly when they load the same bundles:
+    same bundle type and strategy, and the same file and resource patterns
+    up to order, repeats and redundant path components.
+
+    Args:
+        bundle_config: Bundle configuration
+        ignore_pattern_sets: ignore_patterns lists passed to load_bundles()
+
+    Returns:
+        Hashable cache key
+    """
+    sets = [frozenset(patterns) for patterns in ignore_pattern_sets or ()]
+    # An empty list ignores nothing, which disables discovery filtering altogether
+    ignore_key: FrozenSet[FrozenSet[str]] = (
+        frozenset() if any(not patterns for patterns in sets) else frozenset(sets)
+    )
+    return (
+        bundle_config.bundle_type,
+        bundle_config.bundle_strategy.value,
+        _canonical_patterns(bundle_config.file_patterns),
+        _canonical_patterns(bundle_config.resource_patterns),
+        ignore_key,
+    )
+
+
+class DocumentLoader:
+    """Loads and processes document bundles for analysis.
+
+    Directory listings, loaded bundles and DocumentFile objects are cached
+    for the loader's lifetime, so a loader should not outlive the run it was
+    created for unless its owner reports edited files with refresh(). Rules
+    sharing a bundle configuration get the same bundles, and bundles from
+    different configurations share the DocumentFile of every file they have
+    in common, so each file is read at most once.
+
+    Files with a buffer in the current overlay_session() get the buffer's
+    text as content.
+    """
+
+    def __init__(
+        self,
+        project_path: Path,
+        respect_gitignore: bool = False,
+        backend: DiscoveryBackend = DiscoveryBackend.FILESYSTEM,
+        content_overrides: Optional[Mapping[str, str]] = None,
+    ):
         """Initialize document loader.
 
         Args:
             project_path: Root path of the project
+            respect_gitignore: Skip files and directories ignored by .gitignore
+                files during discovery
+            backend: How to enumerate candidate files. The git backend lists
+                them from the git index (falling back to walking the filesystem
+                outside a git working tree) and fingerprints unmodified tracked
+                files with their blob ids.
+            content_overrides: Content to use instead of reading the file, by
+                POSIX path relative to project_path (e.g. staged content)
         """
         self.project_path = Path(project_path)
+        self.respect_gitignore = respect_gitignore
+        self.backend = DiscoveryBackend(backend)
+        self.content_overrides = content_overrides or {}
+        self._gitignore: Optional[GitIgnoreMatcher] = None
+        self._discovery = FileDiscovery()
+        self._git_index: Optional[GitFileIndex] = None
+        self._git_index_loaded = False
+        self._bundles: Dict[Hashable, List[DocumentBundle]] = {}
+        self._documents: Dict[Path, DocumentFile] = {}
 
     def list_resources(self, resource_type: str) -> List[str]:
         """List available resources of a given type.
@@ -41,50 +128,99 @@ class DocumentLoader:
             return []
 
         resource_names = []
-        for pattern in patterns:
-            matches = self.project_path.glob(pattern)
-            for match in matches:
-                if match.is_file():
-                    # Extract resource name from path
-                    if resource_type in ["skill", "agent"]:
-                        # For skills/agents, use parent directory name
-                        resource_names.append(match.parent.name)
-                    elif resource_type in ["command", "rule"]:
-                        # For commands/rules, use filename without extension
-                        resource_names.append(match.stem)
+        for match in self._glob(self.project_path, patterns):
+            # Extract resource name from path
+            if resource_type in ["skill", "agent"]:
+                # For skills/agents, use parent directory name
+                resource_names.append(match.parent.name)
+            elif resource_type in ["command", "rule"]:
+                # For commands/rules, use filename without extension
+                resource_names.append(match.stem)
 
         return sorted(set(resource_names))
 
-    def load_bundles(self, bundle_config: DocumentBundleConfig) -> List[DocumentBundle]:
+    def load_bundles(
+        self,
+        bundle_config: DocumentBundleConfig,
+        ignore_pattern_sets: Optional[Sequence[Sequence[str]]] = None,
+    ) -> List[DocumentBundle]:
         """Load document bundles based on configuration.
 
         Args:
             bundle_config: Configuration specifying how to load bundles
+            ignore_pattern_sets: Optional ignore_patterns lists of the rules that
+                will validate the bundles. Files every list ignores are skipped
+                during discovery and never read.
+
+        Returns:
+            List of document bundles ready for analysis. Repeated calls with an
+            equivalent configuration (see bundle_cache_key()) return the same
+            bundle objects, which must not be modified.
+        """
+        key = bundle_cache_key(bundle_config, ignore_pattern_sets)
+        cached = self._bundles.get(key)
+        if cached is None:
+            cached = self._load_bundles(bundle_config, ignore_pattern_sets)
+            self._bundles[key] = cached
+        return list(cached)
+
+    def _load_bundles(
+        self,
+        bundle_config: DocumentBundleConfig,
+        ignore_pattern_sets: Optional[Sequence[Sequence[str]]],
+    ) -> List[DocumentBundle]:
+        """Discover files and build bundles, bypassing the bundle cache.
+
+        Args:
+            bundle_config: Configuration specifying how to load bundles
+            ignore_pattern_sets: ignore_patterns lists of the validating rules
 
         Returns:
-            List of document bundles ready for analysis
+            List of document bundles
         """
+        discovery_filter = self._discovery_filter(ignore_pattern_sets)
+
         # Discover main files matching patterns
-        main_files = self._discover_files(bundle_config.file_patterns)
+        main_files = self._discover_files(bundle_config.file_patterns, discovery_filter)
 
         if not main_files:
             return []
 
         if bundle_config.bundle_strategy == BundleStrategy.INDIVIDUAL:
             # Each file becomes its own bundle (with optional resources)
-            return self._create_individual_bundles(main_files, bundle_config)
+            return self._create_individual_bundles(main_files, bundle_config, discovery_filter)
         else:
             # All files combined into single bundle
             return self._create_collection_bundle(main_files, bundle_config)
 
+    def _discovery_filter(
+        self, ignore_pattern_sets: Optional[Sequence[Sequence[str]]]
+    ) -> Optional[DiscoveryFilter]:
+        """Build the filter applied while discovering files.
+
+        Args:
+            ignore_pattern_sets: ignore_patterns lists, one per rule
+
+        Returns:
+            DiscoveryFilter, or None if nothing would be skipped
+        """
+        if self.respect_gitignore and self._gitignore is None:
+            self._gitignore = GitIgnoreMatcher(self.project_path)
+        discovery_filter = DiscoveryFilter(ignore_pattern_sets or (), self._gitignore)
+        return discovery_filter if discovery_filter else None
+
     def _create_individual_bundles(
-        self, main_files: List[Path], bundle_config: DocumentBundleConfig
+        self,
+        main_files: List[Path],
+        bundle_config: DocumentBundleConfig,
+        discovery_filter: Optional[DiscoveryFilter] = None,
     ) -> List[DocumentBundle]:
         """Create individual bundles, one per main file.
 
         Args:
             main_files: List of main document files
             bundle_config: Bundle configuration
+            discovery_filter: Optional filter for resource files to skip
 
         Returns:
             List of individual document bundles
@@ -97,7 +233,7 @@ class DocumentLoader:
             # If resource patterns specified, find resources relative to main file's directory
             if bundle_config.resource_patterns:
                 resource_files = self._discover_resources(
-                    main_file, bundle_config.resource_patterns
+                    main_file, bundle_config.resource_patterns, discovery_filter
                 )
                 files.extend([self._create_document_file(f) for f in resource_files])
 
@@ -142,115 +278,153 @@ class DocumentLoader:
 
         return [bundle]
 
-    def _discover_files(self, patterns: List[str]) -> List[Path]:
+    def _discover_files(
+        self, patterns: List[str], discovery_filter: Optional[DiscoveryFilter] = None
+    ) -> List[Path]:
         """Find files matching glob patterns relative to project root.
 
         Args:
             patterns: List of glob patterns (e.g., ".claude/skills/*/SKILL.md")
+            discovery_filter: Optional filter for files and directories to skip
 
         Returns:
             List of absolute paths to matching files
         """
-        found_files = []
-
-        for pattern in patterns:
-            # Glob from project root
-            matches = self.project_path.glob(pattern)
-            for match in matches:
-                if match.is_file():
-                    found_files.append(match)
-
-        # Remove duplicates and sort by path
-        # Use string representation for deduplication to handle case-insensitive
-        # filesystems (e.g., macOS) where different case patterns may match same file
-        seen = set()
-        unique_files = []
-        for file_path in found_files:
-            # Normalize by converting to lowercase for comparison on case-insensitive systems
-            key = str(file_path).lower()
-            if key not in seen:
-                seen.add(key)
-                # On case-insensitive filesystems, glob returns the pattern's casing, not the file's
-                # Get the actual filesystem casing by listing the parent directory
-                try:
-                    parent = file_path.parent
-                    actual_name = None
-                    for item in parent.iterdir():
-                        if item.name.lower() == file_path.name.lower():
-                            actual_name = item.name
-                            break
-
-                    if actual_name and actual_name != file_path.name:
-                        # Use the actual filesystem casing
-                        actual_path = parent / actual_name
-                        unique_files.append(actual_path)
-                    else:
-                        unique_files.append(file_path)
-                except (OSError, RuntimeError):
-                    # If reading directory fails, fall back to original path
-                    unique_files.append(file_path)
-
-        return sorted(unique_files)
-
-    def _discover_resources(self, main_file: Path, resource_patterns: List[str]) -> List[Path]:
+        # One walk for all patterns; names come back with their on-disk casing,
+        # so a file matched by both "SKILL.md" and "skill.md" patterns on a
+        # case-insensitive filesystem is found once
+        return self._glob(self.project_path, patterns, discovery_filter)
+
+    def _discover_resources(
+        self,
+        main_file: Path,
+        resource_patterns: List[str],
+        discovery_filter: Optional[DiscoveryFilter] = None,
+    ) -> List[Path]:
         """Find resource files relative to a main file's directory.
 
         Args:
             main_file: The main document file
             resource_patterns: Glob patterns for resources (e.g., "**/*.py")
+            discovery_filter: Optional filter for files and directories to skip
 
         Returns:
             List of resource file paths
         """
-        resource_dir = main_file.parent
-        found_resources = []
-
-        for pattern in resource_patterns:
-            matches = resource_dir.glob(pattern)
-            for match in matches:
-                # Skip the main file itself
-                if match.is_file() and match != main_file:
-                    found_resources.append(match)
-
-        return sorted(set(found_resources))
-
-    def _create_document_file(self, file_path: Path) -> DocumentFile:
-        """Create a DocumentFile from a path.
+        matches = self._glob(main_file.parent, resource_patterns, discovery_filter)
+        # Skip the main file itself
+        return [match for match in matches if match != main_file]
+
+    def _glob(
+        self,
+        base: Path,
+        patterns: Sequence[str],
+        discovery_filter: Optional[DiscoveryFilter] = None,
+    ) -> List[Path]:
+        """Find files below base matching glob patterns with the configured backend.
 
         Args:
-            file_path: Absolute path to the file
+            base: Directory the patterns are relative to
+            patterns: Glob patterns
+            discovery_filter: Optional filter for files and directories to skip
 
         Returns:
-            DocumentFile with loaded content
+            Sorted list of matching file paths
         """
-        relative_path = str(file_path.relative_to(self.project_path))
-        content = self._load_file_content(file_path)
+        git_index = self._git_file_index()
+        if git_index is not None:
+            matches = git_index.glob(base, patterns, discovery_filter)
+            if matches is not None:
+                # Look up the fingerprints of the whole result at once
+                git_index.load_fingerprints(matches)
+                return matches
+        return self._discovery.glob(base, patterns, self.project_path, discovery_filter)
+
+    def _git_file_index(self) -> Optional[GitFileIndex]:
+        """Get the git file index, listing it on first use.
 
-        return DocumentFile(
-            relative_path=relative_path,
-            content=content,
-            file_path=file_path,
-        )
+        Returns:
+            GitFileIndex, or None if the git backend is off or unavailable here
+        """
+        if self.backend != DiscoveryBackend.GIT:
+            return None
+        if not self._git_index_loaded:
+            self._git_index_loaded = True
+            self._git_index = GitFileIndex.load(self.project_path)
+            if self._git_index is None:
+                logger.debug(
+                    f"{self.project_path} is not in a git working tree, "
+                    "discovering files from the filesystem"
+                )
+        return self._git_index
+
+    def refresh(self, file_paths: Iterable[Path]) -> None:
+        """Forget the content of edited files, keeping everything else loaded.
+
+        Cached bundles keep their file lists; their DocumentFile for each
+        edited file is replaced, so the next access reads the file (or its
+        buffer in the current overlay_session()) again. Files created or
+        deleted since loading are not picked up; use a new loader for those.
+
+        Args:
+            file_paths: Absolute paths of edited files
+        """
+        stale = {Path(file_path) for file_path in file_paths} & set(self._documents)
+        if not stale:
+            return
+        for file_path in stale:
+            del self._documents[file_path]
+        if self._git_index is not None:
+            self._git_index.forget_fingerprints(stale)
+        for key, bundles in self._bundles.items():
+            self._bundles[key] = [
+                (
+                    bundle.model_copy(
+                        update={
+                            "files": [
+                                self._create_document_file(file.file_path)
+                                if file.file_path in stale
+                                else file
+                                for file in bundle.files
+                            ]
+                        }
+                    )
+                    if any(file.file_path in stale for file in bundle.files)
+                    else bundle
+                )
+                for bundle in bundles
+            ]
 
-    def _load_file_content(self, file_path: Path) -> str:
-        """Read file content with error handling.
+    def _create_document_file(self, file_path: Path) -> DocumentFile:
+        """Create a DocumentFile from a path.
 
         Args:
-            file_path: Path to file to read
+            file_path: Absolute path to the file
 
         Returns:
-            File content as string
+            DocumentFile whose content is read on first access (unless
+            overridden or buffered), shared by every bundle that contains the file
         """
-        try:
-            return file_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            # Try fallback encoding
-            try:
-                return file_path.read_text(encoding="latin-1")
-            except Exception as e:
-                return f"[Error reading file: {e}]"
-        except Exception as e:
-            return f"[Error reading file: {e}]"
+        document = self._documents.get(file_path)
+        if document is None:
+            relative_path = str(file_path.relative_to(self.project_path))
+            git_index = self._git_file_index()
+            buffered = get_overlay(file_path)
+            document = DocumentFile(
+                relative_path=relative_path,
+                file_path=file_path,
+                # A buffer's content is not the blob's
+                fingerprint=(
+                    git_index.fingerprint(file_path) if git_index and buffered is None else None
+                ),
+                content=(
+                    buffered
+                    if buffered is not None
+                    else self.content_overrides.get(Path(relative_path).as_posix())
+                ),
+            )
+            self._documents[file_path] = document
+        return document
 
     def _generate_bundle_id(self, *files: Path) -> str:
         """Generate a unique bundle ID from file paths.
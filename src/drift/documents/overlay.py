@@ -0,0 +1,115 @@
+"""Unsaved editor buffers layered over the files on disk.
+
+An editor integration validates what the user sees, not what was last saved.
+Inside overlay_session(), the document loader and validators that read files
+themselves get a buffer's text instead of the file's content. Paths without a
+buffer are read from disk as usual.
+
+Like the other per-run sessions, the overlay is held in a context variable,
+so it reaches validators running in worker threads started with
+asyncio.to_thread().
+"""
+
+import io
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Union
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+_current_overlay: ContextVar[Optional[Dict[str, str]]] = ContextVar(
+    "drift_document_overlay", default=None
+)
+
+
+def _key(path: PathLike) -> str:
+    """Normalize a path for overlay lookups."""
+    return os.path.normpath(os.path.abspath(path))
+
+
+@contextmanager
+def overlay_session(contents: Union[Mapping[str, str], Mapping[Path, str]]) -> Iterator[None]:
+    """Read the given contents instead of the files' content inside the block.
+
+    Sessions nest; inner contents win over outer ones for the same path.
+    Line endings are normalized as when reading a file in text mode.
+
+    Args:
+        contents: Buffer text by file path (absolute, or relative to the
+            working directory)
+    """
+    overlay = dict(_current_overlay.get() or {})
+    overlay.update(
+        (_key(path), text.replace("\r\n", "\n").replace("\r", "\n"))
+        for path, text in contents.items()
+    )
+    token = _current_overlay.set(overlay)
+    try:
+        yield
+    finally:
+        _current_overlay.reset(token)
+
+
+def get_overlay(path: PathLike) -> Optional[str]:
+    """Get the buffer text of a file, if the current session has one.
+
+    Args:
+        path: File path
+
+    Returns:
+        Buffer text, or None outside a session or for files without a buffer
+    """
+    overlay = _current_overlay.get()
+    if not overlay:
+        return None
+    return overlay.get(_key(path))
+
+
+def read_text(path: PathLike) -> str:
+    """Read a file as UTF-8 text, preferring its buffer in the current session.
+
+    Args:
+        path: File path
+
+    Returns:
+        Buffer text or file content
+
+    Raises:
+        OSError: If there is no buffer and the file cannot be read
+        UnicodeDecodeError: If there is no buffer and the file is not UTF-8
+    """
+    content = get_overlay(path)
+    if content is not None:
+        return content
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def read_lines(path: PathLike) -> List[str]:
+    """Read a file's lines like readlines(), preferring its buffer in the current session.
+
+    Args:
+        path: File path
+
+    Returns:
+        Lines with their trailing newlines
+
+    Raises:
+        OSError: If there is no buffer and the file cannot be read
+        UnicodeDecodeError: If there is no buffer and the file is not UTF-8
+    """
+    return io.StringIO(read_text(path)).readlines()
+
+
+def is_file(path: PathLike) -> bool:
+    """Check whether a file has a buffer in the current session or exists on disk.
+
+    Args:
+        path: File path
+
+    Returns:
+        True for buffered paths and existing regular files
+    """
+    return get_overlay(path) is not None or os.path.isfile(path)
@@ -1,12 +1,16 @@
 """Anthropic API LLM provider."""
 
 import os
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from anthropic import Anthropic, AnthropicError
 
 from drift.config.models import ModelConfig, ProviderConfig
 from drift.providers.base import Provider
+from drift.providers.clients import client_key, get_shared_client
+
+# Provider params that configure the HTTP connection pool
+HTTP_POOL_PARAMS = ("max_connections", "max_keepalive_connections", "keepalive_expiry")
 
 
 class AnthropicProvider(Provider):
@@ -29,14 +33,26 @@ class AnthropicProvider(Provider):
         self._initialize_client()
 
     def _initialize_client(self) -> None:
-        """Initialize the Anthropic client using API key from environment."""
+        """Initialize the Anthropic client using API key from environment.
+
+        Clients are shared by all models using the same provider params and API
+        key. Optional provider params tune the client:
+
+        -- max_retries: SDK retry count for failed requests
+        -- timeout: Request timeout in seconds
+        -- connect_timeout: Connection timeout in seconds (requires timeout)
+        -- max_connections: HTTP connection pool size
+        -- max_keepalive_connections: Idle connections kept alive
+        -- keepalive_expiry: Seconds an idle connection is kept alive
+        """
         try:
             # Get API key environment variable name from provider params
             api_key_env = self.provider_config.params.get("api_key_env", "ANTHROPIC_API_KEY")
             api_key = os.getenv(api_key_env)
 
             if api_key:
-                self.client = Anthropic(api_key=api_key)
+                key = client_key("anthropic", self.provider_config.params, api_key)
+                self.client = get_shared_client(key, lambda: self._create_client(api_key))
             else:
                 # Client is None if API key is not available
                 self.client = None
@@ -45,6 +61,51 @@ class AnthropicProvider(Provider):
             # We'll catch this in is_available()
             self.client = None
 
+    def _create_client(self, api_key: str) -> Anthropic:
+        """Create an Anthropic client tuned by provider params.
+
+        -- api_key: Anthropic API key
+
+        Returns a new Anthropic client.
+        """
+        params = self.provider_config.params
+        client_kwargs: Dict[str, Any] = {"api_key": api_key}
+
+        if "max_retries" in params:
+            client_kwargs["max_retries"] = int(params["max_retries"])
+
+        if "timeout" in params:
+            if "connect_timeout" in params:
+                import httpx
+
+                client_kwargs["timeout"] = httpx.Timeout(
+                    float(params["timeout"]), connect=float(params["connect_timeout"])
+                )
+            else:
+                client_kwargs["timeout"] = float(params["timeout"])
+
+        if any(name in params for name in HTTP_POOL_PARAMS):
+            # httpx ships with the anthropic SDK
+            import httpx
+            from anthropic import DEFAULT_CONNECTION_LIMITS, DefaultHttpxClient
+
+            # Unset limits keep the SDK defaults; None would mean unlimited to httpx
+            limits = httpx.Limits(
+                max_connections=params.get(
+                    "max_connections", DEFAULT_CONNECTION_LIMITS.max_connections
+                ),
+                max_keepalive_connections=params.get(
+                    "max_keepalive_connections",
+                    DEFAULT_CONNECTION_LIMITS.max_keepalive_connections,
+                ),
+                keepalive_expiry=params.get(
+                    "keepalive_expiry", DEFAULT_CONNECTION_LIMITS.keepalive_expiry
+                ),
+            )
+            client_kwargs["http_client"] = DefaultHttpxClient(limits=limits)
+
+        return Anthropic(**client_kwargs)
+
     def is_available(self) -> bool:
         """Check if Anthropic provider is available.
 
@@ -52,20 +52,38 @@ class Provider(ABC):
         Raises:
             Exception: If generation fails
         """
-        # Try cache if enabled and parameters provided
-        if self.cache and cache_key and content_hash:
-            cached_response = self.cache.get(cache_key, content_hash, prompt_hash)
-            if cached_response is not None:
-                return cached_response
+        cached_response = self._get_cached(cache_key, content_hash, prompt_hash)
+        if cached_response is not None:
+            return cached_response
 
         # Cache miss or disabled - call LLM
         response = self._generate_impl(prompt, system_prompt)
 
-        # Store in cache if enabled and parameters provided
+        self._store_cached(cache_key, content_hash, response, prompt_hash, drift_type)
+        return response
+
+    def _get_cached(
+        self,
+        cache_key: Optional[str],
+        content_hash: Optional[str],
+        prompt_hash: Optional[str],
+    ) -> Optional[str]:
+        """Look up a cached response if caching applies to this call."""
         if self.cache and cache_key and content_hash:
-            self.cache.set(cache_key, content_hash, response, prompt_hash, drift_type)
+            return self.cache.get(cache_key, content_hash, prompt_hash)
+        return None
 
-        return response
+    def _store_cached(
+        self,
+        cache_key: Optional[str],
+        content_hash: Optional[str],
+        response: str,
+        prompt_hash: Optional[str],
+        drift_type: Optional[str],
+    ) -> None:
+        """Store a response in the cache if caching applies to this call."""
+        if self.cache and cache_key and content_hash:
+            self.cache.set(cache_key, content_hash, response, prompt_hash, drift_type)
 
     @abstractmethod
     def _generate_impl(self, prompt: str, system_prompt: Optional[str] = None) -> str:
@@ -83,6 +101,14 @@ class Provider(ABC):
         """
         pass
 
+    def cancel(self) -> None:
+        """Abort the requests this provider has in flight.
+
+        Called when a run stops early (e.g. --fail-fast); generate() calls
+        that are aborted raise. Providers that cannot abort a request let it
+        finish, which is the default.
+        """
+
     @abstractmethod
     def is_available(self) -> bool:
         """Check if the provider is available and properly configured.
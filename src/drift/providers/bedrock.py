@@ -1,13 +1,30 @@
 """AWS Bedrock provider implementation."""
 
 import json
-from typing import Any, Optional
+import os
+from typing import Any, Dict, Optional
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
 
 from drift.config.models import ModelConfig, ProviderConfig
 from drift.providers.base import Provider
+from drift.providers.clients import client_key, get_shared_client
+
+# Defaults tuned for many concurrent invocations against one endpoint
+DEFAULT_MAX_POOL_CONNECTIONS = 50
+DEFAULT_RETRY_MODE = "adaptive"
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Environment variables that select which AWS credentials boto3 resolves
+AWS_CREDENTIAL_ENV_VARS = (
+    "AWS_PROFILE",
+    "AWS_DEFAULT_PROFILE",
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SESSION_TOKEN",
+    "AWS_ROLE_ARN",
+)
 
 
 class BedrockProvider(Provider):
@@ -31,20 +48,59 @@ class BedrockProvider(Provider):
         self._initialize_client()
 
     def _initialize_client(self) -> None:
-        """Initialize the Bedrock client using provider params."""
+        """Initialize the Bedrock client using provider params.
+
+        Clients are shared by all models using the same provider params and AWS
+        credentials. Optional provider params tune the client:
+
+        -- region: AWS region (default: us-east-1)
+        -- max_pool_connections: HTTP connection pool size (default: 50)
+        -- retry_mode: botocore retry mode (default: adaptive)
+        -- max_attempts: Total attempts per request including retries (default: 3)
+        -- connect_timeout: Connection timeout in seconds
+        -- read_timeout: Read timeout in seconds
+        -- tcp_keepalive: Enable TCP keep-alive (default: true)
+        """
         try:
-            # Get region from provider params, default to us-east-1
-            region = self.provider_config.params.get("region", "us-east-1")
-
-            self.client = boto3.client(
-                "bedrock-runtime",
-                region_name=region,
-            )
+            credentials = {name: os.environ.get(name) for name in AWS_CREDENTIAL_ENV_VARS}
+            key = client_key("bedrock", self.provider_config.params, credentials)
+            self.client = get_shared_client(key, self._create_client)
         except Exception:
             # Client initialization might fail if no credentials
             # We'll catch this in is_available()
             self.client = None
 
+    def _create_client(self) -> Any:
+        """Create a bedrock-runtime client tuned by provider params.
+
+        Returns a new boto3 client.
+        """
+        params = self.provider_config.params
+
+        # Get region from provider params, default to us-east-1
+        region = params.get("region", "us-east-1")
+
+        config_kwargs: Dict[str, Any] = {
+            "max_pool_connections": int(
+                params.get("max_pool_connections", DEFAULT_MAX_POOL_CONNECTIONS)
+            ),
+            "retries": {
+                "mode": params.get("retry_mode", DEFAULT_RETRY_MODE),
+                "max_attempts": int(params.get("max_attempts", DEFAULT_MAX_ATTEMPTS)),
+            },
+            "tcp_keepalive": bool(params.get("tcp_keepalive", True)),
+        }
+        if "connect_timeout" in params:
+            config_kwargs["connect_timeout"] = float(params["connect_timeout"])
+        if "read_timeout" in params:
+            config_kwargs["read_timeout"] = float(params["read_timeout"])
+
+        return boto3.client(
+            "bedrock-runtime",
+            region_name=region,
+            config=Config(**config_kwargs),
+        )
+
     def is_available(self) -> bool:
         """Check if Bedrock is available.
 
@@ -0,0 +1,58 @@
+"""Process-wide pool of SDK clients shared by LLM providers.
+
+Each configured model gets its own provider instance, but models that use the
+same provider config and credentials can share one SDK client (and therefore
+one HTTP connection pool) instead of each paying for their own TLS handshakes.
+The SDK clients used here (anthropic/httpx, boto3) are thread-safe.
+"""
+
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, Mapping, Tuple
+
+ClientKey = Tuple[str, str]
+
+_clients: Dict[ClientKey, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def client_key(provider_type: str, params: Mapping[str, Any], credentials: Any) -> ClientKey:
+    """Build the cache key for a shared client.
+
+    Credentials are hashed so secrets are never kept in the key itself.
+
+    -- provider_type: Provider type (e.g., 'anthropic', 'bedrock')
+    -- params: Provider params that affect client construction
+    -- credentials: Anything identifying the credentials in use
+
+    Returns a hashable key.
+    """
+    payload = json.dumps(
+        {"params": dict(params), "credentials": credentials}, sort_keys=True, default=str
+    )
+    return provider_type, hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_shared_client(key: ClientKey, factory: Callable[[], Any]) -> Any:
+    """Get the client for a key, creating it with factory on first use.
+
+    If the factory raises, nothing is cached and the exception propagates.
+
+    -- key: Key from client_key()
+    -- factory: Zero-argument callable that builds the client
+
+    Returns the shared client.
+    """
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = factory()
+            _clients[key] = client
+        return client
+
+
+def clear_shared_clients() -> None:
+    """Drop all shared clients (they are closed when garbage collected)."""
+    with _clients_lock:
+        _clients.clear()
@@ -0,0 +1,89 @@
+"""Lazy provider registry.
+
+Providers are registered as factories and only constructed the first time a
+model is looked up, so runs that never reach an LLM phase never build SDK
+clients or probe CLIs.
+"""
+
+import threading
+from typing import Callable, Dict, Iterator, List, MutableMapping
+
+from drift.providers.base import Provider
+
+ProviderFactory = Callable[[], Provider]
+
+
+class ProviderRegistry(MutableMapping[str, Provider]):
+    """Mapping of model names to providers that instantiates on first access.
+
+    Behaves like a ``Dict[str, Provider]``: membership tests and ``len()`` only
+    consult registered names, while item access constructs (and memoizes) the
+    provider, once even when threads look it up at the same time. Assigning a
+    provider instance directly bypasses the factory.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._factories: Dict[str, ProviderFactory] = {}
+        self._instances: Dict[str, Provider] = {}
+        self._lock = threading.Lock()
+
+    def register(self, model_name: str, factory: ProviderFactory) -> None:
+        """Register a factory for a model, discarding any existing instance.
+
+        -- model_name: Model name the provider serves
+        -- factory: Zero-argument callable that builds the provider
+        """
+        self._factories[model_name] = factory
+        self._instances.pop(model_name, None)
+
+    def is_loaded(self, model_name: str) -> bool:
+        """Check whether the provider for a model has been constructed.
+
+        -- model_name: Model name to check
+
+        Returns True if the provider instance exists.
+        """
+        return model_name in self._instances
+
+    def loaded(self) -> List[Provider]:
+        """Get the providers constructed so far.
+
+        Returns the provider instances, without constructing any.
+        """
+        return list(self._instances.values())
+
+    def __getitem__(self, model_name: str) -> Provider:
+        """Get the provider for a model, constructing it on first access."""
+        provider = self._instances.get(model_name)
+        if provider is None:
+            with self._lock:
+                provider = self._instances.get(model_name)
+                if provider is None:
+                    factory = self._factories[model_name]
+                    provider = factory()
+                    self._instances[model_name] = provider
+        return provider
+
+    def __setitem__(self, model_name: str, provider: Provider) -> None:
+        """Register an already constructed provider."""
+        self._instances[model_name] = provider
+
+    def __delitem__(self, model_name: str) -> None:
+        """Remove a provider and its factory."""
+        if model_name not in self:
+            raise KeyError(model_name)
+        self._factories.pop(model_name, None)
+        self._instances.pop(model_name, None)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over registered model names without constructing providers."""
+        return iter(dict.fromkeys([*self._factories, *self._instances]))
+
+    def __len__(self) -> int:
+        """Return the number of registered models."""
+        return len(self._factories.keys() | self._instances.keys())
+
+    def __contains__(self, model_name: object) -> bool:
+        """Check whether a model is registered without constructing it."""
+        return model_name in self._factories or model_name in self._instances
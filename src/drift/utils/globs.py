@@ -0,0 +1,119 @@
+"""Glob-to-regex translation shared by path matching utilities.
+
+Globs are translated one path component at a time: "*", "?" and "[...]"
+never match "/", and a "**" component matches zero or more components.
+Matching therefore does not depend on the Python version's pathlib, whose
+handling of "**" in PurePath.match() has changed between releases.
+"""
+
+import re
+from typing import List, Pattern
+
+
+def translate_segment(segment: str) -> str:
+    """Translate one glob path segment to a regex that never crosses '/'.
+
+    Args:
+        segment: Glob segment such as "*.md" or "SKILL.md"
+
+    Returns:
+        Regex source matching one path component
+    """
+    parts = []
+    i = 0
+    while i < len(segment):
+        char = segment[i]
+        i += 1
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            # Same bracket rules as fnmatch: "!" negates, a leading "]" is literal
+            end = i
+            if end < len(segment) and segment[end] == "!":
+                end += 1
+            if end < len(segment) and segment[end] == "]":
+                end += 1
+            end = segment.find("]", end)
+            if end == -1:
+                parts.append("\\[")
+                continue
+            body = segment[i:end].replace("\\", "\\\\")
+            i = end + 1
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            elif body.startswith("^"):
+                body = "\\" + body
+            parts.append(f"[{body}]")
+        else:
+            parts.append(re.escape(char))
+    return "".join(parts)
+
+
+def split_glob(pattern: str) -> List[str]:
+    """Split a glob into components, dropping empty and "." components.
+
+    Consecutive "**" components are collapsed into one.
+
+    Args:
+        pattern: Glob pattern using "/" as separator
+
+    Returns:
+        List of glob components
+    """
+    segments: List[str] = []
+    for segment in pattern.split("/"):
+        if segment in ("", "."):
+            continue
+        if segment == "**" and segments and segments[-1] == "**":
+            continue
+        segments.append(segment)
+    return segments
+
+
+def translate_path_glob(segments: List[str]) -> str:
+    """Translate glob components to a regex matching whole path components.
+
+    A "**" component matches zero or more path components, so "docs/**/*.md"
+    matches both "docs/a.md" and "docs/x/y/a.md", and a trailing "**" also
+    matches the directory itself ("docs/**" matches "docs" and "docs/a/b").
+
+    Args:
+        segments: Glob components, as returned by split_glob()
+
+    Returns:
+        Regex source; not anchored
+    """
+    if segments == ["**"]:
+        return "[^/]+(?:/[^/]+)*"
+    regex = ""
+    for index, segment in enumerate(segments):
+        last = index == len(segments) - 1
+        if segment == "**":
+            regex += "(?:/[^/]+)*" if last else "(?:[^/]+/)*"
+        else:
+            regex += translate_segment(segment)
+            # A trailing "**" group brings its own leading separator
+            if not last and segments[index + 1 :] != ["**"]:
+                regex += "/"
+    return regex
+
+
+def compile_glob(pattern: str) -> Pattern[str]:
+    """Compile a relative glob pattern for files with pathlib semantics into a regex.
+
+    "*", "?" and "[...]" match within one path component, and a "**" component
+    matches zero or more directories.
+
+    Args:
+        pattern: Glob pattern relative to the project root (e.g. ".claude/skills/*/SKILL.md")
+
+    Returns:
+        Compiled regex to fullmatch against relative POSIX file paths
+    """
+    segments = split_glob(pattern)
+    if not segments or segments[-1] == "**":
+        # pathlib yields only directories for a trailing "**"
+        return re.compile("(?!)")
+    return re.compile(translate_path_glob(segments))
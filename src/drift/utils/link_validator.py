@@ -1,10 +1,11 @@
 """Markdown link validation utilities."""
 
 import re
+from bisect import bisect_right
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Pattern, Tuple
 
-import requests
+from drift.utils.path_index import ProjectPathIndex
 
 # RFC 2606 reserved example domains and localhost addresses
 EXAMPLE_DOMAINS = {
@@ -18,16 +19,146 @@ EXAMPLE_DOMAINS = {
     "0.0.0.0",
 }
 
-# Patterns that indicate placeholder/example file paths
+# Patterns that indicate placeholder/example file paths (none spans lines)
 PLACEHOLDER_PATH_PATTERNS = [
     r"\bpath/to/",  # path/to/file.py
-    r"\byour-[^/]+/",  # your-project/src
-    r"\bmy-[^/]+/",  # my-app/config
-    r"\{[^}]+\}",  # {variable}/path
-    r"\$\{[^}]+\}",  # ${VAR}/path
-    r"<[^>]+>",  # <something>/path
+    r"\byour-[^/\n]+/",  # your-project/src
+    r"\bmy-[^/\n]+/",  # my-app/config
+    r"\{[^}\n]+\}",  # {variable}/path
+    r"\$\{[^}\n]+\}",  # ${VAR}/path
+    r"<[^>\n]+>",  # <something>/path
 ]
 
+_PLACEHOLDER_PATH = re.compile("|".join(PLACEHOLDER_PATH_PATTERNS))
+
+# Placeholder markers together with the rest of the path they start, so that
+# {variable}/path/file.py does not leave path/file.py behind. Each alternative
+# starts with a literal (word boundaries are checked behind it) so the regex
+# engine can skip ahead to candidate positions.
+_PLACEHOLDER_SPAN = re.compile(
+    r"(?:p(?<=\bp)ath/to|y(?<=\by)our-[^/\n]+|m(?<=\bm)y-[^/\n]+"
+    r"|\{[^}\n]+\}|\$\{[^}\n]+\}|<[^>\n]+>)[^\s]*"
+)
+
+_DOMAIN = re.compile(r"(?:https?://|mailto:)?([^/:@]+(?:\.[^/:@]+)*)")
+
+# Markdown links: [text](url)
+_MARKDOWN_LINK = re.compile(r"\[([^\]]+)\]\(([^\)]+)\)")
+
+# Markdown links confined to a single line, used when scanning documents
+_INLINE_MARKDOWN_LINK = re.compile(r"\[([^\]\n]+)\]\(([^\)\n]+)\)")
+
+_BARE_URL = re.compile(r"https?://[^\s]+")
+
+# Path-like references (but not URLs). Absolute paths like /etc/config.yaml are
+# NOT extracted (usually system paths).
+_PATH_REFERENCE = re.compile(
+    # Relative paths starting with ./ or ../ (most reliable indicator)
+    r"\.{1,2}/[\w\-./]+"
+    # Otherwise never start after a slash or word char (to avoid matching
+    # file.py from path/to/file.py or /etc/config.yaml)
+    r"|(?<![/\w\-])(?:"
+    # Paths with slashes and file extensions: path/to/file.ext, only after
+    # whitespace or at the start
+    r"(?<!\S)[\w\-]+(?:/[\w\-]+)+\.[\w]+\b"
+    # Standalone filenames with common extensions: README.md, test.py
+    r"|[\w\-]{1,50}\.(?:md|py|js|ts|tsx|jsx|yaml|yml|json|sh|bash|txt|csv|xml"
+    r"|html|css|rs|go|java|rb|php|c|cpp|h|hpp|toml|ini|conf|cfg)\b"
+    r")"
+)
+
+# Every path reference contains "./" or a dot followed by a word character
+_PATH_HINT = re.compile(r"\.[\w/]")
+
+_INDENTED_CODE = ("    ", "\t")
+
+
+class FileReference(NamedTuple):
+    """A link target or file path found in markdown content.
+
+    Attributes:
+        target: Link URL or path as written
+        line: 1-based line number
+        column: 1-based column of the first character of target
+        kind: "link" for markdown link targets, "path" for plain path references
+    """
+
+    target: str
+    line: int
+    column: int
+    kind: str
+
+
+def _blank(match: "re.Match[str]") -> str:
+    """Replace a match with spaces so later columns stay aligned."""
+    return " " * (match.end() - match.start())
+
+
+def _keep_link_text(match: "re.Match[str]") -> str:
+    """Replace [text](url) with its text, padded to the original width."""
+    text = match.group(1)
+    return " " + text + " " * (match.end() - match.start() - len(text) - 1)
+
+
+def _blank_inline_code(line: str, start: int = 0) -> Tuple[str, int]:
+    """Blank inline code spans (`...`) that open and close on a line.
+
+    Args:
+        line: Line to process
+        start: Index to start looking for spans from
+
+    Returns:
+        Tuple of the blanked line and the index of a backtick that opens a span
+        continuing past the end of the line (-1 if there is none)
+    """
+    pos = start
+    while True:
+        opener = line.find("`", pos)
+        if opener == -1:
+            return line, -1
+        if line.startswith("`", opener + 1):
+            # An inline span needs at least one character between backticks
+            pos = opener + 1
+            continue
+        closer = line.find("`", opener + 1)
+        if closer == -1:
+            return line, opener
+        line = line[:opener] + " " * (closer - opener + 1) + line[closer + 1 :]
+        pos = closer + 1
+
+
+def _iter_path_matches(text: str) -> Iterator["re.Match[str]"]:
+    """Find path references in text, searching only words that may contain one.
+
+    Path references never contain whitespace and always contain a _PATH_HINT,
+    so _PATH_REFERENCE only runs over the space-delimited words around hints
+    instead of every position of the text.
+
+    Args:
+        text: Text to search
+
+    Yields:
+        Matches of _PATH_REFERENCE, in order
+    """
+    searched_to = 0
+    for hint in _PATH_HINT.finditer(text):
+        offset = hint.start()
+        if offset < searched_to:
+            continue
+        line_start = text.rfind("\n", 0, offset) + 1
+        line_end = text.find("\n", offset)
+        if line_end == -1:
+            line_end = len(text)
+        word_start = line_start
+        word_end = line_end
+        for separator in (" ", "\t"):
+            word_start = max(word_start, text.rfind(separator, word_start, offset) + 1)
+            end = text.find(separator, offset, word_end)
+            if end != -1:
+                word_end = end
+        yield from _PATH_REFERENCE.finditer(text, word_start, word_end)
+        searched_to = word_end
+
 
 class LinkValidator:
     """Validate various types of markdown links.
@@ -37,6 +168,9 @@ class LinkValidator:
     references. Supports filtering of example/placeholder links to reduce
     false positives.
 
+    References are found by scan_file_references(), which walks a document once
+    to track code fence and inline code state.
+
     Example:
         >>> validator = LinkValidator()
         >>> links = validator.extract_links("[doc](file.md)")
@@ -66,6 +200,8 @@ class LinkValidator:
     ) -> None:
         """Initialize LinkValidator with filtering options.
 
+        Custom skip patterns are compiled once here; invalid regexes are ignored.
+
         Args:
             skip_example_domains: Skip RFC 2606 example domains (example.com, localhost, etc.)
             skip_code_blocks: Skip links found in code blocks
@@ -76,89 +212,94 @@ class LinkValidator:
         self.skip_code_blocks = skip_code_blocks
         self.skip_placeholder_paths = skip_placeholder_paths
         self.custom_skip_patterns = custom_skip_patterns or []
+        self._custom_skip_regexes = self._compile_patterns(self.custom_skip_patterns)
 
-    def _remove_code_blocks(self, content: str) -> str:
-        """Remove code blocks and inline code from markdown content.
-
-        Removes fenced code blocks (```), indented code blocks (4 spaces or tab),
-        and inline code (`...`) to prevent extraction of links from example code.
-
-        Uses a counter-based approach to handle nested code blocks correctly,
-        matching opening ``` with the corresponding closing ``` at the same
-        nesting level.
+    @staticmethod
+    def _compile_patterns(patterns: Iterable[str]) -> List[Pattern[str]]:
+        """Compile regex patterns, silently skipping invalid ones.
 
         Args:
-            content: Markdown content to process
+            patterns: Regex patterns to compile
 
         Returns:
-            Content with code blocks and inline code removed
+            List of compiled patterns
         """
-        # Remove fenced code blocks (```...```)
-        # Use counter-based approach to handle nested blocks correctly
-        lines = content.split("\n")
-        result_lines = []
-        fence_depth = 0
-
-        for line in lines:
-            # Check if line starts with ``` (at start of line, possibly with leading whitespace)
-            stripped = line.lstrip()
-            if stripped.startswith("```"):
-                if fence_depth == 0:
-                    # Opening a new code block - start skipping
-                    fence_depth = 1
-                else:
-                    # Already in a code block
-                    # This could be a nested opening or a closing
-                    # For simplicity, treat any ``` as closing when we're inside a block
-                    fence_depth = 0
-                # Skip the fence line itself
+        compiled = []
+        for pattern in patterns:
+            try:
+                compiled.append(re.compile(pattern))
+            except re.error:
                 continue
+        return compiled
 
-            # Only include lines that are outside code blocks
-            if fence_depth == 0:
-                result_lines.append(line)
+    def _mask_code(self, content: str) -> List[str]:
+        """Split markdown content into lines with code blanked out.
 
-        content = "\n".join(result_lines)
+        Fenced code blocks (```) and their fence lines, and indented code lines
+        (4 spaces or tab), come out as empty lines. Inline code (`...`) is
+        replaced by spaces so columns stay aligned. An inline span may continue
+        over several lines; a backtick that is never closed is kept.
 
-        # Remove indented code blocks (4 spaces or tab at line start)
-        content = re.sub(r"^(    |\t).*$", "", content, flags=re.MULTILINE)
+        Any ``` line toggles the fence, so a ``` inside a block closes it.
 
-        # Remove inline code (`...`)
-        # This prevents extraction of file paths wrapped in backticks
-        content = re.sub(r"`[^`]+`", "", content)
+        Args:
+            content: Markdown content to process
+
+        Returns:
+            One entry per line of content
+        """
+        lines = content.split("\n")
+        in_fence = False
+        # Index of the line where an unclosed inline span opened, and its column
+        span_line = -1
+        span_column = 0
+
+        for index, line in enumerate(lines):
+            if not in_fence and span_line == -1 and "`" not in line:
+                if line.startswith(_INDENTED_CODE):
+                    lines[index] = ""
+                continue
 
-        return content
+            if line.lstrip().startswith("```"):
+                in_fence = not in_fence
+                lines[index] = ""
+                continue
+            if in_fence or line.startswith(_INDENTED_CODE):
+                lines[index] = ""
+                continue
 
-    def _remove_placeholder_patterns(self, content: str) -> str:
-        """Remove placeholder patterns from content before extraction.
+            start = 0
+            if span_line != -1:
+                closer = line.find("`")
+                if closer == -1:
+                    continue
+                # The open span ends on this line, so everything since it opened is code
+                opened = lines[span_line]
+                lines[span_line] = opened[:span_column] + " " * (len(opened) - span_column)
+                for between in range(span_line + 1, index):
+                    lines[between] = " " * len(lines[between])
+                span_line = -1
+                line = " " * (closer + 1) + line[closer + 1 :]
+                start = closer + 1
+
+            lines[index], opener = _blank_inline_code(line, start)
+            if opener != -1:
+                span_line = index
+                span_column = opener
+
+        # A span still open at the end was never closed: its backtick is literal text
+        return lines
 
-        This prevents partial extraction of paths that contain placeholder markers.
-        For example, {variable}/path/file.py should not extract path/file.py.
+    def _remove_code_blocks(self, content: str) -> str:
+        """Remove code blocks and inline code from markdown content.
 
         Args:
-            content: Content to process
+            content: Markdown content to process
 
         Returns:
-            Content with placeholder patterns removed
+            Content with code blanked out, see _mask_code()
         """
-        # Remove lines or segments containing placeholder markers
-        # This prevents extraction of fragments after the placeholder
-        for pattern in PLACEHOLDER_PATH_PATTERNS:
-            # For path prefix patterns, remove the entire path that follows
-            if pattern in (r"\bpath/to/", r"\byour-[^/]+/", r"\bmy-[^/]+/"):
-                # Match the pattern plus any path that follows (non-whitespace)
-                extended = pattern.rstrip("/") + r"[^\s]*"
-                content = re.sub(extended, "", content)
-            # For template variable patterns, also remove any path that follows
-            elif pattern in (r"\{[^}]+\}", r"\$\{[^}]+\}", r"<[^>]+>"):
-                # Match the template variable plus optional following path
-                extended = pattern + r"[^\s]*"
-                content = re.sub(extended, "", content)
-            else:
-                # For other patterns, just remove them as-is
-                content = re.sub(pattern, "", content)
-
-        return content
+        return "\n".join(self._mask_code(content))
 
     def _is_example_domain(self, link: str) -> bool:
         """Check if link uses an example/test domain.
@@ -174,8 +315,7 @@ class LinkValidator:
         """
         # Extract domain from various link formats
         # Handle http://, https://, mailto:, and plain domains
-        domain_pattern = r"(?:https?://|mailto:)?([^/:@]+(?:\.[^/:@]+)*)"
-        match = re.search(domain_pattern, link)
+        match = _DOMAIN.search(link)
 
         if not match:
             return False
@@ -203,10 +343,7 @@ class LinkValidator:
         Returns:
             True if path appears to be a placeholder, False otherwise
         """
-        for pattern in PLACEHOLDER_PATH_PATTERNS:
-            if re.search(pattern, path):
-                return True
-        return False
+        return _PLACEHOLDER_PATH.search(path) is not None
 
     def _matches_custom_pattern(self, link: str) -> bool:
         """Check if link matches any custom skip patterns.
@@ -217,14 +354,25 @@ class LinkValidator:
         Returns:
             True if link matches a custom pattern, False otherwise
         """
-        for pattern in self.custom_skip_patterns:
-            try:
-                if re.search(pattern, link):
-                    return True
-            except re.error:
-                # Silently skip invalid regex patterns
-                continue
-        return False
+        return any(regex.search(link) for regex in self._custom_skip_regexes)
+
+    def _is_skipped(self, ref: str) -> bool:
+        """Check if a reference is filtered out as an example or placeholder.
+
+        Args:
+            ref: Link URL or path to check
+
+        Returns:
+            True if the reference should not be reported
+        """
+        # Don't filter "unknown" type links (anchors, mailto, tel) - they're skipped anyway
+        if ref.startswith(("#", "mailto:", "tel:")):
+            return False
+        if self.skip_example_domains and self._is_example_domain(ref):
+            return True
+        if self.skip_placeholder_paths and self._is_placeholder_path(ref):
+            return True
+        return self._matches_custom_pattern(ref)
 
     def extract_links(self, content: str) -> List[Tuple[str, str]]:
         """Extract all markdown links from content.
@@ -237,17 +385,62 @@ class LinkValidator:
         Returns:
             List of (link_text, link_url) tuples
         """
-        # Regex pattern for markdown links: [text](url)
-        # Pattern explanation:
-        # \[ matches opening bracket
-        # ([^\]]+) captures link text (anything except ])
-        # \] matches closing bracket
-        # \( matches opening paren
-        # ([^\)]+) captures link URL (anything except ))
-        # \) matches closing paren
-        pattern = r"\[([^\]]+)\]\(([^\)]+)\)"
-        matches = re.findall(pattern, content)
-        return matches
+        return _MARKDOWN_LINK.findall(content)
+
+    def scan_file_references(self, content: str) -> List[FileReference]:
+        """Find file references in content with their positions.
+
+        Walks the document once to blank out code (if enabled), keeping every
+        line and column in place. Then placeholder paths are blanked (if
+        enabled), markdown link targets are collected and replaced by their
+        text, bare URLs are blanked and the rest is searched for path-like
+        references. Links and placeholders never span lines.
+
+        Args:
+            content: Markdown content to parse
+
+        Returns:
+            References that pass the example/placeholder/custom filters, in
+            document order within each kind, including repeated occurrences
+        """
+        if self.skip_code_blocks:
+            lines = self._mask_code(content)
+        else:
+            lines = content.split("\n")
+
+        # Offset of the first character of each line, for line/column lookups
+        line_starts = [0]
+        for line in lines[:-1]:
+            line_starts.append(line_starts[-1] + len(line) + 1)
+        text = "\n".join(lines)
+
+        def reference(target: str, offset: int, kind: str) -> FileReference:
+            line_index = bisect_right(line_starts, offset) - 1
+            return FileReference(target, line_index + 1, offset - line_starts[line_index] + 1, kind)
+
+        if self.skip_placeholder_paths:
+            # Must happen before extraction to prevent partial matches
+            text = _PLACEHOLDER_SPAN.sub(_blank, text)
+
+        references = [
+            reference(match.group(2), match.start(2), "link")
+            for match in _INLINE_MARKDOWN_LINK.finditer(text)
+        ]
+        # Keep the link text so paths written as link text are still found
+        text = _INLINE_MARKDOWN_LINK.sub(_keep_link_text, text)
+        text = _BARE_URL.sub(_blank, text)
+        references.extend(
+            reference(match.group(), match.start(), "path") for match in _iter_path_matches(text)
+        )
+
+        skipped: Dict[str, bool] = {}
+        kept = []
+        for ref in references:
+            if ref.target not in skipped:
+                skipped[ref.target] = self._is_skipped(ref.target)
+            if not skipped[ref.target]:
+                kept.append(ref)
+        return kept
 
     def extract_all_file_references(self, content: str) -> List[str]:
         """Extract all file references from content.
@@ -256,7 +449,6 @@ class LinkValidator:
         This includes:
         - Markdown links: [text](path)
         - Relative paths: ./file.sh, ../dir/file.py
-        - Absolute paths: /path/to/file
         - Simple paths: path/to/file.ext
 
         Applies filtering based on instance configuration to skip example/placeholder
@@ -266,89 +458,18 @@ class LinkValidator:
             content: Content to parse
 
         Returns:
-            List of file path strings found in content
+            List of unique file path strings found in content, markdown link
+            targets first
         """
-        # Apply code block filtering if enabled
-        if self.skip_code_blocks:
-            content = self._remove_code_blocks(content)
-
-        # Apply placeholder pattern removal if enabled
-        # This must happen before extraction to prevent partial matches
-        if self.skip_placeholder_paths:
-            content = self._remove_placeholder_patterns(content)
-
-        references = []
-
-        # Extract markdown links first
-        markdown_links = self.extract_links(content)
-        markdown_urls = set()
-        for _, url in markdown_links:
-            references.append(url)
-            markdown_urls.add(url)
-
-        # Remove markdown link content and URLs from the text to avoid matching fragments
-        # Replace [text](url) with just text to avoid matching url fragments
-        content_without_md_links = re.sub(r"\[([^\]]+)\]\(([^\)]+)\)", r"\1", content)
-        # Also remove plain URLs like https://example.com
-        content_without_urls = re.sub(r"https?://[^\s]+", "", content_without_md_links)
-
-        # Extract path-like references (but not URLs)
-        # Match patterns like:
-        # - Standalone files with extensions: README.md, config.yaml
-        # - Relative paths: ./file.sh, ../dir/file.py
-        # - Nested paths: path/to/file.ext
-        # Note: Absolute paths like /etc/config.yaml are NOT extracted (usually system paths)
-        path_patterns = [
-            # Relative paths starting with ./ or ../ (most reliable indicator)
-            r"\.{1,2}/[\w\-./]+",
-            # Paths with slashes and file extensions: path/to/file.ext
-            # Require whitespace or start of string before the path to avoid matching
-            # paths that are part of absolute paths like /etc/config.yaml
-            r"(?:^|(?<=\s))[\w\-]+(?:/[\w\-]+)+\.[\w]+\b",
-            # Standalone filenames with common extensions: README.md, test.py
-            # Only match if NOT preceded by a slash or word char
-            # (to avoid matching file.py from path/to/file.py)
-            r"(?<![/\w\-])[\w\-]{1,50}\.(?:md|py|js|ts|tsx|jsx|yaml|yml|json|sh|bash|txt|csv|xml"
-            r"|html|css|rs|go|java|rb|php|c|cpp|h|hpp|toml|ini|conf|cfg)\b",
-        ]
-
-        for pattern in path_patterns:
-            matches = re.findall(pattern, content_without_urls)
-            references.extend(matches)
-
-        # Apply filtering to remove example/placeholder references
-        filtered_refs = []
-        for ref in references:
-            # Don't filter "unknown" type links (anchors, mailto, tel) - they're skipped anyway
-            if ref.startswith(("#", "mailto:", "tel:")):
-                filtered_refs.append(ref)
-                continue
-
-            # Skip if matches example domain filter
-            if self.skip_example_domains and self._is_example_domain(ref):
-                continue
-
-            # Skip if matches placeholder path filter
-            if self.skip_placeholder_paths and self._is_placeholder_path(ref):
-                continue
-
-            # Skip if matches custom pattern filter
-            if self._matches_custom_pattern(ref):
-                continue
-
-            filtered_refs.append(ref)
-
+        references = self.scan_file_references(content)
+        targets = [ref.target for ref in references if ref.kind == "link"]
+        targets.extend(ref.target for ref in references if ref.kind == "path")
         # Remove duplicates while preserving order
-        seen = set()
-        unique_refs = []
-        for ref in filtered_refs:
-            if ref not in seen:
-                seen.add(ref)
-                unique_refs.append(ref)
-
-        return unique_refs
+        return list(dict.fromkeys(targets))
 
-    def validate_local_file(self, link: str, base_path: Path) -> bool:
+    def validate_local_file(
+        self, link: str, base_path: Path, path_index: Optional[ProjectPathIndex] = None
+    ) -> bool:
         """Check if local file or directory exists.
 
         Resolves relative paths from the base_path and checks if the
@@ -357,6 +478,7 @@ class LinkValidator:
         Args:
             link: Relative or absolute file/directory path
             base_path: Base directory to resolve relative paths from
+            path_index: Optional project index to answer from instead of the filesystem
 
         Returns:
             True if file or directory exists, False otherwise
@@ -364,10 +486,16 @@ class LinkValidator:
         # Handle absolute paths
         if link.startswith("/"):
             file_path = Path(link)
+        elif path_index is not None:
+            # The index normalizes ".." itself
+            file_path = base_path / link
         else:
             # Resolve relative to base_path
             file_path = (base_path / link).resolve()
 
+        if path_index is not None:
+            return path_index.exists(file_path)
+
         # Accept both files and directories as valid
         return file_path.exists()
 
@@ -384,6 +512,8 @@ class LinkValidator:
         Returns:
             True if URL returns status < 400, False otherwise
         """
+        import requests
+
         try:
             response = requests.head(
                 url,
@@ -400,7 +530,13 @@ class LinkValidator:
             # Treat any request error as invalid
             return False
 
-    def validate_resource_reference(self, ref: str, project_path: Path, resource_type: str) -> bool:
+    def validate_resource_reference(
+        self,
+        ref: str,
+        project_path: Path,
+        resource_type: str,
+        path_index: Optional[ProjectPathIndex] = None,
+    ) -> bool:
         """Check if resource reference exists (skill/command/agent).
 
         Checks if the referenced Claude Code resource exists in the
@@ -410,26 +546,28 @@ class LinkValidator:
             ref: Resource name/ID
             project_path: Root path of the project
             resource_type: Type of resource (skill, command, agent)
+            path_index: Optional project index to answer from instead of the filesystem
 
         Returns:
             True if resource exists, False otherwise
         """
         if resource_type == "skill":
             # Skills are in .claude/skills/{ref}/SKILL.md
-            skill_file = project_path / ".claude" / "skills" / ref / "SKILL.md"
-            return skill_file.exists() and skill_file.is_file()
+            resource_file = project_path / ".claude" / "skills" / ref / "SKILL.md"
         elif resource_type == "command":
             # Commands are in .claude/commands/{ref}.md
-            command_file = project_path / ".claude" / "commands" / f"{ref}.md"
-            return command_file.exists() and command_file.is_file()
+            resource_file = project_path / ".claude" / "commands" / f"{ref}.md"
         elif resource_type == "agent":
             # Agents are in .claude/agents/{ref}.md
-            agent_file = project_path / ".claude" / "agents" / f"{ref}.md"
-            return agent_file.exists() and agent_file.is_file()
+            resource_file = project_path / ".claude" / "agents" / f"{ref}.md"
         else:
             # Unknown resource type
             return False
 
+        if path_index is not None:
+            return path_index.is_file(resource_file)
+        return resource_file.exists() and resource_file.is_file()
+
     def categorize_link(self, link: str) -> str:
         """Categorize a link as local, external, or unknown.
 
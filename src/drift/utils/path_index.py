@@ -0,0 +1,347 @@
+"""In-memory index of a project's files and directories.
+
+Link and file-existence validators check many paths per run. Instead of a
+resolve() and stat() per check, a ProjectPathIndex walks the project once with
+os.scandir and answers exists/is_file/is_dir/glob queries from memory.
+
+Directories matching the index ignore patterns (by default VCS metadata,
+dependency and cache directories) are not descended into, and neither are
+symlinked or unreadable directories. Queries that reach into such a directory
+fall back to the filesystem, so answers always match what pathlib would say.
+
+The analyzer shares one index per project for the whole run (see
+project_index_session()); outside a session validators use the filesystem.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Union
+
+from drift.utils.globs import compile_glob
+
+# Directories that are never worth indexing (paths inside them are still
+# answered, from the filesystem)
+DEFAULT_INDEX_IGNORE_PATTERNS = [
+    ".git",
+    ".hg",
+    ".svn",
+    "node_modules",
+    ".venv",
+    "venv",
+    "__pycache__",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".tox",
+]
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+_current_indexes: ContextVar[Optional["_IndexRegistry"]] = ContextVar(
+    "drift_project_indexes", default=None
+)
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Get the leading components of a glob pattern that contain no wildcards."""
+    prefix = []
+    for segment in pattern.split("/"):
+        if segment in ("", "."):
+            continue
+        if any(char in segment for char in "*?["):
+            break
+        prefix.append(segment)
+    return "/".join(prefix)
+
+
+def _is_case_insensitive(root: str, names: Sequence[str]) -> bool:
+    """Probe whether the filesystem under root ignores case."""
+    for name in names:
+        swapped = name.swapcase()
+        if swapped != name:
+            return os.path.exists(os.path.join(root, swapped))
+    return False
+
+
+class ProjectPathIndex:
+    """Files and directories under a project root, collected in one walk.
+
+    Args:
+        root: Project root directory
+        ignore_patterns: Patterns (glob or regex, see drift.validation.patterns)
+            for directories not to descend into
+
+    Attributes:
+        root: Absolute project root
+        ignore_patterns: Patterns for directories that were not walked
+    """
+
+    def __init__(self, root: PathLike, ignore_patterns: Optional[List[str]] = None) -> None:
+        """Walk root and build the index.
+
+        Args:
+            root: Project root directory
+            ignore_patterns: Patterns for directories not to descend into
+                (default: DEFAULT_INDEX_IGNORE_PATTERNS)
+        """
+        self.root = Path(os.path.abspath(root))
+        self.ignore_patterns = (
+            list(DEFAULT_INDEX_IGNORE_PATTERNS) if ignore_patterns is None else ignore_patterns
+        )
+        self._root_str = os.path.normpath(str(self.root))
+        self._files: Set[str] = set()
+        # Walked directories and the names of their entries ("" is the root)
+        self._children: Dict[str, List[str]] = {}
+        # Directories whose contents are unknown (ignored, symlinked, unreadable)
+        self._opaque: Set[str] = set()
+        self._has_symlinked_dirs = False
+        self._walk()
+        self.case_insensitive = _is_case_insensitive(self._root_str, self._children.get("", []))
+
+    def _walk(self) -> None:
+        """Scan the project tree with os.scandir, one listing per directory."""
+        # Imported here: drift.validation imports the validators, which use this module
+        from drift.validation.patterns import compile_patterns
+
+        ignored = compile_patterns(self.ignore_patterns)
+        if not os.path.isdir(self._root_str):
+            return
+
+        stack = [("", self._root_str)]
+        while stack:
+            rel_dir, abs_dir = stack.pop()
+            try:
+                with os.scandir(abs_dir) as entries:
+                    entry_list = list(entries)
+            except OSError:
+                self._opaque.add(rel_dir)
+                continue
+
+            names = []
+            for entry in entry_list:
+                names.append(entry.name)
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                try:
+                    is_dir = entry.is_dir()
+                    is_file = not is_dir and entry.is_file()
+                except OSError:
+                    continue
+                if is_dir:
+                    if entry.is_symlink():
+                        self._has_symlinked_dirs = True
+                        self._opaque.add(rel_path)
+                    elif ignored.matches(rel_path):
+                        self._opaque.add(rel_path)
+                    else:
+                        stack.append((rel_path, entry.path))
+                elif is_file:
+                    self._files.add(rel_path)
+            self._children[rel_dir] = names
+
+    def _relative(self, path: PathLike) -> Optional[str]:
+        """Get the normalized POSIX path of path relative to the root.
+
+        Args:
+            path: Absolute path, or path relative to the root
+
+        Returns:
+            Relative path ("" for the root), or None if the index cannot answer
+            for it (outside the root, or ".." after a possible symlink)
+        """
+        raw = os.fspath(path)
+        if self._has_symlinked_dirs and ".." in raw.replace("\\", "/").split("/"):
+            # resolve() follows the symlink before applying "..", normpath doesn't
+            return None
+        normalized = os.path.normpath(os.path.join(self._root_str, raw))
+        if normalized == self._root_str:
+            return ""
+        if not normalized.startswith(self._root_str + os.sep):
+            return None
+        return normalized[len(self._root_str) + 1 :].replace(os.sep, "/")
+
+    def _is_known(self, rel_path: str) -> bool:
+        """Check whether the index has walked every directory above rel_path."""
+        if not self._opaque:
+            return True
+        parent = rel_path
+        while parent:
+            parent = parent.rpartition("/")[0]
+            if parent in self._opaque:
+                return False
+        return True
+
+    def _is_dir_rel(self, rel_path: str) -> bool:
+        """Check whether an indexed relative path is a directory."""
+        return rel_path in self._children or rel_path in self._opaque
+
+    def exists(self, path: PathLike) -> bool:
+        """Check whether a file or directory exists.
+
+        Args:
+            path: Absolute path, or path relative to the root
+
+        Returns:
+            True if the path exists
+        """
+        rel_path = self._relative(path)
+        if rel_path is None or not self._is_known(rel_path):
+            return self._absolute(path).exists()
+        if rel_path in self._files or self._is_dir_rel(rel_path):
+            return True
+        # A miss may only differ by case on case-insensitive filesystems
+        return self.case_insensitive and self._absolute(path).exists()
+
+    def is_file(self, path: PathLike) -> bool:
+        """Check whether a path is an existing file.
+
+        Args:
+            path: Absolute path, or path relative to the root
+
+        Returns:
+            True if the path is a file
+        """
+        rel_path = self._relative(path)
+        if rel_path is None or not self._is_known(rel_path):
+            return self._absolute(path).is_file()
+        if rel_path in self._files:
+            return True
+        return self.case_insensitive and self._absolute(path).is_file()
+
+    def is_dir(self, path: PathLike) -> bool:
+        """Check whether a path is an existing directory.
+
+        Args:
+            path: Absolute path, or path relative to the root
+
+        Returns:
+            True if the path is a directory
+        """
+        rel_path = self._relative(path)
+        if rel_path is None or not self._is_known(rel_path):
+            return self._absolute(path).is_dir()
+        if self._is_dir_rel(rel_path):
+            return True
+        return self.case_insensitive and self._absolute(path).is_dir()
+
+    def iterdir(self, path: PathLike) -> List[Path]:
+        """List the entries of a directory.
+
+        Args:
+            path: Absolute path, or path relative to the root
+
+        Returns:
+            Absolute paths of the directory's entries
+
+        Raises:
+            OSError: If the directory cannot be listed
+        """
+        rel_path = self._relative(path)
+        names = self._children.get(rel_path) if rel_path is not None else None
+        if names is None:
+            return list(self._absolute(path).iterdir())
+        directory = self.root / rel_path if rel_path else self.root
+        return [directory / name for name in names]
+
+    def glob_files(self, pattern: str) -> List[Path]:
+        """Find files matching a glob pattern relative to the root.
+
+        Only indexed files are matched, unless there are none and matches could
+        hide in an unwalked directory; then the filesystem is globbed. So the
+        result is empty exactly when [p for p in root.glob(pattern) if
+        p.is_file()] is.
+
+        Args:
+            pattern: Glob pattern relative to the root
+
+        Returns:
+            Absolute paths of matching files, sorted
+        """
+        regex = compile_glob(pattern)
+        prefix = _literal_prefix(pattern)
+        start = prefix + "/" if prefix else ""
+        matches = sorted(
+            rel_path
+            for rel_path in self._files
+            if rel_path.startswith(start) and regex.fullmatch(rel_path)
+        )
+        if not matches and self._may_hide_matches(prefix):
+            return sorted(match for match in self.root.glob(pattern) if match.is_file())
+        return [self.root / rel_path for rel_path in matches]
+
+    def _may_hide_matches(self, prefix: str) -> bool:
+        """Check whether files under prefix could be missing from the index.
+
+        Args:
+            prefix: Relative directory the matches must be under
+
+        Returns:
+            True if an unwalked directory overlaps prefix or case may differ
+        """
+        if self.case_insensitive or not self._is_known(prefix):
+            return True
+        if not prefix:
+            return bool(self._opaque)
+        return any(opaque == prefix or opaque.startswith(prefix + "/") for opaque in self._opaque)
+
+    def _absolute(self, path: PathLike) -> Path:
+        """Get path as an absolute Path, resolving relative paths from the root."""
+        return self.root / os.fspath(path)
+
+
+class _IndexRegistry:
+    """Lazily built ProjectPathIndex per project root, shared within a session."""
+
+    def __init__(self, ignore_patterns: Optional[List[str]]) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            ignore_patterns: Ignore patterns for every index built
+        """
+        self.ignore_patterns = ignore_patterns
+        self._indexes: Dict[str, ProjectPathIndex] = {}
+        self._lock = threading.Lock()
+
+    def get(self, root: PathLike) -> ProjectPathIndex:
+        """Get the index for root, walking the project on first use."""
+        key = os.path.normpath(os.path.abspath(root))
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = ProjectPathIndex(key, self.ignore_patterns)
+                self._indexes[key] = index
+            return index
+
+
+@contextmanager
+def project_index_session(ignore_patterns: Optional[List[str]] = None) -> Iterator[None]:
+    """Share one ProjectPathIndex per project with everything run inside the block.
+
+    Indexes are built on first use, so runs that never check a path never walk
+    the project. Files created during the session are not seen.
+
+    Args:
+        ignore_patterns: Patterns for directories not to index
+            (default: DEFAULT_INDEX_IGNORE_PATTERNS)
+    """
+    token = _current_indexes.set(_IndexRegistry(ignore_patterns))
+    try:
+        yield
+    finally:
+        _current_indexes.reset(token)
+
+
+def get_project_index(root: PathLike) -> Optional[ProjectPathIndex]:
+    """Get the session's index for a project root, if inside project_index_session().
+
+    Args:
+        root: Project root directory
+
+    Returns:
+        The shared index, or None outside a session
+    """
+    registry = _current_indexes.get()
+    if registry is None:
+        return None
+    return registry.get(root)
@@ -0,0 +1,153 @@
+"""Persistent cache of external URL check results.
+
+Stores, per URL, the last HTTP status, final URL after redirects, when it was
+checked and its ETag/Last-Modified validators in a single JSON file (by default
+``.drift/cache/url_status.json``). Entries expire after a TTL chosen by status
+class, and expired entries are refreshed with conditional requests.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+STATUS_CLASSES = ("2xx", "3xx", "4xx", "5xx", "error")
+
+# Default TTLs in seconds per status class
+DEFAULT_TTLS: Dict[str, int] = {
+    "2xx": 7 * 24 * 3600,
+    "3xx": 24 * 3600,
+    "4xx": 3600,
+    "5xx": 3600,
+    "error": 3600,
+}
+
+CACHE_VERSION = 1
+
+
+def status_class(status: Optional[int]) -> str:
+    """Get the status class for an HTTP status.
+
+    -- status: HTTP status code, or None if the request failed
+
+    Returns one of STATUS_CLASSES.
+    """
+    if status is None or not 200 <= status < 600:
+        return "error"
+    return f"{status // 100}xx"
+
+
+class UrlStatusCache:
+    """JSON-file store of URL check results with per-status-class TTLs.
+
+    The file is read once on construction and written by save(). All methods
+    are thread-safe.
+
+    -- path: JSON file to store results in
+    -- ttls: TTL in seconds per status class (missing classes use DEFAULT_TTLS)
+    """
+
+    def __init__(self, path: Path, ttls: Optional[Mapping[str, int]] = None):
+        """Initialize the cache and load existing entries.
+
+        -- path: JSON file to store results in
+        -- ttls: TTL in seconds per status class (missing classes use DEFAULT_TTLS)
+        """
+        self.path = Path(path)
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get the stored entry for a URL, fresh or not.
+
+        -- url: URL to look up
+
+        Returns a copy of the entry, or None if the URL was never checked.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            return dict(entry) if entry is not None else None
+
+    def is_fresh(self, entry: Mapping[str, Any]) -> bool:
+        """Check whether an entry is still within its status class TTL.
+
+        -- entry: Entry from get()
+
+        Returns True if the entry can be used without a new request.
+        """
+        try:
+            checked_at = datetime.fromisoformat(entry["checked_at"])
+        except (KeyError, TypeError, ValueError):
+            return False
+        if checked_at.tzinfo is None:
+            checked_at = checked_at.replace(tzinfo=timezone.utc)
+
+        age_seconds = (datetime.now(timezone.utc) - checked_at).total_seconds()
+        return age_seconds <= self.ttls[status_class(entry.get("status"))]
+
+    def set(
+        self,
+        url: str,
+        status: Optional[int],
+        final_url: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Record the result of checking a URL.
+
+        -- url: URL that was checked
+        -- status: Final HTTP status, or None if the request failed
+        -- final_url: URL after following redirects
+        -- etag: ETag response header, if any
+        -- last_modified: Last-Modified response header, if any
+        """
+        entry = {
+            "status": status,
+            "final_url": final_url or url,
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        with self._lock:
+            self._entries[url] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write entries to disk if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"version": CACHE_VERSION, "urls": self._entries}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                tmp_path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                logger.warning(f"Failed to write URL status cache {self.path}: {e}")
+
+    def clear(self) -> None:
+        """Remove all entries (written on the next save())."""
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+
+    def _load(self) -> None:
+        """Load entries from disk, starting empty if the file is missing or invalid."""
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == CACHE_VERSION and isinstance(data.get("urls"), dict):
+                self._entries = data["urls"]
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable URL status cache {self.path}: {e}")
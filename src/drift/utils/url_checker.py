@@ -0,0 +1,279 @@
+"""Concurrent, deduplicated external URL checking.
+
+A single checker is shared by every markdown link rule in a run (see
+url_check_session()), so each distinct URL is requested once no matter how many
+files or bundles reference it. Requests go through one pooled requests.Session
+with a cap on concurrent requests per host. With a UrlStatusCache, fresh results
+from earlier runs are reused without any request.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Mapping, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+from drift.utils.url_cache import UrlStatusCache
+
+if TYPE_CHECKING:
+    import requests
+
+DEFAULT_TIMEOUT = 5
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_PER_HOST_LIMIT = 4
+USER_AGENT = "Drift-Validator/1.0"
+
+_current_checker: ContextVar[Optional["ExternalUrlChecker"]] = ContextVar(
+    "drift_url_checker", default=None
+)
+
+
+class UrlCheckResult(NamedTuple):
+    """Outcome of requesting a URL."""
+
+    status: Optional[int]
+    final_url: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+def is_reachable(status: Optional[int]) -> bool:
+    """Check whether a final HTTP status counts as a working link."""
+    return status is not None and status < 400
+
+
+class ExternalUrlChecker:
+    """Check external URLs concurrently, requesting each URL at most once.
+
+    Each URL gets a HEAD request, falling back to a streamed GET when the server
+    rejects HEAD (any status >= 400 or a redirect loop). A URL is valid when the
+    final status is below 400; request errors count as invalid.
+
+    When a status cache is given, fresh cached results are used as-is and
+    expired ones are revalidated with If-None-Match/If-Modified-Since, so an
+    unchanged page answers 304 without a body.
+
+    Args:
+        timeout: Per-request timeout in seconds
+        max_workers: Maximum concurrent requests overall
+        per_host_limit: Maximum concurrent requests to a single host
+        status_cache: Optional persistent cache of earlier results
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+        status_cache: Optional[UrlStatusCache] = None,
+    ) -> None:
+        """Initialize the checker and its pooled session.
+
+        Args:
+            timeout: Per-request timeout in seconds
+            max_workers: Maximum concurrent requests overall
+            per_host_limit: Maximum concurrent requests to a single host
+            status_cache: Optional persistent cache of earlier results
+        """
+        if max_workers < 1 or per_host_limit < 1:
+            raise ValueError("max_workers and per_host_limit must be at least 1")
+
+        self.timeout = timeout
+        self.per_host_limit = per_host_limit
+        self.status_cache = status_cache
+
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="drift-url-check"
+        )
+        self._results: Dict[str, "Future[bool]"] = {}
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "ExternalUrlChecker":
+        """Return the checker for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the checker."""
+        self.close()
+
+    def submit(self, url: str) -> "Future[bool]":
+        """Schedule a URL check unless it was already scheduled.
+
+        Args:
+            url: HTTP/HTTPS URL to check
+
+        Returns:
+            Future resolving to True if the URL is reachable
+        """
+        with self._lock:
+            future = self._results.get(url)
+            if future is None:
+                future = self._executor.submit(self._check, url)
+                self._results[url] = future
+            return future
+
+    def prefetch(self, urls: Iterable[str]) -> None:
+        """Schedule checks for URLs without waiting for the results.
+
+        Args:
+            urls: URLs to check
+        """
+        for url in urls:
+            self.submit(url)
+
+    def check(self, url: str) -> bool:
+        """Check a URL, reusing an earlier or in-flight result.
+
+        Args:
+            url: HTTP/HTTPS URL to check
+
+        Returns:
+            True if the URL is reachable, False otherwise
+        """
+        return self.submit(url).result()
+
+    def check_many(self, urls: Iterable[str]) -> Dict[str, bool]:
+        """Check several URLs concurrently.
+
+        Args:
+            urls: URLs to check (duplicates are checked once)
+
+        Returns:
+            Mapping of each URL to whether it is reachable
+        """
+        futures = {url: self.submit(url) for url in urls}
+        return {url: future.result() for url, future in futures.items()}
+
+    def close(self) -> None:
+        """Cancel pending checks, release pooled connections and save the status cache."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self.session.close()
+        if self.status_cache is not None:
+            self.status_cache.save()
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Get the semaphore limiting concurrent requests to a URL's host."""
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.per_host_limit)
+                self._host_slots[host] = slot
+            return slot
+
+    def _check(self, url: str) -> bool:
+        """Check a URL, using the status cache when it has a fresh entry."""
+        cache = self.status_cache
+        cached = cache.get(url) if cache is not None else None
+        if cache is not None and cached is not None and cache.is_fresh(cached):
+            return is_reachable(cached.get("status"))
+
+        with self._host_slot(url):
+            result = self._request(url, cached)
+
+        if cache is not None:
+            cache.set(url, *result)
+        return is_reachable(result.status)
+
+    def _request(self, url: str, cached: Optional[Mapping[str, Any]]) -> UrlCheckResult:
+        """Request a URL, falling back to GET when HEAD is rejected.
+
+        Args:
+            url: URL to request
+            cached: Expired cache entry used for a conditional request, if any
+
+        Returns:
+            Result of the request
+        """
+        headers: Dict[str, str] = {}
+        if cached is not None and is_reachable(cached.get("status")):
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        import requests
+
+        try:
+            try:
+                response = self.session.head(
+                    url, timeout=self.timeout, allow_redirects=True, headers=headers
+                )
+                if response.status_code < 400:
+                    return self._result(response, cached)
+            except requests.TooManyRedirects:
+                pass
+
+            # Some servers reject or mishandle HEAD; only fetch headers via GET
+            response = self.session.get(
+                url, timeout=self.timeout, allow_redirects=True, stream=True, headers=headers
+            )
+            response.close()
+            return self._result(response, cached)
+        except requests.RequestException:
+            # Treat any request error as invalid
+            return UrlCheckResult(status=None)
+
+    @staticmethod
+    def _result(
+        response: "requests.Response", cached: Optional[Mapping[str, Any]]
+    ) -> UrlCheckResult:
+        """Build a check result, resolving 304 Not Modified to the cached status."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code == 304 and cached is not None:
+            return UrlCheckResult(
+                status=cached.get("status"),
+                final_url=cached.get("final_url"),
+                etag=etag or cached.get("etag"),
+                last_modified=last_modified or cached.get("last_modified"),
+            )
+        return UrlCheckResult(
+            status=response.status_code,
+            final_url=response.url,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+
+@contextmanager
+def url_check_session(
+    timeout: float = DEFAULT_TIMEOUT,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    status_cache: Optional[UrlStatusCache] = None,
+) -> Iterator[ExternalUrlChecker]:
+    """Share one ExternalUrlChecker with everything run inside the block.
+
+    Args:
+        timeout: Per-request timeout in seconds
+        max_workers: Maximum concurrent requests overall
+        per_host_limit: Maximum concurrent requests to a single host
+        status_cache: Optional persistent cache of earlier results (saved on exit)
+
+    Yields:
+        The active checker
+    """
+    checker = ExternalUrlChecker(timeout, max_workers, per_host_limit, status_cache)
+    token = _current_checker.set(checker)
+    try:
+        yield checker
+    finally:
+        _current_checker.reset(token)
+        checker.close()
+
+
+def get_url_checker() -> Optional[ExternalUrlChecker]:
+    """Get the checker of the enclosing url_check_session(), if any."""
+    return _current_checker.get()
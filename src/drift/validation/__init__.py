@@ -1,15 +1,19 @@
 """Rule-based validation for drift document analysis."""
 
-from drift.validation.validators import (
-    BaseValidator,
-    DependencyDuplicateValidator,
-    FileExistsValidator,
-    ListMatchValidator,
-    ListRegexMatchValidator,
-    MarkdownLinkValidator,
-    RegexMatchValidator,
-    ValidatorRegistry,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from drift.validation.validators import (
+        BaseValidator,
+        DependencyDuplicateValidator,
+        FileExistsValidator,
+        ListMatchValidator,
+        ListRegexMatchValidator,
+        MarkdownLinkValidator,
+        RegexMatchValidator,
+        ValidatorRegistry,
+    )
 
 __all__ = [
     "BaseValidator",
@@ -21,3 +25,10 @@ __all__ = [
     "RegexMatchValidator",
     "ValidatorRegistry",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import validators on first access, keeping drift.validation.patterns light."""
+    if name in __all__:
+        return getattr(importlib.import_module("drift.validation.validators"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
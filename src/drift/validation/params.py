@@ -5,6 +5,7 @@ from typing import Any, Dict, List
 
 from drift.config.models import ParamType
 from drift.core.types import DocumentBundle
+from drift.documents.overlay import is_file, read_text
 
 
 class ParamResolver:
@@ -150,9 +151,9 @@ class ParamResolver:
         # Try each pattern
         for pattern in resource_patterns:
             file_path = self.project_path / pattern
-            if file_path.exists() and file_path.is_file():
+            if is_file(file_path):
                 try:
-                    return file_path.read_text(encoding="utf-8")
+                    return read_text(file_path)
                 except Exception as e:
                     raise ValueError(f"Error reading resource {resource_spec}: {e}")
 
@@ -171,11 +172,11 @@ class ParamResolver:
             ValueError: If file not found or unreadable
         """
         full_path = self.project_path / file_path
-        if not full_path.exists() or not full_path.is_file():
+        if not is_file(full_path):
             raise ValueError(f"File not found: {file_path}")
 
         try:
-            return full_path.read_text(encoding="utf-8")
+            return read_text(full_path)
         except Exception as e:
             raise ValueError(f"Error reading file {file_path}: {e}")
 
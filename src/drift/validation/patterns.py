@@ -2,11 +2,26 @@
 
 This module provides utilities for matching file paths against various pattern types
 including glob patterns, regex patterns, and literal paths.
+
+Glob patterns follow PurePath.match() semantics (matched against the end of
+the path, one component at a time) except that a "**" component matches zero
+or more components, on every Python version. Pattern lists that are checked
+repeatedly should go through compile_patterns(), which compiles each list once.
 """
 
+import os
 import re
-from pathlib import Path
-from typing import List
+from functools import lru_cache
+from pathlib import Path, PurePath
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+from drift.utils.globs import split_glob, translate_path_glob
+
+# Globs ignore case where the platform's paths do (Windows), like Path.match()
+_GLOB_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+# Upper bound on memoized verdicts per CompiledPatternSet
+_MAX_VERDICTS = 65536
 
 
 def is_regex_pattern(pattern: str) -> bool:
@@ -35,14 +50,56 @@ def is_regex_pattern(pattern: str) -> bool:
     return any(indicator in pattern for indicator in regex_indicators)
 
 
+def _glob_source(pattern: str) -> Optional[str]:
+    """Translate a glob to regex source matching the end of a POSIX path.
+
+    -- pattern: Glob pattern; absolute patterns must match the whole path
+
+    Returns regex source to search() with, or None for an empty pattern.
+    """
+    normalized = PurePath(pattern).as_posix()
+    segments = split_glob(normalized)
+    if not segments:
+        return None
+    body = translate_path_glob(segments)
+    if normalized.startswith("/"):
+        return rf"^/{body}\Z"
+    # Right-anchored on a component boundary, like PurePath.match()
+    return rf"(?:^|(?<=/)){body}\Z"
+
+
+@lru_cache(maxsize=1024)
+def _compile_glob(pattern: str) -> Optional[Pattern[str]]:
+    """Compile a single glob pattern (cached)."""
+    source = _glob_source(pattern)
+    return re.compile(source, _GLOB_FLAGS) if source is not None else None
+
+
+@lru_cache(maxsize=1024)
+def _compile_regex(pattern: str) -> Pattern[str]:
+    """Compile a single regex pattern (cached).
+
+    Raises ValueError if pattern is invalid regex.
+    """
+    try:
+        return re.compile(pattern)
+    except re.error as e:
+        raise ValueError(f"Invalid regex pattern '{pattern}': {e}") from e
+
+
+def _normalize_path(path: str) -> str:
+    """Normalize a path the way PurePath does before glob matching."""
+    return PurePath(path).as_posix()
+
+
 def match_glob_pattern(path: str, pattern: str) -> bool:
     """Match a path against a glob pattern.
 
-    Uses pathlib.Path.match() for glob pattern matching.
-    Supports patterns like:
+    The pattern is matched against the end of the path, component by
+    component, like pathlib.PurePath.match(). Supports patterns like:
     - "*.md" - matches any .md file
-    - "**/*.py" - matches .py files in any subdirectory
-    - "src/**" - matches anything under src/
+    - "**/*.py" - matches .py files at any depth, including the top level
+    - "src/**" - matches src/ and anything under it
 
     -- path: File path to check (relative or absolute)
     -- pattern: Glob pattern to match against
@@ -50,8 +107,8 @@ def match_glob_pattern(path: str, pattern: str) -> bool:
     Returns True if path matches pattern, False otherwise.
     """
     try:
-        path_obj = Path(path)
-        return path_obj.match(pattern)
+        compiled = _compile_glob(pattern)
+        return compiled is not None and compiled.search(_normalize_path(path)) is not None
     except (ValueError, TypeError):
         return False
 
@@ -67,13 +124,9 @@ def match_regex_pattern(path: str, pattern: str) -> bool:
 
     Returns True if path matches pattern, False otherwise.
 
-    Raises re.error if pattern is invalid regex.
+    Raises ValueError if pattern is invalid regex.
     """
-    try:
-        compiled = re.compile(pattern)
-        return compiled.match(path) is not None
-    except re.error as e:
-        raise ValueError(f"Invalid regex pattern '{pattern}': {e}") from e
+    return _compile_regex(pattern).match(path) is not None
 
 
 def match_literal_path(path: str, literal: str) -> bool:
@@ -119,11 +172,123 @@ def match_pattern(path: str, pattern: str) -> bool:
         return match_glob_pattern(path, pattern)
 
 
+def _combine(sources: List[str]) -> Optional[Pattern[str]]:
+    """Compile glob regex sources into one alternation (None if there are none)."""
+    if not sources:
+        return None
+    return re.compile("|".join(f"(?:{source})" for source in sources), _GLOB_FLAGS)
+
+
+class CompiledPatternSet:
+    """A list of ignore patterns compiled once for repeated matching.
+
+    Each pattern is classified once. All globs are translated into a single
+    combined regex and each regex pattern is compiled once. Verdicts are
+    memoized per path, so asking again about a file (e.g. for another rule
+    with the same patterns) is a dict lookup.
+
+    -- patterns: Patterns (glob or regex) as accepted by should_ignore_path()
+
+    Raises ValueError if any regex pattern is invalid.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        """Classify and compile the patterns."""
+        self.patterns: Tuple[str, ...] = tuple(patterns)
+        glob_sources: List[str] = []
+        # Globs ending in "**": whatever they match, they match everything below
+        tree_sources: List[str] = []
+        self._regexes: List[Pattern[str]] = []
+        for pattern in self.patterns:
+            if not isinstance(pattern, str) or not pattern:
+                continue
+            if is_regex_pattern(pattern):
+                self._regexes.append(_compile_regex(pattern))
+            else:
+                source = _glob_source(pattern)
+                if source is not None:
+                    glob_sources.append(source)
+                    if split_glob(PurePath(pattern).as_posix())[-1] == "**":
+                        tree_sources.append(source)
+        self._globs = _combine(glob_sources)
+        self._tree_globs = _combine(tree_sources)
+        self._verdicts: Dict[str, bool] = {}
+
+    def __bool__(self) -> bool:
+        """Check whether any pattern can match."""
+        return self._globs is not None or bool(self._regexes)
+
+    def matches(self, path: str) -> bool:
+        """Check if a path matches any of the patterns.
+
+        -- path: File path to check (relative or absolute)
+
+        Returns True if path matches any pattern, False otherwise.
+        """
+        verdict = self._verdicts.get(path)
+        if verdict is None:
+            verdict = self._match(path)
+            if len(self._verdicts) >= _MAX_VERDICTS:
+                self._verdicts.clear()
+            self._verdicts[path] = verdict
+        return verdict
+
+    def matches_tree(self, directory: str) -> bool:
+        """Check if a directory and everything below it match the patterns.
+
+        Only globs ending in "**" (e.g. "node_modules/**") can guarantee this;
+        other patterns are decided file by file.
+
+        -- directory: Directory path to check (relative or absolute)
+
+        Returns True if every path under the directory would match.
+        """
+        if self._tree_globs is None:
+            return False
+        try:
+            return self._tree_globs.search(_normalize_path(directory)) is not None
+        except TypeError:
+            return False
+
+    def _match(self, path: str) -> bool:
+        """Match a path against the compiled patterns without memoization."""
+        if any(regex.match(path) for regex in self._regexes):
+            return True
+        if self._globs is None:
+            return False
+        try:
+            return self._globs.search(_normalize_path(path)) is not None
+        except TypeError:
+            return False
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern_tuple(patterns: Tuple[str, ...]) -> CompiledPatternSet:
+    """Build a CompiledPatternSet for a tuple of patterns (cached)."""
+    return CompiledPatternSet(patterns)
+
+
+def compile_patterns(patterns: Iterable[str]) -> CompiledPatternSet:
+    """Get the compiled form of a pattern list.
+
+    Equal pattern lists share one CompiledPatternSet (and its memoized
+    verdicts) for the lifetime of the process.
+
+    -- patterns: Patterns (glob or regex)
+
+    Returns the CompiledPatternSet for the patterns.
+
+    Raises ValueError if any regex pattern is invalid.
+    """
+    return _compile_pattern_tuple(tuple(patterns))
+
+
 def should_ignore_path(path: str, ignore_patterns: List[str]) -> bool:
     """Check if a path should be ignored based on a list of patterns.
 
     Checks the path against all ignore patterns. Returns True if
-    any pattern matches.
+    any pattern matches. The list is compiled once and reused on
+    later calls with the same patterns (see compile_patterns()).
 
     -- path: File path to check
     -- ignore_patterns: List of patterns (glob or regex)
@@ -134,9 +299,4 @@ def should_ignore_path(path: str, ignore_patterns: List[str]) -> bool:
     """
     if not ignore_patterns:
         return False
-
-    for pattern in ignore_patterns:
-        if match_pattern(path, pattern):
-            return True
-
-    return False
+    return compile_patterns(ignore_patterns).matches(path)
@@ -0,0 +1,235 @@
+"""Token counting for validators.
+
+Tokenizers (and the Anthropic client) are loaded once per process, and counts
+are memoized by (provider, content hash) so unchanged files are only counted
+once no matter how many rules or bundles reference them. The memo keeps the
+most recently used ``TOKEN_COUNT_CACHE_SIZE`` counts, so long-lived processes
+(``drift serve``, ``drift lsp``) do not grow with every edit. Callers that already
+know a content fingerprint (a git blob id, see DocumentFile.fingerprint) pass it
+instead, which saves hashing the text.
+
+The ``approximate`` provider needs no package, credentials or network. It splits
+text into letter runs, digit groups and individual symbols, and charges one
+token per ``APPROXIMATE_CHARS_PER_TOKEN`` letters of each run. For English prose
+and Markdown it is typically within 20% of the Claude and GPT-4 tokenizers;
+symbol-heavy text such as code or tables tends to be overestimated (up to about
+1.5x), so leave a matching margin on max_count/min_count limits.
+"""
+
+import hashlib
+import math
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+SUPPORTED_PROVIDERS = ("anthropic", "openai", "llama", "approximate")
+
+# Model used for Anthropic token counting (Claude Sonnet 4.5)
+ANTHROPIC_COUNT_MODEL = "claude-sonnet-4-5-20250929"
+
+# Concurrent count_tokens requests per batch
+ANTHROPIC_BATCH_CONCURRENCY = 8
+
+# Memoized token counts kept per process (least recently used are dropped first)
+TOKEN_COUNT_CACHE_SIZE = 10000
+
+# Letters per token for the approximate provider
+APPROXIMATE_CHARS_PER_TOKEN = 6
+
+_APPROXIMATE_PIECE = re.compile(r"[A-Za-z]+|[0-9]{1,3}|[^\sA-Za-z0-9]")
+
+_tokenizers: Dict[str, Any] = {}
+_counts: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def approximate_token_count(text: str) -> int:
+    """Estimate the token count of text without a tokenizer.
+
+    -- text: Text to estimate
+
+    Returns the estimated token count.
+    """
+    count = 0
+    for match in _APPROXIMATE_PIECE.finditer(text):
+        piece = match.group(0)
+        if piece[0].isalpha():
+            count += math.ceil(len(piece) / APPROXIMATE_CHARS_PER_TOKEN)
+        else:
+            count += 1
+    return count
+
+
+def _load_tokenizer(provider: str) -> Any:
+    """Load the tokenizer (or API client) for a provider once per process.
+
+    -- provider: Token counter provider ('anthropic', 'openai', 'llama')
+
+    Returns the tokenizer.
+    Raises ImportError if required library not installed.
+    """
+    with _lock:
+        tokenizer = _tokenizers.get(provider)
+    if tokenizer is not None:
+        return tokenizer
+
+    if provider == "anthropic":
+        try:
+            from anthropic import Anthropic
+        except ImportError:
+            raise ImportError(
+                "Anthropic token counting requires 'anthropic' package. "
+                "Install with: pip install anthropic"
+            )
+        tokenizer = Anthropic()
+
+    elif provider == "openai":
+        try:
+            import tiktoken
+        except ImportError:
+            raise ImportError(
+                "OpenAI token counting requires 'tiktoken' package. "
+                "Install with: pip install tiktoken"
+            )
+        # Use GPT-4 tokenizer as default
+        tokenizer = tiktoken.encoding_for_model("gpt-4")
+
+    elif provider == "llama":
+        try:
+            from transformers import AutoTokenizer
+        except ImportError:
+            raise ImportError(
+                "Llama token counting requires 'transformers' package. "
+                "Install with: pip install transformers"
+            )
+        # Use Llama-2 tokenizer as default
+        tokenizer = AutoTokenizer.from_pretrained("meta-llama/Llama-2-7b-hf")
+
+    else:
+        raise ValueError(f"Unsupported provider: {provider}")
+
+    with _lock:
+        return _tokenizers.setdefault(provider, tokenizer)
+
+
+def _count_anthropic(client: Any, text: str) -> int:
+    """Count tokens with the Anthropic count_tokens API.
+
+    -- client: Anthropic client
+    -- text: Text to count tokens for
+
+    Returns token count.
+    """
+    # Use the beta messages.count_tokens API (Nov 2024+)
+    # https://docs.claude.com/en/api/messages-count-tokens
+    response = client.beta.messages.count_tokens(
+        betas=["token-counting-2024-11-01"],
+        model=ANTHROPIC_COUNT_MODEL,
+        messages=[{"role": "user", "content": text}],
+    )
+    count: int = response.input_tokens
+    return count
+
+
+def _count_uncached(texts: List[str], provider: str) -> List[int]:
+    """Count tokens for texts that are not memoized yet.
+
+    -- texts: Texts to count
+    -- provider: Token counter provider
+
+    Returns token counts in input order.
+    """
+    if provider == "approximate":
+        return [approximate_token_count(text) for text in texts]
+
+    tokenizer = _load_tokenizer(provider)
+
+    if provider == "anthropic":
+        # count_tokens takes one message list per request, so batches are
+        # sent as concurrent requests over the shared client
+        if len(texts) == 1:
+            return [_count_anthropic(tokenizer, texts[0])]
+        workers = min(ANTHROPIC_BATCH_CONCURRENCY, len(texts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda text: _count_anthropic(tokenizer, text), texts))
+
+    return [len(tokenizer.encode(text)) for text in texts]
+
+
+def _content_hash(text: str) -> str:
+    """Return the memo key of a text without a known fingerprint.
+
+    -- text: Text to hash
+
+    Returns the hex SHA-256 of the text.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def count_tokens_batch(
+    texts: Sequence[str],
+    provider: str,
+    fingerprints: Optional[Sequence[Optional[str]]] = None,
+) -> List[int]:
+    """Count tokens for several texts, reusing memoized counts.
+
+    Identical texts are only counted once.
+
+    -- texts: Texts to count
+    -- provider: Token counter provider (see SUPPORTED_PROVIDERS)
+    -- fingerprints: Known content fingerprint of each text, or None where unknown;
+       used as the memo key instead of hashing the text
+
+    Returns token counts in input order.
+    Raises ImportError if required library not installed.
+    """
+    if provider not in SUPPORTED_PROVIDERS:
+        raise ValueError(f"Unsupported provider: {provider}")
+
+    if fingerprints is None:
+        fingerprints = [None] * len(texts)
+    keys = [
+        (provider, f"blob:{fingerprint}" if fingerprint else _content_hash(text))
+        for text, fingerprint in zip(texts, fingerprints)
+    ]
+
+    known: Dict[Tuple[str, str], int] = {}
+    missing: Dict[Tuple[str, str], str] = {}
+    with _lock:
+        for key, text in zip(keys, texts):
+            if key in _counts:
+                _counts.move_to_end(key)
+                known[key] = _counts[key]
+            else:
+                missing.setdefault(key, text)
+
+    if missing:
+        fresh = dict(zip(missing, _count_uncached(list(missing.values()), provider)))
+        with _lock:
+            _counts.update(fresh)
+            while len(_counts) > TOKEN_COUNT_CACHE_SIZE:
+                _counts.popitem(last=False)
+        known.update(fresh)
+
+    return [known[key] for key in keys]
+
+
+def count_tokens(text: str, provider: str) -> int:
+    """Count tokens for a text, reusing memoized counts.
+
+    -- text: Text to count tokens for
+    -- provider: Token counter provider (see SUPPORTED_PROVIDERS)
+
+    Returns token count.
+    Raises ImportError if required library not installed.
+    """
+    return count_tokens_batch([text], provider)[0]
+
+
+def clear_token_caches() -> None:
+    """Drop loaded tokenizers and memoized counts."""
+    with _lock:
+        _tokenizers.clear()
+        _counts.clear()
@@ -7,35 +7,86 @@ This package provides a modular structure for validators:
 """
 
 import importlib
-from typing import Any, Dict, List, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
 
 from drift.config.models import ClientType, ValidationRule
 from drift.core.types import DocumentBundle, DocumentRule
 from drift.validation.validators.base import BaseValidator
-from drift.validation.validators.client import (
-    ClaudeCircularDependenciesValidator,
-    ClaudeDependencyDuplicateValidator,
-    ClaudeMaxDependencyDepthValidator,
-    ClaudeMcpPermissionsValidator,
-    ClaudeSettingsDuplicatesValidator,
-    ClaudeSkillSettingsValidator,
-)
-from drift.validation.validators.core import (
-    BlockLineCountValidator,
-    CircularDependenciesValidator,
-    DependencyDuplicateValidator,
-    FileExistsValidator,
-    FileSizeValidator,
-    JsonSchemaValidator,
-    ListMatchValidator,
-    ListRegexMatchValidator,
-    MarkdownLinkValidator,
-    MaxDependencyDepthValidator,
-    RegexMatchValidator,
-    TokenCountValidator,
-    YamlFrontmatterValidator,
-    YamlSchemaValidator,
-)
+
+if TYPE_CHECKING:
+    from drift.validation.validators.client import (
+        ClaudeCircularDependenciesValidator,
+        ClaudeDependencyDuplicateValidator,
+        ClaudeMaxDependencyDepthValidator,
+        ClaudeMcpPermissionsValidator,
+        ClaudeSettingsDuplicatesValidator,
+        ClaudeSkillSettingsValidator,
+    )
+    from drift.validation.validators.core import (
+        BlockLineCountValidator,
+        CircularDependenciesValidator,
+        DependencyDuplicateValidator,
+        FileExistsValidator,
+        FileSizeValidator,
+        JsonSchemaValidator,
+        ListMatchValidator,
+        ListRegexMatchValidator,
+        MarkdownLinkValidator,
+        MaxDependencyDepthValidator,
+        RegexMatchValidator,
+        TokenCountValidator,
+        YamlFrontmatterValidator,
+        YamlSchemaValidator,
+    )
+
+# Built-in validator classes by name and the package defining them. They are
+# imported when a registry is first created (or a class is accessed here), so
+# importing drift.validation does not import every validator module.
+_CORE_PACKAGE = "drift.validation.validators.core"
+_CLIENT_PACKAGE = "drift.validation.validators.client"
+_BUILTIN_VALIDATORS = {
+    # File validators
+    "FileExistsValidator": _CORE_PACKAGE,
+    "FileSizeValidator": _CORE_PACKAGE,
+    "TokenCountValidator": _CORE_PACKAGE,
+    # Format validators
+    "JsonSchemaValidator": _CORE_PACKAGE,
+    "YamlSchemaValidator": _CORE_PACKAGE,
+    "YamlFrontmatterValidator": _CORE_PACKAGE,
+    # Pattern validators
+    "RegexMatchValidator": _CORE_PACKAGE,
+    "ListMatchValidator": _CORE_PACKAGE,
+    "ListRegexMatchValidator": _CORE_PACKAGE,
+    "MarkdownLinkValidator": _CORE_PACKAGE,
+    # Block validators
+    "BlockLineCountValidator": _CORE_PACKAGE,
+    # Dependency validators
+    "DependencyDuplicateValidator": _CORE_PACKAGE,
+    "CircularDependenciesValidator": _CORE_PACKAGE,
+    "MaxDependencyDepthValidator": _CORE_PACKAGE,
+    # Claude Code validators
+    "ClaudeDependencyDuplicateValidator": _CLIENT_PACKAGE,
+    "ClaudeCircularDependenciesValidator": _CLIENT_PACKAGE,
+    "ClaudeMaxDependencyDepthValidator": _CLIENT_PACKAGE,
+    "ClaudeSkillSettingsValidator": _CLIENT_PACKAGE,
+    "ClaudeSettingsDuplicatesValidator": _CLIENT_PACKAGE,
+    "ClaudeMcpPermissionsValidator": _CLIENT_PACKAGE,
+}
+
+
+def _builtin_validator_class(name: str) -> Type[BaseValidator]:
+    """Import a built-in validator class by name."""
+    validator_class: Type[BaseValidator] = getattr(
+        importlib.import_module(_BUILTIN_VALIDATORS[name]), name
+    )
+    return validator_class
+
+
+def __getattr__(name: str) -> Any:
+    """Import built-in validator classes on first access."""
+    if name in _BUILTIN_VALIDATORS:
+        return _builtin_validator_class(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ValidatorRegistry:
@@ -97,32 +148,7 @@ class ValidatorRegistry:
     def _register_builtin_validators(self) -> None:
         """Register all built-in core validators with their namespaced types."""
         builtin_validators = [
-            # File validators
-            FileExistsValidator(self.loader),
-            FileSizeValidator(self.loader),
-            TokenCountValidator(self.loader),
-            # Format validators
-            JsonSchemaValidator(self.loader),
-            YamlSchemaValidator(self.loader),
-            YamlFrontmatterValidator(self.loader),
-            # Pattern validators
-            RegexMatchValidator(self.loader),
-            ListMatchValidator(self.loader),
-            ListRegexMatchValidator(self.loader),
-            MarkdownLinkValidator(self.loader),
-            # Block validators
-            BlockLineCountValidator(self.loader),
-            # Dependency validators
-            DependencyDuplicateValidator(self.loader),
-            CircularDependenciesValidator(self.loader),
-            MaxDependencyDepthValidator(self.loader),
-            # Claude Code validators
-            ClaudeDependencyDuplicateValidator(self.loader),
-            ClaudeCircularDependenciesValidator(self.loader),
-            ClaudeMaxDependencyDepthValidator(self.loader),
-            ClaudeSkillSettingsValidator(self.loader),
-            ClaudeSettingsDuplicatesValidator(self.loader),
-            ClaudeMcpPermissionsValidator(self.loader),
+            _builtin_validator_class(name)(self.loader) for name in _BUILTIN_VALIDATORS
         ]
 
         for validator in builtin_validators:
@@ -362,6 +388,7 @@ class ValidatorRegistry:
 
 __all__ = [
     "BaseValidator",
+    "BlockLineCountValidator",
     "CircularDependenciesValidator",
     "ClaudeCircularDependenciesValidator",
     "ClaudeDependencyDuplicateValidator",
@@ -49,8 +49,8 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, Generator, List, Literal, Optional, Tuple
 
 from drift.config.models import ClientType, ValidationRule
-from drift.core.types import DocumentBundle, DocumentRule
-from drift.validation.patterns import should_ignore_path
+from drift.core.types import DocumentBundle, DocumentFile, DocumentRule
+from drift.validation.patterns import compile_patterns, should_ignore_path
 
 
 class BaseValidator(ABC):
@@ -286,7 +286,25 @@ class BaseValidator(ABC):
             ...     if not self._validate_content(content):
             ...         failures.append(rel_path)
         """
+        for file in self._iter_bundle_documents(bundle, rule):
+            yield (file.relative_path, file.content, str(file.file_path))
+
+    def _iter_bundle_documents(
+        self, bundle: DocumentBundle, rule: ValidationRule
+    ) -> Generator[DocumentFile, None, None]:
+        """Iterate over the bundle's files not matched by the rule's ignore patterns.
+
+        Unlike _iter_bundle_files() this does not touch file content, so
+        validators that only need metadata (paths, sizes) never read files.
+
+        -- bundle: Document bundle containing files to iterate
+        -- rule: ValidationRule that may contain ignore_patterns in params
+
+        Yields DocumentFile objects.
+        """
         ignore_patterns = rule.params.get("ignore_patterns") if rule.params else None
+        # Compile once for the whole bundle rather than per file
+        ignored = compile_patterns(ignore_patterns) if ignore_patterns else None
         for file in bundle.files:
-            if not self._should_ignore_file(file.relative_path, ignore_patterns):
-                yield (file.relative_path, file.content, str(file.file_path))
+            if ignored is None or not ignored.matches(file.relative_path):
+                yield file
@@ -10,6 +10,7 @@ from typing import List, Literal, Optional
 
 from drift.config.models import ClientType, ValidationRule
 from drift.core.types import DocumentBundle, DocumentRule
+from drift.documents.overlay import is_file, read_text
 from drift.validation.validators.base import BaseValidator
 
 
@@ -71,7 +72,7 @@ class ClaudeSkillSettingsValidator(BaseValidator):
             return None
 
         # Check if settings.json exists
-        if not settings_file.exists() or not settings_file.is_file():
+        if not is_file(settings_file):
             return self._create_failure_learning(
                 rule=rule,
                 bundle=bundle,
@@ -80,8 +81,7 @@ class ClaudeSkillSettingsValidator(BaseValidator):
 
         # Read settings.json
         try:
-            with settings_file.open("r") as f:
-                settings = json.load(f)
+            settings = json.loads(read_text(settings_file))
         except json.JSONDecodeError as e:
             return self._create_failure_learning(
                 rule=rule,
@@ -223,14 +223,13 @@ class ClaudeSettingsDuplicatesValidator(BaseValidator):
         settings_file = project_path / ".claude" / "settings.json"
 
         # Check if settings.json exists
-        if not settings_file.exists() or not settings_file.is_file():
+        if not is_file(settings_file):
             # No settings file - validation passes (nothing to validate)
             return None
 
         # Read settings.json
         try:
-            with settings_file.open("r") as f:
-                settings = json.load(f)
+            settings = json.loads(read_text(settings_file))
         except json.JSONDecodeError as e:
             return self._create_failure_learning(
                 rule=rule,
@@ -351,12 +350,12 @@ class ClaudeMcpPermissionsValidator(BaseValidator):
         settings_file = project_path / ".claude" / "settings.json"
 
         # Check if .mcp.json exists
-        if not mcp_file.exists() or not mcp_file.is_file():
+        if not is_file(mcp_file):
             # No MCP config - validation passes (nothing to validate)
             return None
 
         # Check if settings.json exists
-        if not settings_file.exists() or not settings_file.is_file():
+        if not is_file(settings_file):
             return self._create_failure_learning(
                 rule=rule,
                 bundle=bundle,
@@ -365,8 +364,7 @@ class ClaudeMcpPermissionsValidator(BaseValidator):
 
         # Read .mcp.json
         try:
-            with mcp_file.open("r") as f:
-                mcp_config = json.load(f)
+            mcp_config = json.loads(read_text(mcp_file))
         except json.JSONDecodeError as e:
             return self._create_failure_learning(
                 rule=rule,
@@ -382,8 +380,7 @@ class ClaudeMcpPermissionsValidator(BaseValidator):
 
         # Read settings.json
         try:
-            with settings_file.open("r") as f:
-                settings = json.load(f)
+            settings = json.loads(read_text(settings_file))
         except json.JSONDecodeError as e:
             return self._create_failure_learning(
                 rule=rule,
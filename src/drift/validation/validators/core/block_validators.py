@@ -5,6 +5,7 @@ from typing import List, Literal, Optional
 
 from drift.config.models import ValidationRule
 from drift.core.types import DocumentBundle, DocumentRule
+from drift.documents.overlay import read_lines
 from drift.validation.validators.base import BaseValidator
 
 
@@ -126,10 +127,9 @@ class BlockLineCountValidator(BaseValidator):
         for doc_file in files_to_check:
             file_path = bundle.project_path / doc_file.relative_path
 
-            # Read file content
+            # Read file content (or its unsaved buffer)
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
+                lines = read_lines(file_path)
             except FileNotFoundError:
                 # File listed in bundle but doesn't exist - skip it
                 continue
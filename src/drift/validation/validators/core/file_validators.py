@@ -1,9 +1,13 @@
 """Validators for file existence, size checks, and token counting."""
 
-from typing import List, Literal, Optional
+from pathlib import Path
+from typing import Callable, List, Literal, Optional
 
 from drift.config.models import ValidationRule
 from drift.core.types import DocumentBundle, DocumentRule
+from drift.documents.overlay import get_overlay, is_file, read_text
+from drift.utils.path_index import get_project_index
+from drift.validation.tokens import SUPPORTED_PROVIDERS, count_tokens, count_tokens_batch
 from drift.validation.validators.base import BaseValidator
 
 
@@ -56,12 +60,17 @@ class FileExistsValidator(BaseValidator):
             raise ValueError("FileExistsValidator requires params.file_path")
 
         project_path = bundle.project_path
+        # Answer from the run's project index when there is one
+        path_index = get_project_index(project_path)
 
         # Check if file_path contains glob patterns
         if "*" in file_path or "?" in file_path:
             # Glob pattern - check if any files match
-            matches = list(project_path.glob(file_path))
-            matching_files = [m for m in matches if m.is_file()]
+            if path_index is not None:
+                matching_files = path_index.glob_files(file_path)
+            else:
+                matches = list(project_path.glob(file_path))
+                matching_files = [m for m in matches if m.is_file()]
 
             # Check if parent directory structure exists for the glob pattern
             # E.g., for .claude/skills/*/SKILL.md, check if .claude/skills/ exists
@@ -76,7 +85,11 @@ class FileExistsValidator(BaseValidator):
             if parent_parts:
                 parent_path = project_path / "/".join(parent_parts)
                 # If parent doesn't exist, pass (nothing to validate)
-                if not (parent_path.exists() and parent_path.is_dir()):
+                if path_index is not None:
+                    parent_is_dir = path_index.is_dir(parent_path)
+                else:
+                    parent_is_dir = parent_path.exists() and parent_path.is_dir()
+                if not parent_is_dir:
                     return None
 
                 # Check if there are subdirectories that could contain the files
@@ -88,14 +101,21 @@ class FileExistsValidator(BaseValidator):
                     wildcard_idx = next(
                         (i for i, p in enumerate(parts) if "*" in p or "?" in p), None
                     )
+                    is_dir: Callable[[Path], bool]
+                    if path_index is not None:
+                        entries = path_index.iterdir(parent_path)
+                        is_dir = path_index.is_dir
+                    else:
+                        entries = list(parent_path.iterdir())
+                        is_dir = Path.is_dir
                     if wildcard_idx is not None and wildcard_idx < len(parts) - 1:
                         # Pattern like */SKILL.md - check for subdirectories
-                        has_subdirs = any(p.is_dir() for p in parent_path.iterdir())
+                        has_subdirs = any(is_dir(p) for p in entries)
                         if not has_subdirs:
                             return None  # No subdirectories, nothing to validate
                     else:
                         # Pattern like *.md - check for any contents
-                        has_contents = any(parent_path.iterdir())
+                        has_contents = bool(entries)
                         if not has_contents:
                             return None  # Empty directory, nothing to validate
                 except (OSError, PermissionError):
@@ -115,8 +135,12 @@ class FileExistsValidator(BaseValidator):
         else:
             # Specific file path
             file_path_obj = project_path / file_path
+            if path_index is not None:
+                file_exists = path_index.is_file(file_path_obj)
+            else:
+                file_exists = file_path_obj.exists() and file_path_obj.is_file()
 
-            if file_path_obj.exists() and file_path_obj.is_file():
+            if file_exists:
                 # File exists - validation passes
                 return None
             else:
@@ -224,13 +248,22 @@ class FileSizeValidator(BaseValidator):
             )
 
         # Otherwise, validate all files in the bundle
+        # Byte-size constraints only need a stat; don't read content for them
+        needs_content = max_count is not None or min_count is not None
         failed_files = []
-        for rel_path, content, abs_path in self._iter_bundle_files(bundle, rule):
+        for file in self._iter_bundle_documents(bundle, rule):
+            content = file.content if needs_content else ""
             failure = self._validate_file_constraints(
-                rel_path, abs_path, content, max_count, min_count, max_size, min_size
+                file.relative_path,
+                str(file.file_path),
+                content,
+                max_count,
+                min_count,
+                max_size,
+                min_size,
             )
             if failure:
-                failed_files.append((rel_path, failure))
+                failed_files.append((file.relative_path, failure))
 
         if failed_files:
             # Build detailed message
@@ -272,7 +305,7 @@ class FileSizeValidator(BaseValidator):
         project_path = bundle.project_path
         file_path = project_path / file_path_str
 
-        if not file_path.exists() or not file_path.is_file():
+        if not is_file(file_path):
             return self._create_failure(
                 rule=rule,
                 bundle=bundle,
@@ -281,7 +314,10 @@ class FileSizeValidator(BaseValidator):
             )
 
         try:
-            content = file_path.read_text(encoding="utf-8")
+            if max_count is not None or min_count is not None:
+                content = read_text(file_path)
+            else:
+                content = ""
         except Exception as e:
             return self._create_failure(
                 rule=rule,
@@ -336,14 +372,17 @@ class FileSizeValidator(BaseValidator):
             if min_count is not None and line_count < min_count:
                 return f"File has {line_count} lines (below min {min_count})"
 
-        # Check byte size constraints
+        # Check byte size constraints (of the unsaved buffer, if there is one)
         if max_size is not None or min_size is not None:
-            from pathlib import Path
-
             file_path = Path(abs_path)
-            if file_path.exists():
+            buffered = get_overlay(file_path)
+            byte_size: Optional[int] = None
+            if buffered is not None:
+                byte_size = len(buffered.encode("utf-8"))
+            elif file_path.exists():
                 byte_size = file_path.stat().st_size
 
+            if byte_size is not None:
                 if max_size is not None and byte_size > max_size:
                     return f"File is {byte_size} bytes (exceeds max {max_size})"
 
@@ -385,12 +424,17 @@ class TokenCountValidator(BaseValidator):
     DEPRECATED: This validator requires provider-specific authentication and dependencies.
     For example, Anthropic token counting requires API credentials, making it unsuitable
     for offline programmatic checks. Use FileSizeValidator with line count (max_count/min_count)
-    instead for a general, offline validation approach.
+    or the 'approximate' provider instead for a general, offline validation approach.
 
     Supports multiple tokenizer providers:
     - anthropic: For Claude models (requires 'anthropic' package + API credentials)
     - openai: For OpenAI models (requires 'tiktoken' package)
     - llama: For Llama models (requires 'transformers' package)
+    - approximate: Offline estimate, no dependencies (see drift.validation.tokens for
+      its error bound)
+
+    Tokenizers are loaded once per process and counts are memoized by content hash
+    (or by the file's git blob id when the loader knows it).
     """
 
     @property
@@ -422,8 +466,10 @@ class TokenCountValidator(BaseValidator):
         """Check if file token count meets constraints.
 
         Expected params:
-            - file_path: File path to validate (required)
-            - provider: Tokenizer provider ('anthropic', 'openai', 'llama', default: 'anthropic')
+            - file_path: File path to validate (optional - if not provided, validates
+              bundle.files)
+            - provider: Tokenizer provider ('anthropic', 'openai', 'llama', 'approximate',
+              default: 'anthropic')
             - max_count: Maximum number of tokens (optional)
             - min_count: Minimum number of tokens (optional)
 
@@ -432,28 +478,78 @@ class TokenCountValidator(BaseValidator):
         -- all_bundles: Not used for this validator
 
         Returns DocumentRule if constraints violated, None if satisfied.
+
+        If params.file_path is provided, validates that specific file.
+        If params.file_path is not provided, validates all files in the bundle,
+        counting their tokens in a single batch.
         """
         if not rule.params:
             raise ValueError("TokenCountValidator requires params")
 
-        file_path_str = rule.params.get("file_path")
-        if not file_path_str:
-            raise ValueError("TokenCountValidator requires params.file_path")
-
         provider = rule.params.get("provider", "anthropic")
-        if provider not in ["anthropic", "openai", "llama"]:
+        if provider not in SUPPORTED_PROVIDERS:
             raise ValueError(
                 f"Unsupported token counter provider: {provider}. "
-                "Must be 'anthropic', 'openai', or 'llama'"
+                "Must be 'anthropic', 'openai', 'llama', or 'approximate'"
             )
 
-        max_count = rule.params.get("max_count")
-        min_count = rule.params.get("min_count")
+        file_path_str = rule.params.get("file_path")
+        if file_path_str:
+            return self._validate_specific_file(rule, bundle, file_path_str, provider)
 
-        project_path = bundle.project_path
-        file_path = project_path / file_path_str
+        files = list(self._iter_bundle_documents(bundle, rule))
+        if not files:
+            return None
+
+        try:
+            token_counts = count_tokens_batch(
+                [file.content for file in files],
+                provider,
+                fingerprints=[file.fingerprint for file in files],
+            )
+        except Exception as e:
+            return self._create_token_failure(
+                rule=rule,
+                bundle=bundle,
+                file_paths=[file.relative_path for file in files],
+                observed_issue=self._counting_error(e, provider),
+            )
+
+        failed_files = []
+        for file, token_count in zip(files, token_counts):
+            issue = self._check_constraints(rule, token_count, provider)
+            if issue:
+                failed_files.append((file.relative_path, issue))
 
-        if not file_path.exists() or not file_path.is_file():
+        if failed_files:
+            return self._create_token_failure(
+                rule=rule,
+                bundle=bundle,
+                file_paths=[path for path, _ in failed_files],
+                observed_issue="; ".join(f"{path}: {issue}" for path, issue in failed_files),
+            )
+
+        return None
+
+    def _validate_specific_file(
+        self,
+        rule: ValidationRule,
+        bundle: DocumentBundle,
+        file_path_str: str,
+        provider: str,
+    ) -> Optional[DocumentRule]:
+        """Check the token count of a specific file.
+
+        -- rule: ValidationRule with token constraints
+        -- bundle: Document bundle being validated
+        -- file_path_str: Relative path to file
+        -- provider: Token counter provider
+
+        Returns DocumentRule if constraints violated, None if satisfied.
+        """
+        file_path = bundle.project_path / file_path_str
+
+        if not is_file(file_path):
             return self._create_token_failure(
                 rule=rule,
                 bundle=bundle,
@@ -461,10 +557,9 @@ class TokenCountValidator(BaseValidator):
                 observed_issue=f"File {rule.file_path} does not exist",
             )
 
-        # Read file content
+        # Read file content (or its unsaved buffer)
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = read_text(file_path)
         except Exception as e:
             return self._create_token_failure(
                 rule=rule,
@@ -476,106 +571,79 @@ class TokenCountValidator(BaseValidator):
         # Count tokens using the specified provider
         try:
             token_count = self._count_tokens(content, provider)
-        except ImportError as e:
+        except Exception as e:
             return self._create_token_failure(
                 rule=rule,
                 bundle=bundle,
                 file_paths=[file_path_str],
-                observed_issue=(
-                    f"Token counting failed: {e}. "
-                    f"Install required package for '{provider}' provider."
-                ),
+                observed_issue=self._counting_error(e, provider),
             )
-        except Exception as e:
+
+        issue = self._check_constraints(rule, token_count, provider)
+        if issue:
             return self._create_token_failure(
                 rule=rule,
                 bundle=bundle,
                 file_paths=[file_path_str],
-                observed_issue=f"Token counting failed: {e}",
+                observed_issue=issue,
             )
 
-        # Check constraints
+        # All constraints satisfied
+        return None
+
+    def _check_constraints(
+        self, rule: ValidationRule, token_count: int, provider: str
+    ) -> Optional[str]:
+        """Check a token count against the rule's max_count and min_count.
+
+        -- rule: ValidationRule with params containing token constraints
+        -- token_count: Counted tokens
+        -- provider: Token counter provider, for the message
+
+        Returns the observed issue if a constraint is violated, None otherwise.
+        """
+        max_count = rule.params.get("max_count") if rule.params else None
+        min_count = rule.params.get("min_count") if rule.params else None
+
         if max_count is not None and token_count > max_count:
-            return self._create_token_failure(
-                rule=rule,
-                bundle=bundle,
-                file_paths=[file_path_str],
-                observed_issue=(
-                    f"File has {token_count} tokens "
-                    f"(exceeds max {max_count}) using {provider} tokenizer"
-                ),
+            return (
+                f"File has {token_count} tokens "
+                f"(exceeds max {max_count}) using {provider} tokenizer"
             )
 
         if min_count is not None and token_count < min_count:
-            return self._create_token_failure(
-                rule=rule,
-                bundle=bundle,
-                file_paths=[file_path_str],
-                observed_issue=(
-                    f"File has {token_count} tokens "
-                    f"(below min {min_count}) using {provider} tokenizer"
-                ),
+            return (
+                f"File has {token_count} tokens "
+                f"(below min {min_count}) using {provider} tokenizer"
             )
 
-        # All constraints satisfied
         return None
 
+    def _counting_error(self, error: Exception, provider: str) -> str:
+        """Describe a token counting failure.
+
+        -- error: Exception raised while counting
+        -- provider: Token counter provider
+
+        Returns the observed issue.
+        """
+        if isinstance(error, ImportError):
+            return (
+                f"Token counting failed: {error}. "
+                f"Install required package for '{provider}' provider."
+            )
+        return f"Token counting failed: {error}"
+
     def _count_tokens(self, text: str, provider: str) -> int:
         """Count tokens using the specified provider.
 
         -- text: Text to count tokens for
-        -- provider: Token counter provider ('anthropic', 'openai', 'llama')
+        -- provider: Token counter provider ('anthropic', 'openai', 'llama', 'approximate')
 
         Returns token count.
         Raises ImportError if required library not installed.
         """
-        if provider == "anthropic":
-            try:
-                from anthropic import Anthropic
-            except ImportError:
-                raise ImportError(
-                    "Anthropic token counting requires 'anthropic' package. "
-                    "Install with: pip install anthropic"
-                )
-
-            client = Anthropic()
-            # Use the new beta messages.count_tokens API (Nov 2024+)
-            # https://docs.claude.com/en/api/messages-count-tokens
-            response = client.beta.messages.count_tokens(
-                betas=["token-counting-2024-11-01"],
-                model="claude-sonnet-4-5-20250929",  # Use Claude Sonnet 4.5
-                messages=[{"role": "user", "content": text}],
-            )
-            return response.input_tokens
-
-        elif provider == "openai":
-            try:
-                import tiktoken
-            except ImportError:
-                raise ImportError(
-                    "OpenAI token counting requires 'tiktoken' package. "
-                    "Install with: pip install tiktoken"
-                )
-
-            # Use GPT-4 tokenizer as default
-            encoding = tiktoken.encoding_for_model("gpt-4")
-            return len(encoding.encode(text))
-
-        elif provider == "llama":
-            try:
-                from transformers import AutoTokenizer
-            except ImportError:
-                raise ImportError(
-                    "Llama token counting requires 'transformers' package. "
-                    "Install with: pip install transformers"
-                )
-
-            # Use Llama-2 tokenizer as default
-            tokenizer = AutoTokenizer.from_pretrained("meta-llama/Llama-2-7b-hf")
-            return len(tokenizer.encode(text))
-
-        else:
-            raise ValueError(f"Unsupported provider: {provider}")
+        return count_tokens(text, provider)
 
     def _create_token_failure(
         self,
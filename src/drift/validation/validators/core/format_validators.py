@@ -5,6 +5,7 @@ from typing import Any, List, Literal, Optional
 
 from drift.config.models import ValidationRule
 from drift.core.types import DocumentBundle, DocumentRule
+from drift.documents.overlay import is_file, read_text
 from drift.validation.validators.base import BaseValidator
 
 
@@ -103,7 +104,7 @@ class JsonSchemaValidator(BaseValidator):
         file_path = project_path / file_path_str
 
         # Check if file exists
-        if not file_path.exists() or not file_path.is_file():
+        if not is_file(file_path):
             return self._create_failure(
                 rule=rule,
                 bundle=bundle,
@@ -113,8 +114,7 @@ class JsonSchemaValidator(BaseValidator):
 
         # Read file content
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = read_text(file_path)
         except Exception as e:
             return self._create_failure(
                 rule=rule,
@@ -196,8 +196,7 @@ class JsonSchemaValidator(BaseValidator):
                 return f"Schema file not found: {rule.params['schema_file']}"
 
             try:
-                with open(schema_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                return json.loads(read_text(schema_file))
             except json.JSONDecodeError as e:
                 return f"Invalid JSON in schema file: {e}"
             except Exception as e:
@@ -317,7 +316,7 @@ class YamlSchemaValidator(BaseValidator):
         file_path = project_path / file_path_str
 
         # Check if file exists
-        if not file_path.exists() or not file_path.is_file():
+        if not is_file(file_path):
             return self._create_failure(
                 rule=rule,
                 bundle=bundle,
@@ -327,8 +326,7 @@ class YamlSchemaValidator(BaseValidator):
 
         # Read file content
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = read_text(file_path)
         except Exception as e:
             return self._create_failure(
                 rule=rule,
@@ -415,15 +413,14 @@ class YamlSchemaValidator(BaseValidator):
                 return f"Schema file not found: {rule.params['schema_file']}"
 
             try:
-                with open(schema_file, "r", encoding="utf-8") as f:
-                    # Try JSON first, then YAML
-                    content = f.read()
-                    try:
-                        return json.loads(content)
-                    except json.JSONDecodeError:
-                        import yaml
-
-                        return yaml.safe_load(content)
+                # Try JSON first, then YAML
+                content = read_text(schema_file)
+                try:
+                    return json.loads(content)
+                except json.JSONDecodeError:
+                    import yaml
+
+                    return yaml.safe_load(content)
             except Exception as e:
                 return f"Failed to read schema file: {e}"
         else:
@@ -498,7 +495,7 @@ class YamlFrontmatterValidator(BaseValidator):
             file_path = project_path / rule.file_path
 
             # Check if file exists
-            if not file_path.exists() or not file_path.is_file():
+            if not is_file(file_path):
                 return self._create_failure(
                     rule=rule,
                     bundle=bundle,
@@ -508,8 +505,7 @@ class YamlFrontmatterValidator(BaseValidator):
 
             # Read file content
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
+                content = read_text(file_path)
             except Exception as e:
                 return self._create_failure(
                     rule=rule,
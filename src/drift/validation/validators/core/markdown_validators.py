@@ -1,11 +1,13 @@
 """Validators for markdown content validation."""
 
 from pathlib import Path as PathLib
-from typing import List, Literal, Optional
+from typing import Any, Dict, Iterable, List, Literal, Optional
 
 from drift.config.models import ValidationRule
-from drift.core.types import DocumentBundle, DocumentRule
+from drift.core.types import DocumentBundle, DocumentFile, DocumentRule
 from drift.utils.link_validator import LinkValidator
+from drift.utils.path_index import get_project_index
+from drift.utils.url_checker import ExternalUrlChecker, get_url_checker
 from drift.validation.validators.base import BaseValidator
 
 
@@ -52,33 +54,31 @@ class MarkdownLinkValidator(BaseValidator):
         check_resource_refs = rule.params.get("check_resource_refs", False)
         resource_patterns = rule.params.get("resource_patterns", [])
 
-        # Extract filtering params (with defaults matching LinkValidator defaults)
-        skip_example_domains = rule.params.get("skip_example_domains", True)
-        skip_code_blocks = rule.params.get("skip_code_blocks", True)
-        skip_placeholder_paths = rule.params.get("skip_placeholder_paths", True)
-        custom_skip_patterns = rule.params.get("custom_skip_patterns", [])
-
-        # Merge custom_skip_patterns with ignore_patterns (ignore_patterns take precedence)
-        merged_skip_patterns = list(custom_skip_patterns)
-        ignore_patterns = rule.params.get("ignore_patterns")
-        if ignore_patterns:
-            merged_skip_patterns.extend(ignore_patterns)
-
-        validator = LinkValidator(
-            skip_example_domains=skip_example_domains,
-            skip_code_blocks=skip_code_blocks,
-            skip_placeholder_paths=skip_placeholder_paths,
-            custom_skip_patterns=merged_skip_patterns,
-        )
+        validator = self._build_link_validator(rule.params)
+        path_index = get_project_index(bundle.project_path)
         broken_links = []
 
-        for file in bundle.files:
+        refs_per_file = [
+            validator.extract_all_file_references(file.content) for file in bundle.files
+        ]
+
+        # Check every external URL in the bundle concurrently, then fan the
+        # results back out to the files that reference them
+        url_status: Dict[str, bool] = {}
+        if check_external_urls:
+            external_urls = [
+                ref
+                for refs in refs_per_file
+                for ref in refs
+                if validator.categorize_link(ref) == "external"
+            ]
+            if external_urls:
+                url_status = self._check_external_urls(external_urls)
+
+        for file, file_refs in zip(bundle.files, refs_per_file):
             file_path = PathLib(file.file_path)
             file_dir = file_path.parent
 
-            # Extract all file references from content (markdown links and plain paths)
-            file_refs = validator.extract_all_file_references(file.content)
-
             for ref in file_refs:
                 # Categorize the reference
                 link_type = validator.categorize_link(ref)
@@ -87,17 +87,19 @@ class MarkdownLinkValidator(BaseValidator):
                 if link_type == "local" and check_local_files:
                     # Try both relative to file's directory and project root
                     # First try relative to file's directory (for local resources)
-                    found_relative_to_file = validator.validate_local_file(ref, file_dir)
+                    found_relative_to_file = validator.validate_local_file(
+                        ref, file_dir, path_index
+                    )
                     # Then try relative to project root (for project-wide references)
                     found_relative_to_project = validator.validate_local_file(
-                        ref, bundle.project_path
+                        ref, bundle.project_path, path_index
                     )
 
                     # Only report as broken if not found in either location
                     if not found_relative_to_file and not found_relative_to_project:
                         broken_links.append((file.relative_path, ref, "local file not found"))
                 elif link_type == "external" and check_external_urls:
-                    if not validator.validate_external_url(ref):
+                    if not url_status[ref]:
                         broken_links.append((file.relative_path, ref, "external URL unreachable"))
 
             # Also check resource references if enabled
@@ -118,7 +120,7 @@ class MarkdownLinkValidator(BaseValidator):
                             resource_type = self._guess_resource_type(pattern)
                             if resource_type:
                                 if not validator.validate_resource_reference(
-                                    resource_name, bundle.project_path, resource_type
+                                    resource_name, bundle.project_path, resource_type, path_index
                                 ):
                                     broken_links.append(
                                         (
@@ -149,6 +151,69 @@ class MarkdownLinkValidator(BaseValidator):
 
         return None
 
+    def collect_external_urls(
+        self, rule: ValidationRule, files: Iterable[DocumentFile]
+    ) -> List[str]:
+        """Collect the external URLs this rule would check in the given files.
+
+        -- rule: ValidationRule with markdown link params
+        -- files: Files to scan
+
+        Returns unique URLs in first-seen order (empty if external checks are disabled).
+        """
+        if not rule.params.get("check_external_urls", True):
+            return []
+
+        validator = self._build_link_validator(rule.params)
+        urls: Dict[str, None] = {}
+        for file in files:
+            for ref in validator.extract_all_file_references(file.content):
+                if validator.categorize_link(ref) == "external":
+                    urls[ref] = None
+        return list(urls)
+
+    @staticmethod
+    def _build_link_validator(params: Dict[str, Any]) -> LinkValidator:
+        """Build a LinkValidator from rule params.
+
+        -- params: Rule params with filtering options
+
+        Returns configured LinkValidator.
+        """
+        # Extract filtering params (with defaults matching LinkValidator defaults)
+        skip_example_domains = params.get("skip_example_domains", True)
+        skip_code_blocks = params.get("skip_code_blocks", True)
+        skip_placeholder_paths = params.get("skip_placeholder_paths", True)
+        custom_skip_patterns = params.get("custom_skip_patterns", [])
+
+        # Merge custom_skip_patterns with ignore_patterns (ignore_patterns take precedence)
+        merged_skip_patterns = list(custom_skip_patterns)
+        ignore_patterns = params.get("ignore_patterns")
+        if ignore_patterns:
+            merged_skip_patterns.extend(ignore_patterns)
+
+        return LinkValidator(
+            skip_example_domains=skip_example_domains,
+            skip_code_blocks=skip_code_blocks,
+            skip_placeholder_paths=skip_placeholder_paths,
+            custom_skip_patterns=merged_skip_patterns,
+        )
+
+    @staticmethod
+    def _check_external_urls(urls: List[str]) -> Dict[str, bool]:
+        """Check URLs with the run's shared checker, or a temporary one.
+
+        -- urls: URLs to check
+
+        Returns mapping of each URL to whether it is reachable.
+        """
+        checker = get_url_checker()
+        if checker is not None:
+            return checker.check_many(urls)
+
+        with ExternalUrlChecker() as local_checker:
+            return local_checker.check_many(urls)
+
     def _guess_resource_type(self, pattern: str) -> Optional[str]:
         """Guess resource type from pattern.
 
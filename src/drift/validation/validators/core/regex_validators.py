@@ -5,6 +5,7 @@ from typing import List, Literal, Optional
 
 from drift.config.models import ValidationRule
 from drift.core.types import DocumentBundle, DocumentRule
+from drift.documents.overlay import is_file, read_text
 from drift.validation.validators.base import BaseValidator
 
 
@@ -126,7 +127,7 @@ class RegexMatchValidator(BaseValidator):
         full_path = project_path / file_path
 
         # Check if file exists
-        if not full_path.exists() or not full_path.is_file():
+        if not is_file(full_path):
             return self._create_failure_learning(
                 rule=rule,
                 bundle=bundle,
@@ -134,9 +135,9 @@ class RegexMatchValidator(BaseValidator):
                 context=f"File not found: {file_path}",
             )
 
-        # Read file content
+        # Read file content (or its unsaved buffer)
         try:
-            content = full_path.read_text()
+            content = read_text(full_path)
         except Exception as e:
             return self._create_failure_learning(
                 rule=rule,
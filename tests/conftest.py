@@ -1,6 +1,8 @@
 """Pytest configuration and shared fixtures for drift tests."""
 
 import json
+import os
+import sys
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -20,6 +22,102 @@ from drift.config.models import (
 from drift.core.types import AnalysisSummary, CompleteAnalysisResult, Conversation, Rule, Turn
 
 
+@pytest.fixture(autouse=True)
+def isolated_claude_probe_cache(tmp_path, monkeypatch):
+    """Keep Claude Code CLI probe results from leaking between tests."""
+    from drift.providers.claude_code import clear_availability_cache
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
+    clear_availability_cache()
+    yield
+    clear_availability_cache()
+
+
+@pytest.fixture(autouse=True)
+def isolated_shared_clients():
+    """Keep shared provider SDK clients from leaking between tests."""
+    from drift.providers.clients import clear_shared_clients
+
+    clear_shared_clients()
+    yield
+    clear_shared_clients()
+
+
+@pytest.fixture(autouse=True)
+def isolated_token_caches():
+    """Keep loaded tokenizers and memoized token counts from leaking between tests."""
+    from drift.validation.tokens import clear_token_caches
+
+    clear_token_caches()
+    yield
+    clear_token_caches()
+
+
+FAKE_CLAUDE_SCRIPT = """#!{python}
+import json, os, sys, time
+
+if "--version" in sys.argv:
+    print("claude 9.9.9 (fake)")
+    sys.exit(0)
+
+prompt = sys.stdin.read()
+log_path = os.environ.get("FAKE_CLAUDE_LOG")
+started = time.time()
+time.sleep(float(os.environ.get("FAKE_CLAUDE_SLEEP", "0")))
+if log_path:
+    with open(log_path, "a") as f:
+        record = dict(argv=sys.argv[1:], stdin=prompt, start=started, end=time.time())
+        f.write(json.dumps(record) + "\\n")
+sys.stdout.write(os.environ.get("FAKE_CLAUDE_STDOUT", json.dumps(dict(result="ok"))))
+sys.stderr.write(os.environ.get("FAKE_CLAUDE_STDERR", ""))
+sys.exit(int(os.environ.get("FAKE_CLAUDE_EXIT", "0")))
+"""
+
+
+class FakeClaude:
+    """Handle for a fake `claude` executable placed first on PATH."""
+
+    def __init__(self, path, log_path, monkeypatch):
+        """Initialize the handle."""
+        self.path = path
+        self.log_path = log_path
+        self._monkeypatch = monkeypatch
+
+    def respond(self, stdout=None, exit_code=0, stderr="", sleep=0.0):
+        """Configure what the fake CLI prints and how it exits."""
+        if stdout is None:
+            self._monkeypatch.delenv("FAKE_CLAUDE_STDOUT", raising=False)
+        else:
+            self._monkeypatch.setenv("FAKE_CLAUDE_STDOUT", stdout)
+        self._monkeypatch.setenv("FAKE_CLAUDE_EXIT", str(exit_code))
+        self._monkeypatch.setenv("FAKE_CLAUDE_STDERR", stderr)
+        self._monkeypatch.setenv("FAKE_CLAUDE_SLEEP", str(sleep))
+
+    def calls(self):
+        """Return recorded invocations (argv and stdin) in completion order."""
+        if not self.log_path.exists():
+            return []
+        return [json.loads(line) for line in self.log_path.read_text().splitlines()]
+
+
+@pytest.fixture
+def fake_claude(tmp_path, monkeypatch):
+    """Put a scriptable fake `claude` CLI first on PATH."""
+    bin_dir = tmp_path / "fake-bin"
+    bin_dir.mkdir()
+    cli = bin_dir / "claude"
+    cli.write_text(FAKE_CLAUDE_SCRIPT.format(python=sys.executable))
+    cli.chmod(0o755)
+
+    log_path = tmp_path / "fake-claude-calls.jsonl"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setenv("FAKE_CLAUDE_LOG", str(log_path))
+
+    fake = FakeClaude(cli, log_path, monkeypatch)
+    fake.respond()
+    return fake
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for tests."""
@@ -1573,7 +1573,7 @@ class TestAnalyzeCommand:
             yaml.dump(rules_data, f)
 
         # Mock config loader to track the rules_files parameter
-        def mock_load_config(project_path, rules_files=None):
+        def mock_load_config(project_path, rules_files=None, use_cache=False):
             assert rules_files == [str(rules_file)]
             return sample_drift_config
 
@@ -1620,7 +1620,7 @@ class TestAnalyzeCommand:
             yaml.dump(rules_data2, f)
 
         # Mock config loader to track the rules_files parameter
-        def mock_load_config(project_path, rules_files=None):
+        def mock_load_config(project_path, rules_files=None, use_cache=False):
             assert rules_files == [str(rules_file1), str(rules_file2)]
             return sample_drift_config
 
@@ -1687,7 +1687,7 @@ class TestAnalyzeCommand:
         remote_url = "https://example.com/rules.yaml"
 
         # Mock config loader to track the rules_files parameter
-        def mock_load_config(project_path, rules_files=None):
+        def mock_load_config(project_path, rules_files=None, use_cache=False):
             assert rules_files == [remote_url]
             return sample_drift_config
 
@@ -0,0 +1,440 @@
+"""Unit tests for change sets used by --changed-since and --staged runs."""
+
+import shutil
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from drift.cli.commands.analyze import analyze_command
+from drift.config.models import (
+    BundleStrategy,
+    DocumentBundleConfig,
+    DriftConfig,
+    ParallelExecutionConfig,
+    RuleDefinition,
+    ValidationRule,
+    ValidationRulesConfig,
+)
+from drift.core.analyzer import DriftAnalyzer
+from drift.core.types import DocumentFile
+from drift.documents.changes import ChangeSet
+from drift.documents.loader import DocumentLoader
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def _git(repo, *args):
+    """Run a git command in repo and return its stripped output."""
+    completed = subprocess.run(
+        ["git", "-C", str(repo), *args], capture_output=True, text=True, check=True
+    )
+    return completed.stdout.strip()
+
+
+def _write(repo, rel_path, content):
+    """Write a file below repo, creating parent directories."""
+    path = repo / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create a git repository with skills, an agent and linked docs on a base commit."""
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "config", "user.email", "dev@example.com")
+    _git(tmp_path, "config", "user.name", "Dev")
+    files = {
+        "README.md": "# Readme\n\nSee [the guide](docs/guide.md).\n",
+        "docs/guide.md": "# Guide\n\nBack to [readme](../README.md).\n",
+        "docs/other.md": "# Other\n",
+        ".claude/skills/alpha/SKILL.md": "---\nname: alpha\n---\nAlpha skill\n",
+        ".claude/skills/beta/SKILL.md": "---\nname: beta\n---\nBeta skill\n",
+        ".claude/agents/dev.md": "---\nname: dev\nskills:\n  - alpha\n---\nDeveloper\n",
+    }
+    for rel_path, content in files.items():
+        _write(tmp_path, rel_path, content)
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+def _document(repo, rel_path):
+    """Create a lazily loaded DocumentFile for a file in repo."""
+    return DocumentFile(relative_path=rel_path, file_path=repo / rel_path)
+
+
+class TestChangeSetSince:
+    """Tests for ChangeSet.since()."""
+
+    def test_lists_committed_unstaged_and_untracked_changes(self, repo):
+        """Test every kind of change since the merge base is listed."""
+        _git(repo, "checkout", "-q", "-b", "feature")
+        _write(repo, "docs/other.md", "# Other, committed\n")
+        _git(repo, "commit", "-q", "-am", "edit")
+        _write(repo, "docs/guide.md", "# Guide, unstaged\n")
+        _write(repo, "notes.md", "untracked\n")
+
+        changes = ChangeSet.since(repo, "main")
+
+        assert changes.paths == {"docs/other.md", "docs/guide.md", "notes.md"}
+        assert changes.description == "changes since main"
+        assert changes.contents == {}
+
+    def test_uses_merge_base(self, repo):
+        """Test commits made on the ref after branching are not listed."""
+        _git(repo, "checkout", "-q", "-b", "feature")
+        _git(repo, "checkout", "-q", "main")
+        _write(repo, "docs/other.md", "# Other, on main\n")
+        _git(repo, "commit", "-q", "-am", "main edit")
+        _git(repo, "checkout", "-q", "feature")
+
+        assert ChangeSet.since(repo, "main").paths == set()
+
+    def test_deleted_files_listed(self, repo):
+        """Test deleted files are part of the change."""
+        (repo / "docs" / "guide.md").unlink()
+
+        assert ChangeSet.since(repo, "HEAD").paths == {"docs/guide.md"}
+
+    def test_paths_relative_to_subdirectory_project(self, repo):
+        """Test a project below the repository root gets paths relative to itself."""
+        _write(repo, "docs/guide.md", "changed\n")
+        _write(repo, "README.md", "changed\n")
+
+        assert ChangeSet.since(repo / "docs", "HEAD").paths == {"guide.md"}
+
+    def test_unknown_ref_raises(self, repo):
+        """Test an unknown ref is reported as a ValueError."""
+        with pytest.raises(ValueError, match="merge-base"):
+            ChangeSet.since(repo, "no-such-branch")
+
+    def test_outside_repository_raises(self, tmp_path_factory):
+        """Test directories outside a git working tree are reported as a ValueError."""
+        with pytest.raises(ValueError):
+            ChangeSet.since(tmp_path_factory.mktemp("plain"), "HEAD")
+
+
+class TestChangeSetStaged:
+    """Tests for ChangeSet.staged()."""
+
+    def test_lists_only_staged_files_with_staged_content(self, repo):
+        """Test only staged files count and their content comes from the index."""
+        _write(repo, "docs/guide.md", "staged\n")
+        _git(repo, "add", "docs/guide.md")
+        _write(repo, "docs/guide.md", "staged\nplus unstaged\n")
+        _write(repo, "docs/other.md", "unstaged only\n")
+        _write(repo, "notes.md", "untracked\n")
+
+        changes = ChangeSet.staged(repo)
+
+        assert changes.paths == {"docs/guide.md"}
+        assert changes.contents == {"docs/guide.md": "staged\n"}
+        assert changes.description == "staged changes"
+
+    def test_staged_deletion_has_no_content(self, repo):
+        """Test a staged deletion is listed without content."""
+        _git(repo, "rm", "-q", "docs/other.md")
+
+        changes = ChangeSet.staged(repo)
+
+        assert changes.paths == {"docs/other.md"}
+        assert changes.contents == {}
+
+    def test_staged_binary_file_has_empty_content(self, repo):
+        """Test staged binary files are not decoded."""
+        (repo / "image.png").write_bytes(b"\x89PNG\x00\x00data")
+        _write(repo, "new.md", "new\n")
+        _git(repo, "add", "image.png", "new.md")
+
+        changes = ChangeSet.staged(repo)
+
+        assert changes.contents == {"image.png": "", "new.md": "new\n"}
+
+    def test_nothing_staged(self, repo):
+        """Test an empty index diff gives an empty change set."""
+        _write(repo, "docs/other.md", "unstaged\n")
+
+        changes = ChangeSet.staged(repo)
+
+        assert changes.paths == set()
+
+
+class TestChangeSetAffects:
+    """Tests for ChangeSet.affects() and affects_bundle()."""
+
+    def test_changed_file_is_affected(self, repo):
+        """Test changed files are affected and unrelated ones are not."""
+        changes = ChangeSet(repo, ["docs/other.md"], "test")
+
+        assert changes.affects(_document(repo, "docs/other.md"))
+        assert not changes.affects(_document(repo, "README.md"))
+
+    def test_document_linking_to_changed_file_is_affected(self, repo):
+        """Test links resolved from the document's directory make it a dependent."""
+        changes = ChangeSet(repo, ["README.md"], "test")
+
+        assert changes.affects(_document(repo, "docs/guide.md"))
+        assert not changes.affects(_document(repo, "docs/other.md"))
+
+    def test_link_resolved_from_project_root(self, repo):
+        """Test project-root-relative links make a document a dependent."""
+        _write(repo, "docs/index.md", "See docs/other.md#top for details.\n")
+        changes = ChangeSet(repo, ["docs/other.md"], "test")
+
+        assert changes.affects(_document(repo, "docs/index.md"))
+
+    def test_document_linking_to_deleted_file_is_affected(self, repo):
+        """Test dependents of a deleted file are checked (their link is now broken)."""
+        (repo / "docs" / "guide.md").unlink()
+        changes = ChangeSet.since(repo, "HEAD")
+
+        assert changes.affects(_document(repo, "README.md"))
+
+    def test_resource_listing_changed_skill_is_affected(self, repo):
+        """Test agents listing a changed skill in their frontmatter are dependents."""
+        changes = ChangeSet(repo, [".claude/skills/alpha/SKILL.md"], "test")
+
+        assert changes.affects(_document(repo, ".claude/agents/dev.md"))
+
+    def test_resource_listing_other_skill_is_not_affected(self, repo):
+        """Test agents that only list unchanged skills are not dependents."""
+        changes = ChangeSet(repo, [".claude/skills/beta/SKILL.md"], "test")
+
+        assert not changes.affects(_document(repo, ".claude/agents/dev.md"))
+
+    def test_any_file_of_a_skill_changes_it(self, repo):
+        """Test changing a skill's supporting file counts as changing the skill."""
+        changes = ChangeSet(repo, [".claude/skills/alpha/scripts/run.py"], "test")
+
+        assert changes.affects(_document(repo, ".claude/agents/dev.md"))
+
+    def test_invalid_frontmatter_is_affected(self, repo):
+        """Test documents whose frontmatter cannot be parsed are checked."""
+        _write(repo, ".claude/agents/broken.md", "---\nskills: [alpha\n---\n")
+        changes = ChangeSet(repo, [".claude/skills/alpha/SKILL.md"], "test")
+
+        assert changes.affects(_document(repo, ".claude/agents/broken.md"))
+
+    def test_unrelated_documents_are_not_read_in_full(self, repo):
+        """Test documents that never mention a changed name skip link parsing."""
+        changes = ChangeSet(repo, ["docs/other.md"], "test")
+
+        with patch.object(changes._link_scanner, "extract_all_file_references") as mock_extract:
+            assert not changes.affects(_document(repo, ".claude/agents/dev.md"))
+
+        mock_extract.assert_not_called()
+
+    def test_affects_bundle(self, repo):
+        """Test a bundle is affected when any of its files is."""
+        config = DocumentBundleConfig(
+            bundle_type="skill",
+            file_patterns=[".claude/skills/*/SKILL.md"],
+            bundle_strategy=BundleStrategy.INDIVIDUAL,
+        )
+        bundles = DocumentLoader(repo).load_bundles(config)
+        changes = ChangeSet(repo, [".claude/skills/beta/SKILL.md"], "test")
+
+        assert [changes.affects_bundle(bundle) for bundle in bundles] == [False, True]
+
+
+class TestLoaderContentOverrides:
+    """Tests for DocumentLoader content_overrides."""
+
+    def test_override_replaces_file_content(self, repo):
+        """Test overridden paths use the given content and others are read from disk."""
+        config = DocumentBundleConfig(
+            bundle_type="docs",
+            file_patterns=["docs/*.md"],
+            bundle_strategy=BundleStrategy.INDIVIDUAL,
+        )
+        loader = DocumentLoader(repo, content_overrides={"docs/guide.md": "staged\n"})
+
+        bundles = loader.load_bundles(config)
+
+        contents = {bundle.files[0].relative_path: bundle.files[0].content for bundle in bundles}
+        assert contents == {"docs/guide.md": "staged\n", "docs/other.md": "# Other\n"}
+
+
+def _rule(description, bundle_strategy, scope="document_level"):
+    """Build a rule definition with a size check that every skill file fails."""
+    return RuleDefinition(
+        description=description,
+        scope="project_level",
+        context="Skills matter",
+        requires_project_context=True,
+        validation_rules=ValidationRulesConfig(
+            scope=scope,
+            rules=[
+                ValidationRule(
+                    rule_type="core:file_size",
+                    description="Tiny skills",
+                    params={"max_size": 1},
+                    failure_message="Too long",
+                    expected_behavior="Short",
+                )
+            ],
+            document_bundle=DocumentBundleConfig(
+                bundle_type="skill",
+                file_patterns=[".claude/skills/*/SKILL.md"],
+                bundle_strategy=bundle_strategy,
+            ),
+        ),
+    )
+
+
+class TestAnalyzerChangeFilter:
+    """Tests for DriftAnalyzer.analyze_documents() with a change set."""
+
+    def _analyze(self, repo, rule_definitions, changes):
+        """Run document analysis and return the result."""
+        config = DriftConfig(rule_definitions=rule_definitions)
+        analyzer = DriftAnalyzer(config=config, project_path=repo)
+        return analyzer.analyze_documents(changes=changes)
+
+    def _failing_files(self, result):
+        """Get the files reported by document rules."""
+        return sorted(
+            path for rule in result.metadata["document_rules"] for path in rule["file_paths"]
+        )
+
+    def test_individual_rule_limited_to_affected_bundles(self, repo):
+        """Test per-document rules only check bundles touched by the change."""
+        changes = ChangeSet(repo, [".claude/skills/beta/SKILL.md"], "test")
+
+        result = self._analyze(
+            repo, {"short_skills": _rule("Short", BundleStrategy.INDIVIDUAL)}, changes
+        )
+
+        assert self._failing_files(result) == [".claude/skills/beta/SKILL.md"]
+        assert result.metadata["change_filter"] == {
+            "description": "test",
+            "changed_files": [".claude/skills/beta/SKILL.md"],
+            "full_scope_rules": [],
+        }
+
+    def test_project_wide_rules_run_in_full(self, repo):
+        """Test collection bundles and project-level checks are not filtered."""
+        changes = ChangeSet(repo, [".claude/skills/beta/SKILL.md"], "test")
+
+        result = self._analyze(
+            repo,
+            {
+                "collection": _rule("Collection", BundleStrategy.COLLECTION),
+                "project_level": _rule("Project", BundleStrategy.INDIVIDUAL, scope="project_level"),
+            },
+            changes,
+        )
+
+        assert result.metadata["change_filter"]["full_scope_rules"] == [
+            "collection",
+            "project_level",
+        ]
+
+    def test_unaffected_rule_is_skipped(self, repo):
+        """Test rules with no affected bundle run no checks and pass."""
+        changes = ChangeSet(repo, ["docs/other.md"], "test")
+
+        result = self._analyze(
+            repo, {"short_skills": _rule("Short", BundleStrategy.INDIVIDUAL)}, changes
+        )
+
+        assert self._failing_files(result) == []
+        assert result.metadata["execution_details"] == []
+        assert result.summary.rules_passed == ["short_skills"]
+
+    def test_without_changes_everything_is_checked(self, repo):
+        """Test runs without a change set check every bundle and add no metadata."""
+        result = self._analyze(
+            repo, {"short_skills": _rule("Short", BundleStrategy.INDIVIDUAL)}, None
+        )
+
+        assert self._failing_files(result) == [
+            ".claude/skills/alpha/SKILL.md",
+            ".claude/skills/beta/SKILL.md",
+        ]
+        assert "change_filter" not in result.metadata
+
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_staged_content_reaches_validators_reading_files(self, repo, parallel):
+        """Test validators that open files themselves check the staged text."""
+        _write(repo, "docs/guide.md", "# Guide\n\n```\n1\n2\n3\n4\n5\n6\n```\n")
+        _git(repo, "add", "docs/guide.md")
+        _write(repo, "docs/guide.md", "# Guide\n\n```\n1\n```\n")
+        rule = RuleDefinition(
+            description="Short code blocks",
+            scope="project_level",
+            context="Docs matter",
+            requires_project_context=False,
+            validation_rules=ValidationRulesConfig(
+                rules=[
+                    ValidationRule(
+                        rule_type="core:block_line_count",
+                        description="Short code blocks",
+                        params={"pattern_start": "^```", "pattern_end": "^```", "max_lines": 3},
+                        failure_message="Code block too long",
+                        expected_behavior="Short code blocks",
+                    )
+                ],
+                document_bundle=DocumentBundleConfig(
+                    bundle_type="docs",
+                    file_patterns=["docs/*.md"],
+                    bundle_strategy=BundleStrategy.INDIVIDUAL,
+                ),
+            ),
+        )
+        config = DriftConfig(
+            rule_definitions={"short_blocks": rule},
+            parallel_execution=ParallelExecutionConfig(enabled=parallel),
+        )
+        analyzer = DriftAnalyzer(config=config, project_path=repo)
+
+        staged = analyzer.analyze_documents(changes=ChangeSet.staged(repo))
+        working_tree = analyzer.analyze_documents(changes=ChangeSet(repo, ["docs/guide.md"], "t"))
+
+        assert self._failing_files(staged) == ["docs/guide.md"]
+        assert self._failing_files(working_tree) == []
+
+
+class TestAnalyzeCommandChangeFlags:
+    """Tests for the --changed-since and --staged options of the analyze command."""
+
+    def test_rejects_both_flags(self, repo, capsys):
+        """Test --changed-since and --staged cannot be combined."""
+        with pytest.raises(SystemExit) as exc_info:
+            analyze_command(project=str(repo), changed_since="main", staged=True)
+
+        assert exc_info.value.code == 1
+        assert "Only one of --changed-since, --staged" in capsys.readouterr().err
+
+    def test_rejects_conversation_scope(self, repo, capsys):
+        """Test change filtering only applies to document analysis."""
+        with pytest.raises(SystemExit) as exc_info:
+            analyze_command(project=str(repo), scope="conversation", staged=True)
+
+        assert exc_info.value.code == 1
+        assert "require project or all scope" in capsys.readouterr().err
+
+    def test_reports_git_errors(self, repo, capsys):
+        """Test an unknown ref exits with an error message."""
+        with pytest.raises(SystemExit) as exc_info:
+            analyze_command(project=str(repo), scope="project", changed_since="no-such-ref")
+
+        assert exc_info.value.code == 1
+        assert "Could not determine changed files" in capsys.readouterr().err
+
+    def test_passes_change_set_to_analyzer(self, repo):
+        """Test the staged change set reaches document analysis."""
+        _write(repo, "docs/other.md", "staged\n")
+        _git(repo, "add", "docs/other.md")
+
+        with patch.object(
+            DriftAnalyzer, "analyze_documents", side_effect=RuntimeError("stop")
+        ) as mock_analyze:
+            with pytest.raises(SystemExit):
+                analyze_command(project=str(repo), scope="project", staged=True, no_llm=True)
+
+        changes = mock_analyze.call_args.kwargs["changes"]
+        assert changes.paths == {"docs/other.md"}
+        assert changes.contents == {"docs/other.md": "staged\n"}
@@ -138,21 +138,11 @@ class TestClaudeCodeIntegration:
         assert isinstance(analyzer.providers["api-sonnet"], AnthropicProvider)
         assert isinstance(analyzer.providers["cli-sonnet"], ClaudeCodeProvider)
 
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
     def test_analyzer_uses_claude_code_for_generation(
-        self, mock_run, mock_which, claude_code_config, temp_project_path
+        self, fake_claude, claude_code_config, temp_project_path
     ):
         """Test that analyzer can use Claude Code provider for generation."""
-        # Mock CLI availability
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
-        generate_result = Mock(
-            returncode=0,
-            stdout='{"response": "Analysis result"}',
-            stderr="",
-        )
-        mock_run.side_effect = [version_result, generate_result]
+        fake_claude.respond(stdout='{"response": "Analysis result"}')
 
         analyzer = DriftAnalyzer(config=claude_code_config, project_path=temp_project_path)
 
@@ -163,7 +153,7 @@ class TestClaudeCodeIntegration:
         result = provider.generate("Test prompt")
 
         assert result == "Analysis result"
-        assert mock_run.call_count == 2  # version check + generation
+        assert [call["stdin"] for call in fake_claude.calls()] == ["Test prompt"]
 
     @patch("drift.providers.claude_code.shutil.which")
     def test_analyzer_model_mapping(self, mock_which, temp_project_path):
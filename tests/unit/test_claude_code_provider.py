@@ -2,6 +2,8 @@
 
 import json
 import subprocess
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -83,50 +85,46 @@ class TestClaudeCodeProviderInit:
 
 
 class TestClaudeCodeProviderGenerate:
-    """Test Claude Code provider generation."""
+    """Test Claude Code provider generation against a fake CLI on PATH."""
 
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
-    def test_generate_success_with_json_response(
-        self, mock_run, mock_which, provider_config, model_config
-    ):
+    def test_generate_success_with_json_response(self, fake_claude, provider_config, model_config):
         """Test successful generation with JSON response."""
-        # Mock CLI availability
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
-
-        # Mock generation response
-        response_data = {"response": "This is the AI response"}
-        generate_result = Mock(returncode=0, stdout=json.dumps(response_data), stderr="")
-
-        mock_run.side_effect = [version_result, generate_result]
+        fake_claude.respond(stdout=json.dumps({"response": "This is the AI response"}))
 
         provider = ClaudeCodeProvider(provider_config, model_config)
         result = provider.generate("What is 2+2?")
 
         assert result == "This is the AI response"
-        assert mock_run.call_count == 2
 
-        # Check generate call arguments
-        generate_call = mock_run.call_args_list[1]
-        assert generate_call[0][0][0] == "claude"
-        assert generate_call[0][0][1] == "-p"
-        assert generate_call[0][0][2] == "What is 2+2?"
-        assert "--model" in generate_call[0][0]
-        assert "sonnet" in generate_call[0][0]
-        assert "--output-format" in generate_call[0][0]
-        assert "json" in generate_call[0][0]
+        calls = fake_claude.calls()
+        assert len(calls) == 1
+        argv = calls[0]["argv"]
+        assert argv[0] == "-p"
+        assert "--model" in argv
+        assert "sonnet" in argv
+        assert "--output-format" in argv
+        assert "json" in argv
+
+    def test_prompt_sent_over_stdin(self, fake_claude, provider_config, model_config):
+        """Test the prompt is streamed over stdin instead of argv."""
+        provider = ClaudeCodeProvider(provider_config, model_config)
+        provider.generate("What is 2+2?")
 
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
-    def test_generate_with_different_json_fields(
-        self, mock_run, mock_which, provider_config, model_config
-    ):
-        """Test generation with different JSON response field names."""
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
+        call = fake_claude.calls()[0]
+        assert call["stdin"] == "What is 2+2?"
+        assert "What is 2+2?" not in call["argv"]
+
+    def test_large_prompt_exceeding_arg_max(self, fake_claude, provider_config, model_config):
+        """Test prompts larger than ARG_MAX are delivered intact."""
+        large_prompt = "x" * (4 * 1024 * 1024)
+
+        provider = ClaudeCodeProvider(provider_config, model_config)
+        assert provider.generate(large_prompt) == "ok"
+
+        assert fake_claude.calls()[0]["stdin"] == large_prompt
 
-        # Test different field names
+    def test_generate_with_different_json_fields(self, fake_claude, provider_config, model_config):
+        """Test generation with different JSON response field names."""
         test_cases = [
             {"result": "Response via result"},
             {"content": "Response via content"},
@@ -135,41 +133,25 @@ class TestClaudeCodeProviderGenerate:
         ]
 
         for response_data in test_cases:
-            generate_result = Mock(returncode=0, stdout=json.dumps(response_data), stderr="")
-            mock_run.side_effect = [version_result, generate_result]
+            fake_claude.respond(stdout=json.dumps(response_data))
 
             provider = ClaudeCodeProvider(provider_config, model_config)
             result = provider.generate("Test prompt")
 
             assert list(response_data.values())[0] in result
 
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
-    def test_generate_with_non_json_fallback(
-        self, mock_run, mock_which, provider_config, model_config
-    ):
+    def test_generate_with_non_json_fallback(self, fake_claude, provider_config, model_config):
         """Test generation falls back to raw text when JSON parsing fails."""
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
-        generate_result = Mock(returncode=0, stdout="This is raw text response", stderr="")
-
-        mock_run.side_effect = [version_result, generate_result]
+        fake_claude.respond(stdout="This is raw text response")
 
         provider = ClaudeCodeProvider(provider_config, model_config)
         result = provider.generate("Test prompt")
 
         assert result == "This is raw text response"
 
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
-    def test_generate_with_system_prompt(self, mock_run, mock_which, provider_config, model_config):
+    def test_generate_with_system_prompt(self, fake_claude, provider_config, model_config):
         """Test generation with system prompt."""
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
-        response_data = {"response": "Combined prompt response"}
-        generate_result = Mock(returncode=0, stdout=json.dumps(response_data), stderr="")
-
-        mock_run.side_effect = [version_result, generate_result]
+        fake_claude.respond(stdout=json.dumps({"response": "Combined prompt response"}))
 
         provider = ClaudeCodeProvider(provider_config, model_config)
         result = provider.generate("User prompt", system_prompt="System instructions")
@@ -177,85 +159,45 @@ class TestClaudeCodeProviderGenerate:
         assert result == "Combined prompt response"
 
         # Check that system prompt was prepended to user prompt
-        generate_call = mock_run.call_args_list[1]
-        prompt_arg = generate_call[0][0][2]
-        assert "System instructions" in prompt_arg
-        assert "User prompt" in prompt_arg
-
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
-    def test_generate_with_opus_model(self, mock_run, mock_which, provider_config):
-        """Test generation with opus model."""
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
-        response_data = {"response": "Opus response"}
-        generate_result = Mock(returncode=0, stdout=json.dumps(response_data), stderr="")
-
-        mock_run.side_effect = [version_result, generate_result]
-
-        # Create model config with opus
-        opus_config = ModelConfig(
-            provider="claude-code",
-            model_id="opus",
-            params={},
-        )
-
-        provider = ClaudeCodeProvider(provider_config, opus_config)
-        provider.generate("Test prompt")
-
-        # Check model argument
-        generate_call = mock_run.call_args_list[1]
-        assert "opus" in generate_call[0][0]
-
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
-    def test_generate_with_full_model_id(self, mock_run, mock_which, provider_config):
-        """Test generation with full Claude model ID."""
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
-        response_data = {"response": "Response"}
-        generate_result = Mock(returncode=0, stdout=json.dumps(response_data), stderr="")
-
-        mock_run.side_effect = [version_result, generate_result]
-
-        # Create model config with full model ID
-        full_id_config = ModelConfig(
-            provider="claude-code",
-            model_id="claude-sonnet-4-5-20250929",
-            params={},
-        )
+        prompt_sent = fake_claude.calls()[0]["stdin"]
+        assert prompt_sent.startswith("System instructions")
+        assert "User prompt" in prompt_sent
+
+    @pytest.mark.parametrize(
+        "model_id,expected",
+        [
+            ("opus", "opus"),
+            ("haiku", "haiku"),
+            ("claude-sonnet-4-5-20250929", "sonnet"),
+            ("claude-opus-4-5-20250929", "opus"),
+            ("claude-haiku-4-5-20250929", "haiku"),
+        ],
+    )
+    def test_generate_model_argument(self, fake_claude, provider_config, model_id, expected):
+        """Test the model name passed to the CLI is derived from the model ID."""
+        config = ModelConfig(provider="claude-code", model_id=model_id, params={})
 
-        provider = ClaudeCodeProvider(provider_config, full_id_config)
+        provider = ClaudeCodeProvider(provider_config, config)
         provider.generate("Test prompt")
 
-        # Should extract "sonnet" from full ID
-        generate_call = mock_run.call_args_list[1]
-        assert "sonnet" in generate_call[0][0]
-
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
-    def test_generate_with_custom_timeout(self, mock_run, mock_which, provider_config):
-        """Test generation with custom timeout."""
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
-        response_data = {"response": "Response"}
-        generate_result = Mock(returncode=0, stdout=json.dumps(response_data), stderr="")
-
-        mock_run.side_effect = [version_result, generate_result]
+        argv = fake_claude.calls()[0]["argv"]
+        assert argv[argv.index("--model") + 1] == expected
 
-        # Create model config with custom timeout
+    def test_generate_with_custom_timeout(self, fake_claude, provider_config):
+        """Test generation honours the timeout model param."""
+        fake_claude.respond(sleep=5)
         timeout_config = ModelConfig(
             provider="claude-code",
             model_id="sonnet",
-            params={"timeout": 300},
+            params={"timeout": 0.5},
         )
 
         provider = ClaudeCodeProvider(provider_config, timeout_config)
-        provider.generate("Test prompt")
 
-        # Check timeout was used
-        generate_call = mock_run.call_args_list[1]
-        assert generate_call[1]["timeout"] == 300
+        with pytest.raises(Exception) as exc_info:
+            provider.generate("Test prompt")
+
+        assert "timed out after 0.5 seconds" in str(exc_info.value)
 
     @patch("drift.providers.claude_code.shutil.which")
     @patch("drift.providers.claude_code.subprocess.run")
@@ -271,15 +213,9 @@ class TestClaudeCodeProviderGenerate:
         assert "Claude Code provider is not available" in str(exc_info.value)
         assert "install" in str(exc_info.value).lower()
 
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
-    def test_generate_with_cli_error(self, mock_run, mock_which, provider_config, model_config):
+    def test_generate_with_cli_error(self, fake_claude, provider_config, model_config):
         """Test generation handles CLI errors."""
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
-        generate_result = Mock(returncode=1, stdout="", stderr="Error: Invalid argument")
-
-        mock_run.side_effect = [version_result, generate_result]
+        fake_claude.respond(stdout="", stderr="Error: Invalid argument", exit_code=1)
 
         provider = ClaudeCodeProvider(provider_config, model_config)
 
@@ -289,25 +225,123 @@ class TestClaudeCodeProviderGenerate:
         assert "Claude Code CLI error" in str(exc_info.value)
         assert "Invalid argument" in str(exc_info.value)
 
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
-    def test_generate_with_timeout_error(self, mock_run, mock_which, provider_config, model_config):
-        """Test generation handles timeout errors."""
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
-
-        mock_run.side_effect = [
-            version_result,
-            subprocess.TimeoutExpired("claude", 120),
-        ]
+    def test_generate_with_timeout_error(self, fake_claude, provider_config):
+        """Test timed out calls report the configured timeout."""
+        fake_claude.respond(sleep=5)
+        config = ModelConfig(provider="claude-code", model_id="sonnet", params={"timeout": 1})
 
-        provider = ClaudeCodeProvider(provider_config, model_config)
+        provider = ClaudeCodeProvider(provider_config, config)
 
         with pytest.raises(Exception) as exc_info:
             provider.generate("Test prompt")
 
         assert "timed out" in str(exc_info.value)
-        assert "120 seconds" in str(exc_info.value)
+        assert "1 seconds" in str(exc_info.value)
+
+
+class TestClaudeCliPool:
+    """Test concurrent CLI execution through the subprocess pool."""
+
+    def test_concurrency_is_bounded(self, fake_claude, model_config):
+        """Test no more than max_concurrency CLI processes overlap."""
+        fake_claude.respond(sleep=0.3)
+        config = ProviderConfig(provider=ProviderType.CLAUDE_CODE, params={"max_concurrency": 2})
+        provider = ClaudeCodeProvider(config, model_config)
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            results = list(executor.map(provider.generate, [f"prompt {i}" for i in range(6)]))
+
+        assert results == ["ok"] * 6
+        calls = fake_claude.calls()
+        assert sorted(c["stdin"] for c in calls) == [f"prompt {i}" for i in range(6)]
+
+        events = sorted([(c["start"], 1) for c in calls] + [(c["end"], -1) for c in calls])
+        running = peak = 0
+        for _, delta in events:
+            running += delta
+            peak = max(peak, running)
+        assert peak == 2
+
+    def test_calls_run_concurrently(self, fake_claude, model_config):
+        """Test independent calls overlap instead of running serially."""
+        fake_claude.respond(sleep=0.5)
+        config = ProviderConfig(provider=ProviderType.CLAUDE_CODE, params={"max_concurrency": 4})
+        provider = ClaudeCodeProvider(config, model_config)
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(provider.generate, ["p"] * 4))
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 1.5
+
+    def test_cancellation_kills_subprocess(self, fake_claude):
+        """Test cancelling an in-flight call terminates the CLI process."""
+        from drift.providers.claude_code import ClaudeCliPool
+
+        fake_claude.respond(sleep=5)
+        pool = ClaudeCliPool(1)
+
+        started = time.monotonic()
+        future = pool.submit(["claude", "-p"], "slow", 10)
+        time.sleep(0.5)
+        future.cancel()
+        with pytest.raises(CancelledError):
+            future.result()
+
+        # The only slot is free again once the slow process is gone
+        fake_claude.respond()
+        result = pool.submit(["claude", "-p"], "fast", 10).result()
+        pool.close()
+
+        assert result.returncode == 0
+        assert [c["stdin"] for c in fake_claude.calls()] == ["fast"]
+        assert time.monotonic() - started < 3
+
+    def test_provider_cancel_aborts_running_and_queued_calls(self, fake_claude, model_config):
+        """Test cancel() kills running CLI calls and drops the ones waiting for a slot."""
+        fake_claude.respond(sleep=5)
+        config = ProviderConfig(provider=ProviderType.CLAUDE_CODE, params={"max_concurrency": 1})
+        provider = ClaudeCodeProvider(config, model_config)
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(provider.generate, f"prompt {i}") for i in range(2)]
+            time.sleep(0.5)
+            provider.cancel()
+            for future in futures:
+                with pytest.raises(CancelledError):
+                    future.result(timeout=5)
+
+        assert fake_claude.calls() == []
+        assert time.monotonic() - started < 3
+
+    def test_pool_rejects_invalid_size(self):
+        """Test pools need at least one slot."""
+        from drift.providers.claude_code import ClaudeCliPool
+
+        with pytest.raises(ValueError):
+            ClaudeCliPool(0)
+
+    def test_pool_close_and_restart(self, fake_claude):
+        """Test a closed pool restarts its loop on next use."""
+        from drift.providers.claude_code import ClaudeCliPool
+
+        pool = ClaudeCliPool(1)
+        first = pool.submit(["claude", "-p"], "one", 10).result()
+        pool.close()
+        second = pool.submit(["claude", "-p"], "two", 10).result()
+        pool.close()
+
+        assert first.returncode == 0
+        assert second.stdout == json.dumps({"result": "ok"})
+
+    def test_shared_pool_per_concurrency(self):
+        """Test providers with the same limit share a pool."""
+        from drift.providers.claude_code import get_cli_pool
+
+        assert get_cli_pool(3) is get_cli_pool(3)
+        assert get_cli_pool(3) is not get_cli_pool(5)
 
 
 class TestClaudeCodeProviderCaching:
@@ -335,21 +369,12 @@ class TestClaudeCodeProviderCaching:
 
         assert result == "Cached response"
         mock_cache.get.assert_called_once_with("test_key", "abc123", None)
-        # Should not call CLI since we hit cache
-        assert mock_run.call_count == 1  # Only version check
+        # Should not call CLI since we hit cache (availability is probed lazily)
+        assert mock_run.call_count == 0
 
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
-    def test_generate_with_cache_miss(
-        self, mock_run, mock_which, provider_config, model_config, mock_cache
-    ):
+    def test_generate_with_cache_miss(self, fake_claude, provider_config, model_config, mock_cache):
         """Test generation with cache miss."""
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
-        response_data = {"response": "Fresh response"}
-        generate_result = Mock(returncode=0, stdout=json.dumps(response_data), stderr="")
-
-        mock_run.side_effect = [version_result, generate_result]
+        fake_claude.respond(stdout=json.dumps({"response": "Fresh response"}))
 
         # Mock cache to return None (cache miss)
         mock_cache.get.return_value = None
@@ -428,95 +453,12 @@ class TestClaudeCodeProviderEdgeCases:
         # Should default to sonnet and log warning
         assert provider._get_model_name() == "sonnet"
 
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
-    def test_generate_with_haiku_model(self, mock_run, mock_which, provider_config):
-        """Test generation with haiku model."""
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
-        response_data = {"response": "Haiku response"}
-        generate_result = Mock(returncode=0, stdout=json.dumps(response_data), stderr="")
-
-        mock_run.side_effect = [version_result, generate_result]
-
-        # Create model config with haiku
-        haiku_config = ModelConfig(
-            provider="claude-code",
-            model_id="haiku",
-            params={},
-        )
-
-        provider = ClaudeCodeProvider(provider_config, haiku_config)
-        provider.generate("Test prompt")
-
-        # Check model argument
-        generate_call = mock_run.call_args_list[1]
-        assert "haiku" in generate_call[0][0]
-
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
-    def test_generate_with_full_opus_model_id(self, mock_run, mock_which, provider_config):
-        """Test generation with full Opus model ID extracts 'opus'."""
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
-        response_data = {"response": "Opus response"}
-        generate_result = Mock(returncode=0, stdout=json.dumps(response_data), stderr="")
-
-        mock_run.side_effect = [version_result, generate_result]
-
-        # Create model config with full opus model ID
-        opus_config = ModelConfig(
-            provider="claude-code",
-            model_id="claude-opus-4-5-20250929",
-            params={},
-        )
-
-        provider = ClaudeCodeProvider(provider_config, opus_config)
-        provider.generate("Test prompt")
-
-        # Check that "opus" was extracted from full ID
-        generate_call = mock_run.call_args_list[1]
-        assert "opus" in generate_call[0][0]
-
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
-    def test_generate_with_full_haiku_model_id(self, mock_run, mock_which, provider_config):
-        """Test generation with full Haiku model ID extracts 'haiku'."""
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
-        response_data = {"response": "Haiku response"}
-        generate_result = Mock(returncode=0, stdout=json.dumps(response_data), stderr="")
-
-        mock_run.side_effect = [version_result, generate_result]
-
-        # Create model config with full haiku model ID
-        haiku_config = ModelConfig(
-            provider="claude-code",
-            model_id="claude-haiku-4-5-20250929",
-            params={},
-        )
-
-        provider = ClaudeCodeProvider(provider_config, haiku_config)
-        provider.generate("Test prompt")
-
-        # Check that "haiku" was extracted from full ID
-        generate_call = mock_run.call_args_list[1]
-        assert "haiku" in generate_call[0][0]
-
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
     def test_generate_with_dict_response_no_known_fields(
-        self, mock_run, mock_which, provider_config, model_config
+        self, fake_claude, provider_config, model_config
     ):
         """Test generation with dict response but no known text fields."""
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
-
         # Response with unknown field names
-        response_data = {"unknown_field": "", "another_field": "Some text"}
-        generate_result = Mock(returncode=0, stdout=json.dumps(response_data), stderr="")
-
-        mock_run.side_effect = [version_result, generate_result]
+        fake_claude.respond(stdout=json.dumps({"unknown_field": "", "another_field": "Some text"}))
 
         provider = ClaudeCodeProvider(provider_config, model_config)
 
@@ -527,20 +469,11 @@ class TestClaudeCodeProviderEdgeCases:
         assert "Could not extract response text from Claude Code output" in str(exc_info.value)
         assert "unknown_field" in str(exc_info.value)
 
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
     def test_generate_with_dict_response_only_empty_values(
-        self, mock_run, mock_which, provider_config, model_config
+        self, fake_claude, provider_config, model_config
     ):
         """Test generation with dict response containing only empty values."""
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
-
-        # Response with only empty values
-        response_data = {"field1": "", "field2": ""}
-        generate_result = Mock(returncode=0, stdout=json.dumps(response_data), stderr="")
-
-        mock_run.side_effect = [version_result, generate_result]
+        fake_claude.respond(stdout=json.dumps({"field1": "", "field2": ""}))
 
         provider = ClaudeCodeProvider(provider_config, model_config)
 
@@ -550,38 +483,31 @@ class TestClaudeCodeProviderEdgeCases:
 
         assert "Could not extract response text from Claude Code output" in str(exc_info.value)
 
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
-    def test_generate_with_string_json_response(
-        self, mock_run, mock_which, provider_config, model_config
+    def test_generate_with_non_string_result_field(
+        self, fake_claude, provider_config, model_config
     ):
-        """Test generation when JSON response is a string (not dict)."""
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
+        """Test generation rejects a non-string 'result' field."""
+        fake_claude.respond(stdout=json.dumps({"result": 42}))
 
-        # JSON response that's just a string
-        generate_result = Mock(returncode=0, stdout=json.dumps("Direct string response"), stderr="")
+        provider = ClaudeCodeProvider(provider_config, model_config)
+
+        with pytest.raises(Exception) as exc_info:
+            provider.generate("Test prompt")
 
-        mock_run.side_effect = [version_result, generate_result]
+        assert "Expected 'result' field to be string" in str(exc_info.value)
+
+    def test_generate_with_string_json_response(self, fake_claude, provider_config, model_config):
+        """Test generation when JSON response is a string (not dict)."""
+        fake_claude.respond(stdout=json.dumps("Direct string response"))
 
         provider = ClaudeCodeProvider(provider_config, model_config)
         result = provider.generate("Test prompt")
 
         assert result == "Direct string response"
 
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
-    def test_generate_with_unexpected_json_type(
-        self, mock_run, mock_which, provider_config, model_config
-    ):
+    def test_generate_with_unexpected_json_type(self, fake_claude, provider_config, model_config):
         """Test generation with unexpected JSON response type (list, number, etc)."""
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
-
-        # JSON response that's a list
-        generate_result = Mock(returncode=0, stdout=json.dumps([1, 2, 3]), stderr="")
-
-        mock_run.side_effect = [version_result, generate_result]
+        fake_claude.respond(stdout=json.dumps([1, 2, 3]))
 
         provider = ClaudeCodeProvider(provider_config, model_config)
 
@@ -592,18 +518,14 @@ class TestClaudeCodeProviderEdgeCases:
         assert "Error calling Claude Code CLI" in str(exc_info.value)
         assert "Unexpected response type" in str(exc_info.value)
 
-    @patch("drift.providers.claude_code.shutil.which")
-    @patch("drift.providers.claude_code.subprocess.run")
     def test_generate_with_file_not_found_error(
-        self, mock_run, mock_which, provider_config, model_config
+        self, fake_claude, provider_config, model_config, monkeypatch, tmp_path
     ):
-        """Test generation handles FileNotFoundError."""
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
-
-        mock_run.side_effect = [version_result, FileNotFoundError("claude command not found")]
-
+        """Test generation handles the CLI disappearing after the probe."""
         provider = ClaudeCodeProvider(provider_config, model_config)
+        assert provider.is_available()
+
+        monkeypatch.setenv("PATH", str(tmp_path / "empty"))
 
         with pytest.raises(Exception) as exc_info:
             provider.generate("Test prompt")
@@ -611,22 +533,121 @@ class TestClaudeCodeProviderEdgeCases:
         assert "Claude Code CLI not found" in str(exc_info.value)
         assert "PATH" in str(exc_info.value)
 
+    def test_generate_with_generic_exception(self, fake_claude, provider_config, model_config):
+        """Test generation handles generic exceptions."""
+        provider = ClaudeCodeProvider(provider_config, model_config)
+
+        # Generic exception that's not a known error type
+        with patch(
+            "drift.providers.claude_code.asyncio.create_subprocess_exec",
+            side_effect=OSError("Generic OS error"),
+        ):
+            with pytest.raises(Exception) as exc_info:
+                provider.generate("Test prompt")
+
+        assert "Error calling Claude Code CLI" in str(exc_info.value)
+        assert "Generic OS error" in str(exc_info.value)
+
+
+class TestClaudeCodeAvailabilityCache:
+    """Test caching of the Claude Code CLI availability probe."""
+
+    @pytest.fixture
+    def fake_cli(self, tmp_path):
+        """Create a real file so the CLI fingerprint can be computed."""
+        cli = tmp_path / "bin" / "claude"
+        cli.parent.mkdir()
+        cli.write_text("#!/bin/sh\necho 'claude 1.0.0'\n")
+        cli.chmod(0o755)
+        return cli
+
     @patch("drift.providers.claude_code.shutil.which")
     @patch("drift.providers.claude_code.subprocess.run")
-    def test_generate_with_generic_exception(
-        self, mock_run, mock_which, provider_config, model_config
+    def test_probe_runs_lazily(self, mock_run, mock_which, provider_config, model_config):
+        """Test constructing the provider does not probe the CLI."""
+        ClaudeCodeProvider(provider_config, model_config)
+
+        mock_which.assert_not_called()
+        mock_run.assert_not_called()
+
+    @patch("drift.providers.claude_code.shutil.which")
+    @patch("drift.providers.claude_code.subprocess.run")
+    def test_probe_cached_per_process(
+        self, mock_run, mock_which, fake_cli, provider_config, model_config
     ):
-        """Test generation handles generic exceptions."""
-        mock_which.return_value = "/usr/local/bin/claude"
-        version_result = Mock(returncode=0, stdout="claude version 1.0.0\n", stderr="")
+        """Test the version probe runs once across provider instances."""
+        mock_which.return_value = str(fake_cli)
+        mock_run.return_value = Mock(returncode=0, stdout="claude 1.0.0\n", stderr="")
 
-        # Generic exception that's not a known error type
-        mock_run.side_effect = [version_result, OSError("Generic OS error")]
+        assert ClaudeCodeProvider(provider_config, model_config).is_available()
+        assert ClaudeCodeProvider(provider_config, model_config).is_available()
 
-        provider = ClaudeCodeProvider(provider_config, model_config)
+        assert mock_run.call_count == 1
 
-        with pytest.raises(Exception) as exc_info:
-            provider.generate("Test prompt")
+    @patch("drift.providers.claude_code.shutil.which")
+    @patch("drift.providers.claude_code.subprocess.run")
+    def test_probe_cached_on_disk(
+        self, mock_run, mock_which, fake_cli, provider_config, model_config
+    ):
+        """Test a fresh process reuses the on-disk probe result."""
+        from drift.providers.claude_code import clear_availability_cache
 
-        assert "Error calling Claude Code CLI" in str(exc_info.value)
-        assert "Generic OS error" in str(exc_info.value)
+        mock_which.return_value = str(fake_cli)
+        mock_run.return_value = Mock(returncode=0, stdout="claude 1.0.0\n", stderr="")
+
+        assert ClaudeCodeProvider(provider_config, model_config).is_available()
+        clear_availability_cache()  # Simulate a new process
+        assert ClaudeCodeProvider(provider_config, model_config).is_available()
+
+        assert mock_run.call_count == 1
+
+    @patch("drift.providers.claude_code.shutil.which")
+    @patch("drift.providers.claude_code.subprocess.run")
+    def test_disk_cache_expires(
+        self, mock_run, mock_which, fake_cli, provider_config, model_config
+    ):
+        """Test expired on-disk probe results trigger a new probe."""
+        from drift.providers.claude_code import clear_availability_cache
+
+        mock_which.return_value = str(fake_cli)
+        mock_run.return_value = Mock(returncode=0, stdout="claude 1.0.0\n", stderr="")
+
+        assert ClaudeCodeProvider(provider_config, model_config).is_available()
+        clear_availability_cache()
+
+        with patch("drift.providers.claude_code.time.time", return_value=1e12):
+            assert ClaudeCodeProvider(provider_config, model_config).is_available()
+
+        assert mock_run.call_count == 2
+
+    @patch("drift.providers.claude_code.shutil.which")
+    @patch("drift.providers.claude_code.subprocess.run")
+    def test_disk_cache_disabled_with_zero_ttl(self, mock_run, mock_which, fake_cli, model_config):
+        """Test availability_ttl=0 disables the on-disk cache."""
+        from drift.providers.claude_code import _probe_cache_file, clear_availability_cache
+
+        config = ProviderConfig(provider=ProviderType.CLAUDE_CODE, params={"availability_ttl": 0})
+        mock_which.return_value = str(fake_cli)
+        mock_run.return_value = Mock(returncode=0, stdout="claude 1.0.0\n", stderr="")
+
+        assert ClaudeCodeProvider(config, model_config).is_available()
+        clear_availability_cache()
+        assert ClaudeCodeProvider(config, model_config).is_available()
+
+        assert mock_run.call_count == 2
+        assert not _probe_cache_file().exists()
+
+    @patch("drift.providers.claude_code.shutil.which")
+    @patch("drift.providers.claude_code.subprocess.run")
+    def test_replaced_cli_invalidates_cache(
+        self, mock_run, mock_which, fake_cli, provider_config, model_config
+    ):
+        """Test a changed executable is probed again."""
+        mock_which.return_value = str(fake_cli)
+        mock_run.return_value = Mock(returncode=0, stdout="claude 1.0.0\n", stderr="")
+
+        assert ClaudeCodeProvider(provider_config, model_config).is_available()
+        fake_cli.write_text("#!/bin/sh\necho 'claude 2.0.0 upgraded'\n")
+        assert ClaudeCodeProvider(provider_config, model_config).is_available()
+
+        assert mock_run.call_count == 2
@@ -0,0 +1,205 @@
+"""Unit tests for the on-disk configuration cache."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from drift.config import cache as config_cache
+from drift.config.cache import ConfigCache, default_cache_dir
+from drift.config.loader import ConfigLoader
+from drift.config.remote import RemoteRulesFetcher
+
+
+def _rule(description):
+    """Build a programmatic rule definition."""
+    return {
+        "description": description,
+        "scope": "project_level",
+        "context": "Test rule",
+        "requires_project_context": True,
+        "validation_rules": {
+            "rules": [
+                {
+                    "rule_type": "core:file_exists",
+                    "description": description,
+                    "params": {"file_path": "README.md"},
+                    "failure_message": "Missing README",
+                    "expected_behavior": "Has a README",
+                }
+            ],
+            "document_bundle": {
+                "bundle_type": "project",
+                "file_patterns": ["README.md"],
+                "bundle_strategy": "collection",
+            },
+        },
+    }
+
+
+def _write(path, content):
+    """Write a YAML file with a fresh modification time."""
+    path.write_text(yaml.dump(content))
+    # Make sure the change is visible even on coarse timestamp filesystems
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Create a project with rules in .drift.yaml and an isolated global config."""
+    monkeypatch.setattr(ConfigLoader, "GLOBAL_CONFIG_PATHS", [tmp_path / "global.yaml"])
+    project_path = tmp_path / "project"
+    project_path.mkdir()
+    _write(project_path / ".drift.yaml", {"rule_definitions": {"readme": _rule("Has README")}})
+    return project_path
+
+
+def _load(project, rules_files=None):
+    """Load a config through the cache, recording whether the files were read."""
+    with patch.object(ConfigLoader, "_load_config", wraps=ConfigLoader._load_config) as load:
+        config = ConfigLoader.load_config(project, rules_files=rules_files, use_cache=True)
+    return config, load.called
+
+
+class TestConfigCache:
+    """Tests for ConfigLoader.load_config(use_cache=True)."""
+
+    def test_second_load_is_a_hit(self, project):
+        """Test an unchanged project is loaded from the cache."""
+        first, first_read = _load(project)
+        second, second_read = _load(project)
+
+        assert first_read and not second_read
+        assert second == first
+        assert second == ConfigLoader.load_config(project)
+
+    def test_without_use_cache_always_reads(self, project):
+        """Test load_config() neither reads nor writes the cache by default."""
+        ConfigLoader.load_config(project)
+
+        assert not default_cache_dir().exists()
+
+    def test_edited_source_misses(self, project):
+        """Test editing a contributing file reloads the configuration."""
+        _load(project)
+        _write(project / ".drift.yaml", {"rule_definitions": {"other": _rule("Other")}})
+
+        config, read = _load(project)
+
+        assert read
+        assert list(config.rule_definitions) == ["other"]
+
+    def test_touched_source_hits(self, project):
+        """Test a new mtime with identical content still hits."""
+        _load(project)
+        config_path = project / ".drift.yaml"
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+
+        _, read = _load(project)
+
+        assert not read
+
+    def test_new_source_misses(self, project):
+        """Test creating a file that did not exist reloads the configuration."""
+        _load(project)
+        _write(project / ".drift_rules.yaml", {"extra": _rule("Extra")})
+
+        config, read = _load(project)
+
+        assert read
+        assert "extra" in config.rule_definitions
+
+    def test_global_config_change_misses(self, project, tmp_path):
+        """Test editing the global config reloads the configuration."""
+        _load(project)
+        _write(tmp_path / "global.yaml", {"default_group_name": "Global"})
+
+        config, read = _load(project)
+
+        assert read
+        assert config.default_group_name == "Global"
+
+    def test_additional_rules_file_change_misses(self, project):
+        """Test editing a configured additional rules file reloads the configuration."""
+        _write(project / "shared.yaml", {"shared": _rule("Shared")})
+        _write(project / ".drift.yaml", {"additional_rules_files": ["shared.yaml"]})
+        _load(project)
+
+        _write(project / "shared.yaml", {"renamed": _rule("Renamed")})
+        config, read = _load(project)
+
+        assert read
+        assert "renamed" in config.rule_definitions
+
+    def test_cli_rules_files_have_own_entries(self, project, tmp_path):
+        """Test each set of CLI rules files is cached separately."""
+        _write(tmp_path / "a.yaml", {"a": _rule("A")})
+        _write(tmp_path / "b.yaml", {"b": _rule("B")})
+
+        a, _ = _load(project, [str(tmp_path / "a.yaml")])
+        b, _ = _load(project, [str(tmp_path / "b.yaml")])
+        cached_a, read = _load(project, [str(tmp_path / "a.yaml")])
+
+        assert list(a.rule_definitions) == ["a"]
+        assert list(b.rule_definitions) == ["b"]
+        assert cached_a == a and not read
+
+    def test_version_change_misses(self, project):
+        """Test entries written by another drift version are not used."""
+        _load(project)
+
+        with patch.object(config_cache, "_drift_version", return_value="0.0.0-other"):
+            _, read = _load(project)
+
+        assert read
+
+    def test_remote_rules_are_not_cached(self, project):
+        """Test configurations with remote rules files are always loaded."""
+        url = "https://example.com/rules.yaml"
+        rules = yaml.dump({"r": _rule("R")})
+        with patch.object(RemoteRulesFetcher, "fetch", return_value=rules):
+            _load(project, [url])
+            _, read = _load(project, [url])
+
+        assert read
+        assert list(default_cache_dir().glob("*.json")) == []
+
+    def test_corrupt_entry_is_a_miss(self, project):
+        """Test an unreadable entry is ignored and rewritten."""
+        expected, _ = _load(project)
+        for entry in default_cache_dir().glob("*.json"):
+            entry.write_text("{not json")
+
+        config, read = _load(project)
+
+        assert read and config == expected
+        assert not _load(project)[1]
+
+    def test_disabled_by_environment(self, project, monkeypatch):
+        """Test DRIFT_CONFIG_CACHE=0 turns the cache off."""
+        monkeypatch.setenv("DRIFT_CONFIG_CACHE", "0")
+
+        _load(project)
+        _, read = _load(project)
+
+        assert read
+        assert not default_cache_dir().exists()
+
+    def test_cache_dir_from_environment(self, project, monkeypatch, tmp_path):
+        """Test DRIFT_CONFIG_CACHE_DIR moves the cache."""
+        monkeypatch.setenv("DRIFT_CONFIG_CACHE_DIR", str(tmp_path / "configs"))
+
+        _load(project)
+
+        assert default_cache_dir() == tmp_path / "configs"
+        assert len(list((tmp_path / "configs").glob("*.json"))) == 1
+
+    def test_clear(self, project):
+        """Test clear() removes every entry."""
+        _load(project)
+
+        assert ConfigCache().clear() == 1
+        assert _load(project)[1]
@@ -631,16 +631,17 @@ class TestRulesFileLoading:
         class MockResponse:
             text = yaml_content
             status_code = 200
+            headers = {}
 
             def raise_for_status(self):
                 pass
 
-        def mock_get(url, timeout):
+        def mock_get(session, url, timeout, headers=None):
             assert url == "https://example.com/rules.yaml"
             assert timeout == ConfigLoader.RULES_FETCH_TIMEOUT
             return MockResponse()
 
-        monkeypatch.setattr(requests, "get", mock_get)
+        monkeypatch.setattr(requests.Session, "get", mock_get)
 
         result = ConfigLoader._load_remote_rules("https://example.com/rules.yaml")
         assert result == rules_data
@@ -649,10 +650,10 @@ class TestRulesFileLoading:
         """Test timeout when fetching remote rules."""
         import requests
 
-        def mock_get(url, timeout):
+        def mock_get(session, url, timeout, headers=None):
             raise requests.exceptions.Timeout()
 
-        monkeypatch.setattr(requests, "get", mock_get)
+        monkeypatch.setattr(requests.Session, "get", mock_get)
 
         with pytest.raises(ValueError) as exc_info:
             ConfigLoader._load_remote_rules("https://example.com/rules.yaml")
@@ -669,10 +670,10 @@ class TestRulesFileLoading:
             def raise_for_status(self):
                 raise requests.exceptions.HTTPError("404 Not Found")
 
-        def mock_get(url, timeout):
+        def mock_get(session, url, timeout, headers=None):
             return MockResponse()
 
-        monkeypatch.setattr(requests, "get", mock_get)
+        monkeypatch.setattr(requests.Session, "get", mock_get)
 
         with pytest.raises(ValueError) as exc_info:
             ConfigLoader._load_remote_rules("https://example.com/rules.yaml")
@@ -682,10 +683,10 @@ class TestRulesFileLoading:
         """Test connection error when fetching remote rules."""
         import requests
 
-        def mock_get(url, timeout):
+        def mock_get(session, url, timeout, headers=None):
             raise requests.exceptions.ConnectionError("Network unreachable")
 
-        monkeypatch.setattr(requests, "get", mock_get)
+        monkeypatch.setattr(requests.Session, "get", mock_get)
 
         with pytest.raises(ValueError) as exc_info:
             ConfigLoader._load_remote_rules("https://example.com/rules.yaml")
@@ -698,14 +699,15 @@ class TestRulesFileLoading:
         class MockResponse:
             text = "invalid: yaml: content:\n  - broken"
             status_code = 200
+            headers = {}
 
             def raise_for_status(self):
                 pass
 
-        def mock_get(url, timeout):
+        def mock_get(session, url, timeout, headers=None):
             return MockResponse()
 
-        monkeypatch.setattr(requests, "get", mock_get)
+        monkeypatch.setattr(requests.Session, "get", mock_get)
 
         with pytest.raises(ValueError) as exc_info:
             ConfigLoader._load_remote_rules("https://example.com/rules.yaml")
@@ -718,14 +720,15 @@ class TestRulesFileLoading:
         class MockResponse:
             text = ""
             status_code = 200
+            headers = {}
 
             def raise_for_status(self):
                 pass
 
-        def mock_get(url, timeout):
+        def mock_get(session, url, timeout, headers=None):
             return MockResponse()
 
-        monkeypatch.setattr(requests, "get", mock_get)
+        monkeypatch.setattr(requests.Session, "get", mock_get)
 
         result = ConfigLoader._load_remote_rules("https://example.com/rules.yaml")
         assert result == {}
@@ -1185,3 +1188,44 @@ class TestRulesFileLoading:
         assert "cli_rule1" in config.rule_definitions
         assert "cli_rule2" in config.rule_definitions
         assert "default_rule" not in config.rule_definitions
+
+
+class TestConfigSources:
+    """Tests for ConfigLoader.config_sources()."""
+
+    def test_default_sources(self, temp_dir, monkeypatch):
+        """Test global, project and default rules files are listed even if missing."""
+        monkeypatch.setattr(ConfigLoader, "GLOBAL_CONFIG_PATHS", [temp_dir / "global.yaml"])
+        project = temp_dir.resolve()
+
+        sources = ConfigLoader.config_sources(temp_dir)
+
+        assert sources == [
+            temp_dir / "global.yaml",
+            project / ".drift.yaml",
+            project / ".drift_rules.yaml",
+        ]
+
+    def test_additional_rules_files_relative_to_project(self, temp_dir, monkeypatch):
+        """Test additional rules files from the config are resolved against the project."""
+        monkeypatch.setattr(ConfigLoader, "GLOBAL_CONFIG_PATHS", [])
+        config = DriftConfig(
+            additional_rules_files=["rules/extra.yaml", "https://example.com/rules.yaml"]
+        )
+
+        sources = ConfigLoader.config_sources(temp_dir, config=config)
+
+        assert sources[-1] == temp_dir.resolve() / "rules" / "extra.yaml"
+        assert len(sources) == 3
+
+    def test_cli_rules_files_replace_default_rules(self, temp_dir, monkeypatch):
+        """Test CLI rules files are listed instead of the default rules files."""
+        monkeypatch.setattr(ConfigLoader, "GLOBAL_CONFIG_PATHS", [])
+        monkeypatch.chdir(temp_dir)
+        config = DriftConfig(additional_rules_files=["ignored.yaml"])
+
+        sources = ConfigLoader.config_sources(
+            temp_dir, rules_files=["cli.yaml", "https://example.com/rules.yaml"], config=config
+        )
+
+        assert sources == [temp_dir.resolve() / ".drift.yaml", temp_dir.resolve() / "cli.yaml"]
@@ -0,0 +1,397 @@
+"""Unit tests for the drift daemon (drift serve), its client and warm cache."""
+
+import json
+import os
+import socket
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from drift.cli.commands.analyze import analyze_command
+from drift.cli.main import main
+from drift.config.loader import ConfigLoader
+from drift.daemon.client import (
+    DaemonError,
+    DaemonUnavailable,
+    default_socket_path,
+    forward_analyze,
+    send_request,
+)
+from drift.daemon.server import (
+    INVALID_PARAMS,
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    DriftServer,
+)
+from drift.daemon.warm import WarmCache
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not supported"
+)
+
+
+def _rules(max_size):
+    """Build a project config with one size rule over skill files."""
+    return {
+        "rule_definitions": {
+            "small_skills": {
+                "description": "Skills are small",
+                "scope": "project_level",
+                "context": "Small skills load fast",
+                "requires_project_context": True,
+                "validation_rules": {
+                    "rules": [
+                        {
+                            "rule_type": "core:file_size",
+                            "description": "Small skill",
+                            "params": {"max_size": max_size},
+                            "failure_message": "Skill too large",
+                            "expected_behavior": "Small skill",
+                        }
+                    ],
+                    "document_bundle": {
+                        "bundle_type": "skill",
+                        "file_patterns": [".claude/skills/*/SKILL.md"],
+                        "bundle_strategy": "individual",
+                    },
+                },
+            }
+        }
+    }
+
+
+def _write_config(project, max_size):
+    """Write .drift.yaml with a fresh modification time."""
+    config_path = project / ".drift.yaml"
+    config_path.write_text(yaml.dump(_rules(max_size)))
+    # Make sure the change is visible even on coarse timestamp filesystems
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Create a project with two skills and an isolated global config."""
+    monkeypatch.setattr(ConfigLoader, "GLOBAL_CONFIG_PATHS", [tmp_path / "global.yaml"])
+    project_path = tmp_path / "project"
+    for name, content in {"alpha": "a" * 10, "beta": "b" * 100}.items():
+        skill = project_path / ".claude" / "skills" / name / "SKILL.md"
+        skill.parent.mkdir(parents=True)
+        skill.write_text(content)
+    _write_config(project_path, 50)
+    return project_path
+
+
+@pytest.fixture
+def socket_path():
+    """Get a short socket path (Unix socket paths are limited to ~100 bytes)."""
+    with tempfile.TemporaryDirectory(prefix="drift") as directory:
+        yield Path(directory) / "d.sock"
+
+
+@pytest.fixture
+def server(socket_path):
+    """Run a daemon in a background thread."""
+    drift_server = DriftServer(socket_path)
+    thread = threading.Thread(target=drift_server.serve, daemon=True)
+    thread.start()
+    yield drift_server
+    if thread.is_alive():
+        send_request("shutdown", socket_path=socket_path)
+    thread.join(timeout=10)
+
+
+class TestWarmCache:
+    """Tests for WarmCache."""
+
+    def test_config_reused_while_sources_unchanged(self, project):
+        """Test the configuration is loaded once and handed out as copies."""
+        cache = WarmCache()
+
+        with patch.object(ConfigLoader, "load_config", wraps=ConfigLoader.load_config) as mock_load:
+            first = cache.load_config(project)
+            second = cache.load_config(project)
+
+        assert mock_load.call_count == 1
+        assert first == second
+        assert first is not second
+
+    def test_config_reloaded_when_source_changes(self, project):
+        """Test editing .drift.yaml reloads the configuration."""
+        cache = WarmCache()
+        cache.load_config(project)
+
+        _write_config(project, 5)
+        config = cache.load_config(project)
+
+        rule = config.rule_definitions["small_skills"].validation_rules.rules[0]
+        assert rule.params == {"max_size": 5}
+
+    def test_config_reloaded_when_source_appears(self, project):
+        """Test creating a config file that did not exist reloads the configuration."""
+        cache = WarmCache()
+        cache.load_config(project)
+
+        (project / ".drift_rules.yaml").write_text(
+            yaml.dump({"extra": {**_rules(1)["rule_definitions"]["small_skills"]}})
+        )
+
+        assert "extra" in cache.load_config(project).rule_definitions
+
+    def test_analyzer_reused_for_equal_config(self, project):
+        """Test analyzers are rebuilt only when the run's configuration differs."""
+        cache = WarmCache()
+
+        first = cache.analyzer(cache.load_config(project), project)
+        second = cache.analyzer(cache.load_config(project), project)
+        config = cache.load_config(project)
+        config.cache_enabled = False
+        third = cache.analyzer(config, project)
+
+        assert first is second
+        assert third is not first
+
+    def test_invalidate(self, project, tmp_path):
+        """Test invalidating one project or all of them drops their state."""
+        other = tmp_path / "other"
+        other.mkdir()
+        cache = WarmCache()
+        cache.load_config(project)
+        cache.load_config(other)
+
+        assert cache.invalidate(project) == 1
+        assert cache.projects == [str(other.resolve())]
+        assert cache.invalidate(project) == 0
+        assert cache.invalidate() == 1
+        assert cache.projects == []
+
+
+class TestDriftServer:
+    """Tests for DriftServer request handling."""
+
+    def test_analyze_returns_output_and_exit_code(self, project, server, socket_path):
+        """Test analyze runs drift in the daemon and returns its captured output."""
+        result = send_request(
+            "analyze",
+            {"project": str(project), "scope": "project", "format": "json"},
+            socket_path,
+        )
+
+        assert result["exit_code"] == 2
+        output = json.loads(result["stdout"])
+        assert output["summary"]["total_rule_violations"] == 1
+
+    def test_analyze_reuses_warm_state_and_reloads_config(self, project, server, socket_path):
+        """Test later runs reuse the configuration until its file changes."""
+        params = {"project": str(project), "scope": "project"}
+
+        with patch.object(ConfigLoader, "load_config", wraps=ConfigLoader.load_config) as mock_load:
+            assert send_request("analyze", params, socket_path)["exit_code"] == 2
+            assert send_request("analyze", params, socket_path)["exit_code"] == 2
+            _write_config(project, 1000)
+            assert send_request("analyze", params, socket_path)["exit_code"] == 0
+
+        assert mock_load.call_count == 2
+
+    def test_analyze_paths_limits_documents(self, project, server, socket_path):
+        """Test analyze-paths only checks the given documents."""
+        params = {"project": str(project), "format": "json"}
+
+        alpha = send_request(
+            "analyze-paths", {**params, "paths": [".claude/skills/alpha/SKILL.md"]}, socket_path
+        )
+        beta = send_request(
+            "analyze-paths",
+            {**params, "paths": [str(project / ".claude/skills/beta/SKILL.md")]},
+            socket_path,
+        )
+
+        assert alpha["exit_code"] == 0
+        assert beta["exit_code"] == 2
+
+    def test_invalidate(self, project, server, socket_path):
+        """Test invalidate drops the warm state of a project."""
+        send_request("analyze", {"project": str(project), "scope": "project"}, socket_path)
+
+        result = send_request("invalidate", {"project": str(project)}, socket_path)
+
+        assert result == {"invalidated": 1}
+        assert server.cache.projects == []
+
+    def test_shutdown_removes_socket(self, server, socket_path):
+        """Test shutdown stops the daemon and removes its socket."""
+        assert send_request("shutdown", socket_path=socket_path) == {"stopping": True}
+
+        for _ in range(100):
+            if not socket_path.exists():
+                break
+            threading.Event().wait(0.05)
+        assert not socket_path.exists()
+        with pytest.raises(DaemonUnavailable):
+            send_request("invalidate", socket_path=socket_path)
+
+    @pytest.mark.parametrize(
+        "line, code",
+        [
+            (b"not json", PARSE_ERROR),
+            (b"[1, 2]", INVALID_REQUEST),
+            (b'{"id": 1, "params": {}}', INVALID_REQUEST),
+            (b'{"id": 1, "method": "nope"}', METHOD_NOT_FOUND),
+            (b'{"id": 1, "method": "analyze", "params": {"project": "relative"}}', INVALID_PARAMS),
+            (
+                b'{"id": 1, "method": "analyze", "params": {"project": "/p", "bogus": 1}}',
+                INVALID_PARAMS,
+            ),
+            (b'{"id": 1, "method": "analyze-paths", "params": {"project": "/p"}}', INVALID_PARAMS),
+        ],
+    )
+    def test_invalid_requests(self, socket_path, line, code):
+        """Test malformed requests get JSON-RPC errors."""
+        drift_server = DriftServer(socket_path)
+        try:
+            response = drift_server.handle_message(line)
+        finally:
+            drift_server.server_close()
+
+        assert response["error"]["code"] == code
+
+    def test_several_requests_on_one_connection(self, server, socket_path):
+        """Test a client may send requests one after another on one connection."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(socket_path))
+            client.sendall(
+                b'{"jsonrpc": "2.0", "id": 1, "method": "invalidate"}\n'
+                b'{"jsonrpc": "2.0", "id": 2, "method": "invalidate"}\n'
+            )
+            with client.makefile("rb") as reader:
+                responses = [json.loads(reader.readline()) for _ in range(2)]
+
+        assert [response["id"] for response in responses] == [1, 2]
+
+    def test_idle_connection_does_not_block_others(self, server, socket_path):
+        """Test a client that connects and sends nothing does not stall the daemon."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as idle:
+            idle.connect(str(socket_path))
+
+            result = send_request("invalidate", socket_path=socket_path, timeout=5)
+
+        assert result == {"invalidated": 0}
+
+    def test_replaces_stale_socket(self, socket_path):
+        """Test a socket file left by a dead daemon is replaced."""
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_path))
+        stale.close()
+
+        drift_server = DriftServer(socket_path)
+        drift_server.server_close()
+
+    def test_refuses_to_replace_running_daemon(self, server, socket_path):
+        """Test a second daemon on the same socket is refused."""
+        with pytest.raises(RuntimeError, match="already listening"):
+            DriftServer(socket_path)
+
+    def test_socket_only_accessible_by_owner(self, server, socket_path):
+        """Test the socket is created with owner-only permissions."""
+        assert socket_path.stat().st_mode & 0o077 == 0
+
+
+class TestClient:
+    """Tests for the daemon client."""
+
+    def test_default_socket_path(self, monkeypatch, tmp_path):
+        """Test $DRIFT_SOCKET wins over $XDG_RUNTIME_DIR and the home directory."""
+        monkeypatch.delenv("DRIFT_SOCKET", raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        assert default_socket_path() == Path.home() / ".drift" / "drift.sock"
+
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        assert default_socket_path() == tmp_path / "drift.sock"
+
+        monkeypatch.setenv("DRIFT_SOCKET", str(tmp_path / "custom.sock"))
+        assert default_socket_path() == tmp_path / "custom.sock"
+
+    def test_forward_without_daemon(self, socket_path):
+        """Test forwarding is skipped when no socket exists."""
+        assert forward_analyze({"scope": "project"}, socket_path) is None
+
+    def test_forward_resolves_paths_and_prints_output(
+        self, project, server, socket_path, monkeypatch, capsys
+    ):
+        """Test relative project and rules paths are resolved by the client."""
+        monkeypatch.chdir(project.parent)
+        (project.parent / "rules.yaml").write_text(yaml.dump(_rules(1000)["rule_definitions"]))
+
+        exit_code = forward_analyze(
+            {"project": "project", "scope": "project", "rules_file": ["rules.yaml"]}, socket_path
+        )
+
+        assert exit_code == 0
+        assert "Drift Analysis Results" in capsys.readouterr().out
+
+    def test_forward_resolves_cache_dir(self, project, socket_path, monkeypatch):
+        """Test a relative cache directory is resolved against the client's directory."""
+        monkeypatch.chdir(project.parent)
+        socket_path.touch()
+        result = {"exit_code": 0, "stdout": "", "stderr": ""}
+        with patch("drift.daemon.client.send_request", return_value=result) as send:
+            forward_analyze({"project": "project", "cache_dir": "cache"}, socket_path)
+
+        params = send.call_args.args[1]
+        assert params["cache_dir"] == str((project.parent / "cache").resolve())
+
+    def test_forward_falls_back_when_daemon_does_not_answer(self, socket_path, monkeypatch):
+        """Test a daemon that accepts but never responds makes the CLI run locally."""
+        monkeypatch.setattr("drift.daemon.client.RESPONSE_TIMEOUT", 0.2)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stuck:
+            stuck.bind(str(socket_path))
+            stuck.listen()
+
+            assert forward_analyze({"project": "/p"}, socket_path) is None
+
+    def test_forward_falls_back_on_daemon_error(self, socket_path):
+        """Test daemon errors make the CLI run locally instead."""
+        socket_path.touch()
+        with patch("drift.daemon.client.send_request", side_effect=DaemonError(-32603, "broken")):
+            assert forward_analyze({"scope": "project"}, socket_path) is None
+
+
+class TestCliForwarding:
+    """Tests for forwarding from the drift command."""
+
+    def test_main_forwards_to_daemon(self, monkeypatch):
+        """Test drift exits with the daemon's exit code without analyzing locally."""
+        monkeypatch.setattr("sys.argv", ["drift", "--scope", "project"])
+
+        with patch("drift.cli.main.forward_analyze", return_value=2) as mock_forward:
+            with patch("drift.cli.commands.analyze.analyze_command") as mock_analyze:
+                with pytest.raises(SystemExit) as exc_info:
+                    main()
+
+        assert exc_info.value.code == 2
+        assert mock_forward.call_args.args[0]["scope"] == "project"
+        mock_analyze.assert_not_called()
+
+    def test_no_daemon_runs_locally(self, monkeypatch):
+        """Test --no-daemon never contacts the daemon."""
+        monkeypatch.setattr("sys.argv", ["drift", "--no-daemon"])
+
+        with patch("drift.cli.main.forward_analyze") as mock_forward:
+            with patch("drift.cli.commands.analyze.analyze_command") as mock_analyze:
+                main()
+
+        mock_forward.assert_not_called()
+        mock_analyze.assert_called_once()
+
+    def test_paths_outside_project_rejected(self, project, capsys):
+        """Test analyze paths must be inside the project."""
+        with pytest.raises(SystemExit) as exc_info:
+            analyze_command(project=str(project), paths=["/elsewhere/doc.md"])
+
+        assert exc_info.value.code == 1
+        assert "outside the project" in capsys.readouterr().err
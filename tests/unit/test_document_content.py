@@ -0,0 +1,168 @@
+"""Tests for document content reading and lazy DocumentFile content."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from drift.config.models import BundleStrategy, DocumentBundleConfig
+from drift.core.types import DocumentFile
+from drift.documents.content import (
+    SNIFF_BYTES,
+    DocumentContent,
+    is_binary_data,
+    read_document_content,
+)
+from drift.documents.loader import DocumentLoader
+
+
+class TestReadDocumentContent:
+    """Tests for read_document_content()."""
+
+    def test_reads_utf8_text(self, tmp_path):
+        """Test UTF-8 text is decoded."""
+        path = tmp_path / "doc.md"
+        path.write_text("# Héllo\n", encoding="utf-8")
+
+        assert read_document_content(path) == DocumentContent("# Héllo\n", False)
+
+    def test_normalizes_newlines(self, tmp_path):
+        """Test CRLF and CR newlines are translated like a text-mode read."""
+        path = tmp_path / "doc.md"
+        path.write_bytes(b"a\r\nb\rc\n")
+
+        assert read_document_content(path).text == "a\nb\nc\n"
+
+    def test_latin1_fallback(self, tmp_path):
+        """Test bytes that are not valid UTF-8 are decoded as latin-1."""
+        path = tmp_path / "doc.md"
+        path.write_bytes(b"caf\xe9\n")
+
+        assert read_document_content(path).text == "café\n"
+
+    def test_binary_file_is_not_decoded(self, tmp_path):
+        """Test files with NUL bytes are reported as binary with empty text."""
+        path = tmp_path / "image.png"
+        path.write_bytes(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR")
+
+        assert read_document_content(path) == DocumentContent("", True)
+
+    def test_large_file_read_past_sniff_block(self, tmp_path):
+        """Test files larger than the sniffed block are read in full."""
+        path = tmp_path / "big.md"
+        text = "line\n" * (SNIFF_BYTES // 5 + 100)
+        path.write_text(text)
+
+        assert read_document_content(path).text == text
+
+    def test_memory_mapped_read(self, tmp_path):
+        """Test files above the mmap threshold decode identically via mmap."""
+        path = tmp_path / "big.md"
+        text = "ünïcode line\r\n" * (SNIFF_BYTES // 10)
+        path.write_bytes(text.encode("utf-8"))
+
+        with patch("drift.documents.content.mmap.mmap", wraps=__import__("mmap").mmap) as mapped:
+            result = read_document_content(path, mmap_threshold=SNIFF_BYTES)
+
+        mapped.assert_called_once()
+        assert result.text == text.replace("\r\n", "\n")
+        assert result.is_binary is False
+
+    def test_read_error_reported_in_text(self, tmp_path):
+        """Test read errors are returned as text rather than raised."""
+        result = read_document_content(tmp_path / "missing.md")
+
+        assert result.text.startswith("[Error reading file:")
+        assert result.is_binary is False
+
+    def test_permission_error_reported_in_text(self, tmp_path):
+        """Test unreadable files report the error rather than raising."""
+        path = tmp_path / "doc.md"
+        path.write_text("content")
+
+        with patch("pathlib.Path.open", side_effect=PermissionError("Access denied")):
+            result = read_document_content(path)
+
+        assert result.text == "[Error reading file: Access denied]"
+
+    def test_is_binary_data(self):
+        """Test the binary sniff only flags NUL bytes."""
+        assert is_binary_data(b"abc\x00def")
+        assert not is_binary_data("plain text ✓".encode("utf-8"))
+        assert not is_binary_data(b"")
+
+
+class TestLazyDocumentFile:
+    """Tests for DocumentFile content loading."""
+
+    def test_content_read_on_first_access(self, tmp_path):
+        """Test content is read from disk only when accessed, and only once."""
+        path = tmp_path / "doc.md"
+        path.write_text("hello")
+        document = DocumentFile(relative_path="doc.md", file_path=path)
+
+        with patch(
+            "drift.documents.content.read_document_content", wraps=read_document_content
+        ) as mock_read:
+            assert document.is_loaded is False
+            assert document.content == "hello"
+            assert document.content == "hello"
+
+        assert document.is_loaded is True
+        assert mock_read.call_count == 1
+
+    def test_explicit_content_is_not_read(self):
+        """Test content passed in is used without touching the file."""
+        document = DocumentFile(
+            relative_path="doc.md", file_path=Path("/nonexistent/doc.md"), content="given"
+        )
+
+        assert document.is_loaded is True
+        assert document.content == "given"
+        assert document.is_binary is False
+
+    def test_binary_file(self, tmp_path):
+        """Test binary files have empty content and are flagged."""
+        path = tmp_path / "archive.zip"
+        path.write_bytes(b"PK\x03\x04\x00\x00")
+        document = DocumentFile(relative_path="archive.zip", file_path=path)
+
+        assert document.content == ""
+        assert document.is_binary is True
+
+    def test_equality_ignores_load_state(self, tmp_path):
+        """Test a lazy and an eager document with the same content are equal."""
+        path = tmp_path / "doc.md"
+        path.write_text("same")
+
+        lazy = DocumentFile(relative_path="doc.md", file_path=path)
+        eager = DocumentFile(relative_path="doc.md", file_path=path, content="same")
+        other = DocumentFile(relative_path="doc.md", file_path=path, content="different")
+
+        assert lazy == eager
+        assert lazy != other
+
+    def test_model_dump_includes_content(self, tmp_path):
+        """Test serialized documents still carry their content."""
+        path = tmp_path / "doc.md"
+        path.write_text("dumped")
+        document = DocumentFile(relative_path="doc.md", file_path=path)
+
+        assert document.model_dump()["content"] == "dumped"
+
+    @pytest.mark.parametrize("rel_path", ["a.md", "docs/b.md"])
+    def test_loader_does_not_read_files(self, tmp_path, rel_path):
+        """Test loading bundles discovers files without reading them."""
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("content")
+        config = DocumentBundleConfig(
+            bundle_type="docs",
+            file_patterns=["**/*.md"],
+            bundle_strategy=BundleStrategy.COLLECTION,
+        )
+
+        bundles = DocumentLoader(tmp_path).load_bundles(config)
+
+        assert [file.is_loaded for file in bundles[0].files] == [False]
+        assert bundles[0].files[0].content == "content"
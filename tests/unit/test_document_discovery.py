@@ -0,0 +1,404 @@
+"""Unit tests for ignore-aware document discovery."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from drift.config.models import (
+    BundleStrategy,
+    DiscoveryConfig,
+    DocumentBundleConfig,
+    DriftConfig,
+    RuleDefinition,
+    ValidationRule,
+    ValidationRulesConfig,
+)
+from drift.core.analyzer import DriftAnalyzer
+from drift.documents.content import read_document_content
+from drift.documents.discovery import DiscoveryFilter, FileDiscovery, GitIgnoreMatcher, glob_files
+from drift.documents.loader import DocumentLoader
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project with dependency and build directories."""
+    files = [
+        "README.md",
+        "docs/guide.md",
+        "docs/api/v1.md",
+        "docs/draft.tmp.md",
+        "node_modules/pkg/README.md",
+        "node_modules/pkg/docs/index.md",
+        ".venv/lib/site.md",
+        "build/out.md",
+        "build/keep.md",
+        ".claude/skills/alpha/SKILL.md",
+        ".claude/skills/alpha/notes.md",
+        ".claude/skills/alpha/vendor/lib.md",
+    ]
+    for rel_path in files:
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel_path)
+    return tmp_path
+
+
+def _relative(paths, root):
+    """Sort paths as POSIX strings relative to root."""
+    return sorted(path.relative_to(root).as_posix() for path in paths)
+
+
+class TestGlobFiles:
+    """Tests for glob_files."""
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "*.md",
+            "**/*.md",
+            "docs/**/*.md",
+            "**/pkg/*.md",
+            ".claude/skills/*/SKILL.md",
+            "docs/*",
+            "docs/**",
+            "build/out.md",
+            "missing/*.md",
+        ],
+    )
+    def test_matches_pathlib(self, project, pattern):
+        """Test results agree with Path.glob() for files."""
+        expected = sorted(path for path in project.glob(pattern) if path.is_file())
+
+        assert sorted(glob_files(project, pattern)) == expected
+
+    def test_does_not_follow_symlinks_for_double_star(self, project, tmp_path_factory):
+        """Test "**" does not recurse through symlinked directories, like Path.glob()."""
+        target = tmp_path_factory.mktemp("shared")
+        (target / "shared.md").write_text("x")
+        (project / "linked").symlink_to(target, target_is_directory=True)
+
+        assert "linked/shared.md" not in _relative(glob_files(project, "**/*.md"), project)
+        assert _relative(glob_files(project, "linked/*.md"), project) == ["linked/shared.md"]
+
+    def test_ignored_directories_are_not_walked(self, project):
+        """Test directories ignored as a whole are never listed."""
+        discovery_filter = DiscoveryFilter([["node_modules/**", ".venv/**"]])
+
+        with patch("drift.documents.discovery.os.scandir", wraps=os.scandir) as mock_scandir:
+            found = glob_files(project, "**/*.md", project, discovery_filter)
+
+        walked = {Path(call.args[0]).name for call in mock_scandir.call_args_list}
+        assert not walked & {"node_modules", "pkg", ".venv", "lib"}
+        assert "node_modules/pkg/README.md" not in _relative(found, project)
+        assert "docs/api/v1.md" in _relative(found, project)
+
+    def test_ignore_rules_relative_to_project_root(self, project):
+        """Test ignore rules see project-relative paths when globbing from a subdirectory."""
+        discovery_filter = DiscoveryFilter([[".claude/skills/*/vendor/**"]])
+        skill_dir = project / ".claude" / "skills" / "alpha"
+
+        found = glob_files(skill_dir, "**/*.md", project, discovery_filter)
+
+        assert _relative(found, skill_dir) == ["SKILL.md", "notes.md"]
+
+
+class TestFileDiscovery:
+    """Tests for the per-run discovery engine."""
+
+    def test_each_directory_listed_once(self, project):
+        """Test patterns, bundles and resources share one listing per directory."""
+        discovery = FileDiscovery()
+
+        with patch("drift.documents.discovery.os.scandir", wraps=os.scandir) as mock_scandir:
+            discovery.glob(project, ["**/*.md", "docs/*.md", "**/SKILL.md"])
+            discovery.glob(project, ["docs/**/*.md", "README.md"])
+            discovery.glob(project / ".claude" / "skills" / "alpha", ["**/*.md"], project)
+
+        listed = [call.args[0] for call in mock_scandir.call_args_list]
+        assert len(listed) == len(set(listed))
+
+    def test_multiple_patterns_single_walk(self, project):
+        """Test several patterns are matched during one walk, without duplicates."""
+        discovery = FileDiscovery()
+
+        found = discovery.glob(project, ["docs/*.md", "**/guide.md", "docs/api/*.md"])
+
+        assert _relative(found, project) == [
+            "docs/api/v1.md",
+            "docs/draft.tmp.md",
+            "docs/guide.md",
+        ]
+
+    def test_literal_component_resolved_to_disk_casing(self, project):
+        """Test a literal name that only differs in case resolves on case-insensitive disks."""
+        skill_dir = project / ".claude" / "skills" / "alpha"
+        discovery = FileDiscovery()
+
+        # Case-sensitive filesystem: no match for a differently-cased name
+        assert discovery.glob(skill_dir, ["skill.md"]) == []
+
+        with patch("drift.documents.discovery.os.path.exists", return_value=True):
+            found = FileDiscovery().glob(skill_dir, ["skill.md", "SKILL.md"])
+
+        assert found == [skill_dir / "SKILL.md"]
+
+    def test_unreadable_directory_skipped(self, project):
+        """Test directories that cannot be listed are skipped."""
+        assert FileDiscovery().glob(project / "missing", ["*.md"]) == []
+
+
+class TestDiscoveryFilter:
+    """Tests for DiscoveryFilter."""
+
+    def test_file_skipped_only_when_every_rule_ignores_it(self):
+        """Test pattern lists from several rules are intersected."""
+        discovery_filter = DiscoveryFilter([["*.tmp.md", "build/**"], ["build/**"]])
+
+        assert discovery_filter.skips_file("build/out.md")
+        assert not discovery_filter.skips_file("docs/draft.tmp.md")
+
+    def test_rule_without_patterns_disables_filtering(self):
+        """Test a rule that ignores nothing keeps every file."""
+        discovery_filter = DiscoveryFilter([["build/**"], []])
+
+        assert not discovery_filter
+        assert not discovery_filter.skips_file("build/out.md")
+
+    def test_directories_pruned_only_for_subtree_patterns(self):
+        """Test only globs ending in "**" prune directories."""
+        discovery_filter = DiscoveryFilter([["node_modules/**", "*.md", r"^build/"]])
+
+        assert discovery_filter.skips_dir("node_modules")
+        assert discovery_filter.skips_dir("web/node_modules/pkg")
+        assert not discovery_filter.skips_dir("docs")
+        assert not discovery_filter.skips_dir("build")
+        assert discovery_filter.skips_file("build/out.md")
+
+    def test_invalid_regex_raises(self):
+        """Test invalid regex patterns are reported."""
+        with pytest.raises(ValueError, match="Invalid regex pattern"):
+            DiscoveryFilter([[r"(unclosed\)"]])
+
+
+class TestGitIgnoreMatcher:
+    """Tests for GitIgnoreMatcher."""
+
+    @pytest.mark.parametrize(
+        "rel_path,is_dir,expected",
+        [
+            ("debug.log", False, True),
+            ("logs/debug.log", False, True),
+            ("important.log", False, False),
+            ("build", True, True),
+            ("build", False, False),
+            ("src/build", True, True),
+            ("dist", True, True),
+            ("src/dist", True, False),
+            ("cache", True, False),
+            ("cache/data.bin", False, True),
+            ("README.md", False, False),
+            (".git", True, True),
+            ("secret.txt", False, True),
+        ],
+    )
+    def test_root_rules(self, tmp_path, rel_path, is_dir, expected):
+        """Test unanchored, anchored, directory-only and negated patterns."""
+        (tmp_path / ".gitignore").write_text(
+            "# comment\n\n*.log\n!important.log\nbuild/\n/dist\ncache/**\n"
+        )
+        (tmp_path / ".git" / "info").mkdir(parents=True)
+        (tmp_path / ".git" / "info" / "exclude").write_text("secret.txt\n")
+
+        assert GitIgnoreMatcher(tmp_path).is_ignored(rel_path, is_dir) is expected
+
+    def test_nested_gitignore_takes_precedence(self, tmp_path):
+        """Test deeper .gitignore files override their parents."""
+        (tmp_path / ".gitignore").write_text("*.md\n")
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / ".gitignore").write_text("!*.md\ngenerated.md\n")
+        matcher = GitIgnoreMatcher(tmp_path)
+
+        assert matcher.is_ignored("README.md", False)
+        assert not matcher.is_ignored("docs/guide.md", False)
+        assert matcher.is_ignored("docs/generated.md", False)
+
+    def test_without_gitignore(self, tmp_path):
+        """Test nothing but .git is ignored without ignore files."""
+        matcher = GitIgnoreMatcher(tmp_path)
+
+        assert not matcher.is_ignored("README.md", False)
+        assert matcher.is_ignored(".git", True)
+
+
+class TestLoaderDiscovery:
+    """Tests for ignore rules applied by DocumentLoader."""
+
+    def _config(self, patterns, strategy=BundleStrategy.COLLECTION, resources=None):
+        """Build a bundle config."""
+        return DocumentBundleConfig(
+            bundle_type="doc",
+            file_patterns=patterns,
+            bundle_strategy=strategy,
+            resource_patterns=resources or [],
+        )
+
+    def test_ignored_files_never_read(self, project):
+        """Test skipped files are not opened."""
+        loader = DocumentLoader(project)
+
+        with patch(
+            "drift.documents.content.read_document_content", wraps=read_document_content
+        ) as mock_read:
+            bundles = loader.load_bundles(
+                self._config(["**/*.md"]),
+                ignore_pattern_sets=[["node_modules/**", ".venv/**", "build/**"]],
+            )
+            for file in bundles[0].files:
+                file.content
+
+        read_paths = [
+            call.args[0].relative_to(project).as_posix() for call in mock_read.call_args_list
+        ]
+        loaded = sorted(file.relative_path for file in bundles[0].files)
+        assert loaded == sorted(read_paths)
+        assert not any(path.startswith(("node_modules/", ".venv/", "build/")) for path in loaded)
+        assert "docs/guide.md" in loaded
+
+    def test_resources_filtered(self, project):
+        """Test resource discovery applies the same ignore rules."""
+        loader = DocumentLoader(project)
+
+        bundles = loader.load_bundles(
+            self._config(
+                [".claude/skills/*/SKILL.md"], BundleStrategy.INDIVIDUAL, resources=["**/*.md"]
+            ),
+            ignore_pattern_sets=[["**/vendor/**"]],
+        )
+
+        assert [file.relative_path for file in bundles[0].files] == [
+            ".claude/skills/alpha/SKILL.md",
+            ".claude/skills/alpha/notes.md",
+        ]
+
+    def test_large_directory_without_per_file_listing(self, tmp_path):
+        """Test discovery does not list a directory again for every file found."""
+        for index in range(300):
+            (tmp_path / f"doc{index}.md").write_text("x")
+        loader = DocumentLoader(tmp_path)
+
+        with patch.object(Path, "iterdir", side_effect=AssertionError("iterdir")), patch(
+            "drift.documents.discovery.os.scandir", wraps=os.scandir
+        ) as mock_scandir:
+            files = loader._discover_files(["*.md", "doc1*.md"])
+
+        assert len(files) == 300
+        assert mock_scandir.call_count == 1
+
+    def test_respect_gitignore(self, project):
+        """Test .gitignore mode skips ignored paths."""
+        (project / ".gitignore").write_text("node_modules/\n.venv/\nbuild/*\n!build/keep.md\n")
+        loader = DocumentLoader(project, respect_gitignore=True)
+
+        bundles = loader.load_bundles(self._config(["**/*.md"]))
+
+        loaded = [file.relative_path for file in bundles[0].files]
+        assert "build/keep.md" in loaded
+        assert "build/out.md" not in loaded
+        assert not any(path.startswith(("node_modules/", ".venv/")) for path in loaded)
+
+    def test_gitignore_disabled_by_default(self, project):
+        """Test .gitignore files are not consulted unless enabled."""
+        (project / ".gitignore").write_text("node_modules/\n")
+
+        bundles = DocumentLoader(project).load_bundles(self._config(["**/*.md"]))
+
+        assert "node_modules/pkg/README.md" in [file.relative_path for file in bundles[0].files]
+
+
+class TestAnalyzerDiscoveryPatterns:
+    """Tests for the ignore patterns the analyzer passes to discovery."""
+
+    def _rule(self, rule_type, params):
+        """Build a validation rule."""
+        return ValidationRule(
+            rule_type=rule_type,
+            description="Check",
+            params=params,
+            failure_message="Failed",
+            expected_behavior="Passes",
+        )
+
+    def _config(self, rules, **overrides):
+        """Build a config with one document rule."""
+        return DriftConfig(
+            rule_definitions={
+                "docs": RuleDefinition(
+                    description="Docs",
+                    scope="project_level",
+                    context="Docs matter",
+                    requires_project_context=True,
+                    validation_rules=ValidationRulesConfig(
+                        rules=rules,
+                        document_bundle=DocumentBundleConfig(
+                            bundle_type="doc",
+                            file_patterns=["**/*.md"],
+                            bundle_strategy=BundleStrategy.COLLECTION,
+                        ),
+                    ),
+                )
+            },
+            **overrides,
+        )
+
+    def test_merged_overrides_are_used(self, project):
+        """Test validator- and rule-level overrides feed discovery."""
+        config = self._config(
+            [
+                self._rule("core:regex_match", {"pattern": "x", "ignore_patterns": ["a/**"]}),
+                self._rule("core:token_count", {"max_count": 10}),
+            ],
+            validator_param_overrides={
+                "core:token_count": {"replace": {"ignore_patterns": ["node_modules/**"]}}
+            },
+            rule_param_overrides={"docs": {"merge": {"ignore_patterns": ["build/**"]}}},
+        )
+        analyzer = DriftAnalyzer(config=config, project_path=project)
+        rule_def = config.rule_definitions["docs"]
+
+        assert analyzer._discovery_ignore_patterns("docs", rule_def) == [
+            ["a/**", "build/**"],
+            ["node_modules/**", "build/**"],
+        ]
+
+    def test_rule_without_patterns_keeps_everything(self, project):
+        """Test one rule without ignore_patterns disables discovery filtering."""
+        config = self._config(
+            [
+                self._rule("core:regex_match", {"pattern": "x", "ignore_patterns": ["a/**"]}),
+                self._rule("core:token_count", {"max_count": 10}),
+            ]
+        )
+        analyzer = DriftAnalyzer(config=config, project_path=project)
+
+        assert analyzer._discovery_ignore_patterns("docs", config.rule_definitions["docs"]) == []
+
+    def test_analyze_documents_prunes_ignored_directories(self, project):
+        """Test a run never reads files every rule ignores."""
+        config = self._config(
+            [self._rule("core:regex_match", {"pattern": "node_modules"})],
+            validator_param_overrides={
+                "core:regex_match": {"replace": {"ignore_patterns": ["node_modules/**"]}}
+            },
+            discovery=DiscoveryConfig(respect_gitignore=True),
+        )
+        (project / ".gitignore").write_text(".venv/\n")
+
+        with patch("drift.documents.discovery.os.scandir", wraps=os.scandir) as mock_scandir:
+            result = DriftAnalyzer(config=config, project_path=project).analyze_documents()
+
+        walked = {Path(call.args[0]).name for call in mock_scandir.call_args_list}
+        assert "node_modules" not in walked
+        assert ".venv" not in walked
+        assert result.summary.total_rule_violations == 1
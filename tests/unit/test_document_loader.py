@@ -3,9 +3,20 @@
 from pathlib import Path
 from unittest.mock import patch
 
-from drift.config.models import BundleStrategy, DocumentBundleConfig
+import pytest
+
+from drift.config.models import (
+    BundleStrategy,
+    DocumentBundleConfig,
+    DriftConfig,
+    RuleDefinition,
+    ValidationRule,
+    ValidationRulesConfig,
+)
+from drift.core.analyzer import DriftAnalyzer
 from drift.core.types import DocumentBundle, DocumentFile
-from drift.documents.loader import DocumentLoader
+from drift.documents.content import read_document_content
+from drift.documents.loader import DocumentLoader, bundle_cache_key
 
 
 class TestDocumentLoader:
@@ -108,53 +119,6 @@ class TestDocumentLoader:
         assert files[1].name == "middle.md"
         assert files[2].name == "zebra.md"
 
-    def test_load_file_content_utf8(self, temp_dir):
-        """Test loading file with UTF-8 encoding."""
-        test_file = temp_dir / "test.txt"
-        test_content = "Hello, 世界! 🌍"
-        test_file.write_text(test_content, encoding="utf-8")
-
-        loader = DocumentLoader(project_path=temp_dir)
-        content = loader._load_file_content(test_file)
-
-        assert content == test_content
-
-    def test_load_file_content_latin1_fallback(self, temp_dir):
-        """Test loading file falls back to latin-1 on UTF-8 error."""
-        test_file = temp_dir / "test.txt"
-        # Write with latin-1 encoding
-        test_content = "Café résumé"
-        test_file.write_text(test_content, encoding="latin-1")
-
-        loader = DocumentLoader(project_path=temp_dir)
-        content = loader._load_file_content(test_file)
-
-        # Should successfully read the file
-        assert isinstance(content, str)
-        assert len(content) > 0
-
-    def test_load_file_content_handles_permission_error(self, temp_dir):
-        """Test loading file handles permission errors gracefully."""
-        test_file = temp_dir / "test.txt"
-        test_file.write_text("content")
-
-        loader = DocumentLoader(project_path=temp_dir)
-
-        with patch("pathlib.Path.read_text", side_effect=PermissionError("Access denied")):
-            content = loader._load_file_content(test_file)
-
-        assert "[Error reading file:" in content
-        assert "Access denied" in content
-
-    def test_load_file_content_handles_missing_file(self, temp_dir):
-        """Test loading file handles missing file error."""
-        test_file = temp_dir / "nonexistent.txt"
-
-        loader = DocumentLoader(project_path=temp_dir)
-        content = loader._load_file_content(test_file)
-
-        assert "[Error reading file:" in content
-
     def test_create_document_file(self, temp_dir):
         """Test creating DocumentFile object."""
         test_file = temp_dir / "subdir" / "test.md"
@@ -461,3 +425,130 @@ class TestDocumentLoader:
         # IDs should be MD5 hashes (12 chars)
         assert len(id1) == 12
         assert len(id4) == 12
+
+
+class TestBundleCache:
+    """Tests for per-loader bundle and document caching."""
+
+    @pytest.fixture
+    def skills(self, temp_dir):
+        """Create two skills with a resource each."""
+        for name in ("alpha", "beta"):
+            skill_dir = temp_dir / ".claude" / "skills" / name
+            skill_dir.mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text(f"# {name}")
+            (skill_dir / "notes.md").write_text("notes")
+        return temp_dir
+
+    def _config(self, file_patterns, resource_patterns=None, **overrides):
+        """Build an individual-strategy skill bundle config."""
+        values = {
+            "bundle_type": "skill",
+            "file_patterns": file_patterns,
+            "bundle_strategy": BundleStrategy.INDIVIDUAL,
+            "resource_patterns": resource_patterns or [],
+        }
+        values.update(overrides)
+        return DocumentBundleConfig(**values)
+
+    def test_cache_key_canonicalizes_patterns(self):
+        """Test pattern order, repeats and redundant components don't change the key."""
+        first = self._config([".claude/skills/*/SKILL.md", "docs/**/*.md"])
+        second = self._config(
+            ["./docs/**/**/*.md", ".claude/skills/*/SKILL.md", ".claude/skills/*/SKILL.md"]
+        )
+
+        assert bundle_cache_key(first) == bundle_cache_key(second)
+
+    def test_cache_key_distinguishes_configs(self):
+        """Test configs that load different bundles get different keys."""
+        base = self._config(["*.md"])
+
+        assert bundle_cache_key(base) != bundle_cache_key(self._config(["*.md"], ["*.py"]))
+        assert bundle_cache_key(base) != bundle_cache_key(self._config(["*.md"], bundle_type="doc"))
+        assert bundle_cache_key(base) != bundle_cache_key(
+            self._config(["*.md"], bundle_strategy=BundleStrategy.COLLECTION)
+        )
+        assert bundle_cache_key(base) != bundle_cache_key(base, [["build/**"]])
+
+    def test_cache_key_empty_ignore_set_disables_filtering(self):
+        """Test an empty ignore_patterns list keys like no filtering at all."""
+        config = self._config(["*.md"])
+
+        assert bundle_cache_key(config, [["build/**"], []]) == bundle_cache_key(config)
+        assert bundle_cache_key(config, [["a", "b"]]) == bundle_cache_key(config, [["b", "a"]])
+
+    def test_equivalent_configs_discover_once(self, skills):
+        """Test equivalent configs return the cached bundles without a new walk."""
+        loader = DocumentLoader(skills)
+        first = loader.load_bundles(self._config([".claude/skills/*/SKILL.md"]))
+
+        with patch.object(loader._discovery, "glob", wraps=loader._discovery.glob) as mock_glob:
+            second = loader.load_bundles(self._config(["./.claude/skills/*/SKILL.md"]))
+
+        mock_glob.assert_not_called()
+        assert second == first
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_returned_list_is_a_copy(self, skills):
+        """Test callers can't modify the cached bundle list."""
+        loader = DocumentLoader(skills)
+        config = self._config([".claude/skills/*/SKILL.md"])
+
+        loader.load_bundles(config).clear()
+
+        assert len(loader.load_bundles(config)) == 2
+
+    def test_overlapping_configs_share_documents(self, skills):
+        """Test distinct configs share the DocumentFile of common files."""
+        loader = DocumentLoader(skills)
+        with_resources = loader.load_bundles(self._config([".claude/skills/*/SKILL.md"], ["*.md"]))
+        collection = loader.load_bundles(
+            self._config([".claude/skills/**/*.md"], bundle_strategy=BundleStrategy.COLLECTION)
+        )
+
+        individual_files = {
+            file.relative_path: file for bundle in with_resources for file in bundle.files
+        }
+        assert len(individual_files) == 4
+        for file in collection[0].files:
+            assert file is individual_files[file.relative_path]
+
+    def test_analyzer_reads_shared_files_once(self, skills):
+        """Test rule definitions with the same bundle config read each file once per run."""
+
+        def rule_definition(pattern):
+            return RuleDefinition(
+                description="Skill check",
+                scope="project_level",
+                context="Skills matter",
+                requires_project_context=True,
+                validation_rules=ValidationRulesConfig(
+                    rules=[
+                        ValidationRule(
+                            rule_type="core:regex_match",
+                            description="Has heading",
+                            params={"pattern": pattern},
+                            failure_message="Missing",
+                            expected_behavior="Present",
+                        )
+                    ],
+                    document_bundle=self._config([".claude/skills/*/SKILL.md"]),
+                ),
+            )
+
+        config = DriftConfig(
+            rule_definitions={
+                "heading": rule_definition("^# "),
+                "name": rule_definition("alpha|beta"),
+            }
+        )
+
+        with patch(
+            "drift.documents.content.read_document_content", wraps=read_document_content
+        ) as mock_read:
+            DriftAnalyzer(config=config, project_path=skills).analyze_documents()
+
+        read_paths = [call.args[0] for call in mock_read.call_args_list]
+        assert len(read_paths) == 2
+        assert len(set(read_paths)) == 2
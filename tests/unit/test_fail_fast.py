@@ -0,0 +1,291 @@
+"""Unit tests for stopping analysis at the first failing rule (--fail-fast)."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from drift.cli.commands.analyze import _merge_results
+from drift.cli.main import main
+from drift.config.loader import ConfigLoader
+from drift.config.models import (
+    BundleStrategy,
+    DocumentBundleConfig,
+    DriftConfig,
+    ParallelExecutionConfig,
+    PhaseDefinition,
+    RuleDefinition,
+    SeverityLevel,
+    ValidationRule,
+    ValidationRulesConfig,
+)
+from drift.core.analyzer import DriftAnalyzer
+from drift.core.types import AnalysisEventKind, AnalysisSummary, CompleteAnalysisResult
+from tests.test_utils import CliRunner
+
+
+def _bundle_config(bundle_strategy=BundleStrategy.COLLECTION):
+    """Build a bundle of the project's Markdown files."""
+    return DocumentBundleConfig(
+        bundle_type="docs", bundle_strategy=bundle_strategy, file_patterns=["*.md"]
+    )
+
+
+def _exists(file_path):
+    """Build a validation rule checking that a file exists."""
+    return ValidationRule(
+        rule_type="core:file_exists",
+        description=f"Check {file_path} exists",
+        file_path=file_path,
+        failure_message=f"{file_path} is missing",
+        expected_behavior=f"{file_path} should exist",
+    )
+
+
+def _rule(*file_paths, severity=None, bundle_strategy=BundleStrategy.COLLECTION):
+    """Build a programmatic rule checking that files exist."""
+    return RuleDefinition(
+        description="Project has required files",
+        scope="project_level",
+        context="Test rule",
+        requires_project_context=False,
+        severity=severity,
+        validation_rules=ValidationRulesConfig(
+            document_bundle=_bundle_config(bundle_strategy),
+            rules=[_exists(file_path) for file_path in file_paths],
+        ),
+    )
+
+
+def _llm_rule():
+    """Build a rule checked by a model."""
+    return RuleDefinition(
+        description="Docs are clear",
+        scope="project_level",
+        context="Test rule",
+        requires_project_context=False,
+        document_bundle=_bundle_config(),
+        phases=[PhaseDefinition(name="review", type="prompt", prompt="Review the docs")],
+    )
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project with a README and two Markdown files."""
+    (tmp_path / "README.md").write_text("# Project\n")
+    (tmp_path / "a.md").write_text("# A\n")
+    (tmp_path / "b.md").write_text("# B\n")
+    return tmp_path
+
+
+def _analyzer(project, parallel=True, **rules):
+    """Create an analyzer for the given rules."""
+    config = DriftConfig(
+        rule_definitions=rules,
+        parallel_execution=ParallelExecutionConfig(enabled=parallel),
+    )
+    return DriftAnalyzer(config=config, project_path=project)
+
+
+class TestFailFastDocuments:
+    """Tests for analyze_documents(fail_fast=True)."""
+
+    def test_stops_at_first_failing_rule(self, project):
+        """Test rules after the first failing one are not checked."""
+        analyzer = _analyzer(
+            project,
+            has_readme=_rule("README.md"),
+            has_changelog=_rule("CHANGELOG.md"),
+            has_license=_rule("LICENSE"),
+        )
+
+        result = analyzer.analyze_documents(fail_fast=True)
+
+        assert result.metadata["partial"] == {"reason": "fail_fast", "rule": "has_changelog"}
+        assert result.summary.rules_checked == ["has_readme", "has_changelog"]
+        assert result.summary.rules_failed == ["has_changelog"]
+        assert result.summary.total_rule_violations == 1
+        ran = {detail["rule_name"] for detail in result.metadata["execution_details"]}
+        assert "has_license" not in ran
+
+    def test_stops_between_bundles(self, project):
+        """Test an individual rule stops after its first failing bundle."""
+        analyzer = _analyzer(
+            project, has_changelog=_rule("CHANGELOG.md", bundle_strategy=BundleStrategy.INDIVIDUAL)
+        )
+
+        full = analyzer.analyze_documents()
+        stopped = analyzer.analyze_documents(fail_fast=True)
+
+        assert full.summary.total_rule_violations == 3
+        assert stopped.summary.total_rule_violations == 1
+        assert stopped.summary.total_checks == 1
+
+    def test_warnings_do_not_stop(self, project):
+        """Test violations of warning-severity rules keep the run going."""
+        analyzer = _analyzer(
+            project,
+            has_changelog=_rule("CHANGELOG.md", severity=SeverityLevel.WARNING),
+            has_license=_rule("LICENSE"),
+        )
+
+        result = analyzer.analyze_documents(fail_fast=True)
+
+        assert result.metadata["partial"]["rule"] == "has_license"
+        assert result.summary.rules_warned == ["has_changelog"]
+
+    def test_complete_run_is_not_partial(self, project):
+        """Test a run without failures is the same as without fail_fast."""
+        analyzer = _analyzer(project, has_readme=_rule("README.md"))
+
+        result = analyzer.analyze_documents(fail_fast=True)
+
+        assert "partial" not in result.metadata
+        assert result.summary == analyzer.analyze_documents().summary
+
+    def test_programmatic_rules_run_first(self, project):
+        """Test a failing programmatic rule stops the run before model-checked rules."""
+        analyzer = _analyzer(project, docs_clear=_llm_rule(), has_license=_rule("LICENSE"))
+
+        with patch.object(
+            DriftAnalyzer, "_analyze_document_bundle", autospec=True, return_value=([], [])
+        ) as analyze_bundle:
+            analyzer.analyze_documents()
+        assert [call.args[2] for call in analyze_bundle.call_args_list] == [
+            "docs_clear",
+            "has_license",
+        ]
+
+        with patch.object(
+            DriftAnalyzer, "_analyze_document_bundle", wraps=analyzer._analyze_document_bundle
+        ) as analyze_bundle:
+            result = analyzer.analyze_documents(fail_fast=True)
+
+        assert [call.args[1] for call in analyze_bundle.call_args_list] == ["has_license"]
+        assert result.metadata["partial"]["rule"] == "has_license"
+
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_stops_within_bundle(self, project, parallel):
+        """Test the validation rules of a bundle stop at the first failure."""
+        analyzer = _analyzer(
+            project, parallel=parallel, has_files=_rule("MISSING.md", "OTHER.md", "README.md")
+        )
+
+        with patch(
+            "drift.core.analyzer.DriftAnalyzer._gather_until_failure",
+            wraps=DriftAnalyzer._gather_until_failure,
+        ) as gather:
+            result = analyzer.analyze_documents(fail_fast=True)
+
+        assert result.summary.total_rule_violations == 1
+        assert gather.called == parallel
+        if not parallel:
+            # Sequential runs stop right after the first rule
+            assert result.summary.total_checks == 1
+
+    def test_iter_results(self, project):
+        """Test streamed runs end with a partial summary."""
+        analyzer = _analyzer(
+            project, has_changelog=_rule("CHANGELOG.md"), has_license=_rule("LICENSE")
+        )
+
+        events = list(analyzer.iter_results("project", fail_fast=True))
+
+        assert [event.kind for event in events] == [
+            AnalysisEventKind.EXECUTION,
+            AnalysisEventKind.VIOLATION,
+            AnalysisEventKind.SUMMARY,
+        ]
+        assert events[-1].result.metadata["partial"]["rule"] == "has_changelog"
+
+
+class TestGatherUntilFailure:
+    """Tests for cancelling pending validation rules."""
+
+    def test_cancels_pending_rules(self):
+        """Test rules still running at the first failure are cancelled and left out."""
+        cancelled = []
+
+        async def finish(delay, violation):
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(delay)
+                raise
+            return violation, {"delay": delay}
+
+        async def run():
+            return await DriftAnalyzer._gather_until_failure(
+                [finish(0, None), finish(0.01, "violation"), finish(10, None)]
+            )
+
+        results = asyncio.run(run())
+
+        assert results == [(None, {"delay": 0}), ("violation", {"delay": 0.01})]
+        assert cancelled == [10]
+
+    def test_keeps_errors(self):
+        """Test exceptions of finished rules are returned like asyncio.gather() does."""
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        async def passes():
+            return None, {}
+
+        async def run():
+            return await DriftAnalyzer._gather_until_failure([fail(), passes()])
+
+        results = asyncio.run(run())
+
+        assert isinstance(results[0], RuntimeError)
+        assert results[1] == (None, {})
+
+
+class TestFailFastCommand:
+    """Tests for drift --fail-fast."""
+
+    @pytest.fixture
+    def configured(self, project, tmp_path, monkeypatch):
+        """Write two failing rules into the project's .drift.yaml."""
+        monkeypatch.setattr(ConfigLoader, "GLOBAL_CONFIG_PATHS", [tmp_path / "global.yaml"])
+        rules = {
+            name: _rule(file_path).model_dump(mode="json", exclude_none=True)
+            for name, file_path in [("has_changelog", "CHANGELOG.md"), ("has_license", "LICENSE")]
+        }
+        (project / ".drift.yaml").write_text(json.dumps({"rule_definitions": rules}))
+        return project
+
+    def test_partial_json_result(self, configured):
+        """Test the run stops early, says so and still exits with code 2."""
+        result = CliRunner().invoke(
+            main,
+            ["--fail-fast", "--format", "json", "--scope", "project", "--project", str(configured)],
+        )
+
+        output = json.loads(result.stdout)
+        assert result.exit_code == 2
+        assert output["metadata"]["partial"]["rule"] == "has_changelog"
+        assert output["summary"]["total_rule_violations"] == 1
+        assert "--fail-fast" in result.stderr
+
+    def test_all_scope_skips_conversations(self, configured):
+        """Test a failing document rule stops --scope all before conversations."""
+        with patch.object(DriftAnalyzer, "analyze") as analyze:
+            result = CliRunner().invoke(
+                main, ["--fail-fast", "--scope", "all", "--project", str(configured)]
+            )
+
+        assert result.exit_code == 2
+        assert "Partial results" in result.stdout
+        analyze.assert_not_called()
+
+    def test_merge_keeps_partial_marker(self):
+        """Test merged results stay marked partial."""
+        conv = CompleteAnalysisResult(metadata={}, summary=AnalysisSummary())
+        doc = CompleteAnalysisResult(
+            metadata={"partial": {"reason": "fail_fast", "rule": "r"}}, summary=AnalysisSummary()
+        )
+
+        assert _merge_results(conv, doc).metadata["partial"]["rule"] == "r"
@@ -517,3 +517,35 @@ class TestFileSizeValidator:
         assert "specific.md" in result.file_paths
         assert "200 lines" in result.observed_issue
         assert "exceeds max 100" in result.observed_issue
+
+    def test_bundle_mode_byte_size_does_not_read_content(self, validator, tmp_path):
+        """Test byte-size constraints are checked without loading file content."""
+        small = tmp_path / "small.md"
+        large = tmp_path / "large.md"
+        small.write_text("x" * 10)
+        large.write_text("x" * 500)
+
+        bundle = DocumentBundle(
+            bundle_id="test",
+            bundle_type="skill",
+            bundle_strategy="collection",
+            project_path=tmp_path,
+            files=[
+                DocumentFile(relative_path="small.md", file_path=small),
+                DocumentFile(relative_path="large.md", file_path=large),
+            ],
+        )
+
+        rule = ValidationRule(
+            rule_type="core:file_size",
+            description="Check byte size",
+            params={"max_size": 100},
+            failure_message="File too large",
+            expected_behavior="Files should be under 100 bytes",
+        )
+
+        result = validator.validate(rule, bundle)
+
+        assert result is not None
+        assert result.file_paths == ["large.md"]
+        assert not any(file.is_loaded for file in bundle.files)
@@ -0,0 +1,259 @@
+"""Unit tests for git-index-backed file discovery."""
+
+import shutil
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from drift.config.models import (
+    BundleStrategy,
+    DiscoveryBackend,
+    DiscoveryConfig,
+    DocumentBundleConfig,
+    DriftConfig,
+    RuleDefinition,
+    ValidationRule,
+    ValidationRulesConfig,
+)
+from drift.core.analyzer import DriftAnalyzer
+from drift.documents.discovery import DiscoveryFilter, FileDiscovery
+from drift.documents.git_index import GitFileIndex
+from drift.documents.loader import DocumentLoader
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def _git(repo, *args):
+    """Run a git command in repo and return its stripped output."""
+    completed = subprocess.run(
+        ["git", "-C", str(repo), *args], capture_output=True, text=True, check=True
+    )
+    return completed.stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create a git repository with tracked, untracked and ignored files."""
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "dev@example.com")
+    _git(tmp_path, "config", "user.name", "Dev")
+    files = {
+        "README.md": "# Readme\n",
+        "docs/guide.md": "guide\n",
+        "docs/api/v1.md": "v1\n",
+        ".claude/skills/alpha/SKILL.md": "alpha\n",
+        ".claude/skills/alpha/scripts/run.py": "print()\n",
+        ".claude/skills/beta/SKILL.md": "beta\n",
+        ".gitignore": "build/\n",
+    }
+    for rel_path, content in files.items():
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+
+    (tmp_path / "notes.md").write_text("untracked\n")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "out.md").write_text("ignored\n")
+    return tmp_path
+
+
+class TestGitFileIndex:
+    """Tests for GitFileIndex."""
+
+    def test_load_outside_git_returns_none(self, tmp_path):
+        """Test directories outside a git working tree have no index."""
+        assert GitFileIndex.load(tmp_path) is None
+
+    def test_load_without_git_returns_none(self, repo):
+        """Test a missing git executable falls back to no index."""
+        with patch("drift.documents.git_index.subprocess.Popen", side_effect=FileNotFoundError):
+            assert GitFileIndex.load(repo) is None
+
+    def test_lists_tracked_and_untracked_not_ignored(self, repo):
+        """Test the index holds tracked and untracked files but not ignored ones."""
+        index = GitFileIndex.load(repo)
+
+        matches = index.glob(repo, ["**/*.md"])
+
+        rel_paths = [path.relative_to(repo).as_posix() for path in matches]
+        assert "notes.md" in rel_paths
+        assert "build/out.md" not in rel_paths
+        assert len(index) == 8
+
+    @pytest.mark.parametrize(
+        "patterns",
+        [
+            ["**/*.md"],
+            ["*.md"],
+            [".claude/skills/*/SKILL.md"],
+            ["docs/**/*.md", "README.md"],
+            ["docs/*", ".claude/**/*.py"],
+            ["./docs//api/*.md"],
+            ["missing/**/*.md"],
+        ],
+    )
+    def test_glob_matches_filesystem_discovery(self, repo, patterns):
+        """Test index globbing agrees with walking the filesystem for non-ignored files."""
+        index = GitFileIndex.load(repo)
+        gitignore_filter = DiscoveryFilter([["build/**"]])
+
+        expected = FileDiscovery().glob(repo, patterns, repo, gitignore_filter)
+
+        assert index.glob(repo, patterns) == expected
+
+    def test_glob_relative_to_subdirectory(self, repo):
+        """Test patterns are relative to base when base is below the project root."""
+        index = GitFileIndex.load(repo)
+        skill_dir = repo / ".claude" / "skills" / "alpha"
+
+        matches = index.glob(skill_dir, ["**/*"])
+
+        assert matches == [skill_dir / "SKILL.md", skill_dir / "scripts" / "run.py"]
+
+    def test_glob_applies_discovery_filter(self, repo):
+        """Test files and directories skipped by the filter are left out."""
+        index = GitFileIndex.load(repo)
+
+        matches = index.glob(repo, ["**/*.md"], DiscoveryFilter([["docs/**", "README.md"]]))
+
+        rel_paths = [path.relative_to(repo).as_posix() for path in matches]
+        assert rel_paths == [
+            ".claude/skills/alpha/SKILL.md",
+            ".claude/skills/beta/SKILL.md",
+            "notes.md",
+        ]
+
+    def test_glob_skips_deleted_files(self, repo):
+        """Test staged files deleted from the working tree are not returned."""
+        index = GitFileIndex.load(repo)
+        (repo / "docs" / "guide.md").unlink()
+
+        assert index.glob(repo, ["docs/*.md"]) == []
+
+    def test_glob_cannot_answer_outside_root_or_parent_patterns(self, repo, tmp_path_factory):
+        """Test the index declines queries it cannot answer."""
+        index = GitFileIndex.load(repo)
+
+        assert index.glob(tmp_path_factory.mktemp("elsewhere"), ["*.md"]) is None
+        assert index.glob(repo / "docs", ["../*.md"]) is None
+
+    def test_subdirectory_project(self, repo):
+        """Test a project below the repository root lists paths relative to itself."""
+        index = GitFileIndex.load(repo / "docs")
+
+        assert index.glob(repo / "docs", ["**/*.md"]) == [
+            repo / "docs" / "api" / "v1.md",
+            repo / "docs" / "guide.md",
+        ]
+
+    def test_fingerprint_is_blob_id_for_unmodified_files(self, repo):
+        """Test unmodified tracked files are fingerprinted with their blob id."""
+        index = GitFileIndex.load(repo)
+
+        fingerprint = index.fingerprint(repo / "README.md")
+
+        assert fingerprint == _git(repo, "hash-object", "README.md")
+
+    def test_fingerprint_missing_for_modified_and_untracked_files(self, repo):
+        """Test only files whose content matches the index get a fingerprint."""
+        (repo / "docs" / "guide.md").write_text("changed\n")
+        index = GitFileIndex.load(repo)
+
+        assert index.fingerprint(repo / "docs" / "guide.md") is None
+        assert index.fingerprint(repo / "notes.md") is None
+        assert index.fingerprint(repo / "docs" / "api" / "v1.md") is not None
+
+
+class TestLoaderGitBackend:
+    """Tests for DocumentLoader with the git discovery backend."""
+
+    def _config(self, patterns, resource_patterns=None):
+        """Build an individual-strategy bundle config."""
+        return DocumentBundleConfig(
+            bundle_type="skill",
+            file_patterns=patterns,
+            bundle_strategy=BundleStrategy.INDIVIDUAL,
+            resource_patterns=resource_patterns or [],
+        )
+
+    def test_loads_bundles_from_index_without_walking(self, repo):
+        """Test the git backend discovers files without listing directories."""
+        loader = DocumentLoader(repo, backend=DiscoveryBackend.GIT)
+
+        with patch("drift.documents.discovery.os.scandir") as mock_scandir:
+            bundles = loader.load_bundles(self._config([".claude/skills/*/SKILL.md"], ["**/*.py"]))
+
+        mock_scandir.assert_not_called()
+        assert [[file.relative_path for file in bundle.files] for bundle in bundles] == [
+            [".claude/skills/alpha/SKILL.md", ".claude/skills/alpha/scripts/run.py"],
+            [".claude/skills/beta/SKILL.md"],
+        ]
+
+    def test_documents_carry_blob_fingerprints(self, repo):
+        """Test loaded documents are fingerprinted with their blob ids."""
+        loader = DocumentLoader(repo, backend=DiscoveryBackend.GIT)
+
+        bundles = loader.load_bundles(self._config(["*.md"]))
+
+        fingerprints = {
+            bundle.files[0].relative_path: bundle.files[0].fingerprint for bundle in bundles
+        }
+        assert fingerprints == {
+            "README.md": _git(repo, "hash-object", "README.md"),
+            "notes.md": None,
+        }
+        assert not any(bundle.files[0].is_loaded for bundle in bundles)
+
+    def test_falls_back_to_filesystem_outside_git(self, tmp_path):
+        """Test the git backend walks the filesystem when there is no repository."""
+        (tmp_path / "a.md").write_text("a")
+        loader = DocumentLoader(tmp_path, backend="git")
+
+        bundles = loader.load_bundles(self._config(["*.md"]))
+
+        assert [bundle.files[0].relative_path for bundle in bundles] == ["a.md"]
+        assert bundles[0].files[0].fingerprint is None
+
+    def test_filesystem_backend_does_not_run_git(self, repo):
+        """Test the default backend never calls git."""
+        loader = DocumentLoader(repo)
+
+        with patch("drift.documents.git_index.subprocess.Popen") as mock_run:
+            loader.load_bundles(self._config(["*.md"]))
+
+        mock_run.assert_not_called()
+
+    def test_analyzer_uses_configured_backend(self, repo):
+        """Test the discovery.backend setting reaches the document loader."""
+        config = DriftConfig(
+            rule_definitions={
+                "skills": RuleDefinition(
+                    description="Skills",
+                    scope="project_level",
+                    context="Skills matter",
+                    requires_project_context=True,
+                    validation_rules=ValidationRulesConfig(
+                        rules=[
+                            ValidationRule(
+                                rule_type="core:file_size",
+                                description="Small skills",
+                                params={"max_size": 1000},
+                                failure_message="Too large",
+                                expected_behavior="Small",
+                            )
+                        ],
+                        document_bundle=self._config([".claude/skills/*/SKILL.md"]),
+                    ),
+                )
+            },
+            discovery=DiscoveryConfig(backend="git"),
+        )
+        analyzer = DriftAnalyzer(config=config, project_path=repo)
+
+        with patch("drift.core.analyzer.DocumentLoader", wraps=DocumentLoader) as mock_loader:
+            analyzer.analyze_documents()
+
+        assert mock_loader.call_args.kwargs["backend"] == DiscoveryBackend.GIT
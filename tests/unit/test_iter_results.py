@@ -0,0 +1,203 @@
+"""Unit tests for streamed analysis results and the NDJSON output format."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from drift.cli.main import main
+from drift.cli.output.ndjson import NdjsonFormatter
+from drift.config.loader import ConfigLoader
+from drift.config.models import (
+    BundleStrategy,
+    DocumentBundleConfig,
+    DriftConfig,
+    RuleDefinition,
+    ValidationRule,
+    ValidationRulesConfig,
+)
+from drift.core.analyzer import DriftAnalyzer
+from drift.core.types import AnalysisEventKind
+from tests.test_utils import CliRunner
+
+
+def _rule(file_path, bundle_strategy=BundleStrategy.COLLECTION):
+    """Build a programmatic rule checking that a file exists."""
+    return RuleDefinition(
+        description=f"Project has {file_path}",
+        scope="project_level",
+        context="Test rule",
+        requires_project_context=False,
+        validation_rules=ValidationRulesConfig(
+            document_bundle=DocumentBundleConfig(
+                bundle_type="docs",
+                bundle_strategy=bundle_strategy,
+                file_patterns=["*.md"],
+            ),
+            rules=[
+                ValidationRule(
+                    rule_type="core:file_exists",
+                    description=f"Check {file_path} exists",
+                    file_path=file_path,
+                    failure_message=f"{file_path} is missing",
+                    expected_behavior=f"{file_path} should exist",
+                )
+            ],
+        ),
+    )
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project with a README and two Markdown files."""
+    (tmp_path / "README.md").write_text("# Project\n")
+    (tmp_path / "a.md").write_text("# A\n")
+    (tmp_path / "b.md").write_text("# B\n")
+    return tmp_path
+
+
+@pytest.fixture
+def analyzer(project):
+    """Create an analyzer with one passing and one failing rule."""
+    config = DriftConfig(
+        rule_definitions={
+            "has_readme": _rule("README.md"),
+            "has_changelog": _rule("CHANGELOG.md", BundleStrategy.INDIVIDUAL),
+        }
+    )
+    return DriftAnalyzer(config=config, project_path=project)
+
+
+class TestIterResults:
+    """Tests for DriftAnalyzer.iter_results()."""
+
+    def test_records_then_summary(self, analyzer):
+        """Test every check and violation is streamed before one closing summary."""
+        events = list(analyzer.iter_results("project"))
+
+        kinds = [event.kind for event in events]
+        assert kinds[-1] == AnalysisEventKind.SUMMARY
+        assert kinds.count(AnalysisEventKind.SUMMARY) == 1
+        executions = [e.execution for e in events if e.kind == AnalysisEventKind.EXECUTION]
+        violations = [e.rule for e in events if e.kind == AnalysisEventKind.VIOLATION]
+        assert {detail["rule_name"] for detail in executions} == {"has_readme", "has_changelog"}
+        # The individual rule runs once per Markdown file and fails each time
+        assert len(violations) == 3
+        assert {violation.rule_type for violation in violations} == {"has_changelog"}
+
+    def test_summary_matches_analyze_documents(self, analyzer):
+        """Test the streamed summary equals the buffered run's summary."""
+        expected = analyzer.analyze_documents()
+
+        summary = list(analyzer.iter_results("project"))[-1].result
+
+        assert summary.summary == expected.summary
+        assert "execution_details" not in summary.metadata
+        assert "document_rules" not in summary.metadata
+        assert summary.results == []
+
+    def test_records_match_analyze_documents(self, analyzer):
+        """Test the streamed records are the buffered run's details and violations."""
+        expected = analyzer.analyze_documents()
+
+        events = list(analyzer.iter_results("project"))
+
+        executions = [e.execution for e in events if e.kind == AnalysisEventKind.EXECUTION]
+        violations = [e.rule for e in events if e.kind == AnalysisEventKind.VIOLATION]
+        assert executions == expected.metadata["execution_details"]
+        assert violations == [rule for result in expected.results for rule in result.rules]
+
+    def test_stopping_early_stops_analysis(self, analyzer):
+        """Test closing the iterator after the first record checks no further bundles."""
+        checked = []
+        iter_bundles = analyzer._iter_document_bundles
+
+        def counting_bundles(*args, **kwargs):
+            for item in iter_bundles(*args, **kwargs):
+                checked.append(item)
+                yield item
+
+        with patch.object(analyzer, "_iter_document_bundles", counting_bundles):
+            events = analyzer.iter_results("project")
+            first = next(events)
+            events.close()
+            total = len(checked)
+            checked.clear()
+            list(analyzer.iter_results("project"))
+
+        assert first.kind in (AnalysisEventKind.EXECUTION, AnalysisEventKind.VIOLATION)
+        assert total == 1
+        assert len(checked) > total
+
+    def test_conversation_scope(self, project):
+        """Test the conversation scope ends with the same summary as analyze()."""
+        analyzer = DriftAnalyzer(config=DriftConfig(), project_path=project)
+
+        events = list(analyzer.iter_results("conversation"))
+
+        assert events[-1].kind == AnalysisEventKind.SUMMARY
+        assert events[-1].result.summary == analyzer.analyze().summary
+
+    def test_unknown_scope(self, analyzer):
+        """Test an unknown scope is rejected."""
+        with pytest.raises(ValueError, match="Unknown scope"):
+            list(analyzer.iter_results("everything"))
+
+
+class TestNdjsonFormatter:
+    """Tests for NdjsonFormatter."""
+
+    def test_format_matches_streamed_records(self, analyzer):
+        """Test formatting a finished result gives the same lines as streaming it."""
+        formatter = NdjsonFormatter()
+        streamed = [formatter.format_event(event) for event in analyzer.iter_results("project")]
+
+        formatted = formatter.format(analyzer.analyze_documents()).split("\n")
+
+        assert sorted(formatted[:-1]) == sorted(streamed[:-1])
+        assert json.loads(formatted[-1])["total_checks"] == json.loads(streamed[-1])["total_checks"]
+
+    def test_record_types(self, analyzer):
+        """Test each line is one JSON object tagged with its record type."""
+        lines = NdjsonFormatter().format(analyzer.analyze_documents()).split("\n")
+
+        records = [json.loads(line) for line in lines]
+        assert {record["type"] for record in records[:-1]} == {"execution", "violation"}
+        assert records[-1]["type"] == "summary"
+        assert records[-1]["total_rule_violations"] == 3
+        violation = next(record for record in records if record["type"] == "violation")
+        assert violation["rule_type"] == "has_changelog"
+        assert violation["bundle_id"]
+
+    def test_format_name(self):
+        """Test the format name."""
+        assert NdjsonFormatter().get_format_name() == "ndjson"
+
+
+class TestNdjsonCommand:
+    """Tests for drift --format ndjson."""
+
+    def test_streams_records(self, project, tmp_path, monkeypatch):
+        """Test the command prints one JSON record per line, ending with the summary."""
+        monkeypatch.setattr(ConfigLoader, "GLOBAL_CONFIG_PATHS", [tmp_path / "global.yaml"])
+        (project / ".drift.yaml").write_text(
+            json.dumps(
+                {
+                    "rule_definitions": {
+                        "has_changelog": _rule("CHANGELOG.md").model_dump(
+                            mode="json", exclude_none=True
+                        )
+                    }
+                }
+            )
+        )
+
+        result = CliRunner().invoke(
+            main,
+            ["--format", "ndjson", "--scope", "project", "--project", str(project)],
+        )
+
+        records = [json.loads(line) for line in result.stdout.splitlines() if line]
+        assert result.exit_code == 2
+        assert [record["type"] for record in records] == ["execution", "violation", "summary"]
+        assert records[-1]["total_rule_violations"] == 1
@@ -1,11 +1,12 @@
 """Unit tests for link validation."""
 
+import re
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
 
-from drift.utils.link_validator import LinkValidator
+from drift.utils.link_validator import FileReference, LinkValidator
 
 
 class TestLinkValidator:
@@ -123,7 +124,7 @@ Some text
         # Directories should be considered valid (changed to support directory links)
         assert is_valid is True
 
-    @patch("drift.utils.link_validator.requests.head")
+    @patch("requests.head")
     def test_validate_external_url_success(self, mock_head, validator):
         """Test validating successful external URL."""
         mock_response = Mock()
@@ -135,7 +136,7 @@ Some text
         assert is_valid is True
         mock_head.assert_called_once()
 
-    @patch("drift.utils.link_validator.requests.head")
+    @patch("requests.head")
     def test_validate_external_url_not_found(self, mock_head, validator):
         """Test validating URL that returns 404."""
         mock_response = Mock()
@@ -146,7 +147,7 @@ Some text
 
         assert is_valid is False
 
-    @patch("drift.utils.link_validator.requests.head")
+    @patch("requests.head")
     def test_validate_external_url_timeout(self, mock_head, validator):
         """Test handling URL timeout."""
         mock_head.side_effect = requests.Timeout()
@@ -155,7 +156,7 @@ Some text
 
         assert is_valid is False
 
-    @patch("drift.utils.link_validator.requests.head")
+    @patch("requests.head")
     def test_validate_external_url_connection_error(self, mock_head, validator):
         """Test handling connection error."""
         mock_head.side_effect = requests.ConnectionError()
@@ -164,7 +165,7 @@ Some text
 
         assert is_valid is False
 
-    @patch("drift.utils.link_validator.requests.head")
+    @patch("requests.head")
     def test_validate_external_url_redirect(self, mock_head, validator):
         """Test URL with redirect."""
         mock_response = Mock()
@@ -1281,3 +1282,84 @@ path/to/placeholder.py
         refs3 = v3.extract_all_file_references(content)
         assert "http://example.com" in refs3
         assert "path/to/placeholder.py" not in refs3
+
+
+class TestScanFileReferences:
+    """Test the single-pass reference scanner."""
+
+    def test_positions(self):
+        """Test references carry 1-based line and column positions."""
+        validator = LinkValidator()
+        content = "# Title\n\nSee [guide](docs/guide.md) and ./run.sh\nEdit config.yaml"
+
+        refs = validator.scan_file_references(content)
+
+        assert refs == [
+            FileReference("docs/guide.md", 3, 13, "link"),
+            FileReference("./run.sh", 3, 32, "path"),
+            FileReference("config.yaml", 4, 6, "path"),
+        ]
+
+    def test_line_numbers_after_code_blocks(self):
+        """Test fenced blocks and inline code do not shift positions."""
+        validator = LinkValidator()
+        content = "```\nskip.md\n```\n`code` then README.md"
+
+        refs = validator.scan_file_references(content)
+
+        assert refs == [FileReference("README.md", 4, 13, "path")]
+
+    def test_repeated_references_kept(self):
+        """Test every occurrence is reported, not just the first."""
+        validator = LinkValidator()
+
+        refs = validator.scan_file_references("README.md\nagain README.md")
+
+        assert [(ref.line, ref.column) for ref in refs] == [(1, 1), (2, 7)]
+        assert validator.extract_all_file_references("README.md\nagain README.md") == ["README.md"]
+
+    def test_inline_code_across_lines(self):
+        """Test inline code spans continuing over a line break are skipped."""
+        validator = LinkValidator()
+        content = "Run `scripts/a.sh\nscripts/b.sh` before docs/c.md"
+
+        refs = validator.extract_all_file_references(content)
+
+        assert refs == ["docs/c.md"]
+
+    def test_unclosed_backtick_is_literal(self):
+        """Test a backtick that never closes does not hide the rest of the document."""
+        validator = LinkValidator()
+        content = "A stray ` here\nsee docs/a.md\nand docs/b.md"
+
+        refs = validator.extract_all_file_references(content)
+
+        assert refs == ["docs/a.md", "docs/b.md"]
+
+    def test_link_text_not_joined_to_neighbours(self):
+        """Test replacing a link by its text does not glue it to adjacent words."""
+        validator = LinkValidator()
+
+        refs = validator.extract_all_file_references("docs/a.md[t](b.md)")
+
+        assert refs == ["b.md", "docs/a.md"]
+
+    def test_placeholder_does_not_span_lines(self):
+        """Test a placeholder only removes the rest of its own line."""
+        validator = LinkValidator()
+        content = "Replace your-name below\nthen edit docs/setup.md"
+
+        refs = validator.extract_all_file_references(content)
+
+        assert refs == ["docs/setup.md"]
+
+    def test_custom_patterns_compiled_once(self):
+        """Test custom skip patterns are compiled when the validator is created."""
+        with patch("drift.utils.link_validator.re.compile", wraps=re.compile) as mock_compile:
+            validator = LinkValidator(custom_skip_patterns=[r"vendor/", r"[unclosed"])
+            assert mock_compile.call_count == 2
+
+            refs = validator.extract_all_file_references("vendor/lib.py and src/app.py")
+
+            assert mock_compile.call_count == 2
+        assert refs == ["src/app.py"]
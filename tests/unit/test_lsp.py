@@ -0,0 +1,424 @@
+"""Unit tests for the drift language server (drift lsp)."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from drift.cli.main import main
+from drift.config.loader import ConfigLoader
+from drift.core.analyzer import DriftAnalyzer
+from drift.daemon.lsp import (
+    METHOD_NOT_FOUND,
+    SERVER_NOT_INITIALIZED,
+    SEVERITY_ERROR,
+    SEVERITY_WARNING,
+    LanguageServer,
+    read_message,
+    uri_to_path,
+    write_message,
+)
+
+
+def _title_rule(severity=None):
+    """Build a rule requiring every doc to start with a title."""
+    rule = {
+        "description": "Docs have a title",
+        "scope": "project_level",
+        "context": "Titles help readers",
+        "requires_project_context": True,
+        "document_bundle": {
+            "bundle_type": "doc",
+            "file_patterns": ["docs/*.md"],
+            "bundle_strategy": "individual",
+        },
+        "phases": [
+            {
+                "name": "title",
+                "type": "core:regex_match",
+                "params": {"pattern": "^# ", "flags": 8},
+                "failure_message": "Missing title",
+                "expected_behavior": "Starts with a title",
+            }
+        ],
+    }
+    if severity:
+        rule["severity"] = severity
+    return rule
+
+
+def _llm_rule():
+    """Build a rule that needs an LLM."""
+    return {
+        "description": "Docs read well",
+        "scope": "project_level",
+        "context": "Readable docs",
+        "requires_project_context": True,
+        "document_bundle": {
+            "bundle_type": "doc",
+            "file_patterns": ["docs/*.md"],
+            "bundle_strategy": "individual",
+        },
+        "phases": [{"name": "review", "type": "prompt", "prompt": "Review {files_with_content}"}],
+    }
+
+
+def _write_rules(project, rules):
+    """Write the project's .drift.yaml."""
+    (project / ".drift.yaml").write_text(yaml.dump({"rule_definitions": rules}))
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Create a project with two titled docs and an isolated global config."""
+    monkeypatch.setattr(ConfigLoader, "GLOBAL_CONFIG_PATHS", [tmp_path / "global.yaml"])
+    project = tmp_path / "project"
+    (project / "docs").mkdir(parents=True)
+    (project / "docs" / "a.md").write_text("# A\n")
+    (project / "docs" / "b.md").write_text("# B\n")
+    _write_rules(project, {"titles": _title_rule()})
+    return project
+
+
+class _Client:
+    """Drive a LanguageServer with messages and collect what it sends."""
+
+    def __init__(self, project, **options):
+        """Create and initialize a server for project."""
+        self.output = io.BytesIO()
+        self.server = LanguageServer(io.BytesIO(), self.output, debounce=0, **options)
+        self.project = project
+        self.request("initialize", {"rootUri": project.as_uri()})
+
+    def request(self, method, params=None, request_id=1):
+        """Send a request."""
+        self.server.handle_message(
+            {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}
+        )
+
+    def notify(self, method, params):
+        """Send a notification."""
+        self.server.handle_message({"jsonrpc": "2.0", "method": method, "params": params})
+
+    def uri(self, rel_path):
+        """Get the URI of a project file."""
+        return (self.project / rel_path).as_uri()
+
+    def open(self, rel_path, text):
+        """Open a document."""
+        self.notify(
+            "textDocument/didOpen",
+            {
+                "textDocument": {
+                    "uri": self.uri(rel_path),
+                    "languageId": "markdown",
+                    "version": 1,
+                    "text": text,
+                }
+            },
+        )
+
+    def change(self, rel_path, text):
+        """Replace a document's text."""
+        self.notify(
+            "textDocument/didChange",
+            {
+                "textDocument": {"uri": self.uri(rel_path), "version": 2},
+                "contentChanges": [{"text": text}],
+            },
+        )
+
+    def messages(self):
+        """Get and forget the messages sent so far."""
+        stream = io.BytesIO(self.output.getvalue())
+        self.output.seek(0)
+        self.output.truncate()
+        messages = []
+        while True:
+            message = read_message(stream)
+            if message is None:
+                return messages
+            messages.append(message)
+
+    def diagnostics(self):
+        """Check pending files and get the last published diagnostics per file."""
+        self.server.validate_pending()
+        published = {}
+        for message in self.messages():
+            if message.get("method") == "textDocument/publishDiagnostics":
+                path = uri_to_path(message["params"]["uri"])
+                rel_path = path.relative_to(self.project).as_posix()
+                published[rel_path] = message["params"]["diagnostics"]
+        return published
+
+
+class TestFraming:
+    """Tests for Content-Length message framing."""
+
+    def test_round_trip(self):
+        """Test a written message reads back unchanged."""
+        stream = io.BytesIO()
+        write_message(stream, {"jsonrpc": "2.0", "method": "ping", "params": {"text": "ü"}})
+        write_message(stream, {"jsonrpc": "2.0", "id": 2, "result": None})
+        stream.seek(0)
+
+        assert read_message(stream)["params"] == {"text": "ü"}
+        assert read_message(stream)["id"] == 2
+        assert read_message(stream) is None
+
+    def test_missing_content_length(self):
+        """Test a header without Content-Length is rejected."""
+        with pytest.raises(ValueError, match="Content-Length"):
+            read_message(io.BytesIO(b"Content-Type: x\r\n\r\n{}"))
+
+    def test_uri_to_path(self, tmp_path):
+        """Test file URIs convert to paths and other schemes are ignored."""
+        path = tmp_path / "with space.md"
+
+        assert uri_to_path(path.as_uri()) == path
+        assert uri_to_path("untitled:Untitled-1") is None
+
+
+class TestLifecycle:
+    """Tests for initialize, shutdown and unknown requests."""
+
+    def test_initialize_reports_full_sync(self, project):
+        """Test initialize sets the root and advertises full document sync."""
+        client = _Client(project)
+
+        response = client.messages()[0]
+        assert response["result"]["capabilities"]["textDocumentSync"] == {
+            "openClose": True,
+            "change": 1,
+        }
+        assert client.server.project_path == project.resolve()
+
+    def test_request_before_initialize(self, project):
+        """Test requests other than initialize are refused until initialized."""
+        server = LanguageServer(io.BytesIO(), io.BytesIO(), debounce=0)
+        server.handle_message({"jsonrpc": "2.0", "id": 1, "method": "shutdown"})
+
+        response = read_message(io.BytesIO(server.writer.getvalue()))
+        assert response["error"]["code"] == SERVER_NOT_INITIALIZED
+
+    def test_unknown_request(self, project):
+        """Test unknown requests get a method-not-found error."""
+        client = _Client(project)
+        client.messages()
+
+        client.request("textDocument/hover", {}, request_id=7)
+
+        response = client.messages()[0]
+        assert response["id"] == 7
+        assert response["error"]["code"] == METHOD_NOT_FOUND
+
+    def test_serve_exit_code(self, project):
+        """Test serve() exits with 0 after shutdown and 1 without it."""
+        stream = io.BytesIO()
+        for message in (
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+            {"jsonrpc": "2.0", "id": 2, "method": "shutdown"},
+            {"jsonrpc": "2.0", "method": "exit"},
+        ):
+            write_message(stream, message)
+        stream.seek(0)
+
+        assert LanguageServer(stream, io.BytesIO(), project_path=project).serve() == 0
+        assert LanguageServer(io.BytesIO(), io.BytesIO(), project_path=project).serve() == 1
+
+
+class TestDiagnostics:
+    """Tests for checking open documents."""
+
+    def test_unsaved_buffer_is_checked(self, project):
+        """Test diagnostics follow the editor's text, not the file on disk."""
+        client = _Client(project)
+        client.open("docs/a.md", "# A\n")
+        assert client.diagnostics() == {"docs/a.md": []}
+
+        client.change("docs/a.md", "no title\n")
+        diagnostics = client.diagnostics()["docs/a.md"]
+
+        assert len(diagnostics) == 1
+        assert diagnostics[0]["code"] == "titles"
+        assert diagnostics[0]["message"] == "Missing title"
+        assert diagnostics[0]["source"] == "drift"
+        assert (project / "docs" / "a.md").read_text() == "# A\n"
+
+        client.change("docs/a.md", "# Fixed\n")
+        assert client.diagnostics() == {"docs/a.md": []}
+
+    def test_severity_follows_rule(self, project):
+        """Test failing rules are errors and warning rules are warnings."""
+        _write_rules(project, {"titles": _title_rule(severity="warning")})
+        client = _Client(project)
+        client.open("docs/a.md", "no title\n")
+
+        assert client.diagnostics()["docs/a.md"][0]["severity"] == SEVERITY_WARNING
+
+        _write_rules(project, {"titles": _title_rule()})
+        client = _Client(project)
+        client.open("docs/a.md", "no title\n")
+
+        assert client.diagnostics()["docs/a.md"][0]["severity"] == SEVERITY_ERROR
+
+    def test_only_affected_bundles_rerun(self, project):
+        """Test an edit only checks the edited document's bundles."""
+        client = _Client(project)
+        client.open("docs/a.md", "no title\n")
+        client.open("docs/b.md", "# B\n")
+        client.diagnostics()
+
+        with patch.object(
+            DriftAnalyzer, "_analyze_document_bundle", autospec=True, return_value=([], [])
+        ) as mock_analyze:
+            client.change("docs/b.md", "# B, edited\n")
+            client.diagnostics()
+
+        checked = [call.args[1].files[0].relative_path for call in mock_analyze.call_args_list]
+        assert checked == ["docs/b.md"]
+
+    def test_edits_are_debounced(self, project):
+        """Test a burst of edits is checked once, after the debounce delay."""
+        client = _Client(project)
+        client.server.debounce = 0.05
+
+        with patch.object(LanguageServer, "validate_pending", autospec=True) as mock_validate:
+            client.open("docs/a.md", "one\n")
+            client.change("docs/a.md", "two\n")
+            client.change("docs/a.md", "# three\n")
+            client.server._timer.join()
+
+        mock_validate.assert_called_once()
+        assert client.server.buffers[project / "docs" / "a.md"] == "# three\n"
+
+    def test_unaffected_diagnostics_are_kept(self, project):
+        """Test diagnostics of documents not affected by an edit stay published."""
+        client = _Client(project)
+        client.open("docs/a.md", "no title\n")
+        client.open("docs/b.md", "# B\n")
+        client.diagnostics()
+
+        client.change("docs/b.md", "# B, edited\n")
+        diagnostics = client.diagnostics()
+
+        assert len(diagnostics["docs/a.md"]) == 1
+        assert diagnostics["docs/b.md"] == []
+
+    def test_loader_is_reused_between_edits(self, project):
+        """Test edits refresh the kept document loader instead of replacing it."""
+        client = _Client(project)
+        client.open("docs/a.md", "# A\n")
+        client.diagnostics()
+        loader = client.server._loader
+
+        client.change("docs/a.md", "no title\n")
+        client.diagnostics()
+
+        assert client.server._loader is loader
+
+    def test_close_clears_diagnostics(self, project):
+        """Test closing a document publishes empty diagnostics for it."""
+        client = _Client(project)
+        client.open("docs/a.md", "no title\n")
+        client.diagnostics()
+
+        client.notify("textDocument/didClose", {"textDocument": {"uri": client.uri("docs/a.md")}})
+
+        published = [
+            message["params"]
+            for message in client.messages()
+            if message.get("method") == "textDocument/publishDiagnostics"
+        ]
+        assert published == [{"uri": client.uri("docs/a.md"), "diagnostics": []}]
+        assert client.server.buffers == {}
+
+    def test_other_documents_are_ignored(self, project):
+        """Test files of other types and outside the project are not tracked."""
+        client = _Client(project)
+        (project / "script.py").write_text("print()\n")
+
+        client.open("script.py", "print()\n")
+        client.notify(
+            "textDocument/didOpen",
+            {
+                "textDocument": {
+                    "uri": (project.parent / "outside.md").as_uri(),
+                    "languageId": "markdown",
+                    "version": 1,
+                    "text": "",
+                }
+            },
+        )
+
+        assert client.server.buffers == {}
+
+    def test_llm_rules_skipped_by_default(self, project):
+        """Test only programmatic rules run unless LLM rules are allowed."""
+        _write_rules(project, {"titles": _title_rule(), "readable": _llm_rule()})
+        client = _Client(project)
+        client.open("docs/a.md", "# A\n")
+
+        with patch.object(DriftAnalyzer, "analyze_documents", autospec=True) as mock_analyze:
+            client.server.validate_pending()
+
+        assert mock_analyze.call_args.kwargs["rule_types"] == ["titles"]
+
+    def test_llm_rules_with_initialization_option(self, project):
+        """Test the llm initialization option also runs LLM rules."""
+        _write_rules(project, {"titles": _title_rule(), "readable": _llm_rule()})
+        client = _Client(project)
+        client.request(
+            "initialize", {"rootUri": project.as_uri(), "initializationOptions": {"llm": True}}
+        )
+        client.open("docs/a.md", "# A\n")
+
+        with patch.object(DriftAnalyzer, "analyze_documents", autospec=True) as mock_analyze:
+            client.server.validate_pending()
+
+        assert sorted(mock_analyze.call_args.kwargs["rule_types"]) == ["readable", "titles"]
+
+    def test_config_error_is_shown_once(self, project):
+        """Test an invalid configuration is reported once with showMessage."""
+        (project / ".drift.yaml").write_text("rule_definitions: [not, a, mapping]\n")
+        client = _Client(project)
+        client.messages()
+
+        client.open("docs/a.md", "# A\n")
+        client.server.validate_pending()
+        client.change("docs/a.md", "# A again\n")
+        client.server.validate_pending()
+
+        shown = [m for m in client.messages() if m.get("method") == "window/showMessage"]
+        assert len(shown) == 1
+        assert "configuration" in shown[0]["params"]["message"]
+
+
+class TestLspCommand:
+    """Tests for the drift lsp command line."""
+
+    def test_lsp_over_stdio(self, project, monkeypatch):
+        """Test drift lsp answers framed messages on stdin on stdout."""
+        stdin = io.BytesIO()
+        for message in (
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+            {"jsonrpc": "2.0", "id": 2, "method": "shutdown"},
+            {"jsonrpc": "2.0", "method": "exit"},
+        ):
+            write_message(stdin, message)
+        stdin.seek(0)
+        stdout = io.TextIOWrapper(io.BytesIO())
+        monkeypatch.setattr("sys.stdin", io.TextIOWrapper(stdin))
+        monkeypatch.setattr("sys.stdout", stdout)
+        monkeypatch.setattr("sys.argv", ["drift", "--project", str(project), "lsp"])
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 0
+        stdout.buffer.seek(0)
+        responses = [read_message(stdout.buffer), read_message(stdout.buffer)]
+        assert [response["id"] for response in responses] == [1, 2]
+        assert json.dumps(responses[1]["result"]) == "null"
@@ -0,0 +1,197 @@
+"""Unit tests for unsaved buffers layered over files on disk."""
+
+import asyncio
+
+import pytest
+
+from drift.config.models import BundleStrategy, DocumentBundleConfig, ValidationRule
+from drift.core.types import DocumentBundle, DocumentFile
+from drift.documents.loader import DocumentLoader
+from drift.documents.overlay import get_overlay, is_file, overlay_session, read_lines, read_text
+from drift.validation.validators.core.block_validators import BlockLineCountValidator
+from drift.validation.validators.core.file_validators import TokenCountValidator
+from drift.validation.validators.core.regex_validators import RegexMatchValidator
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project with two documents."""
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "a.md").write_text("# A\n")
+    (tmp_path / "docs" / "b.md").write_text("# B\n")
+    return tmp_path
+
+
+def _bundle(project, rel_path):
+    """Build a bundle with one file read from disk."""
+    return DocumentBundle(
+        bundle_id="test",
+        bundle_type="docs",
+        bundle_strategy="individual",
+        project_path=project,
+        files=[
+            DocumentFile(
+                relative_path=rel_path,
+                file_path=project / rel_path,
+                content=(project / rel_path).read_text(),
+            )
+        ],
+    )
+
+
+class TestOverlaySession:
+    """Tests for overlay_session() and the read helpers."""
+
+    def test_read_outside_session_uses_disk(self, project):
+        """Test files are read from disk without a session."""
+        path = project / "docs" / "a.md"
+
+        assert get_overlay(path) is None
+        assert read_text(path) == "# A\n"
+        assert read_lines(path) == ["# A\n"]
+
+    def test_buffer_replaces_file_content(self, project):
+        """Test a buffered path reads the buffer and others read the disk."""
+        with overlay_session({project / "docs" / "a.md": "edited\nlines\n"}):
+            assert read_text(project / "docs" / "a.md") == "edited\nlines\n"
+            assert read_lines(project / "docs" / "a.md") == ["edited\n", "lines\n"]
+            assert read_text(project / "docs" / "b.md") == "# B\n"
+
+        assert read_text(project / "docs" / "a.md") == "# A\n"
+
+    def test_paths_are_normalized(self, project):
+        """Test lookups match regardless of how the path is spelled."""
+        with overlay_session({str(project / "docs" / "a.md"): "edited"}):
+            assert get_overlay(project / "docs" / ".." / "docs" / "a.md") == "edited"
+
+    def test_line_endings_are_normalized(self, project):
+        """Test CRLF and CR buffers read like files opened in text mode."""
+        with overlay_session({project / "docs" / "a.md": "one\r\ntwo\rthree"}):
+            assert read_text(project / "docs" / "a.md") == "one\ntwo\nthree"
+
+    def test_unsaved_new_file_exists(self, project):
+        """Test a buffer for a file not yet on disk counts as a file."""
+        new_file = project / "docs" / "new.md"
+
+        assert not is_file(new_file)
+        with overlay_session({new_file: "draft"}):
+            assert is_file(new_file)
+            assert read_text(new_file) == "draft"
+
+    def test_sessions_nest(self, project):
+        """Test inner sessions add to and override outer ones."""
+        a = project / "docs" / "a.md"
+        b = project / "docs" / "b.md"
+        with overlay_session({a: "outer a", b: "outer b"}):
+            with overlay_session({a: "inner a"}):
+                assert read_text(a) == "inner a"
+                assert read_text(b) == "outer b"
+            assert read_text(a) == "outer a"
+
+    def test_session_reaches_worker_threads(self, project):
+        """Test validators run with asyncio.to_thread() see the buffers."""
+        path = project / "docs" / "a.md"
+
+        async def read_in_thread():
+            return await asyncio.to_thread(read_text, path)
+
+        with overlay_session({path: "edited"}):
+            assert asyncio.run(read_in_thread()) == "edited"
+
+
+class TestValidatorsReadBuffers:
+    """Tests for validators that open files themselves."""
+
+    def test_regex_match_file_path(self, project):
+        """Test RegexMatchValidator checks the buffer of params.file_path."""
+        rule = ValidationRule(
+            rule_type="core:regex_match",
+            description="Has a title",
+            params={"file_path": "docs/a.md", "pattern": r"^# "},
+            failure_message="Missing title",
+            expected_behavior="Starts with a title",
+        )
+        bundle = _bundle(project, "docs/a.md")
+
+        assert RegexMatchValidator().validate(rule, bundle) is None
+        with overlay_session({project / "docs" / "a.md": "no title\n"}):
+            assert RegexMatchValidator().validate(rule, bundle) is not None
+
+    def test_block_line_count(self, project):
+        """Test BlockLineCountValidator counts lines of the buffer."""
+        rule = ValidationRule(
+            rule_type="core:block_line_count",
+            description="Short code blocks",
+            params={"pattern_start": "^```", "pattern_end": "^```", "max_lines": 1},
+            failure_message="Code block too long",
+            expected_behavior="Short code blocks",
+        )
+        bundle = _bundle(project, "docs/a.md")
+
+        assert BlockLineCountValidator().validate(rule, bundle) is None
+        with overlay_session({project / "docs" / "a.md": "```\none\ntwo\n```\n"}):
+            assert BlockLineCountValidator().validate(rule, bundle) is not None
+
+    def test_token_count(self, project):
+        """Test TokenCountValidator counts tokens of the buffer."""
+        rule = ValidationRule(
+            rule_type="core:token_count",
+            description="Short document",
+            params={"file_path": "docs/a.md", "provider": "approximate", "max_count": 20},
+            failure_message="Too many tokens",
+            expected_behavior="Short document",
+        )
+        bundle = _bundle(project, "docs/a.md")
+
+        assert TokenCountValidator().validate(rule, bundle) is None
+        with overlay_session({project / "docs" / "a.md": "word " * 200}):
+            assert TokenCountValidator().validate(rule, bundle) is not None
+
+
+class TestLoaderOverlay:
+    """Tests for DocumentLoader with buffers and refresh()."""
+
+    CONFIG = DocumentBundleConfig(
+        bundle_type="docs",
+        file_patterns=["docs/*.md"],
+        bundle_strategy=BundleStrategy.INDIVIDUAL,
+    )
+
+    def _contents(self, loader):
+        """Get file contents of the loaded bundles by relative path."""
+        return {
+            file.relative_path: file.content
+            for bundle in loader.load_bundles(self.CONFIG)
+            for file in bundle.files
+        }
+
+    def test_buffer_is_document_content(self, project):
+        """Test documents with a buffer get the buffer's text."""
+        with overlay_session({project / "docs" / "a.md": "edited\n"}):
+            contents = self._contents(DocumentLoader(project))
+
+        assert contents == {"docs/a.md": "edited\n", "docs/b.md": "# B\n"}
+
+    def test_refresh_replaces_only_edited_documents(self, project):
+        """Test refresh() rereads edited files and keeps the other documents."""
+        loader = DocumentLoader(project)
+        bundles = loader.load_bundles(self.CONFIG)
+        unchanged = bundles[1].files[0]
+
+        with overlay_session({project / "docs" / "a.md": "edited\n"}):
+            loader.refresh([project / "docs" / "a.md"])
+            refreshed = loader.load_bundles(self.CONFIG)
+            assert refreshed[0].files[0].content == "edited\n"
+
+        assert refreshed[1].files[0] is unchanged
+        assert bundles[0].files[0].content == "# A\n"
+
+    def test_refresh_ignores_unknown_files(self, project):
+        """Test refreshing files the loader never loaded keeps its bundles."""
+        loader = DocumentLoader(project)
+        bundles = loader.load_bundles(self.CONFIG)
+
+        loader.refresh([project / "elsewhere.md"])
+
+        reloaded = loader.load_bundles(self.CONFIG)
+        assert all(new is old for new, old in zip(reloaded, bundles))
@@ -1,11 +1,15 @@
 """Tests for parallel execution functionality."""
 
+import json
+import threading
+import time
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from pydantic import ValidationError
 
-from drift.config.models import DriftConfig, ParallelExecutionConfig, ValidationRule
+from drift.config.models import DriftConfig, ParallelExecutionConfig, SeverityLevel, ValidationRule
 from drift.core.analyzer import DriftAnalyzer
 from drift.core.types import DocumentBundle, DocumentFile, DocumentRule
 
@@ -98,6 +102,12 @@ class TestParallelExecutionConfig:
         config = ParallelExecutionConfig(enabled=False)
         assert config.enabled is False
 
+    def test_max_conversations(self):
+        """Test the conversation limit defaults to 4 and must be positive."""
+        assert ParallelExecutionConfig().max_conversations == 4
+        with pytest.raises(ValidationError):
+            ParallelExecutionConfig(max_conversations=0)
+
 
 class TestDriftConfigIntegration:
     """Test integration of ParallelExecutionConfig with DriftConfig."""
@@ -664,3 +674,132 @@ class TestConcurrencySafety:
         seq_statuses = sorted([d["status"] for d in seq_details])
         par_statuses = sorted([d["status"] for d in par_details])
         assert seq_statuses == par_statuses
+
+
+class TestConversationConcurrency:
+    """Test conversations are analyzed concurrently."""
+
+    @pytest.fixture
+    def conversations(self, sample_conversation):
+        """Create six conversations."""
+        return [
+            sample_conversation.model_copy(update={"session_id": f"session-{index}"})
+            for index in range(6)
+        ]
+
+    @pytest.fixture
+    def provider(self):
+        """Create a provider whose calls take 0.2s and record how they overlap."""
+        provider = MagicMock()
+        provider.is_available.return_value = True
+        lock = threading.Lock()
+        provider.in_flight = provider.peak = 0
+        provider.sessions = []
+
+        def generate(prompt, **kwargs):
+            with lock:
+                provider.in_flight += 1
+                provider.peak = max(provider.peak, provider.in_flight)
+                provider.sessions.append(kwargs["cache_key"].split("_")[0])
+            time.sleep(0.2)
+            with lock:
+                provider.in_flight -= 1
+            if kwargs["cache_key"].startswith("session-1_"):
+                return json.dumps(
+                    [
+                        {
+                            "turn_number": 1,
+                            "observed_behavior": "Stopped early",
+                            "expected_behavior": "Finish the work",
+                        }
+                    ]
+                )
+            return "[]"
+
+        provider.generate.side_effect = generate
+        return provider
+
+    def _analyze(self, config, conversations, provider, fail_fast=False):
+        """Run conversation analysis on the given conversations."""
+        with patch("drift.core.analyzer.ClaudeCodeLoader") as loader_class, patch(
+            "drift.core.analyzer.BedrockProvider", return_value=provider
+        ):
+            loader_class.return_value.load_conversations.return_value = conversations
+            return DriftAnalyzer(config=config).analyze(fail_fast=fail_fast)
+
+    def test_llm_calls_overlap_up_to_limit(self, sample_drift_config, conversations, provider):
+        """Test conversations run up to max_conversations at once, reported in order."""
+        sample_drift_config.parallel_execution = ParallelExecutionConfig(max_conversations=3)
+
+        started = time.monotonic()
+        result = self._analyze(sample_drift_config, conversations, provider)
+
+        assert time.monotonic() - started < 1.0
+        assert provider.peak == 3
+        assert [r.session_id for r in result.results] == [f"session-{i}" for i in range(6)]
+        assert [r.session_id for r in result.results if r.rules] == ["session-1"]
+
+    def test_disabled_runs_one_at_a_time(self, sample_drift_config, conversations, provider):
+        """Test conversations are analyzed sequentially with parallel execution disabled."""
+        sample_drift_config.parallel_execution = ParallelExecutionConfig(enabled=False)
+
+        result = self._analyze(sample_drift_config, conversations, provider)
+
+        assert provider.peak == 1
+        assert provider.sessions == [f"session-{i}" for i in range(6)]
+        assert len(result.results) == 6
+
+    def test_fail_fast_stops_scheduling(self, sample_drift_config, conversations, provider):
+        """Test fail-fast reports up to the failing conversation and starts no more."""
+        sample_drift_config.parallel_execution = ParallelExecutionConfig(max_conversations=2)
+        sample_drift_config.rule_definitions["incomplete_work"].severity = SeverityLevel.FAIL
+
+        result = self._analyze(sample_drift_config, conversations, provider, fail_fast=True)
+
+        assert [r.session_id for r in result.results] == ["session-0", "session-1"]
+        assert result.metadata["partial"]["rule"] == "incomplete_work"
+        # Only the conversation already running when the failure was seen also ran
+        assert len(provider.sessions) < 6
+
+    def test_fail_fast_starts_no_llm_call_after_failure(self, sample_drift_config, conversations):
+        """Test conversations still running when fail-fast stops make no further LLM calls."""
+        sample_drift_config.parallel_execution = ParallelExecutionConfig(max_conversations=2)
+        rule = sample_drift_config.rule_definitions["incomplete_work"]
+        rule.severity = SeverityLevel.FAIL
+        sample_drift_config.rule_definitions["second_pass"] = rule.model_copy()
+
+        seen = threading.Event()
+        first_failing_rule = DriftAnalyzer._first_failing_rule
+
+        def spy(analyzer, rule_types):
+            failed = first_failing_rule(analyzer, rule_types)
+            if failed is not None:
+                seen.set()
+            return failed
+
+        started_after_failure = []
+        provider = MagicMock()
+        provider.is_available.return_value = True
+
+        def generate(prompt, **kwargs):
+            started_after_failure.append(seen.is_set())
+            session = kwargs["cache_key"].split("_")[0]
+            if session == "session-1":
+                return json.dumps(
+                    [{"turn_number": 1, "observed_behavior": "a", "expected_behavior": "b"}]
+                )
+            # session-0 is reported at 1.0s; the other worker's passes start every 0.4s,
+            # so without stopping, session-3's second pass would start at 1.2s
+            time.sleep(0.5 if session == "session-0" else 0.4)
+            return "[]"
+
+        provider.generate.side_effect = generate
+
+        with patch.object(DriftAnalyzer, "_first_failing_rule", spy):
+            result = self._analyze(sample_drift_config, conversations, provider, fail_fast=True)
+        time.sleep(0.5)
+
+        assert [r.session_id for r in result.results] == ["session-0", "session-1"]
+        assert seen.is_set()
+        assert not any(started_after_failure)
+        provider.cancel.assert_called()
@@ -0,0 +1,365 @@
+"""Unit tests for the in-memory project path index."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from drift.config.models import (
+    BundleStrategy,
+    DocumentBundleConfig,
+    DriftConfig,
+    RuleDefinition,
+    ValidationRule,
+    ValidationRulesConfig,
+)
+from drift.core.analyzer import DriftAnalyzer
+from drift.core.types import DocumentBundle, DocumentFile
+from drift.utils import path_index as path_index_module
+from drift.utils.path_index import (
+    ProjectPathIndex,
+    compile_glob,
+    get_project_index,
+    project_index_session,
+)
+from drift.validation.validators.core.file_validators import FileExistsValidator
+from drift.validation.validators.core.markdown_validators import MarkdownLinkValidator
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a small project tree."""
+    files = [
+        "CLAUDE.md",
+        "README.md",
+        ".claude/skills/alpha/SKILL.md",
+        ".claude/skills/beta/SKILL.md",
+        ".claude/skills/beta/notes/extra.md",
+        ".claude/commands/deploy.md",
+        ".claude/agents/reviewer.md",
+        "docs/guide.md",
+        "docs/api/v1.md",
+        "docs/.hidden.md",
+        "src/app.py",
+        "node_modules/pkg/index.md",
+        ".git/HEAD",
+    ]
+    for rel_path in files:
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel_path)
+    (tmp_path / "empty").mkdir()
+    return tmp_path
+
+
+class TestCompileGlob:
+    """Tests for glob translation."""
+
+    @pytest.mark.parametrize(
+        "pattern,path,expected",
+        [
+            ("*.md", "README.md", True),
+            ("*.md", "docs/guide.md", False),
+            ("**/*.md", "README.md", True),
+            ("**/*.md", "docs/api/v1.md", True),
+            ("docs/**/v1.md", "docs/v1.md", True),
+            ("docs/**/v1.md", "docs/api/v1.md", True),
+            (".claude/skills/*/SKILL.md", ".claude/skills/alpha/SKILL.md", True),
+            (".claude/skills/*/SKILL.md", ".claude/skills/a/b/SKILL.md", False),
+            ("docs/?uide.md", "docs/guide.md", True),
+            ("docs/[gx]uide.md", "docs/guide.md", True),
+            ("docs/[!g]uide.md", "docs/guide.md", False),
+            ("docs/**", "docs/guide.md", False),
+            ("a+b.md", "a+b.md", True),
+        ],
+    )
+    def test_matches(self, pattern, path, expected):
+        """Test globs follow pathlib semantics for files."""
+        assert bool(compile_glob(pattern).fullmatch(path)) is expected
+
+
+class TestProjectPathIndex:
+    """Tests for ProjectPathIndex lookups."""
+
+    def test_exists(self, project):
+        """Test files and directories are found, missing paths are not."""
+        index = ProjectPathIndex(project)
+
+        assert index.exists(project / "docs" / "guide.md")
+        assert index.exists(project / "docs" / "api")
+        assert index.exists("docs/api/v1.md")
+        assert index.exists(project)
+        assert not index.exists(project / "docs" / "missing.md")
+
+    def test_is_file_and_is_dir(self, project):
+        """Test file and directory checks are distinguished."""
+        index = ProjectPathIndex(project)
+
+        assert index.is_file(project / "CLAUDE.md")
+        assert not index.is_file(project / "docs")
+        assert index.is_dir(project / "docs")
+        assert not index.is_dir(project / "CLAUDE.md")
+
+    def test_dot_dot_is_normalized(self, project):
+        """Test ".." segments are resolved without touching the filesystem."""
+        index = ProjectPathIndex(project)
+
+        assert index.exists(project / "docs" / "api" / ".." / "guide.md")
+        assert not index.exists(project / "docs" / ".." / "guide.md")
+
+    def test_ignored_directories_not_walked(self, project):
+        """Test ignored directories are pruned but still answered from disk."""
+        with patch("drift.utils.path_index.os.scandir", wraps=os.scandir) as mock_scandir:
+            index = ProjectPathIndex(project)
+
+        walked = {Path(call.args[0]).name for call in mock_scandir.call_args_list}
+        assert "node_modules" not in walked
+        assert ".git" not in walked
+        assert index.is_file(project / "node_modules" / "pkg" / "index.md")
+        assert not index.exists(project / "node_modules" / "pkg" / "missing.md")
+
+    def test_custom_ignore_patterns(self, project):
+        """Test ignore patterns replace the defaults."""
+        index = ProjectPathIndex(project, ignore_patterns=["docs"])
+
+        assert "docs" in index._opaque
+        assert "node_modules" not in index._opaque
+        assert index.is_file(project / "docs" / "guide.md")
+
+    def test_outside_root_uses_filesystem(self, project, tmp_path_factory):
+        """Test paths outside the project are checked on disk."""
+        outside = tmp_path_factory.mktemp("outside") / "file.md"
+        outside.write_text("x")
+        index = ProjectPathIndex(project)
+
+        assert index.exists(outside)
+        assert not index.exists(outside.parent / "missing.md")
+
+    def test_iterdir(self, project):
+        """Test directory listings come from the walk."""
+        index = ProjectPathIndex(project)
+
+        assert sorted(p.name for p in index.iterdir(project / "docs")) == [
+            ".hidden.md",
+            "api",
+            "guide.md",
+        ]
+        assert index.iterdir(project / "empty") == []
+        with pytest.raises(OSError):
+            index.iterdir(project / "missing")
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "*.md",
+            "**/*.md",
+            "docs/**/*.md",
+            ".claude/skills/*/SKILL.md",
+            ".claude/**/SKILL.md",
+            "docs/*",
+            "docs/**",
+            "src/*.py",
+            "missing/*.md",
+        ],
+    )
+    def test_glob_files_matches_pathlib(self, project, pattern):
+        """Test glob results agree with pathlib (outside ignored directories)."""
+        index = ProjectPathIndex(project)
+        expected = sorted(
+            path
+            for path in project.glob(pattern)
+            if path.is_file() and not path.relative_to(project).parts[0] in ("node_modules", ".git")
+        )
+
+        assert index.glob_files(pattern) == expected
+
+    def test_glob_files_falls_back_for_ignored_directories(self, project):
+        """Test a glob that only matches inside an ignored directory still finds it."""
+        index = ProjectPathIndex(project)
+
+        assert index.glob_files("**/index.md") == [project / "node_modules" / "pkg" / "index.md"]
+
+    def test_symlinked_directory(self, project, tmp_path_factory):
+        """Test symlinked directories are answered from the filesystem."""
+        target = tmp_path_factory.mktemp("shared")
+        (target / "shared.md").write_text("x")
+        (project / "linked").symlink_to(target, target_is_directory=True)
+        index = ProjectPathIndex(project)
+
+        assert index.is_dir(project / "linked")
+        assert index.is_file(project / "linked" / "shared.md")
+        assert index.glob_files("linked/*.md") == [project / "linked" / "shared.md"]
+
+
+class TestProjectIndexSession:
+    """Tests for sharing indexes within a run."""
+
+    def test_no_index_outside_session(self, project):
+        """Test validators use the filesystem outside a session."""
+        assert get_project_index(project) is None
+
+    def test_index_shared_within_session(self, project):
+        """Test one index is built per project and reused."""
+        with patch.object(
+            path_index_module, "ProjectPathIndex", wraps=ProjectPathIndex
+        ) as mock_index:
+            with project_index_session():
+                first = get_project_index(project)
+                second = get_project_index(str(project))
+
+        assert first is second
+        assert mock_index.call_count == 1
+
+    def test_session_ignore_patterns(self, project):
+        """Test the session's ignore patterns are used for its indexes."""
+        with project_index_session(ignore_patterns=["src"]):
+            index = get_project_index(project)
+
+        assert index is not None
+        assert "src" in index._opaque
+
+
+class TestValidatorsUseIndex:
+    """Tests for validators answering from the session index."""
+
+    def _bundle(self, project, content):
+        """Build a bundle for docs/guide.md with the given content."""
+        return DocumentBundle(
+            bundle_id="guide",
+            bundle_type="doc",
+            bundle_strategy="individual",
+            project_path=project,
+            files=[
+                DocumentFile(
+                    relative_path="docs/guide.md",
+                    content=content,
+                    file_path=project / "docs" / "guide.md",
+                )
+            ],
+        )
+
+    def test_markdown_links_checked_without_stat(self, project):
+        """Test local link checks make no per-reference filesystem calls."""
+        rule = ValidationRule(
+            rule_type="core:markdown_link",
+            description="Check links",
+            params={"check_external_urls": False},
+            failure_message="Broken link",
+            expected_behavior="Links work",
+        )
+        bundle = self._bundle(project, "See [api](api/v1.md), src/app.py and [x](gone.md)")
+
+        with project_index_session():
+            get_project_index(project)
+            with patch.object(Path, "resolve", side_effect=AssertionError("stat")), patch.object(
+                Path, "exists", side_effect=AssertionError("stat")
+            ):
+                result = MarkdownLinkValidator().validate(rule, bundle)
+
+        assert result is not None
+        assert "[gone.md]" in result.observed_issue
+        assert "api/v1.md" not in result.observed_issue
+        assert "src/app.py" not in result.observed_issue
+
+    def test_resource_references_use_index(self, project):
+        """Test skill/command/agent references are checked against the index."""
+        rule = ValidationRule(
+            rule_type="core:markdown_link",
+            description="Check links",
+            params={
+                "check_local_files": False,
+                "check_external_urls": False,
+                "check_resource_refs": True,
+                "resource_patterns": [r"skill:(\w+)"],
+            },
+            failure_message="Broken reference",
+            expected_behavior="References work",
+        )
+        bundle = self._bundle(project, "[skill:alpha](x) and [skill:gamma](y)")
+
+        with project_index_session():
+            result = MarkdownLinkValidator().validate(rule, bundle)
+
+        assert result is not None
+        assert "gamma" in result.observed_issue
+        assert "alpha" not in result.observed_issue
+
+    @pytest.mark.parametrize(
+        "file_path,passes",
+        [
+            ("CLAUDE.md", True),
+            ("MISSING.md", False),
+            (".claude/skills/*/SKILL.md", True),
+            (".claude/commands/*.txt", False),
+            ("empty/*.md", True),
+            ("nowhere/*.md", True),
+        ],
+    )
+    def test_file_exists_same_results(self, project, file_path, passes):
+        """Test FileExistsValidator gives the same verdicts with and without an index."""
+        rule = ValidationRule(
+            rule_type="core:file_exists",
+            description="File exists",
+            params={"file_path": file_path},
+            failure_message="Missing",
+            expected_behavior="Exists",
+        )
+        bundle = self._bundle(project, "")
+
+        without_index = FileExistsValidator().validate(rule, bundle)
+        with project_index_session():
+            with_index = FileExistsValidator().validate(rule, bundle)
+
+        assert (without_index is None) is passes
+        assert (with_index is None) is passes
+
+
+class TestAnalyzerPathIndex:
+    """Tests for the run-wide path index in analyze_documents."""
+
+    def test_project_walked_once_per_run(self, project):
+        """Test all bundles and rules of a run share one index."""
+        config = DriftConfig(
+            rule_definitions={
+                "skill_links": RuleDefinition(
+                    description="Skill links work",
+                    scope="project_level",
+                    context="Broken links mislead",
+                    requires_project_context=True,
+                    validation_rules=ValidationRulesConfig(
+                        rules=[
+                            ValidationRule(
+                                rule_type="core:markdown_link",
+                                description="Check links",
+                                params={"check_external_urls": False},
+                                failure_message="Broken link",
+                                expected_behavior="Links work",
+                            ),
+                            ValidationRule(
+                                rule_type="core:file_exists",
+                                description="Has CLAUDE.md",
+                                params={"file_path": "CLAUDE.md"},
+                                failure_message="Missing",
+                                expected_behavior="Exists",
+                            ),
+                        ],
+                        document_bundle=DocumentBundleConfig(
+                            bundle_type="skill",
+                            file_patterns=[".claude/skills/*/SKILL.md"],
+                            bundle_strategy=BundleStrategy.INDIVIDUAL,
+                        ),
+                    ),
+                )
+            },
+        )
+        (project / ".claude/skills/alpha/SKILL.md").write_text("See [readme](README.md)")
+        (project / ".claude/skills/beta/SKILL.md").write_text("See [gone](gone.md)")
+
+        with patch.object(
+            path_index_module, "ProjectPathIndex", wraps=ProjectPathIndex
+        ) as mock_index:
+            result = DriftAnalyzer(config=config, project_path=project).analyze_documents()
+
+        assert mock_index.call_count == 1
+        assert result.summary.total_rule_violations == 1
@@ -1,8 +1,13 @@
 """Unit tests for pattern matching utilities."""
 
+from unittest.mock import patch
+
 import pytest
 
+from drift.validation import patterns as patterns_module
 from drift.validation.patterns import (
+    CompiledPatternSet,
+    compile_patterns,
     is_regex_pattern,
     match_glob_pattern,
     match_literal_path,
@@ -305,3 +310,105 @@ class TestShouldIgnorePath:
         assert should_ignore_path("src/main.py", patterns) is False
         assert should_ignore_path("README.md", patterns) is False
         assert should_ignore_path("integration_test.py", patterns) is False
+
+
+class TestDoubleStarSemantics:
+    """Tests for "**" matching zero or more path components."""
+
+    @pytest.mark.parametrize(
+        "path,pattern,expected",
+        [
+            ("README.md", "**/*.md", True),
+            ("docs/api/v1.md", "**/*.md", True),
+            ("src", "src/**", True),
+            ("src/a/b/c.py", "src/**", True),
+            ("docs/c.md", "docs/**/c.md", True),
+            ("docs/a/b/c.md", "docs/**/c.md", True),
+            ("mydocs/c.md", "docs/**/c.md", False),
+            ("node_modules/pkg/x/index.js", "**/node_modules/**", True),
+            ("/abs/a.py", "/abs/*.py", True),
+            ("rel/abs/a.py", "/abs/*.py", False),
+        ],
+    )
+    def test_double_star(self, path, pattern, expected):
+        """Test "**" semantics do not depend on the Python version."""
+        assert match_glob_pattern(path, pattern) is expected
+
+    def test_empty_pattern(self):
+        """Test empty patterns never match."""
+        assert match_glob_pattern("test.py", "") is False
+
+
+class TestCompiledPatternSet:
+    """Tests for CompiledPatternSet and compile_patterns."""
+
+    def test_matches_globs_and_regexes(self):
+        """Test globs and regexes in one set."""
+        compiled = CompiledPatternSet(["*.pyc", "dist/**", r"^test_.*\.py"])
+
+        assert compiled.matches("src/app.pyc")
+        assert compiled.matches("dist/bundle/app.js")
+        assert compiled.matches("test_app.py")
+        assert not compiled.matches("src/test_app.py")
+        assert not compiled.matches("src/app.py")
+
+    def test_agrees_with_match_pattern(self):
+        """Test the combined matcher gives the same verdicts as per-pattern matching."""
+        pattern_list = ["*.md", "docs/**", ".git", "build/*.js", r".*\.lock$", "test.??"]
+        paths = ["a.md", "docs/x/y.txt", "sub/.git", "build/a.js", "build/x/a.js", "poetry.lock"]
+        compiled = CompiledPatternSet(pattern_list)
+
+        for path in paths + ["test.py", "test.python", "src/main.py"]:
+            expected = any(match_pattern(path, pattern) for pattern in pattern_list)
+            assert compiled.matches(path) is expected, path
+
+    def test_invalid_regex_raises_on_construction(self):
+        """Test invalid regexes are reported when the set is built."""
+        with pytest.raises(ValueError, match="Invalid regex pattern"):
+            CompiledPatternSet(["*.tmp", r"(unclosed\)"])
+
+    def test_empty_set(self):
+        """Test a set without usable patterns matches nothing."""
+        compiled = CompiledPatternSet(["", None])
+
+        assert not compiled
+        assert not compiled.matches("test.py")
+
+    def test_verdicts_are_memoized(self):
+        """Test each path is matched once."""
+        compiled = CompiledPatternSet(["*.tmp"])
+
+        with patch.object(compiled, "_match", wraps=compiled._match) as mock_match:
+            assert compiled.matches("a.tmp")
+            assert compiled.matches("a.tmp")
+            assert not compiled.matches("b.py")
+
+        assert mock_match.call_count == 2
+
+    def test_compile_patterns_is_cached(self):
+        """Test equal pattern lists share one compiled set."""
+        first = compile_patterns(["*.tmp", "*.log"])
+
+        assert compile_patterns(("*.tmp", "*.log")) is first
+        assert compile_patterns(["*.log"]) is not first
+
+    def test_should_ignore_path_compiles_once(self):
+        """Test repeated should_ignore_path calls do not recompile patterns."""
+        pattern_list = ["*.cache-test", r"^tmp_.*\.py"]
+        with patch.object(
+            patterns_module, "CompiledPatternSet", wraps=CompiledPatternSet
+        ) as mock_set:
+            patterns_module._compile_pattern_tuple.cache_clear()
+            for index in range(50):
+                should_ignore_path(f"file{index}.cache-test", pattern_list)
+
+        assert mock_set.call_count == 1
+
+    def test_matches_tree(self):
+        """Test only globs ending in "**" match whole directory trees."""
+        compiled = CompiledPatternSet(["node_modules/**", "*.md", r"^build/"])
+
+        assert compiled.matches_tree("node_modules")
+        assert compiled.matches_tree("web/node_modules/pkg")
+        assert not compiled.matches_tree("docs")
+        assert not compiled.matches_tree("build")
@@ -0,0 +1,167 @@
+"""Tests for lazy provider registration."""
+
+import json
+import subprocess
+import sys
+import textwrap
+from unittest.mock import MagicMock
+
+import pytest
+
+from drift.config.models import (
+    DocumentBundleConfig,
+    DriftConfig,
+    ModelConfig,
+    ProviderConfig,
+    ProviderType,
+    RuleDefinition,
+    ValidationRule,
+    ValidationRulesConfig,
+)
+from drift.core.analyzer import DriftAnalyzer
+from drift.providers.registry import ProviderRegistry
+
+
+class TestProviderRegistry:
+    """Tests for ProviderRegistry."""
+
+    def test_factory_called_on_first_access_only(self):
+        """Test providers are built on first lookup and memoized."""
+        factory = MagicMock(return_value=MagicMock())
+        registry = ProviderRegistry()
+        registry.register("haiku", factory)
+
+        assert "haiku" in registry
+        assert len(registry) == 1
+        assert list(registry) == ["haiku"]
+        factory.assert_not_called()
+        assert not registry.is_loaded("haiku")
+
+        first = registry["haiku"]
+        second = registry.get("haiku")
+
+        assert first is second
+        factory.assert_called_once()
+        assert registry.is_loaded("haiku")
+
+    def test_get_missing_returns_none(self):
+        """Test get() on unknown model returns None."""
+        assert ProviderRegistry().get("missing") is None
+
+    def test_setitem_overrides_factory(self):
+        """Test assigning an instance takes precedence over the factory."""
+        factory = MagicMock()
+        provider = MagicMock()
+        registry = ProviderRegistry()
+        registry.register("haiku", factory)
+        registry["haiku"] = provider
+
+        assert registry["haiku"] is provider
+        assert len(registry) == 1
+        factory.assert_not_called()
+
+    def test_delete_and_clear(self):
+        """Test deleting and clearing entries."""
+        registry = ProviderRegistry()
+        registry.register("a", MagicMock())
+        registry["b"] = MagicMock()
+
+        del registry["a"]
+        assert "a" not in registry
+        with pytest.raises(KeyError):
+            del registry["a"]
+
+        registry.clear()
+        assert len(registry) == 0
+
+
+class TestAnalyzerLazyProviders:
+    """Tests for lazy provider construction in DriftAnalyzer."""
+
+    def test_providers_not_constructed_at_init(self, sample_drift_config, monkeypatch):
+        """Test DriftAnalyzer defers provider construction."""
+        bedrock_class = MagicMock()
+        monkeypatch.setattr("drift.core.analyzer.BedrockProvider", bedrock_class, raising=False)
+
+        analyzer = DriftAnalyzer(config=sample_drift_config)
+
+        assert "haiku" in analyzer.providers
+        bedrock_class.assert_not_called()
+
+        provider = analyzer.providers["haiku"]
+        assert provider is bedrock_class.return_value
+        bedrock_class.assert_called_once()
+
+    def test_unknown_provider_still_rejected_eagerly(self):
+        """Test models referencing unknown providers fail at init."""
+        config = DriftConfig(
+            providers={},
+            models={"haiku": ModelConfig(provider="missing", model_id="x")},
+        )
+
+        with pytest.raises(ValueError, match="unknown provider"):
+            DriftAnalyzer(config=config)
+
+    def test_programmatic_run_does_not_import_provider_sdks(self, tmp_path):
+        """Test a programmatic-only run never imports boto3 or anthropic."""
+        (tmp_path / "README.md").write_text("# Readme\n")
+        config = DriftConfig(
+            providers={
+                "bedrock": ProviderConfig(provider=ProviderType.BEDROCK, params={}),
+                "anthropic": ProviderConfig(provider=ProviderType.ANTHROPIC, params={}),
+                "cli": ProviderConfig(provider=ProviderType.CLAUDE_CODE, params={}),
+            },
+            models={
+                "haiku": ModelConfig(provider="bedrock", model_id="haiku"),
+                "sonnet": ModelConfig(provider="anthropic", model_id="sonnet"),
+                "cli": ModelConfig(provider="cli", model_id="sonnet"),
+            },
+            cache_enabled=False,
+            temp_dir=str(tmp_path / "tmp"),
+            rule_definitions={
+                "readme": RuleDefinition(
+                    description="README exists",
+                    scope="project_level",
+                    context="ctx",
+                    requires_project_context=False,
+                    validation_rules=ValidationRulesConfig(
+                        rules=[
+                            ValidationRule(
+                                rule_type="core:file_exists",
+                                description="README exists",
+                                params={"file_path": "README.md"},
+                            )
+                        ],
+                        document_bundle=DocumentBundleConfig(
+                            bundle_type="project",
+                            file_patterns=["README.md"],
+                            bundle_strategy="collection",
+                        ),
+                    ),
+                )
+            },
+        )
+
+        script = textwrap.dedent(
+            f"""
+            import json, sys
+            from pathlib import Path
+            from drift.config.models import DriftConfig
+            from drift.core.analyzer import DriftAnalyzer
+
+            config = DriftConfig.model_validate(json.loads({config.model_dump_json()!r}))
+            analyzer = DriftAnalyzer(config=config, project_path=Path({str(tmp_path)!r}))
+            result = analyzer.analyze_documents()
+            print(json.dumps({{
+                "boto3": "boto3" in sys.modules,
+                "anthropic": "anthropic" in sys.modules,
+                "checks": result.summary.total_checks,
+            }}))
+            """
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+        state = json.loads(completed.stdout.strip().splitlines()[-1])
+
+        assert state == {"boto3": False, "anthropic": False, "checks": 1}
@@ -1,7 +1,7 @@
 """Unit tests for LLM providers."""
 
 import json
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import ANY, MagicMock, Mock, patch
 
 import pytest
 from anthropic import AnthropicError
@@ -51,6 +51,7 @@ class TestBedrockProvider:
         mock_boto3.client.assert_called_once_with(
             "bedrock-runtime",
             region_name="us-east-1",
+            config=ANY,
         )
 
     @patch("drift.providers.bedrock.boto3")
@@ -73,8 +74,99 @@ class TestBedrockProvider:
         mock_boto3.client.assert_called_once_with(
             "bedrock-runtime",
             region_name="us-east-1",  # Default
+            config=ANY,
         )
 
+    @patch("drift.providers.bedrock.boto3")
+    def test_client_config_defaults(
+        self, mock_boto3, bedrock_provider_config, bedrock_model_config
+    ):
+        """Test client uses adaptive retries and a sized connection pool by default."""
+        BedrockProvider(bedrock_provider_config, bedrock_model_config)
+
+        config = mock_boto3.client.call_args.kwargs["config"]
+        assert config.max_pool_connections == 50
+        assert config.retries == {"mode": "adaptive", "max_attempts": 3}
+        assert config.tcp_keepalive is True
+
+    @patch("drift.providers.bedrock.boto3")
+    def test_client_config_from_params(self, mock_boto3, bedrock_model_config):
+        """Test client tuning comes from provider params."""
+        provider_config = ProviderConfig(
+            provider=ProviderType.BEDROCK,
+            params={
+                "region": "eu-west-1",
+                "max_pool_connections": 8,
+                "retry_mode": "standard",
+                "max_attempts": 5,
+                "connect_timeout": 2,
+                "read_timeout": 120,
+                "tcp_keepalive": False,
+            },
+        )
+
+        BedrockProvider(provider_config, bedrock_model_config)
+
+        assert mock_boto3.client.call_args.kwargs["region_name"] == "eu-west-1"
+        config = mock_boto3.client.call_args.kwargs["config"]
+        assert config.max_pool_connections == 8
+        assert config.retries == {"mode": "standard", "max_attempts": 5}
+        assert config.connect_timeout == 2.0
+        assert config.read_timeout == 120.0
+        assert config.tcp_keepalive is False
+
+    @patch("drift.providers.bedrock.boto3")
+    def test_client_shared_across_models(self, mock_boto3, bedrock_provider_config):
+        """Test models with the same provider config share one client."""
+        haiku = ModelConfig(provider="bedrock", model_id="haiku", params={})
+        sonnet = ModelConfig(provider="bedrock", model_id="sonnet", params={})
+
+        first = BedrockProvider(bedrock_provider_config, haiku)
+        second = BedrockProvider(bedrock_provider_config, sonnet)
+
+        assert first.client is second.client
+        mock_boto3.client.assert_called_once()
+
+    @patch("drift.providers.bedrock.boto3")
+    def test_client_not_shared_across_regions(self, mock_boto3, bedrock_model_config):
+        """Test different provider params get separate clients."""
+        mock_boto3.client.side_effect = lambda *args, **kwargs: MagicMock()
+        east = ProviderConfig(provider=ProviderType.BEDROCK, params={"region": "us-east-1"})
+        west = ProviderConfig(provider=ProviderType.BEDROCK, params={"region": "us-west-2"})
+
+        first = BedrockProvider(east, bedrock_model_config)
+        second = BedrockProvider(west, bedrock_model_config)
+
+        assert first.client is not second.client
+        assert mock_boto3.client.call_count == 2
+
+    @patch("drift.providers.bedrock.boto3")
+    def test_client_not_shared_across_credentials(
+        self, mock_boto3, monkeypatch, bedrock_provider_config, bedrock_model_config
+    ):
+        """Test switching AWS profile gets a separate client."""
+        mock_boto3.client.side_effect = lambda *args, **kwargs: MagicMock()
+
+        monkeypatch.setenv("AWS_PROFILE", "dev")
+        first = BedrockProvider(bedrock_provider_config, bedrock_model_config)
+        monkeypatch.setenv("AWS_PROFILE", "prod")
+        second = BedrockProvider(bedrock_provider_config, bedrock_model_config)
+
+        assert first.client is not second.client
+
+    @patch("drift.providers.bedrock.boto3")
+    def test_failed_client_not_cached(
+        self, mock_boto3, bedrock_provider_config, bedrock_model_config
+    ):
+        """Test a failed client creation is retried by the next provider."""
+        mock_boto3.client.side_effect = [Exception("AWS Error"), MagicMock()]
+
+        first = BedrockProvider(bedrock_provider_config, bedrock_model_config)
+        second = BedrockProvider(bedrock_provider_config, bedrock_model_config)
+
+        assert first.client is None
+        assert second.client is not None
+
     @patch("drift.providers.bedrock.boto3")
     def test_initialization_failure(
         self, mock_boto3, bedrock_provider_config, bedrock_model_config
@@ -389,6 +481,86 @@ class TestAnthropicProvider:
 
         mock_anthropic.assert_called_once_with(api_key="custom-key")
 
+    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-api-key"})
+    @patch("drift.providers.anthropic.Anthropic")
+    def test_client_tuning_from_params(self, mock_anthropic, anthropic_model_config):
+        """Test retries, timeouts and pool limits come from provider params."""
+        import httpx
+
+        provider_config = ProviderConfig(
+            provider=ProviderType.ANTHROPIC,
+            params={
+                "max_retries": 5,
+                "timeout": 60,
+                "connect_timeout": 5,
+                "max_connections": 16,
+                "max_keepalive_connections": 8,
+                "keepalive_expiry": 30,
+            },
+        )
+
+        AnthropicProvider(provider_config, anthropic_model_config)
+
+        kwargs = mock_anthropic.call_args.kwargs
+        assert kwargs["api_key"] == "test-api-key"
+        assert kwargs["max_retries"] == 5
+        assert kwargs["timeout"] == httpx.Timeout(60.0, connect=5.0)
+        assert isinstance(kwargs["http_client"], httpx.Client)
+        kwargs["http_client"].close()
+
+    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-api-key"})
+    @patch("anthropic.DefaultHttpxClient")
+    @patch("drift.providers.anthropic.Anthropic")
+    def test_single_pool_param_keeps_sdk_limits(
+        self, mock_anthropic, mock_http_client, anthropic_model_config
+    ):
+        """Test setting one pool param keeps the SDK defaults for the others."""
+        import httpx
+        from anthropic import DEFAULT_CONNECTION_LIMITS
+
+        provider_config = ProviderConfig(
+            provider=ProviderType.ANTHROPIC, params={"keepalive_expiry": 30}
+        )
+
+        AnthropicProvider(provider_config, anthropic_model_config)
+
+        limits = mock_http_client.call_args.kwargs["limits"]
+        assert limits == httpx.Limits(
+            max_connections=DEFAULT_CONNECTION_LIMITS.max_connections,
+            max_keepalive_connections=DEFAULT_CONNECTION_LIMITS.max_keepalive_connections,
+            keepalive_expiry=30,
+        )
+        assert limits.max_connections is not None
+        assert limits.max_keepalive_connections is not None
+
+    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-api-key"})
+    @patch("drift.providers.anthropic.Anthropic")
+    def test_client_shared_across_models(self, mock_anthropic, anthropic_provider_config):
+        """Test models with the same provider config and key share one client."""
+        haiku = ModelConfig(provider="anthropic", model_id="haiku", params={})
+        sonnet = ModelConfig(provider="anthropic", model_id="sonnet", params={})
+
+        first = AnthropicProvider(anthropic_provider_config, haiku)
+        second = AnthropicProvider(anthropic_provider_config, sonnet)
+
+        assert first.client is second.client
+        mock_anthropic.assert_called_once()
+
+    @patch("drift.providers.anthropic.Anthropic")
+    def test_client_not_shared_across_api_keys(
+        self, mock_anthropic, monkeypatch, anthropic_provider_config, anthropic_model_config
+    ):
+        """Test a different API key gets a separate client."""
+        mock_anthropic.side_effect = lambda **kwargs: MagicMock()
+
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "key-one")
+        first = AnthropicProvider(anthropic_provider_config, anthropic_model_config)
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "key-two")
+        second = AnthropicProvider(anthropic_provider_config, anthropic_model_config)
+
+        assert first.client is not second.client
+        assert mock_anthropic.call_count == 2
+
     @patch.dict("os.environ", {}, clear=True)
     @patch("drift.providers.anthropic.Anthropic")
     def test_initialization_no_api_key(
@@ -0,0 +1,271 @@
+"""Unit tests for fetching and HTTP caching of remote rules files."""
+
+import json
+import logging
+import threading
+
+import pytest
+import requests
+import yaml
+
+from drift.config.loader import ConfigLoader
+from drift.config.models import RemoteRulesConfig
+from drift.config.remote import RemoteRulesCache, RemoteRulesFetcher, default_cache_dir
+
+URL = "https://rules.example.com/shared.yaml"
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code=200, text="", headers=None):
+        """Initialize with a status, body and headers."""
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        """Raise HTTPError for error statuses like requests does."""
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error")
+
+
+class FakeServer:
+    """Serves canned responses to requests.Session.get and records requests."""
+
+    def __init__(self, monkeypatch):
+        """Patch requests.Session.get to answer from this server."""
+        self.responses = {}
+        self.requests = []
+        self.barrier = None
+        self._lock = threading.Lock()
+
+        def get(session, url, timeout=None, headers=None):
+            with self._lock:
+                self.requests.append((url, dict(headers or {})))
+            if self.barrier is not None:
+                self.barrier.wait()
+            response = self.responses[url]
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        monkeypatch.setattr(requests.Session, "get", get)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Fake HTTP server for remote rules files."""
+    return FakeServer(monkeypatch)
+
+
+def _rules(*names):
+    """Build a rules file defining conversation-level rules with the given names."""
+    return yaml.dump(
+        {
+            name: {
+                "description": f"Rule {name}",
+                "scope": "conversation_level",
+                "context": "Test",
+                "requires_project_context": False,
+            }
+            for name in names
+        }
+    )
+
+
+def _age_entry(url, seconds):
+    """Make a cached entry look fetched the given number of seconds earlier."""
+    cache = RemoteRulesCache()
+    path = cache._entry_path(url)
+    entry = json.loads(path.read_text())
+    entry["fetched_at"] -= seconds
+    path.write_text(json.dumps(entry))
+
+
+def _fetcher(**settings):
+    """Create a fetcher with the given cache settings."""
+    return RemoteRulesFetcher(10, RemoteRulesConfig(**settings))
+
+
+class TestRemoteRulesFetcher:
+    """Tests for RemoteRulesFetcher and its disk cache."""
+
+    def test_fresh_copy_skips_request(self, server):
+        """Test a file fetched within max_age is not requested again."""
+        server.responses[URL] = FakeResponse(200, _rules("a"), {"ETag": '"v1"'})
+
+        with _fetcher() as fetcher:
+            first = fetcher.fetch(URL)
+        with _fetcher() as fetcher:
+            second = fetcher.fetch(URL)
+
+        assert first == second == _rules("a")
+        assert len(server.requests) == 1
+
+    def test_expired_copy_is_revalidated(self, server):
+        """Test an expired copy is revalidated and a 304 keeps its body."""
+        server.responses[URL] = FakeResponse(
+            200, _rules("a"), {"ETag": '"v1"', "Last-Modified": "Mon, 05 Oct 2026 10:00:00 GMT"}
+        )
+        with _fetcher() as fetcher:
+            fetcher.fetch(URL)
+        _age_entry(URL, 600)
+
+        server.responses[URL] = FakeResponse(304)
+        with _fetcher() as fetcher:
+            text = fetcher.fetch(URL)
+            fetcher.fetch(URL)
+
+        assert text == _rules("a")
+        assert server.requests[1][1] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 05 Oct 2026 10:00:00 GMT",
+        }
+        # The 304 made the copy fresh again
+        assert len(server.requests) == 2
+
+    def test_changed_file_replaces_copy(self, server):
+        """Test a 200 on revalidation stores the new content."""
+        server.responses[URL] = FakeResponse(200, _rules("a"), {"ETag": '"v1"'})
+        with _fetcher() as fetcher:
+            fetcher.fetch(URL)
+        _age_entry(URL, 600)
+
+        server.responses[URL] = FakeResponse(200, _rules("b"), {"ETag": '"v2"'})
+        with _fetcher() as fetcher:
+            text = fetcher.fetch(URL)
+
+        assert text == _rules("b")
+        assert RemoteRulesCache().get(URL)["etag"] == '"v2"'
+
+    def test_stale_copy_used_when_server_fails(self, server, caplog):
+        """Test a stale copy within stale_if_error is used when the server is down."""
+        server.responses[URL] = FakeResponse(200, _rules("a"))
+        with _fetcher() as fetcher:
+            fetcher.fetch(URL)
+        _age_entry(URL, 3600)
+
+        server.responses[URL] = requests.exceptions.ConnectionError("unreachable")
+        with caplog.at_level(logging.WARNING), _fetcher() as fetcher:
+            text = fetcher.fetch(URL)
+
+        assert text == _rules("a")
+        assert "using cached copy" in caplog.text
+
+    def test_stale_copy_used_on_server_error(self, server):
+        """Test a 5xx answer falls back to the stale copy too."""
+        server.responses[URL] = FakeResponse(200, _rules("a"))
+        with _fetcher() as fetcher:
+            fetcher.fetch(URL)
+        _age_entry(URL, 3600)
+
+        server.responses[URL] = FakeResponse(503)
+        with _fetcher() as fetcher:
+            assert fetcher.fetch(URL) == _rules("a")
+
+    def test_too_stale_copy_is_not_used(self, server):
+        """Test a copy older than max_age + stale_if_error is not used."""
+        server.responses[URL] = FakeResponse(200, _rules("a"))
+        with _fetcher() as fetcher:
+            fetcher.fetch(URL)
+        _age_entry(URL, 3600)
+
+        server.responses[URL] = requests.exceptions.ConnectionError("unreachable")
+        with _fetcher(max_age=60, stale_if_error=600) as fetcher:
+            with pytest.raises(ValueError, match="Error fetching rules"):
+                fetcher.fetch(URL)
+
+    def test_cache_disabled(self, server):
+        """Test cache_enabled: false requests every time and stores nothing."""
+        server.responses[URL] = FakeResponse(200, _rules("a"))
+
+        with _fetcher(cache_enabled=False) as fetcher:
+            fetcher.fetch(URL)
+            fetcher.fetch(URL)
+
+        assert len(server.requests) == 2
+        assert not default_cache_dir().exists()
+
+    def test_fetch_many_is_concurrent(self, server):
+        """Test several files are requested at the same time, each once."""
+        urls = [f"https://rules.example.com/{name}.yaml" for name in "abc"]
+        for name, url in zip("abc", urls):
+            server.responses[url] = FakeResponse(200, _rules(name))
+        # Each request waits until all three are in flight
+        server.barrier = threading.Barrier(3, timeout=5)
+
+        with _fetcher() as fetcher:
+            results = fetcher.fetch_many([*urls, urls[0]])
+
+        assert results == {url: _rules(name) for name, url in zip("abc", urls)}
+        assert len(server.requests) == 3
+
+    def test_fetch_many_reports_errors_per_url(self, server):
+        """Test a failing file does not hide the others' results."""
+        server.responses["https://rules.example.com/ok.yaml"] = FakeResponse(200, _rules("a"))
+        server.responses["https://rules.example.com/bad.yaml"] = FakeResponse(404)
+
+        with _fetcher() as fetcher:
+            results = fetcher.fetch_many(
+                ["https://rules.example.com/ok.yaml", "https://rules.example.com/bad.yaml"]
+            )
+
+        assert results["https://rules.example.com/ok.yaml"] == _rules("a")
+        assert isinstance(results["https://rules.example.com/bad.yaml"], ValueError)
+
+
+class TestLoadConfigRemoteRules:
+    """Tests for load_config() with remote rules files."""
+
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        """Create an empty project with an isolated global config."""
+        monkeypatch.setattr(ConfigLoader, "GLOBAL_CONFIG_PATHS", [tmp_path / "global.yaml"])
+        project_path = tmp_path / "project"
+        project_path.mkdir()
+        return project_path
+
+    def test_cli_rules_files_fetched_concurrently(self, project, server):
+        """Test --rules-file URLs are fetched together and merged in order."""
+        urls = [f"https://rules.example.com/{name}.yaml" for name in "ab"]
+        server.responses[urls[0]] = FakeResponse(200, _rules("shared", "a"))
+        server.responses[urls[1]] = FakeResponse(200, _rules("shared", "b"))
+        server.barrier = threading.Barrier(2, timeout=5)
+
+        config = ConfigLoader.load_config(project, rules_files=urls)
+
+        assert set(config.rule_definitions) == {"shared", "a", "b"}
+        assert config.rule_definitions["shared"].description == "Rule shared"
+        assert len(server.requests) == 2
+
+    def test_additional_rules_files_use_cache_settings(self, project, server):
+        """Test remote additional rules files honour the remote_rules settings."""
+        (project / ".drift.yaml").write_text(
+            yaml.dump({"additional_rules_files": [URL], "remote_rules": {"max_age": 0}})
+        )
+        server.responses[URL] = FakeResponse(200, _rules("a"), {"ETag": '"v1"'})
+
+        ConfigLoader.load_config(project)
+        server.responses[URL] = FakeResponse(304)
+        config = ConfigLoader.load_config(project)
+
+        assert "a" in config.rule_definitions
+        assert server.requests[1][1] == {"If-None-Match": '"v1"'}
+
+    def test_fetch_error_names_rules_file(self, project, server):
+        """Test a failed fetch without a cached copy fails the load."""
+        server.responses[URL] = requests.exceptions.Timeout()
+
+        with pytest.raises(ValueError, match="Error loading rules file") as exc_info:
+            ConfigLoader.load_config(project, rules_files=[URL])
+        assert "Timeout fetching rules" in str(exc_info.value)
+
+    def test_invalid_settings(self, project):
+        """Test negative durations are rejected."""
+        (project / ".drift.yaml").write_text(
+            yaml.dump({"additional_rules_files": [URL], "remote_rules": {"max_age": -1}})
+        )
+
+        with pytest.raises(ValueError, match="Invalid configuration"):
+            ConfigLoader.load_config(project)
@@ -0,0 +1,133 @@
+"""Startup-time regression tests for the drift CLI.
+
+Each test imports drift in a fresh interpreter, since this process has
+imported everything already.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time allowed for drift.cli.main (python -X importtime)
+STARTUP_BUDGET_MS = 150
+
+# Modules that only the code paths using them may import
+HEAVY_MODULES = [
+    "anthropic",
+    "boto3",
+    "botocore",
+    "jsonschema",
+    "requests",
+    "tiktoken",
+]
+
+
+def _imported_modules(statement):
+    """Run an import statement in a fresh interpreter and list the loaded modules."""
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import json, sys; {statement}; print(json.dumps(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(json.loads(completed.stdout))
+
+
+def _import_time_ms(module):
+    """Measure the cumulative import time of drift modules with python -X importtime."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Top-level imports only; nested ones are included in their parent
+        if name.startswith(" drift") and cumulative.strip().isdigit():
+            total_us += int(cumulative)
+    return total_us / 1000
+
+
+class TestStartupImports:
+    """Tests for what importing drift pulls in."""
+
+    def test_cli_entry_point_is_light(self):
+        """Test the CLI entry point imports no command, model or SDK module."""
+        modules = _imported_modules("import drift.cli.main")
+
+        unexpected = [
+            name
+            for name in [*HEAVY_MODULES, "pydantic", "yaml", "drift.core.analyzer"]
+            if name in modules
+        ]
+        commands = [name for name in modules if name.startswith("drift.cli.commands.")]
+        assert unexpected == []
+        assert commands == []
+
+    def test_config_loading_skips_http_and_validators(self):
+        """Test loading configuration (drift list) imports no HTTP client or validator."""
+        modules = _imported_modules("import drift.cli.commands.list")
+
+        assert [name for name in HEAVY_MODULES if name in modules] == []
+        assert "drift.validation.validators.core" not in modules
+
+    def test_analyzer_skips_sdks_and_validators(self):
+        """Test importing the analyzer defers provider SDKs and validator modules."""
+        modules = _imported_modules("import drift.core.analyzer")
+
+        assert [name for name in HEAVY_MODULES if name in modules] == []
+        assert "drift.validation.validators.core" not in modules
+        assert "drift.providers.anthropic" not in modules
+
+    def test_validators_load_with_first_registry(self):
+        """Test creating a validator registry imports the built-in validators."""
+        modules = _imported_modules(
+            "from drift.validation.validators import ValidatorRegistry; ValidatorRegistry()"
+        )
+
+        assert "drift.validation.validators.core.file_validators" in modules
+        assert "drift.validation.validators.client.claude" in modules
+
+    def test_validation_package_exports(self):
+        """Test names exported by drift.validation still resolve."""
+        from drift.validation import MarkdownLinkValidator, ValidatorRegistry
+        from drift.validation.validators import TokenCountValidator
+        from drift.validation.validators.core import TokenCountValidator as CoreTokenCount
+
+        assert TokenCountValidator is CoreTokenCount
+        assert "core:markdown_link" in ValidatorRegistry()._validators
+        assert MarkdownLinkValidator().validation_type == "core:markdown_link"
+
+    def test_unknown_attribute(self):
+        """Test lazily exporting packages still reject unknown names."""
+        import drift.cli.commands
+        import drift.validation
+
+        with pytest.raises(AttributeError):
+            drift.validation.NoSuchValidator
+        with pytest.raises(AttributeError):
+            drift.cli.commands.no_such_command
+
+
+class TestStartupTime:
+    """Tests for the CLI's import time budget."""
+
+    def test_cli_import_time_budget(self):
+        """Test importing the CLI entry point stays within the startup budget."""
+        # The first run may compile bytecode; keep the best of a few runs
+        best_ms = min(_import_time_ms("drift.cli.main") for _ in range(3))
+
+        assert best_ms < STARTUP_BUDGET_MS, (
+            f"Importing drift.cli.main took {best_ms:.0f} ms "
+            f"(budget {STARTUP_BUDGET_MS} ms); import heavy modules where they are used"
+        )
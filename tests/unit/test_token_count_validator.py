@@ -472,19 +472,21 @@ class TestTokenCountValidator:
         assert "does not exist" in result.observed_issue
         assert "nonexistent.md" in result.file_paths
 
-    def test_missing_file_path(self, validator, bundle_with_file):
-        """Test that validator raises error when file_path is missing."""
+    def test_missing_file_path_validates_bundle(self, validator, bundle_with_file):
+        """Test that validator checks the bundle's files when file_path is missing."""
         rule = ValidationRule(
             rule_type="core:token_count",
             description="No file path",
-            max_count=1000,
-            params={"provider": "anthropic"},
+            params={"provider": "approximate", "max_count": 5},
             failure_message="Error",
-            expected_behavior="Should error",
+            expected_behavior="Should be short",
         )
 
-        with pytest.raises(ValueError, match="requires params.file_path"):
-            validator.validate(rule, bundle_with_file)
+        result = validator.validate(rule, bundle_with_file)
+        assert result is not None
+        assert result.file_paths == ["test.md"]
+        assert "test.md: File has" in result.observed_issue
+        assert "exceeds max 5" in result.observed_issue
 
     def test_file_read_error(self, validator, tmp_path):
         """Test validation when file cannot be read."""
@@ -645,3 +647,151 @@ class TestTokenCountValidator:
         assert result is not None
         assert "Token counting failed" in result.observed_issue
         assert "Tokenizer error" in result.observed_issue
+
+    # ==================== Bundle Tests ====================
+
+    @pytest.fixture
+    def bundle_with_files(self, tmp_path):
+        """Create bundle with a short, a long and an ignored file."""
+        contents = {
+            "short.md": "Short file.",
+            "long.md": "Very long content " * 100,
+            "notes/skip.md": "Ignored content " * 100,
+        }
+        files = []
+        for relative_path, content in contents.items():
+            path = tmp_path / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+            files.append(DocumentFile(relative_path=relative_path, file_path=path))
+
+        return DocumentBundle(
+            bundle_id="test",
+            bundle_type="mixed",
+            bundle_strategy="collection",
+            project_path=tmp_path,
+            files=files,
+        )
+
+    def test_bundle_counted_in_one_batch(self, validator, bundle_with_files, monkeypatch):
+        """Test that the bundle's files are counted with a single batch call."""
+        calls = []
+
+        def fake_batch(texts, provider, fingerprints=None):
+            calls.append((list(texts), provider))
+            return [len(text) for text in texts]
+
+        monkeypatch.setattr(
+            "drift.validation.validators.core.file_validators.count_tokens_batch", fake_batch
+        )
+
+        rule = ValidationRule(
+            rule_type="core:token_count",
+            description="Check bundle tokens",
+            params={"provider": "openai", "max_count": 100, "ignore_patterns": ["notes/**"]},
+            failure_message="Too long",
+            expected_behavior="Files should be short",
+        )
+
+        result = validator.validate(rule, bundle_with_files)
+        assert len(calls) == 1
+        assert calls[0] == (["Short file.", "Very long content " * 100], "openai")
+        assert result is not None
+        assert result.file_paths == ["long.md"]
+        assert result.observed_issue == (
+            "long.md: File has 1800 tokens (exceeds max 100) using openai tokenizer"
+        )
+
+    def test_bundle_passes_fingerprints(self, validator, tmp_path, monkeypatch):
+        """Test that the files' git blob ids are passed as memo keys."""
+        (tmp_path / "a.md").write_text("Tracked file.")
+        (tmp_path / "b.md").write_text("Modified file.")
+        bundle = DocumentBundle(
+            bundle_id="test",
+            bundle_type="mixed",
+            bundle_strategy="collection",
+            project_path=tmp_path,
+            files=[
+                DocumentFile(relative_path="a.md", file_path=tmp_path / "a.md", fingerprint="1a2b"),
+                DocumentFile(relative_path="b.md", file_path=tmp_path / "b.md"),
+            ],
+        )
+        calls = []
+
+        def fake_batch(texts, provider, fingerprints=None):
+            calls.append(fingerprints)
+            return [1 for _ in texts]
+
+        monkeypatch.setattr(
+            "drift.validation.validators.core.file_validators.count_tokens_batch", fake_batch
+        )
+
+        rule = ValidationRule(
+            rule_type="core:token_count",
+            description="Check bundle tokens",
+            params={"provider": "approximate", "max_count": 100},
+            failure_message="Too long",
+            expected_behavior="Files should be short",
+        )
+
+        assert validator.validate(rule, bundle) is None
+        assert calls == [["1a2b", None]]
+
+    def test_bundle_anthropic_batch(self, validator, bundle_with_files, monkeypatch):
+        """Test that a bundle sends one count request per distinct file to Anthropic."""
+        mock_client = Mock()
+        mock_client.beta.messages.count_tokens.side_effect = [
+            Mock(input_tokens=10),
+            Mock(input_tokens=500),
+            Mock(input_tokens=900),
+        ]
+        mock_anthropic = Mock()
+        mock_anthropic.Anthropic.return_value = mock_client
+        monkeypatch.setitem(sys.modules, "anthropic", mock_anthropic)
+
+        rule = ValidationRule(
+            rule_type="core:token_count",
+            description="Check bundle tokens",
+            params={"provider": "anthropic", "min_count": 1, "max_count": 1000},
+            failure_message="Too long",
+            expected_behavior="Files should be short",
+        )
+
+        assert validator.validate(rule, bundle_with_files) is None
+        assert mock_client.beta.messages.count_tokens.call_count == 3
+
+    def test_bundle_counting_error(self, validator, bundle_with_files, monkeypatch):
+        """Test that a failed batch reports every file of the bundle."""
+        monkeypatch.setitem(sys.modules, "tiktoken", None)
+
+        rule = ValidationRule(
+            rule_type="core:token_count",
+            description="Check bundle tokens",
+            params={"provider": "openai", "max_count": 100},
+            failure_message="Too long",
+            expected_behavior="Files should be short",
+        )
+
+        result = validator.validate(rule, bundle_with_files)
+        assert result is not None
+        assert result.file_paths == ["short.md", "long.md", "notes/skip.md"]
+        assert "Install required package for 'openai' provider" in result.observed_issue
+
+    def test_empty_bundle_passes(self, validator, tmp_path):
+        """Test that a bundle without files to check passes."""
+        bundle = DocumentBundle(
+            bundle_id="test",
+            bundle_type="mixed",
+            bundle_strategy="collection",
+            project_path=tmp_path,
+            files=[],
+        )
+        rule = ValidationRule(
+            rule_type="core:token_count",
+            description="Check bundle tokens",
+            params={"provider": "approximate", "max_count": 100},
+            failure_message="Too long",
+            expected_behavior="Files should be short",
+        )
+
+        assert validator.validate(rule, bundle) is None
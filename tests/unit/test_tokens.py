@@ -0,0 +1,267 @@
+"""Unit tests for token counting utilities."""
+
+import sys
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from drift.config.models import ValidationRule
+from drift.core.types import DocumentBundle, DocumentFile
+from drift.validation.tokens import (
+    approximate_token_count,
+    clear_token_caches,
+    count_tokens,
+    count_tokens_batch,
+)
+from drift.validation.validators.core.file_validators import TokenCountValidator
+
+
+def _mock_anthropic(monkeypatch, count_fn=None):
+    """Install a mock anthropic module whose count_tokens uses count_fn."""
+    mock_messages = Mock()
+
+    def fake_count_tokens(**kwargs):
+        text = kwargs["messages"][0]["content"]
+        response = Mock()
+        response.input_tokens = count_fn(text) if count_fn else len(text.split())
+        return response
+
+    mock_messages.count_tokens.side_effect = fake_count_tokens
+    mock_client = Mock()
+    mock_client.beta.messages = mock_messages
+    mock_anthropic = Mock()
+    mock_anthropic.Anthropic.return_value = mock_client
+    monkeypatch.setitem(sys.modules, "anthropic", mock_anthropic)
+    return mock_anthropic, mock_messages
+
+
+class TestApproximateTokenCount:
+    """Tests for the offline approximate provider."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("", 0),
+            ("hello world", 2),
+            ("The quick brown fox jumps over the lazy dog.", 10),
+            ("internationalization", 4),
+            ("1234567", 3),
+            ("日本語", 3),
+        ],
+    )
+    def test_estimates(self, text, expected):
+        """Test estimates for representative inputs."""
+        assert approximate_token_count(text) == expected
+
+    def test_needs_no_packages(self, monkeypatch):
+        """Test approximate counting never imports a tokenizer package."""
+        for name in ("anthropic", "tiktoken", "transformers"):
+            monkeypatch.setitem(sys.modules, name, None)
+
+        assert count_tokens("Offline counting works", "approximate") == 5
+
+
+class TestCountTokens:
+    """Tests for memoized token counting."""
+
+    def test_unsupported_provider(self):
+        """Test unsupported providers raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported provider"):
+            count_tokens("text", "unknown")
+
+    def test_anthropic_client_created_once(self, monkeypatch):
+        """Test the Anthropic client is reused across counts."""
+        mock_anthropic, _ = _mock_anthropic(monkeypatch)
+
+        assert count_tokens("one two", "anthropic") == 2
+        assert count_tokens("one two three", "anthropic") == 3
+
+        mock_anthropic.Anthropic.assert_called_once()
+
+    def test_counts_memoized_by_content(self, monkeypatch):
+        """Test identical content is only counted once per provider."""
+        _, mock_messages = _mock_anthropic(monkeypatch)
+
+        first = count_tokens("same content", "anthropic")
+        second = count_tokens("same content", "anthropic")
+
+        assert first == second == 2
+        assert mock_messages.count_tokens.call_count == 1
+
+    def test_memo_is_per_provider(self, monkeypatch):
+        """Test memoized counts are not shared between providers."""
+        _mock_anthropic(monkeypatch, count_fn=lambda text: 99)
+
+        assert count_tokens("hello world", "anthropic") == 99
+        assert count_tokens("hello world", "approximate") == 2
+
+    def test_openai_encoding_loaded_once(self, monkeypatch):
+        """Test the tiktoken encoding is loaded once per process."""
+        mock_encoding = Mock()
+        mock_encoding.encode.side_effect = lambda text: text.split()
+        mock_tiktoken = Mock()
+        mock_tiktoken.encoding_for_model.return_value = mock_encoding
+        monkeypatch.setitem(sys.modules, "tiktoken", mock_tiktoken)
+
+        assert count_tokens("a b", "openai") == 2
+        assert count_tokens("a b c", "openai") == 3
+
+        mock_tiktoken.encoding_for_model.assert_called_once_with("gpt-4")
+
+    def test_llama_tokenizer_loaded_once(self, monkeypatch):
+        """Test the Llama tokenizer is loaded once per process."""
+        mock_tokenizer = Mock()
+        mock_tokenizer.encode.side_effect = lambda text: list(text)
+        mock_transformers = Mock()
+        mock_transformers.AutoTokenizer.from_pretrained.return_value = mock_tokenizer
+        monkeypatch.setitem(sys.modules, "transformers", mock_transformers)
+
+        assert count_tokens("abc", "llama") == 3
+        assert count_tokens("abcd", "llama") == 4
+
+        mock_transformers.AutoTokenizer.from_pretrained.assert_called_once()
+
+    def test_failed_import_not_cached(self, monkeypatch):
+        """Test a missing package can be installed later in the process."""
+        monkeypatch.setitem(sys.modules, "tiktoken", None)
+        with pytest.raises(ImportError, match="pip install tiktoken"):
+            count_tokens("a b", "openai")
+
+        mock_tiktoken = Mock()
+        mock_tiktoken.encoding_for_model.return_value.encode.side_effect = str.split
+        monkeypatch.setitem(sys.modules, "tiktoken", mock_tiktoken)
+
+        assert count_tokens("a b", "openai") == 2
+
+    def test_memo_evicts_least_recently_used(self, monkeypatch):
+        """Test the memo is capped and keeps the counts used most recently."""
+        _, mock_messages = _mock_anthropic(monkeypatch)
+        monkeypatch.setattr("drift.validation.tokens.TOKEN_COUNT_CACHE_SIZE", 2)
+
+        count_tokens("a", "anthropic")
+        count_tokens("a b", "anthropic")
+        count_tokens("a", "anthropic")  # "a" is now the most recently used
+        count_tokens("a b c", "anthropic")  # Evicts "a b"
+        assert mock_messages.count_tokens.call_count == 3
+
+        count_tokens("a", "anthropic")
+        assert mock_messages.count_tokens.call_count == 3
+        count_tokens("a b", "anthropic")
+        assert mock_messages.count_tokens.call_count == 4
+
+    def test_clear_token_caches(self, monkeypatch):
+        """Test clearing caches reloads tokenizers and recounts."""
+        mock_anthropic, mock_messages = _mock_anthropic(monkeypatch)
+
+        count_tokens("hello", "anthropic")
+        clear_token_caches()
+        count_tokens("hello", "anthropic")
+
+        assert mock_anthropic.Anthropic.call_count == 2
+        assert mock_messages.count_tokens.call_count == 2
+
+
+class TestCountTokensBatch:
+    """Tests for batched token counting."""
+
+    def test_preserves_order_and_dedupes(self, monkeypatch):
+        """Test results follow input order and duplicates are counted once."""
+        _, mock_messages = _mock_anthropic(monkeypatch)
+
+        counts = count_tokens_batch(["a", "a b", "a", "a b c"], "anthropic")
+
+        assert counts == [1, 2, 1, 3]
+        assert mock_messages.count_tokens.call_count == 3
+
+    def test_reuses_memoized_counts(self, monkeypatch):
+        """Test only uncached texts are sent to the API."""
+        _, mock_messages = _mock_anthropic(monkeypatch)
+        count_tokens("a b", "anthropic")
+
+        counts = count_tokens_batch(["a b", "c d e"], "anthropic")
+
+        assert counts == [2, 3]
+        assert mock_messages.count_tokens.call_count == 2
+
+    def test_anthropic_requests_run_concurrently(self, monkeypatch):
+        """Test anthropic batches overlap their count_tokens requests."""
+        lock = threading.Lock()
+        active = {"now": 0, "peak": 0}
+
+        def slow_count(text):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.05)
+            with lock:
+                active["now"] -= 1
+            return len(text)
+
+        _mock_anthropic(monkeypatch, count_fn=slow_count)
+
+        counts = count_tokens_batch([f"text {i}" for i in range(6)], "anthropic")
+
+        assert counts == [6] * 6
+        assert active["peak"] > 1
+
+    def test_empty_batch(self):
+        """Test an empty batch returns no counts."""
+        assert count_tokens_batch([], "anthropic") == []
+
+    def test_fingerprints_key_the_memo(self, monkeypatch):
+        """Test texts with a fingerprint are memoized by it instead of by content."""
+        _, mock_messages = _mock_anthropic(monkeypatch)
+        monkeypatch.setattr(
+            "drift.validation.tokens.hashlib.sha256",
+            Mock(side_effect=AssertionError("fingerprinted text was hashed")),
+        )
+
+        assert count_tokens_batch(["a b"], "anthropic", fingerprints=["abc123"]) == [2]
+        # Same fingerprint: the memoized count is reused without counting again
+        assert count_tokens_batch(["a b"], "anthropic", fingerprints=["abc123"]) == [2]
+
+        assert mock_messages.count_tokens.call_count == 1
+
+    def test_missing_fingerprints_fall_back_to_content(self, monkeypatch):
+        """Test texts without a fingerprint share the content-hash memo."""
+        _, mock_messages = _mock_anthropic(monkeypatch)
+        count_tokens("a b", "anthropic")
+
+        counts = count_tokens_batch(["a b", "c d e"], "anthropic", fingerprints=[None, "def456"])
+
+        assert counts == [2, 3]
+        assert mock_messages.count_tokens.call_count == 2
+
+
+class TestTokenCountValidatorApproximate:
+    """Tests for TokenCountValidator with the approximate provider."""
+
+    def test_validator_accepts_approximate(self, tmp_path):
+        """Test approximate provider validates offline."""
+        test_file = tmp_path / "CLAUDE.md"
+        content = "word " * 100
+        test_file.write_text(content)
+        bundle = DocumentBundle(
+            bundle_id="test",
+            bundle_type="mixed",
+            bundle_strategy="individual",
+            project_path=tmp_path,
+            files=[
+                DocumentFile(relative_path="CLAUDE.md", content=content, file_path=str(test_file))
+            ],
+        )
+        rule = ValidationRule(
+            rule_type="core:token_count",
+            description="Check token count",
+            params={"file_path": "CLAUDE.md", "max_count": 50, "provider": "approximate"},
+            failure_message="Too many tokens",
+            expected_behavior="Should be under 50 tokens",
+        )
+
+        result = TokenCountValidator().validate(rule, bundle)
+
+        assert result is not None
+        assert "100 tokens" in result.observed_issue
+        assert "approximate tokenizer" in result.observed_issue
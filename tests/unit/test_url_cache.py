@@ -0,0 +1,163 @@
+"""Unit tests for the persistent URL status cache."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from drift.config.models import UrlCacheConfig
+from drift.utils.url_cache import DEFAULT_TTLS, UrlStatusCache, status_class
+
+
+def _aged_entry(status, age_seconds):
+    """Build an entry checked age_seconds ago."""
+    checked_at = datetime.now(timezone.utc) - timedelta(seconds=age_seconds)
+    return {"status": status, "checked_at": checked_at.isoformat()}
+
+
+class TestStatusClass:
+    """Tests for status_class."""
+
+    @pytest.mark.parametrize(
+        "status,expected",
+        [
+            (200, "2xx"),
+            (204, "2xx"),
+            (301, "3xx"),
+            (404, "4xx"),
+            (503, "5xx"),
+            (None, "error"),
+            (999, "error"),
+        ],
+    )
+    def test_status_class(self, status, expected):
+        """Test statuses map to their class."""
+        assert status_class(status) == expected
+
+
+class TestUrlStatusCache:
+    """Tests for UrlStatusCache."""
+
+    def test_missing_url(self, tmp_path):
+        """Test unknown URLs have no entry."""
+        cache = UrlStatusCache(tmp_path / "urls.json")
+
+        assert cache.get("https://docs.test/") is None
+
+    def test_set_and_get(self, tmp_path):
+        """Test stored entries keep status, final URL and validators."""
+        cache = UrlStatusCache(tmp_path / "urls.json")
+
+        cache.set(
+            "https://docs.test/",
+            200,
+            final_url="https://docs.test/home",
+            etag='"abc"',
+            last_modified="Wed, 01 Jan 2025 00:00:00 GMT",
+        )
+
+        entry = cache.get("https://docs.test/")
+        assert entry["status"] == 200
+        assert entry["final_url"] == "https://docs.test/home"
+        assert entry["etag"] == '"abc"'
+        assert entry["last_modified"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+        assert cache.is_fresh(entry)
+
+    def test_final_url_defaults_to_url(self, tmp_path):
+        """Test final_url falls back to the requested URL."""
+        cache = UrlStatusCache(tmp_path / "urls.json")
+
+        cache.set("https://docs.test/", None)
+
+        assert cache.get("https://docs.test/")["final_url"] == "https://docs.test/"
+
+    def test_ttl_depends_on_status_class(self, tmp_path):
+        """Test successes outlive failures by default."""
+        cache = UrlStatusCache(tmp_path / "urls.json")
+        two_hours = 2 * 3600
+
+        assert cache.is_fresh(_aged_entry(200, two_hours))
+        assert not cache.is_fresh(_aged_entry(404, two_hours))
+        assert not cache.is_fresh(_aged_entry(None, two_hours))
+        assert not cache.is_fresh(_aged_entry(200, DEFAULT_TTLS["2xx"] + 1))
+
+    def test_custom_ttls(self, tmp_path):
+        """Test configured TTLs override defaults per class."""
+        cache = UrlStatusCache(tmp_path / "urls.json", ttls={"2xx": 60, "error": 0})
+
+        assert not cache.is_fresh(_aged_entry(200, 120))
+        assert not cache.is_fresh(_aged_entry(None, 1))
+        assert cache.is_fresh(_aged_entry(404, 120))
+
+    def test_entry_without_timestamp_is_stale(self, tmp_path):
+        """Test malformed entries are never fresh."""
+        cache = UrlStatusCache(tmp_path / "urls.json")
+
+        assert not cache.is_fresh({"status": 200})
+        assert not cache.is_fresh({"status": 200, "checked_at": "not a date"})
+
+    def test_save_and_reload(self, tmp_path):
+        """Test entries survive a save/load round trip."""
+        path = tmp_path / ".drift" / "cache" / "urls.json"
+        cache = UrlStatusCache(path)
+        cache.set("https://docs.test/", 200, etag='"abc"')
+
+        cache.save()
+
+        reloaded = UrlStatusCache(path)
+        assert reloaded.get("https://docs.test/")["etag"] == '"abc"'
+        assert not list(path.parent.glob("*.tmp"))
+
+    def test_save_skipped_when_unchanged(self, tmp_path):
+        """Test save() does not create a file when nothing was recorded."""
+        path = tmp_path / "urls.json"
+
+        UrlStatusCache(path).save()
+
+        assert not path.exists()
+
+    def test_clear(self, tmp_path):
+        """Test clear() removes persisted entries."""
+        path = tmp_path / "urls.json"
+        cache = UrlStatusCache(path)
+        cache.set("https://docs.test/", 200)
+        cache.save()
+
+        cache.clear()
+        cache.save()
+
+        assert UrlStatusCache(path).get("https://docs.test/") is None
+
+    @pytest.mark.parametrize(
+        "content",
+        ["not json", "[]", json.dumps({"version": 999, "urls": {}})],
+    )
+    def test_unreadable_file_starts_empty(self, tmp_path, content):
+        """Test corrupt or foreign files are ignored."""
+        path = tmp_path / "urls.json"
+        path.write_text(content)
+
+        assert UrlStatusCache(path).get("https://docs.test/") is None
+
+
+class TestUrlCacheConfig:
+    """Tests for UrlCacheConfig validation."""
+
+    def test_defaults(self):
+        """Test the cache is enabled under .drift/cache by default."""
+        config = UrlCacheConfig()
+
+        assert config.enabled is True
+        assert config.path == ".drift/cache/url_status.json"
+        assert config.ttl == {}
+
+    def test_unknown_status_class_rejected(self):
+        """Test TTL keys must be status classes."""
+        with pytest.raises(ValidationError, match="Unknown status class"):
+            UrlCacheConfig(ttl={"200": 60})
+
+    def test_negative_ttl_rejected(self):
+        """Test TTLs must not be negative."""
+        with pytest.raises(ValidationError, match="must not be negative"):
+            UrlCacheConfig(ttl={"4xx": -1})
@@ -0,0 +1,447 @@
+"""Tests for concurrent external URL checking."""
+
+import socket
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from drift.config.models import (
+    BundleStrategy,
+    DocumentBundleConfig,
+    DriftConfig,
+    RuleDefinition,
+    UrlCacheConfig,
+    ValidationRule,
+    ValidationRulesConfig,
+)
+from drift.core.analyzer import DriftAnalyzer
+from drift.core.types import DocumentBundle, DocumentFile
+from drift.utils.url_cache import UrlStatusCache
+from drift.utils.url_checker import ExternalUrlChecker, get_url_checker, url_check_session
+from drift.validation.validators import MarkdownLinkValidator
+
+
+class LinkServer:
+    """Local HTTP server that records requests and active concurrency."""
+
+    def __init__(self):
+        """Start the server on a free localhost port."""
+        self.requests = Counter()
+        self.active = 0
+        self.peak = 0
+        self.delay = 0.0
+        self.etag = '"v1"'
+        self.conditional = []
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self, method):
+                with server._lock:
+                    server.requests[(method, self.path)] += 1
+                    server.conditional.append(self.headers.get("If-None-Match"))
+                    server.active += 1
+                    server.peak = max(server.peak, server.active)
+                try:
+                    if server.delay:
+                        time.sleep(server.delay)
+                    headers = {}
+                    if self.path.startswith("/missing"):
+                        status = 404
+                    elif self.path.startswith("/no-head") and method == "HEAD":
+                        status = 405
+                    elif self.path.startswith("/etag"):
+                        headers["ETag"] = server.etag
+                        status = 304 if self.headers.get("If-None-Match") == server.etag else 200
+                    else:
+                        status = 200
+                    self.send_response(status)
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                finally:
+                    with server._lock:
+                        server.active -= 1
+
+            def do_HEAD(self):
+                self._respond("HEAD")
+
+            def do_GET(self):
+                self._respond("GET")
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+
+    def url(self, path):
+        """Build a URL on this server."""
+        return f"{self.base_url}{path}"
+
+    def count(self, path):
+        """Count requests of any method for a path."""
+        return sum(n for (_, p), n in self.requests.items() if p == path)
+
+    def stop(self):
+        """Stop the server."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def link_server():
+    """Run a local HTTP server for link checks."""
+    server = LinkServer()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def closed_port_url():
+    """URL on a localhost port nothing listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/"
+
+
+class TestExternalUrlChecker:
+    """Tests for ExternalUrlChecker."""
+
+    def test_reachable_and_missing(self, link_server):
+        """Test status codes below 400 are valid and others are not."""
+        with ExternalUrlChecker() as checker:
+            assert checker.check(link_server.url("/ok")) is True
+            assert checker.check(link_server.url("/missing")) is False
+
+    def test_falls_back_to_get_when_head_rejected(self, link_server):
+        """Test a URL whose server rejects HEAD is checked with GET."""
+        with ExternalUrlChecker() as checker:
+            assert checker.check(link_server.url("/no-head")) is True
+
+        assert link_server.requests[("HEAD", "/no-head")] == 1
+        assert link_server.requests[("GET", "/no-head")] == 1
+
+    def test_no_get_when_head_succeeds(self, link_server):
+        """Test GET is not sent when HEAD succeeds."""
+        with ExternalUrlChecker() as checker:
+            checker.check(link_server.url("/ok"))
+
+        assert link_server.requests[("GET", "/ok")] == 0
+
+    def test_connection_error_is_invalid(self, closed_port_url):
+        """Test unreachable hosts are reported as invalid."""
+        with ExternalUrlChecker(timeout=1) as checker:
+            assert checker.check(closed_port_url) is False
+
+    def test_duplicates_requested_once(self, link_server):
+        """Test each distinct URL is requested once per checker."""
+        url = link_server.url("/ok")
+
+        with ExternalUrlChecker() as checker:
+            results = checker.check_many([url, url, url])
+            assert checker.check(url) is True
+
+        assert results == {url: True}
+        assert link_server.count("/ok") == 1
+
+    def test_checks_run_concurrently(self, link_server):
+        """Test URLs are checked in parallel."""
+        link_server.delay = 0.2
+        urls = [link_server.url(f"/ok/{i}") for i in range(4)]
+
+        start = time.monotonic()
+        with ExternalUrlChecker(per_host_limit=4) as checker:
+            results = checker.check_many(urls)
+        elapsed = time.monotonic() - start
+
+        assert all(results.values())
+        assert link_server.peak > 1
+        assert elapsed < 0.2 * len(urls)
+
+    def test_per_host_limit(self, link_server):
+        """Test concurrent requests to one host are capped."""
+        link_server.delay = 0.05
+        urls = [link_server.url(f"/ok/{i}") for i in range(8)]
+
+        with ExternalUrlChecker(max_workers=8, per_host_limit=2) as checker:
+            checker.check_many(urls)
+
+        assert link_server.peak == 2
+
+    def test_invalid_limits(self):
+        """Test limits below one are rejected."""
+        with pytest.raises(ValueError, match="at least 1"):
+            ExternalUrlChecker(per_host_limit=0)
+
+
+class TestExternalUrlCheckerStatusCache:
+    """Tests for ExternalUrlChecker with a persistent status cache."""
+
+    def _expire(self, cache, url):
+        """Backdate an entry so it is past every TTL."""
+        cache._entries[url]["checked_at"] = "2000-01-01T00:00:00+00:00"
+
+    def test_fresh_entry_skips_request(self, link_server, tmp_path):
+        """Test a warm cache answers without any request."""
+        url = link_server.url("/ok")
+        cache_file = tmp_path / "url_status.json"
+
+        with ExternalUrlChecker(status_cache=UrlStatusCache(cache_file)) as checker:
+            assert checker.check(url) is True
+        with ExternalUrlChecker(status_cache=UrlStatusCache(cache_file)) as checker:
+            assert checker.check(url) is True
+
+        assert link_server.count("/ok") == 1
+
+    def test_cached_failure_reported_without_request(self, link_server, tmp_path):
+        """Test fresh failures are reused too."""
+        url = link_server.url("/missing")
+        cache_file = tmp_path / "url_status.json"
+
+        with ExternalUrlChecker(status_cache=UrlStatusCache(cache_file)) as checker:
+            assert checker.check(url) is False
+        requests_after_first_run = link_server.count("/missing")
+        with ExternalUrlChecker(status_cache=UrlStatusCache(cache_file)) as checker:
+            assert checker.check(url) is False
+
+        assert link_server.count("/missing") == requests_after_first_run
+
+    def test_stores_status_final_url_and_etag(self, link_server, tmp_path):
+        """Test results are persisted with their validators."""
+        url = link_server.url("/etag")
+        cache_file = tmp_path / "url_status.json"
+
+        with ExternalUrlChecker(status_cache=UrlStatusCache(cache_file)) as checker:
+            checker.check(url)
+
+        entry = UrlStatusCache(cache_file).get(url)
+        assert entry["status"] == 200
+        assert entry["final_url"] == url
+        assert entry["etag"] == '"v1"'
+        assert entry["checked_at"]
+
+    def test_expired_entry_revalidated_conditionally(self, link_server, tmp_path):
+        """Test expired entries send If-None-Match and accept 304."""
+        url = link_server.url("/etag")
+        cache = UrlStatusCache(tmp_path / "url_status.json")
+        with ExternalUrlChecker(status_cache=cache) as checker:
+            checker.check(url)
+        self._expire(cache, url)
+
+        with ExternalUrlChecker(status_cache=cache) as checker:
+            assert checker.check(url) is True
+
+        assert link_server.conditional == [None, '"v1"']
+        entry = cache.get(url)
+        assert entry["status"] == 200
+        assert cache.is_fresh(entry)
+
+    def test_changed_etag_refreshes_entry(self, link_server, tmp_path):
+        """Test a changed resource replaces the stored ETag."""
+        url = link_server.url("/etag")
+        cache = UrlStatusCache(tmp_path / "url_status.json")
+        with ExternalUrlChecker(status_cache=cache) as checker:
+            checker.check(url)
+        self._expire(cache, url)
+        link_server.etag = '"v2"'
+
+        with ExternalUrlChecker(status_cache=cache) as checker:
+            assert checker.check(url) is True
+
+        assert cache.get(url)["etag"] == '"v2"'
+
+    def test_expired_failure_not_conditional(self, link_server, tmp_path):
+        """Test failed URLs are re-requested without validators."""
+        url = link_server.url("/missing")
+        cache = UrlStatusCache(tmp_path / "url_status.json")
+        cache.set(url, 404, etag='"stale"')
+        self._expire(cache, url)
+
+        with ExternalUrlChecker(status_cache=cache) as checker:
+            assert checker.check(url) is False
+
+        assert set(link_server.conditional) == {None}
+
+
+class TestUrlCheckSession:
+    """Tests for the run-scoped checker session."""
+
+    def test_session_sets_current_checker(self):
+        """Test the checker is only active inside the session."""
+        assert get_url_checker() is None
+
+        with url_check_session() as checker:
+            assert get_url_checker() is checker
+
+        assert get_url_checker() is None
+
+
+def _link_bundle(tmp_path, name, content):
+    """Create a single-file bundle."""
+    path = tmp_path / name
+    path.write_text(content)
+    return DocumentBundle(
+        bundle_id=name,
+        bundle_type="mixed",
+        bundle_strategy="individual",
+        project_path=tmp_path,
+        files=[DocumentFile(relative_path=name, content=content, file_path=str(path))],
+    )
+
+
+class TestMarkdownLinkValidatorUrlChecks:
+    """Tests for MarkdownLinkValidator external URL checks."""
+
+    @pytest.fixture
+    def rule(self):
+        """Markdown link rule that checks localhost URLs."""
+        return ValidationRule(
+            rule_type="core:markdown_link",
+            description="Check links",
+            params={"check_local_files": False, "skip_example_domains": False},
+            failure_message="Broken link",
+            expected_behavior="Links work",
+        )
+
+    def test_results_fan_out_to_each_file(self, link_server, tmp_path, rule):
+        """Test a URL shared by several files is requested once and reported per file."""
+        missing = link_server.url("/missing")
+        files = []
+        for name in ("a.md", "b.md"):
+            (tmp_path / name).write_text(f"[broken]({missing})")
+            files.append(
+                DocumentFile(
+                    relative_path=name,
+                    content=f"[broken]({missing})",
+                    file_path=str(tmp_path / name),
+                )
+            )
+        bundle = DocumentBundle(
+            bundle_id="docs",
+            bundle_type="mixed",
+            bundle_strategy="collection",
+            project_path=tmp_path,
+            files=files,
+        )
+
+        result = MarkdownLinkValidator().validate(rule, bundle)
+
+        assert result is not None
+        assert sorted(result.file_paths) == ["a.md", "b.md"]
+        assert f"a.md: [{missing}]" in result.observed_issue
+        assert f"b.md: [{missing}]" in result.observed_issue
+        assert link_server.requests[("HEAD", "/missing")] == 1
+
+    def test_session_shares_results_across_bundles(self, link_server, tmp_path, rule):
+        """Test bundles validated in one session reuse URL results."""
+        url = link_server.url("/ok")
+        first = _link_bundle(tmp_path, "a.md", f"[ok]({url})")
+        second = _link_bundle(tmp_path, "b.md", f"[ok]({url})")
+        validator = MarkdownLinkValidator()
+
+        with url_check_session():
+            assert validator.validate(rule, first) is None
+            assert validator.validate(rule, second) is None
+
+        assert link_server.count("/ok") == 1
+
+    def test_collect_external_urls(self, tmp_path, rule):
+        """Test collected URLs are unique and follow rule filtering."""
+        bundle = _link_bundle(
+            tmp_path,
+            "a.md",
+            "[one](https://one.test/x) [two](https://two.test/) [one](https://one.test/x)\n"
+            "[local](docs/guide.md)\n```\n[code](https://code.test/)\n```\n",
+        )
+
+        urls = MarkdownLinkValidator().collect_external_urls(rule, bundle.files)
+
+        assert urls == ["https://one.test/x", "https://two.test/"]
+
+    def test_collect_external_urls_disabled(self, tmp_path, rule):
+        """Test no URLs are collected when external checks are disabled."""
+        bundle = _link_bundle(tmp_path, "a.md", "[one](https://one.test/x)")
+        rule.params["check_external_urls"] = False
+
+        assert MarkdownLinkValidator().collect_external_urls(rule, bundle.files) == []
+
+
+class TestAnalyzerUrlChecks:
+    """Tests for run-wide URL deduplication in analyze_documents."""
+
+    def _config(self, tmp_path, url, **config_kwargs):
+        """Create three skills linking to url and a config checking their links."""
+        for name in ("one", "two", "three"):
+            skill_dir = tmp_path / ".claude" / "skills" / name
+            skill_dir.mkdir(parents=True, exist_ok=True)
+            (skill_dir / "SKILL.md").write_text(f"# {name}\n\nSee [docs]({url}).\n")
+
+        return DriftConfig(
+            rule_definitions={
+                "skill_links": RuleDefinition(
+                    description="Skill links work",
+                    scope="project_level",
+                    context="Broken links mislead",
+                    requires_project_context=True,
+                    validation_rules=ValidationRulesConfig(
+                        rules=[
+                            ValidationRule(
+                                rule_type="core:markdown_link",
+                                description="Check links",
+                                params={"skip_example_domains": False},
+                                failure_message="Broken link",
+                                expected_behavior="Links work",
+                            )
+                        ],
+                        document_bundle=DocumentBundleConfig(
+                            bundle_type="skill",
+                            file_patterns=[".claude/skills/*/SKILL.md"],
+                            bundle_strategy=BundleStrategy.INDIVIDUAL,
+                        ),
+                    ),
+                )
+            },
+            **config_kwargs,
+        )
+
+    def test_url_checked_once_per_run(self, link_server, tmp_path):
+        """Test a URL referenced by many bundles is requested once per run."""
+        config = self._config(tmp_path, link_server.url("/missing"))
+
+        result = DriftAnalyzer(config=config, project_path=tmp_path).analyze_documents()
+
+        assert len(result.results[0].rules) == 3
+        assert link_server.requests[("HEAD", "/missing")] == 1
+
+    def test_warm_run_uses_status_cache(self, link_server, tmp_path):
+        """Test a second run answers from .drift/cache without requests."""
+        config = self._config(tmp_path, link_server.url("/ok"))
+
+        DriftAnalyzer(config=config, project_path=tmp_path).analyze_documents()
+        result = DriftAnalyzer(config=config, project_path=tmp_path).analyze_documents()
+
+        assert result.summary.total_rule_violations == 0
+        assert link_server.count("/ok") == 1
+        assert (tmp_path / ".drift" / "cache" / "url_status.json").exists()
+
+    def test_status_cache_can_be_disabled(self, link_server, tmp_path):
+        """Test disabling the URL cache re-checks every run."""
+        config = self._config(
+            tmp_path, link_server.url("/ok"), url_cache=UrlCacheConfig(enabled=False)
+        )
+
+        DriftAnalyzer(config=config, project_path=tmp_path).analyze_documents()
+        DriftAnalyzer(config=config, project_path=tmp_path).analyze_documents()
+
+        assert link_server.count("/ok") == 2
+        assert not (tmp_path / ".drift" / "cache" / "url_status.json").exists()
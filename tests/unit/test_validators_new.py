@@ -377,14 +377,14 @@ class TestMarkdownLinkValidator:
         assert "missing.md" in result.observed_issue
         assert "not found" in result.observed_issue.lower()
 
-    @patch("drift.utils.link_validator.requests.head")
+    @patch("requests.Session.request")
     def test_validate_valid_external_links(
-        self, mock_head, validator, validation_rule, temp_project
+        self, mock_request, validator, validation_rule, temp_project
     ):
         """Test validation with valid external links."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_head.return_value = mock_response
+        mock_request.return_value = mock_response
 
         file_path = temp_project / "readme.md"
         file_path.write_text("[Example](https://example.com)")
@@ -404,14 +404,14 @@ class TestMarkdownLinkValidator:
 
         assert result is None
 
-    @patch("drift.utils.link_validator.requests.head")
+    @patch("requests.Session.request")
     def test_validate_broken_external_links(
-        self, mock_head, validator, validation_rule, temp_project
+        self, mock_request, validator, validation_rule, temp_project
     ):
         """Test validation with broken external links."""
         mock_response = Mock()
         mock_response.status_code = 404
-        mock_head.return_value = mock_response
+        mock_request.return_value = mock_response
 
         file_path = temp_project / "readme.md"
         file_path.write_text("[Example](https://real-domain.com/missing)")
@@ -496,12 +496,12 @@ class TestMarkdownLinkValidator:
 
         assert result is None
 
-    @patch("drift.utils.link_validator.requests.head")
-    def test_validate_skip_external_urls(self, mock_head, validator, temp_project):
+    @patch("requests.Session.request")
+    def test_validate_skip_external_urls(self, mock_request, validator, temp_project):
         """Test validation skips external URL checks when disabled."""
         mock_response = Mock()
         mock_response.status_code = 404
-        mock_head.return_value = mock_response
+        mock_request.return_value = mock_response
 
         file_path = temp_project / "readme.md"
         file_path.write_text("[Example](https://example.com/missing)")
@@ -528,7 +528,7 @@ class TestMarkdownLinkValidator:
         result = validator.validate(rule, bundle)
 
         assert result is None
-        mock_head.assert_not_called()
+        mock_request.assert_not_called()
 
     def test_validate_multiple_files(self, validator, validation_rule, temp_project):
         """Test validation across multiple files."""